@@ -0,0 +1,8 @@
+# app_paths.py
+# Per-user files of the toolkit. Nothing else is imported here, so the GUI can
+# show these paths without loading the modules that use them.
+from pathlib import Path
+
+DATA_DIR = Path.home() / ".nuclei-template-toolkit"
+DEFAULT_CACHE_PATH = DATA_DIR / "metadata_cache.sqlite3"
+DEFAULT_INDEX_PATH = DATA_DIR / "template_index.sqlite3"
@@ -0,0 +1,277 @@
+# archive_source.py
+# Template bundles (.zip, .tar, .tar.gz, ...) as inputs and outputs, without extracting them.
+# A member is addressed as "<archive path>!/<member name>", e.g. "bundle.zip!/http/cves/x.yaml".
+import io
+import mmap
+import os
+import struct
+import tarfile
+import threading
+import time
+import zipfile
+import zlib
+
+ARCHIVE_SEPARATOR = "!/"
+ZIP_SUFFIXES = (".zip",)
+# Suffix -> tarfile write mode.
+TAR_SUFFIXES = {".tar": "w", ".tar.gz": "w:gz", ".tgz": "w:gz", ".tar.bz2": "w:bz2", ".tbz2": "w:bz2",
+                ".tar.xz": "w:xz", ".txz": "w:xz"}
+
+
+def is_archive(path):
+    name = str(path).lower()
+    return name.endswith(ZIP_SUFFIXES) or name.endswith(tuple(TAR_SUFFIXES))
+
+
+def member_path(archive, name):
+    return f"{archive}{ARCHIVE_SEPARATOR}{name}"
+
+
+def split_member_path(path):
+    """(archive, member name) of an archive-qualified path, None for a plain file path."""
+    start = 0
+    while (cut := path.find(ARCHIVE_SEPARATOR, start)) != -1:
+        if is_archive(path[:cut]):
+            return path[:cut], path[cut + len(ARCHIVE_SEPARATOR):]
+        start = cut + 1
+    return None
+
+
+def _map(f):
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Empty files and some file systems cannot be mapped.
+        return None
+
+
+class _ZipReader:
+    """
+    The central directory is read through zipfile; stored and deflated members
+    are then sliced (and inflated) straight out of a memory map of the archive.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._zip = zipfile.ZipFile(self._file)
+        self._map = _map(self._file)
+        self._infos = None
+        self.closed = False
+
+    def names(self):
+        return [info.filename for info in self._zip.infolist() if not info.is_dir()]
+
+    def read(self, name):
+        if self._infos is None:
+            self._infos = {info.filename: info for info in self._zip.infolist()}
+        info = self._infos[name]
+        if self._map is None or info.flag_bits & 0x1 or \
+                info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return self._zip.read(info)
+        # Local file header: the name and extra field lengths sit at offset 26.
+        name_length, extra_length = struct.unpack_from("<HH", self._map, info.header_offset + 26)
+        start = info.header_offset + 30 + name_length + extra_length
+        data = self._map[start:start + info.compress_size]
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -15)
+        if zlib.crc32(data) != info.CRC:
+            raise OSError(f"Bad CRC-32 for {name!r}")
+        return data
+
+    def close(self):
+        self.closed = True
+        self._zip.close()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+def _member_name(member):
+    # "tar -C dir ." stores "./http/x.yaml"; members are addressed without the prefix.
+    name = member.name
+    while name.startswith("./"):
+        name = name[2:]
+    return name
+
+
+class _TarReader:
+    """
+    An uncompressed tar is memory-mapped and members are sliced out of the map.
+    Compressed tars are read through tarfile; reading members in archive order,
+    as discovery lists them, only ever seeks forward in the compressed stream.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = _map(self._file) if path.lower().endswith(".tar") else None
+        self._tar = tarfile.open(fileobj=self._map, mode="r:") if self._map is not None else \
+            tarfile.open(fileobj=self._file, mode="r:*")
+        self._members = None
+        self.closed = False
+
+    def names(self):
+        return [_member_name(member) for member in self._tar if member.isfile()]
+
+    def read(self, name):
+        if self._members is None:
+            self._members = {_member_name(member): member for member in self._tar.getmembers() if member.isfile()}
+        member = self._members.get(name)
+        if member is None:
+            raise FileNotFoundError(f"No member {name!r} in archive")
+        if self._map is not None:
+            return self._map[member.offset_data:member.offset_data + member.size]
+        return self._tar.extractfile(member).read()
+
+    def close(self):
+        self.closed = True
+        self._tar.close()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+# Open archives of this process (each pool worker has its own), by archive path:
+# (reader, lock held while the reader is used, (st_mtime_ns, st_size) it was opened at).
+_open_archives = {}
+_open_lock = threading.Lock()
+# Runs of this process using the open archives; see hold_archives().
+_holders = 0
+
+
+def _forget_archives():
+    # A forked worker would share the parent's file offsets; it opens its own handles instead.
+    global _open_lock, _holders
+    _open_archives.clear()
+    _open_lock = threading.Lock()
+    _holders = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_archives)
+
+
+def _close_reader(entry):
+    reader, lock, _ = entry
+    with lock:
+        reader.close()
+
+
+def _reader(archive):
+    """The open reader of 'archive'; one replaced since it was opened is reopened."""
+    stat = os.stat(archive)
+    version = (stat.st_mtime_ns, stat.st_size)
+    stale = None
+    with _open_lock:
+        entry = _open_archives.get(archive)
+        if entry is not None and entry[2] != version:
+            stale, entry = entry, None
+        if entry is None:
+            reader = _ZipReader(archive) if archive.lower().endswith(ZIP_SUFFIXES) else _TarReader(archive)
+            entry = _open_archives[archive] = (reader, threading.Lock(), version)
+    if stale is not None:
+        _close_reader(stale)
+    return entry
+
+
+def _use_reader(archive, use):
+    """Calls 'use' with the reader of 'archive' while no other thread uses or closes it."""
+    while True:
+        reader, lock, _ = _reader(archive)
+        with lock:
+            # Closed between the lookup and the lock: the archive was replaced or released.
+            if not reader.closed:
+                return use(reader)
+
+
+def list_members(archive):
+    """Names of the regular files in 'archive', in archive order."""
+    return _use_reader(archive, lambda reader: reader.names())
+
+
+def _read(reader, archive, name):
+    try:
+        return reader.read(name)
+    except KeyError:
+        raise FileNotFoundError(f"No member {name!r} in {archive}") from None
+    except (zlib.error, zipfile.BadZipFile, tarfile.TarError) as e:
+        raise OSError(f"Cannot read {name!r} from {archive}: {e}") from e
+
+
+def read_member(path):
+    archive, name = split_member_path(path)
+    try:
+        return _use_reader(archive, lambda reader: _read(reader, archive, name))
+    except (tarfile.TarError, zipfile.BadZipFile) as e:
+        raise OSError(f"Cannot read archive {archive}: {e}") from e
+
+
+def read_file(path):
+    """Contents of a file or of an archive member."""
+    if ARCHIVE_SEPARATOR in path and split_member_path(path):
+        return read_member(path)
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def hold_archives():
+    """
+    Marks the start of a run that reads archives. The archives this process
+    opened stay open until the last run holding them calls release_archives(),
+    so runs sharing the process never close each other's readers.
+    """
+    global _holders
+    with _open_lock:
+        _holders += 1
+
+
+def release_archives():
+    """Ends a run started with hold_archives(); the last one closes the archives of this process."""
+    global _holders
+    with _open_lock:
+        _holders = max(0, _holders - 1)
+        if _holders:
+            return
+        entries = list(_open_archives.values())
+        _open_archives.clear()
+    for entry in entries:
+        _close_reader(entry)
+
+
+class ArchiveWriter:
+    """
+    Writes files into a new .zip or tar archive. The archive is built next to
+    'path' and only renamed into place by close(), so a failed run does not
+    leave a truncated archive behind; discard() drops it.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._partial = f"{self.path}.partial"
+        lower = self.path.lower()
+        if lower.endswith(ZIP_SUFFIXES):
+            self._zip = zipfile.ZipFile(self._partial, "w", zipfile.ZIP_DEFLATED)
+            self._tar = None
+        else:
+            mode = next(mode for suffix, mode in TAR_SUFFIXES.items() if lower.endswith(suffix))
+            self._tar = tarfile.open(self._partial, mode)
+            self._zip = None
+
+    def add(self, name, data, mtime=None):
+        name = name.replace("\\", "/")
+        mtime = time.time() if mtime is None else mtime
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, time.localtime(mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size, info.mtime, info.mode = len(data), int(mtime), 0o644
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        (self._zip or self._tar).close()
+        os.replace(self._partial, self.path)
+
+    def discard(self):
+        (self._zip or self._tar).close()
+        os.remove(self._partial)
@@ -0,0 +1,117 @@
+# benchmarks/bench_highlighter.py
+# Compares the previous per-pattern YAML highlighter with the single-pass one.
+# Usage: python benchmarks/bench_highlighter.py [--lines N] [--repeat N]
+# (set QT_QPA_PLATFORM=offscreen on a machine without a display)
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtCore import QRegularExpression
+from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+from PySide6.QtWidgets import QApplication, QPlainTextEdit
+from corpus import make_template
+from yaml_highlighter import YamlHighlighter
+
+
+class LegacyYamlHighlighter(QSyntaxHighlighter):
+    """The highlighter before the rewrite: ~35 patterns, each recompiled for every line."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.highlighting_rules = []
+        number_format = QTextCharFormat()
+        number_format.setForeground(QColor("#B5CEA8"))
+        self.highlighting_rules.append((QRegularExpression(r"\b[0-9]+\b"), number_format))
+        string_format = QTextCharFormat()
+        string_format.setForeground(QColor("#CE9178"))
+        self.highlighting_rules.append((QRegularExpression(r"'.*?'"), string_format))
+        self.highlighting_rules.append((QRegularExpression(r'".*?"'), string_format))
+        keyword_format = QTextCharFormat()
+        keyword_format.setForeground(QColor("#569CD6"))
+        keyword_format.setFontWeight(QFont.Bold)
+        keywords = ["id", "info", "name", "author", "severity", "description", "reference",
+                    "classification", "metadata", "tags", "requests", "http", "dns", "file",
+                    "network", "headless", "websocket", "matchers", "extractors", "-", "type", "part",
+                    "words", "status", "body", "header", "method", "path", "raw"]
+        for word in keywords:
+            self.highlighting_rules.append((QRegularExpression(rf"\b{word}:"), keyword_format))
+        self.highlighting_rules.append((QRegularExpression(r"^\s*-\s"), keyword_format))
+        comment_format = QTextCharFormat()
+        comment_format.setForeground(QColor("#6A9955"))
+        comment_format.setFontItalic(True)
+        self.highlighting_rules.append((QRegularExpression(r"#[^\n]*"), comment_format))
+
+    def highlightBlock(self, text):
+        for pattern, format in self.highlighting_rules:
+            expression = QRegularExpression(pattern)
+            it = expression.globalMatch(text)
+            while it.hasNext():
+                match = it.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+
+
+def make_document(lines, seed=1337):
+    rng = random.Random(seed)
+    text = []
+    index = 0
+    while len(text) < lines:
+        text += make_template(rng, index, raw_lines=20, payloads=20).splitlines()
+        index += 1
+    return "\n".join(text[:lines])
+
+
+def time_rehighlight(name, highlighter_class, text, repeat):
+    document = QTextDocument()
+    document.setPlainText(text)
+    highlighter = highlighter_class(document)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        highlighter.rehighlight()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    lines = document.blockCount()
+    print(f"{name:<28} {best * 1000:9.1f} ms  {best * 1000 * 1000 / lines:8.2f} ms per 1k lines")
+    return best
+
+
+def time_editor_load(text):
+    """Time for setPlainText in an editor with the viewport-limited highlighter attached."""
+    editor = QPlainTextEdit()
+    editor.resize(900, 700)
+    highlighter = YamlHighlighter(editor.document())
+    highlighter.attach_viewport(editor)
+    editor.show()
+    QApplication.processEvents()
+    start = time.perf_counter()
+    editor.setPlainText(text)
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    lines = editor.document().blockCount()
+    print(f"{'editor load (viewport mode)':<28} {elapsed * 1000:9.1f} ms  "
+          f"{elapsed * 1000 * 1000 / lines:8.2f} ms per 1k lines")
+    editor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YAML highlighter: per-pattern vs. single pass")
+    parser.add_argument("--lines", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    text = make_document(args.lines)
+    print(f"Document: {args.lines} lines, {len(text) / 1024:.0f} KiB")
+    legacy = time_rehighlight("legacy (per pattern)", LegacyYamlHighlighter, text, args.repeat)
+    single = time_rehighlight("single pass", YamlHighlighter, text, args.repeat)
+    print(f"Speedup: {legacy / single:.1f}x")
+    time_editor_load(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# benchmarks/bench_metadata.py
+# Compares the header-only metadata extractor with a full yaml.safe_load.
+# Usage: python benchmarks/bench_metadata.py [--count N] [--raw-lines N] [--payloads N]
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yaml
+from corpus import generate_corpus
+from template_analysis import extract_fields
+from template_metadata import HeaderLoader, load_header
+
+
+def full_parse(text):
+    return extract_fields(yaml.safe_load(text))
+
+
+def header_parse(text):
+    return extract_fields(load_header(text))
+
+
+def run(name, func, texts):
+    start = time.perf_counter()
+    results = [func(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {elapsed:8.3f}s  {len(texts) / elapsed:10.0f} files/s")
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Header extractor vs. full parse")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--raw-lines", type=int, default=40)
+    parser.add_argument("--payloads", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = generate_corpus(tmp, args.count, raw_lines=args.raw_lines, payloads=args.payloads)
+        texts = [Path(p).read_text(encoding="utf-8") for p in paths]
+
+    print(f"Corpus: {len(texts)} templates, {sum(map(len, texts)) / 1024 / 1024:.1f} MiB, "
+          f"loader: {HeaderLoader.__name__}")
+    baseline, base_time = run("yaml.safe_load", full_parse, texts)
+    fast, fast_time = run("load_header", header_parse, texts)
+    mismatches = sum(1 for a, b in zip(baseline, fast) if a != b)
+    print(f"Speedup: {base_time / fast_time:.1f}x, mismatching results: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# benchmarks/corpus.py
+# Deterministic synthetic Nuclei template corpora: the same arguments always
+# produce byte-identical files, so benchmark runs can be compared.
+import math
+import random
+from pathlib import Path
+
+SEVERITIES = ["critical", "high", "medium", "low", "info"]
+TAGS = ["cve", "rce", "sqli", "xss", "lfi", "ssrf", "panel", "exposure", "misconfig", "tech"]
+SIZE_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+MALFORMED_KINDS = ("unclosed", "tab_indent", "not_utf8", "empty")
+# Roughly the shape of the public nuclei-templates repository.
+REALISTIC_SEVERITY_MIX = {"critical": 10, "high": 25, "medium": 25, "low": 8, "info": 32}
+
+
+def _raw_block(rng, lines):
+    body = ["        GET /api/v{0}/item?id={1} HTTP/1.1".format(rng.randint(1, 3), rng.randint(1, 9999)),
+            "        Host: {{Hostname}}",
+            "        User-Agent: Mozilla/5.0"]
+    body += [f"        X-Pad-{n}: {rng.getrandbits(64):016x}" for n in range(lines)]
+    return "\n".join(body)
+
+
+def make_template(rng, index, raw_lines=20, payloads=0, severity=None):
+    """Returns the YAML text of one synthetic Nuclei template."""
+    severity = severity or rng.choice(SEVERITIES)
+    tags = ",".join(rng.sample(TAGS, 3))
+    text = [
+        f"id: synthetic-template-{index}",
+        "",
+        "info:",
+        f"  name: Synthetic Template {index}",
+        "  author: bench",
+        f"  severity: {severity}",
+        "  description: |",
+        "    Generated for benchmarking the toolkit.",
+        "  reference:",
+        f"    - https://example.com/advisory/{index}",
+        f"  tags: {tags}",
+        "",
+        "http:",
+        "  - raw:",
+        "      - |",
+        _raw_block(rng, raw_lines),
+    ]
+    if payloads:
+        text.append("    payloads:")
+        text.append("      param:")
+        text += [f"        - \"payload-{rng.getrandbits(48):012x}\"" for _ in range(payloads)]
+    text += [
+        "    matchers:",
+        "      - type: word",
+        "        words:",
+        f"          - \"marker-{index}\"",
+        "",
+    ]
+    return "\n".join(text)
+
+
+def parse_severity_mix(text):
+    """'critical=10,high=25,...' -> {severity: weight}."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip():
+            mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def _raw_lines(rng, sizes, median):
+    if sizes == "uniform":
+        return rng.randint(0, 2 * median)
+    if sizes == "lognormal":
+        return min(int(rng.lognormvariate(math.log(max(median, 1)), 0.9)), 50 * max(median, 1))
+    return median
+
+
+def _malformed(rng, index, raw_lines, payloads):
+    kind = rng.choice(MALFORMED_KINDS)
+    if kind == "empty":
+        return b""
+    if kind == "not_utf8":
+        return b"id: latin1-\xe9t\xe9\ninfo:\n  severity: \xff\xfe high\n"
+    text = make_template(rng, index, raw_lines, payloads)
+    if kind == "unclosed":
+        return text.replace("  tags: ", "  tags: [", 1).encode("utf-8")
+    return text.replace("\n  name: ", "\n\tname: ", 1).encode("utf-8")
+
+
+def generate_corpus(target_dir, count, seed=1337, raw_lines=20, payloads=50, sizes="fixed",
+                    duplicate_rate=0.0, malformed_rate=0.0, severity_mix=None, folder_size=None):
+    """
+    Writes 'count' templates into target_dir and returns their paths.
+    sizes: 'fixed' gives every template 'raw_lines' raw request lines,
+      'uniform' 0 to 2 * raw_lines, 'lognormal' a long tail around a median
+      of raw_lines (most templates small, a few very large).
+    duplicate_rate: share of files that are byte-identical copies of an
+      earlier template (same id and content hash).
+    malformed_rate: share of files that are not valid templates (broken
+      YAML, bad indentation, not UTF-8, empty).
+    severity_mix: {severity: weight}; without it severities are uniform.
+    folder_size: spread the files over numbered sub-folders of that size.
+    """
+    rng = random.Random(seed)
+    target = Path(target_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    names, weights = (list(severity_mix), list(severity_mix.values())) if severity_mix else (None, None)
+    paths = []
+    originals = []
+    for i in range(count):
+        folder = target / f"{i // folder_size:04d}" if folder_size else target
+        if folder_size and i % folder_size == 0:
+            folder.mkdir(exist_ok=True)
+        path = folder / f"template-{i:06d}.yaml"
+        roll = rng.random()
+        if originals and roll < duplicate_rate:
+            content = Path(rng.choice(originals)).read_bytes()
+        elif roll < duplicate_rate + malformed_rate:
+            content = _malformed(rng, i, _raw_lines(rng, sizes, raw_lines), payloads)
+        else:
+            severity = rng.choices(names, weights)[0] if names else None
+            content = make_template(rng, i, _raw_lines(rng, sizes, raw_lines), payloads, severity).encode("utf-8")
+            originals.append(str(path))
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths
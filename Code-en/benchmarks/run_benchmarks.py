@@ -0,0 +1,244 @@
+# benchmarks/run_benchmarks.py
+# Times the classification, deduplication, metadata extraction and highlighting
+# paths on synthetic corpora of several sizes and saves the results as JSON.
+# Usage: python benchmarks/run_benchmarks.py [--counts 1000,10000,100000] [--jobs N]
+#        [--benchmarks organize,dedup,...] [--output results.json] [--compare previous.json]
+# Every benchmark runs in its own process, so the peak RSS is its own.
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+import yaml
+from corpus import REALISTIC_SEVERITY_MIX, SIZE_DISTRIBUTIONS, generate_corpus, parse_severity_mix
+from discovery import walk_templates
+from engine import TemplateEngine
+from near_dedup import DEFAULT_NEAR_THRESHOLD
+from template_metadata import load_full, load_header, load_outline
+
+try:
+    from PySide6.QtGui import QGuiApplication, QTextDocument
+    from yaml_highlighter import YamlHighlighter
+except ImportError:
+    YamlHighlighter = None
+
+BENCHMARKS = ["organize", "dedup", "dedup_deep", "load_header", "load_outline", "load_full", "safe_load", "highlighter"]
+DEFAULT_COUNTS = "1000,10000,100000"
+RESULTS_DIR = BENCH_DIR / "results"
+
+
+def peak_rss_mb(who):
+    """Peak resident set size of this process (or its reaped children) in MiB, None when unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _read_texts(paths):
+    texts = []
+    for path in paths:
+        try:
+            texts.append(Path(path).read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            pass
+    return texts
+
+
+def _parse_each(func):
+    def bench(corpus, args):
+        texts = _read_texts(walk_templates(corpus))
+        start = time.perf_counter()
+        for text in texts:
+            try:
+                func(text)
+            except Exception:
+                pass
+        return time.perf_counter() - start
+    return bench
+
+
+# The engine benchmarks stream the corpus folder, as the CLI and GUI do, so no path list is held.
+def bench_organize(corpus, args):
+    with tempfile.TemporaryDirectory() as target:
+        start = time.perf_counter()
+        result = TemplateEngine(jobs=args.jobs).do_organize_templates(walk_templates(corpus), target)
+        elapsed = time.perf_counter() - start
+    if result.get("status") != "classification_done":
+        raise RuntimeError(f"classification failed: {result.get('status')}")
+    return elapsed
+
+
+def bench_dedup(corpus, args):
+    start = time.perf_counter()
+    TemplateEngine(jobs=args.jobs).do_find_duplicates(walk_templates(corpus))
+    return time.perf_counter() - start
+
+
+def bench_dedup_deep(corpus, args):
+    """Deduplication with the semantic and near-duplicate checks, which parse every file in full."""
+    start = time.perf_counter()
+    TemplateEngine(jobs=args.jobs, semantic=True,
+                   near_threshold=DEFAULT_NEAR_THRESHOLD).do_find_duplicates(walk_templates(corpus))
+    return time.perf_counter() - start
+
+
+def bench_highlighter(corpus, args):
+    """Opens every template in a document with the highlighter attached, as the editor tab does."""
+    if YamlHighlighter is None:
+        raise RuntimeError("PySide6 is not installed")
+    app = QGuiApplication.instance() or QGuiApplication([sys.argv[0], "-platform", "offscreen"])
+    texts = _read_texts(walk_templates(corpus))
+    document = QTextDocument()
+    highlighter = YamlHighlighter(document)
+    start = time.perf_counter()
+    for text in texts:
+        document.setPlainText(text)
+    elapsed = time.perf_counter() - start
+    del highlighter, app
+    return elapsed
+
+
+def run_one(args):
+    """Runs a single benchmark in this process and prints its result as one JSON line."""
+    files = sum(1 for _ in walk_templates(args.corpus))
+    benches = {"organize": bench_organize, "dedup": bench_dedup, "dedup_deep": bench_dedup_deep,
+               "highlighter": bench_highlighter,
+               "load_header": _parse_each(load_header), "load_outline": _parse_each(load_outline),
+               "load_full": _parse_each(load_full), "safe_load": _parse_each(yaml.safe_load)}
+    baseline = peak_rss_mb(resource.RUSAGE_SELF) if resource else None
+    seconds = benches[args.run_one](args.corpus, args)
+    print(json.dumps({
+        "seconds": round(seconds, 4),
+        "files_per_second": round(files / seconds, 1) if seconds else None,
+        "baseline_rss_mb": baseline,
+        "peak_rss_mb": peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        "peak_child_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+    }))
+    return 0
+
+
+def _spawn(name, corpus, count, args):
+    command = [sys.executable, str(Path(__file__).resolve()), "--run-one", name,
+               "--corpus", corpus, "--jobs", str(args.jobs)]
+    entry = {"benchmark": name, "count": count}
+    completed = subprocess.run(command, capture_output=True, text=True)
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode < 0:
+        entry["error"] = f"killed by signal {-completed.returncode}"
+        return entry
+    if completed.returncode != 0 or not lines:
+        error = completed.stderr.strip().splitlines()
+        entry["error"] = error[-1] if error else f"exit code {completed.returncode}"
+        return entry
+    entry.update(json.loads(lines[-1]))
+    return entry
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=BENCH_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, previous_path):
+    """Prints the change in time against an earlier results file, matched on (benchmark, count)."""
+    with open(previous_path, encoding="utf-8") as f:
+        previous = {(r["benchmark"], r["count"]): r for r in json.load(f)["results"] if "seconds" in r}
+    print(f"\nCompared with {previous_path}:")
+    for result in results:
+        before = previous.get((result["benchmark"], result["count"]))
+        if before is None or "seconds" not in result:
+            continue
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        print(f"  {result['benchmark']:<13} {result['count']:>7}  {before['seconds']:9.3f}s -> "
+              f"{result['seconds']:9.3f}s  ({ratio:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks on synthetic Nuclei template corpora")
+    parser.add_argument("--counts", default=DEFAULT_COUNTS, help="comma-separated corpus sizes")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS),
+                        help=f"comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--raw-lines", type=int, default=20, help="(median) raw request lines per template")
+    parser.add_argument("--payloads", type=int, default=20)
+    parser.add_argument("--sizes", choices=SIZE_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--duplicate-rate", type=float, default=0.05)
+    parser.add_argument("--malformed-rate", type=float, default=0.01)
+    parser.add_argument("--severity-mix", type=parse_severity_mix, default=REALISTIC_SEVERITY_MIX,
+                        help="e.g. critical=10,high=25,medium=25,low=8,info=32")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/bench-<time>.json)")
+    parser.add_argument("--compare", metavar="RESULTS", help="earlier results file to compare with")
+    parser.add_argument("--run-one", choices=BENCHMARKS, help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run_one:
+        return run_one(args)
+
+    counts = [int(c) for c in args.counts.split(",") if c.strip()]
+    selected = [b.strip() for b in args.benchmarks.split(",") if b.strip()]
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    corpus_options = {"seed": args.seed, "raw_lines": args.raw_lines, "payloads": args.payloads,
+                      "sizes": args.sizes, "duplicate_rate": args.duplicate_rate,
+                      "malformed_rate": args.malformed_rate, "severity_mix": args.severity_mix}
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "jobs": args.jobs,
+        "corpus": corpus_options,
+        "results": [],
+    }
+    for count in counts:
+        with tempfile.TemporaryDirectory() as corpus:
+            start = time.perf_counter()
+            generate_corpus(corpus, count, folder_size=1000, **corpus_options)
+            size = sum(p.stat().st_size for p in Path(corpus).rglob("*.yaml"))
+            print(f"Corpus: {count} templates, {size / 1024 / 1024:.1f} MiB "
+                  f"(generated in {time.perf_counter() - start:.1f}s)")
+            for name in selected:
+                entry = _spawn(name, corpus, count, args)
+                entry["corpus_mb"] = round(size / 1024 / 1024, 1)
+                report["results"].append(entry)
+                if "error" in entry:
+                    print(f"  {name:<13} failed: {entry['error']}")
+                else:
+                    print(f"  {name:<13} {entry['seconds']:9.3f}s  {entry['files_per_second']:10.0f} files/s  "
+                          f"peak RSS {entry['peak_rss_mb']} MiB")
+
+    output = Path(args.output) if args.output else \
+        RESULTS_DIR / f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {output}")
+    if args.compare:
+        compare(report["results"], args.compare)
+    return 1 if any("error" in r for r in report["results"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# classification_manifest.py
+import json
+import os
+
+MANIFEST_NAME = "classification_manifest.json"
+
+
+def _normalized(path, real_dirs):
+    """
+    Absolute 'path' with its folder's symlinks resolved, so that one output folder
+    spelled two ways gives the same destinations. The file itself is not resolved:
+    a symlink placement must stay the copy, not the source it points to.
+    """
+    folder, name = os.path.split(os.path.abspath(path))
+    if folder not in real_dirs:
+        real_dirs[folder] = os.path.realpath(folder)
+    return os.path.join(real_dirs[folder], name)
+
+
+class ClassificationManifest:
+    """
+    Remembers where each source template was placed in a classification folder,
+    together with the source's size and mtime at that time. It lets a later run
+    tell which sources changed, keep names owned by other sources, and delete
+    copies that became stale (source removed or moved to another severity).
+    Sources are keyed by absolute path and destinations are stored normalized
+    (see _normalized), however the caller spells them.
+    """
+
+    def __init__(self, target_dir):
+        self.path = os.path.join(target_dir, MANIFEST_NAME)
+        self.target_dir = os.path.realpath(target_dir)
+        self.entries = {}
+        self._real_dirs = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Manifests of older runs may hold paths as they were given, e.g. relative ones.
+            self.entries = {os.path.abspath(source): (self.normalize(entry[0]), *entry[1:])
+                            for source, entry in data.get("entries", {}).items()}
+        except (OSError, ValueError, AttributeError, TypeError, IndexError):
+            self.entries = {}
+
+    def normalize(self, destination):
+        """The form in which 'destination' is recorded and compared."""
+        return _normalized(destination, self._real_dirs)
+
+    def destination(self, source):
+        entry = self.entries.get(os.path.abspath(source))
+        return entry[0] if entry else None
+
+    def is_current(self, source, stat):
+        """True when 'source' was placed and has not changed since."""
+        entry = self.entries.get(os.path.abspath(source))
+        return entry is not None and entry[1] == stat.st_size and entry[2] == stat.st_mtime_ns
+
+    def reserved(self, sources):
+        """Destinations owned by sources other than 'sources'."""
+        sources = {os.path.abspath(source) for source in sources}
+        return {entry[0] for source, entry in self.entries.items() if source not in sources}
+
+    def sources_under(self, path):
+        """Recorded sources equal to 'path' or inside the folder 'path'."""
+        path = os.path.abspath(path)
+        prefix = os.path.join(path, "")
+        return [source for source in self.entries if source == path or source.startswith(prefix)]
+
+    def record(self, source, destination):
+        source, destination = os.path.abspath(source), self.normalize(destination)
+        try:
+            stat = os.stat(source)
+            self.entries[source] = (destination, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            # The source is gone (e.g. it was moved): it can never be "current" again.
+            self.entries[source] = (destination, None, None)
+
+    def remove_copy(self, source, keep=()):
+        """
+        Forgets 'source' and deletes its placed copy, unless that path is in 'keep'
+        (normalized destinations, e.g. those written by the current run) or lies
+        outside the target folder. Returns True if a file was deleted.
+        """
+        entry = self.entries.pop(os.path.abspath(source), None)
+        if entry is None:
+            return False
+        destination = entry[0]
+        if destination in keep or not destination.startswith(os.path.join(self.target_dir, "")):
+            return False
+        try:
+            os.unlink(destination)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def save(self):
+        temporary = self.path + ".tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "entries": self.entries}, f)
+        os.replace(temporary, self.path)
@@ -0,0 +1,110 @@
+# dedup_index.py
+from array import array
+
+
+class PathTable:
+    """
+    Interned file paths, addressed by integer file ids in insertion order.
+    Each path is split after its last separator and the folder part is stored
+    once, so a million templates in a few thousand folders keep a few thousand
+    folder strings plus one short file name per template.
+    """
+    __slots__ = ("_folders", "_folder_ids", "_folder_of", "_names")
+
+    def __init__(self):
+        self._folders = []
+        self._folder_ids = {}
+        self._folder_of = array('L')
+        self._names = []
+
+    def add(self, path):
+        cut = max(path.rfind("/"), path.rfind("\\")) + 1
+        folder = path[:cut]
+        folder_id = self._folder_ids.get(folder)
+        if folder_id is None:
+            folder_id = self._folder_ids[folder] = len(self._folders)
+            self._folders.append(folder)
+        self._folder_of.append(folder_id)
+        self._names.append(path[cut:])
+        return len(self._names) - 1
+
+    def name(self, file_id):
+        return self._names[file_id]
+
+    def paths(self, file_ids):
+        return [self[file_id] for file_id in file_ids]
+
+    def __getitem__(self, file_id):
+        return self._folders[self._folder_of[file_id]] + self._names[file_id]
+
+    def __len__(self):
+        return len(self._names)
+
+
+class GroupIndex:
+    """
+    Key -> file ids. A key seen once costs a single int; only keys shared by
+    several files get an array of members, so groups() walks duplicates only.
+    """
+    __slots__ = ("_first", "_groups")
+
+    def __init__(self):
+        self._first = {}
+        self._groups = {}
+
+    def add(self, key, file_id):
+        first = self._first.setdefault(key, file_id)
+        if first == file_id:
+            return
+        group = self._groups.get(key)
+        if group is None:
+            self._groups[key] = array('L', (first, file_id))
+        else:
+            group.append(file_id)
+
+    def groups(self):
+        """(key, file ids) of every key with two or more files, ordered by their first file."""
+        return sorted(self._groups.items(), key=lambda item: item[1][0])
+
+
+class DedupIndex:
+    """
+    Compact state of a duplicate search. TemplateRecords are folded in with
+    add() and not kept: paths go to a PathTable and everything else refers to
+    files by id, with sizes in an array, digests as raw bytes (only for files
+    that have one) and template IDs and semantic digests in GroupIndexes.
+    Near-duplicate signatures are only kept when 'near' is set.
+    """
+
+    def __init__(self, hash_algo, near=False):
+        self.hash_algo = hash_algo
+        self.paths = PathTable()
+        # -1 for files that could not be read.
+        self.sizes = array('q')
+        self.digests = {}
+        # Files whose digest was computed after analysis, for the metadata cache.
+        self.computed = []
+        self.ids = GroupIndex()
+        self.semantic = GroupIndex()
+        self.signatures = [] if near else None
+
+    def add(self, record):
+        file_id = self.paths.add(record.path)
+        self.sizes.append(-1 if record.size is None else record.size)
+        if record.digest is not None and record.hash_algo == self.hash_algo:
+            self.digests[file_id] = bytes.fromhex(record.digest)
+        if record.template_id:
+            self.ids.add(record.template_id, file_id)
+        if record.semantic_digest:
+            self.semantic.add(bytes.fromhex(record.semantic_digest), file_id)
+        if self.signatures is not None and record.signature:
+            self.signatures.append((file_id, record.template_id or self.paths.name(file_id), record.signature))
+        return file_id
+
+    def computed_digests(self):
+        """(hash_algo, hex digest, path) of every digest computed during the search."""
+        return [(self.hash_algo, self.digests[file_id].hex(), self.paths[file_id]) for file_id in self.computed]
+
+    def materialize(self, groups, key=str):
+        """{key(group key): [paths]} of (group key, file ids) pairs, e.g. for the results dict."""
+        return {key(group_key): self.paths.paths(file_ids) for group_key, file_ids in groups}
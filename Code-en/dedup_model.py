@@ -0,0 +1,185 @@
+# dedup_model.py
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+# (results key, root label, group label format, empty message)
+DEDUP_ROOTS = [
+    ("id_duplicates", "Potential Duplicates by Template ID",
+     lambda key, n: f"ID: {key} ({n} files)", "No duplicates found based on ID."),
+    ("hash_duplicates", "Exact Duplicates by File Hash",
+     lambda key, n: f"Hash: {key[:12]}... ({n} files)", "No duplicates found based on hash."),
+    ("semantic_duplicates", "Same Requests and Matchers (Semantic Hash)",
+     lambda key, n: f"Semantic: {key[:12]}... ({n} files)", "No semantic duplicates found (or the check was not enabled)."),
+    ("near_duplicates", "Near Duplicates by Content Similarity",
+     lambda key, n: f"{key} ({n} files)", "No near duplicates found (or the check was not enabled)."),
+]
+FETCH_BATCH = 200
+TOP_LEVEL = 0
+
+
+class DedupResultsModel(QAbstractItemModel):
+    """
+    Two-level duplicate results (root -> group -> file) that are only turned into
+    rows on demand: groups and files are exposed through canFetchMore/fetchMore in
+    batches, so a result with thousands of groups costs nothing until it is expanded.
+    Index internal ids: 0 for roots, 1 + root for groups, and an encoding of
+    (root, group) for files.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = {}
+        self._groups = [[] for _ in DEDUP_ROOTS]
+        self._loaded_groups = [0 for _ in DEDUP_ROOTS]
+        self._loaded_files = {}
+        self._filter = ""
+        self._sort_order = None
+
+    # -- public API ------------------------------------------------------
+
+    def set_results(self, results):
+        self._results = results or {}
+        self._rebuild()
+
+    def clear(self):
+        self.set_results({})
+
+    def set_filter(self, text):
+        self._filter = text.strip().lower()
+        self._rebuild()
+
+    def group_count(self, root):
+        return len(self._groups[root])
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_order = order
+        self._rebuild()
+
+    # -- internals ---------------------------------------------------------
+
+    def _matches(self, key, files):
+        if not self._filter:
+            return True
+        return self._filter in str(key).lower() or any(self._filter in f.lower() for f in files)
+
+    def _rebuild(self):
+        self.beginResetModel()
+        for root, (results_key, *_rest) in enumerate(DEDUP_ROOTS):
+            groups = [(key, files) for key, files in self._results.get(results_key, {}).items()
+                      if self._matches(key, files)]
+            if self._sort_order is not None:
+                groups.sort(key=lambda group: len(group[1]), reverse=self._sort_order == Qt.DescendingOrder)
+            self._groups[root] = groups
+            self._loaded_groups[root] = 0
+        self._loaded_files = {}
+        self.endResetModel()
+
+    def _file_id(self, root, group):
+        return 1 + len(DEDUP_ROOTS) + group * len(DEDUP_ROOTS) + root
+
+    def _decode(self, index):
+        """Returns (level, root, group, file) for an index; level 0 = root, 1 = group, 2 = file."""
+        internal = index.internalId()
+        if internal == TOP_LEVEL:
+            return 0, index.row(), None, None
+        if internal <= len(DEDUP_ROOTS):
+            return 1, internal - 1, index.row(), None
+        group, root = divmod(internal - 1 - len(DEDUP_ROOTS), len(DEDUP_ROOTS))
+        return 2, root, group, index.row()
+
+    def _is_placeholder(self, root):
+        return not self._groups[root]
+
+    # -- QAbstractItemModel ------------------------------------------------
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, TOP_LEVEL)
+        level, root, group, _ = self._decode(parent)
+        if level == 0:
+            return self.createIndex(row, column, 1 + root)
+        return self.createIndex(row, column, self._file_id(root, parent.row()))
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        level, root, group, _ = self._decode(index)
+        if level == 0:
+            return QModelIndex()
+        if level == 1:
+            return self.createIndex(root, 0, TOP_LEVEL)
+        return self.createIndex(group, 0, 1 + root)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return len(DEDUP_ROOTS)
+        level, root, group, _ = self._decode(parent)
+        if level == 0:
+            return 1 if self._is_placeholder(root) else self._loaded_groups[root]
+        if level == 1 and not self._is_placeholder(root):
+            return self._loaded_files.get((root, group), 0)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return True
+        level, root, _, _ = self._decode(parent)
+        return level == 0 or (level == 1 and not self._is_placeholder(root))
+
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return False
+        level, root, group, _ = self._decode(parent)
+        if level == 0:
+            return self._loaded_groups[root] < len(self._groups[root])
+        if level == 1 and not self._is_placeholder(root):
+            return self._loaded_files.get((root, group), 0) < len(self._groups[root][group][1])
+        return False
+
+    def fetchMore(self, parent):
+        if not parent.isValid():
+            return
+        level, root, group, _ = self._decode(parent)
+        if level == 0:
+            loaded, total = self._loaded_groups[root], len(self._groups[root])
+        else:
+            loaded, total = self._loaded_files.get((root, group), 0), len(self._groups[root][group][1])
+        count = min(FETCH_BATCH, total - loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, loaded, loaded + count - 1)
+        if level == 0:
+            self._loaded_groups[root] += count
+        else:
+            self._loaded_files[(root, group)] = loaded + count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        level, root, group, row = self._decode(index)
+        _key, root_label, group_label, empty_message = DEDUP_ROOTS[root]
+        if level == 0:
+            if index.column() != 0:
+                return None
+            return root_label if role == Qt.DisplayRole else f"{len(self._groups[root])} groups"
+        if level == 1:
+            if index.column() != 0:
+                return None
+            if self._is_placeholder(root):
+                return empty_message
+            key, files = self._groups[root][group]
+            return group_label(key, len(files))
+        files = self._groups[root][group][1]
+        return files[row] if index.column() == 1 else ""
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return ("Duplicate Item (ID / Hash / Similarity)", "File Path")[section]
+        return None
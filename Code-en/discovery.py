@@ -0,0 +1,109 @@
+# discovery.py
+import os
+import tarfile
+import zipfile
+from fnmatch import fnmatch
+from archive_source import is_archive, list_members, member_path
+
+DEFAULT_INCLUDE = ("*.yaml", "*.yml")
+DEFAULT_EXCLUDE = (".git", ".github")
+
+
+def parse_globs(text):
+    """Splits a ';' or ',' separated glob list as typed in the UI."""
+    return tuple(part.strip() for part in text.replace(",", ";").split(";") if part.strip())
+
+
+def _matches(name, rel_path, patterns):
+    return any(fnmatch(name, pattern) or fnmatch(rel_path, pattern) for pattern in patterns)
+
+
+def walk_templates(root, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE, follow_symlinks=False):
+    """
+    Yields template file paths under 'root' as they are found.
+    Directories are walked iteratively with os.scandir, so the first paths are
+    available immediately. 'include' globs are matched against file names and
+    root-relative paths; 'exclude' globs prune files and whole directories.
+    A .zip or tar archive as 'root' yields its members as archive-qualified paths.
+    """
+    root = os.path.abspath(root)
+    if is_archive(root) and os.path.isfile(root):
+        yield from walk_archive(root, include, exclude)
+        return
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            rel_path = os.path.relpath(entry.path, root).replace(os.sep, "/")
+            if exclude and _matches(entry.name, rel_path, exclude):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and _matches(entry.name, rel_path, include):
+                    yield entry.path
+            except OSError:
+                continue
+        # Reversed so directories are visited in name order.
+        stack.extend(reversed(subdirs))
+
+
+def walk_archive(archive, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE):
+    """Yields 'archive!/member' paths of the template members of an archive, in archive order."""
+    try:
+        names = list_members(archive)
+    except (OSError, tarfile.TarError, zipfile.BadZipFile):
+        return
+    for name in names:
+        parts = name.strip("/").split("/")
+        if exclude and any(_matches(parts[i], "/".join(parts[:i + 1]), exclude) for i in range(len(parts))):
+            continue
+        if _matches(parts[-1], "/".join(parts), include):
+            yield member_path(archive, name)
+
+
+def expand_archives(paths, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE):
+    """Replaces archives in a list of selected files by their template members (streamed when there are any)."""
+    if not any(is_archive(path) for path in paths):
+        return paths
+    return (member for path in paths
+            for member in (walk_archive(path, include, exclude) if is_archive(path) else (path,)))
+
+
+def is_template(path, root, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE):
+    """Tells whether walk_templates(root, include, exclude) would yield 'path'."""
+    rel_path = os.path.relpath(os.path.abspath(path), os.path.abspath(root)).replace(os.sep, "/")
+    if rel_path.startswith("../"):
+        return False
+    parts = rel_path.split("/")
+    if exclude and any(_matches(parts[i], "/".join(parts[:i + 1]), exclude) for i in range(len(parts))):
+        return False
+    return _matches(parts[-1], rel_path, include)
+
+
+def walk_directories(root, exclude=DEFAULT_EXCLUDE, follow_symlinks=False):
+    """Yields 'root' and every directory below it that walk_templates would enter."""
+    root = os.path.abspath(root)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        yield directory
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in reversed(entries):
+            rel_path = os.path.relpath(entry.path, root).replace(os.sep, "/")
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks) and not (
+                        exclude and _matches(entry.name, rel_path, exclude)):
+                    stack.append(entry.path)
+            except OSError:
+                continue
@@ -0,0 +1,713 @@
+# engine.py
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from archive_source import ArchiveWriter, hold_archives, is_archive, member_path, read_file, release_archives
+from classification_manifest import ClassificationManifest
+from dedup_index import DedupIndex
+from discovery import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, is_template, walk_templates
+from exact_dedup import DEFAULT_HASH_ALGO, find_exact_duplicates, new_hasher
+from git_source import GitSource
+from metadata_cache import MetadataCache
+from near_dedup import find_near_duplicates
+from placement import DEFAULT_PLACEMENT, execute_placements, plan_placements
+from run_stats import RunStats
+from semantic_dedup import find_semantic_duplicates, semantic_digest
+from template_analysis import SEVERITY_TO_FOLDER_MAP, analyze_templates
+from template_index import DEFAULT_INDEX_PATH, TemplateIndex
+from template_metadata import load_full, load_header
+from template_validation import ERROR, SYNTAX_RULE, WARNING, Diagnostic, LintConfig
+from watch import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, create_watcher
+
+DEFAULT_FOLDER = "other_or_no_severity"
+# Written next to classification_debug.log in the destination folder.
+TRACE_FILE_NAME = "classification_trace.json"
+
+
+class TaskCancelled(Exception):
+    """Raised between file batches of a run once request_stop() was called."""
+
+
+class TemplateEngine:
+    """
+    Qt-free classification and deduplication engine.
+    Progress is reported through the on_* hooks, which do nothing by default;
+    the GUI Worker overrides them to emit Qt signals, the CLI to write to stderr.
+    'pool' (a ProcessPoolExecutor) and 'io_pool' (a ThreadPoolExecutor) may be
+    shared by several engines running at once; without them every run starts its
+    own. With a shared pool 'jobs' still bounds the chunks a run keeps in flight.
+    """
+
+    def __init__(self, jobs=1, cache_path=None, hash_algo=DEFAULT_HASH_ALGO, placement=DEFAULT_PLACEMENT,
+                 io_jobs=8, near_threshold=None, semantic=False, trace_path=None, pool=None, io_pool=None):
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.cache_path = cache_path
+        self.hash_algo = hash_algo
+        self.placement = placement
+        self.io_jobs = max(1, io_jobs)
+        # None disables near-duplicate detection, which needs a full parse of every template.
+        self.near_threshold = near_threshold
+        self.semantic = semantic
+        # Chrome trace of a run; classification defaults to its destination folder.
+        self.trace_path = trace_path
+        self.pool = pool
+        self.io_pool = io_pool
+        # RunStats of the classification or deduplication in progress.
+        self.stats = None
+        self._stop_requested = threading.Event()
+        self._holds_archives = False
+
+    def on_log(self, message):
+        pass
+
+    def on_percent(self, value):
+        pass
+
+    def on_discovered(self, count):
+        pass
+
+    def on_classified(self, record, folder, destination):
+        pass
+
+    def on_stats(self, summary):
+        pass
+
+    def on_finished(self, result):
+        pass
+
+    def on_idle(self):
+        """The run waits for more work (e.g. watch mode between syncs): buffered progress should be shown now."""
+        pass
+
+    def _open_cache(self):
+        if not self.cache_path:
+            return None
+        try:
+            return MetadataCache(self.cache_path)
+        except Exception as e:
+            self.on_log(f"Metadata cache unavailable, analyzing every file: {e}")
+            return None
+
+    def _close_cache(self, cache):
+        if cache is None:
+            return
+        try:
+            evicted = cache.evict_missing()
+            self.on_log(f"{cache.summary()} {evicted} stale entries evicted.")
+            cache.close()
+        except Exception as e:
+            self.on_log(f"Failed to update metadata cache: {e}")
+
+    def _prepare_source(self, file_list):
+        """
+        Returns (paths, total_files). A list or a git_source.GitSource keeps its
+        length; any other iterable (e.g. discovery.walk_templates) is streamed, so
+        total_files is None and the running count is reported through on_discovered
+        instead of a percentage.
+        """
+        if isinstance(file_list, GitSource) and file_list.rev:
+            self.on_log(f"Git: {len(file_list)} templates changed by {file_list.rev}.")
+        if isinstance(file_list, (list, tuple, GitSource)):
+            return file_list, len(file_list)
+        return self._count_discovered(file_list), None
+
+    def _count_discovered(self, paths):
+        count = 0
+        for count, path in enumerate(paths, 1):
+            if count % 200 == 0:
+                self.on_discovered(count)
+            yield path
+        self.on_discovered(count)
+
+    def _start_message(self, total_files, noun):
+        if total_files is None:
+            return f"Scanning folder, starting {noun} with {self.jobs} job(s) as files are found..."
+        return f"Found {total_files} files, starting {noun} with {self.jobs} job(s)..."
+
+    def _report_progress(self, done, total_files):
+        if total_files:
+            self.on_percent(int(done * 100 / total_files))
+
+    def _start_run(self):
+        """Keeps the archives read by this run open until _finish(), whatever other runs of the process do."""
+        if not self._holds_archives:
+            self._holds_archives = True
+            hold_archives()
+
+    def _finish(self, result):
+        if self._holds_archives:
+            self._holds_archives = False
+            release_archives()
+        self.on_finished(result)
+        return result
+
+    def _report_stats(self, stats, trace_path=None):
+        """Sends the summary of a finished run to on_stats, after writing its trace to 'trace_path'."""
+        self.stats = None
+        summary = stats.finish().summary()
+        if trace_path:
+            try:
+                Path(trace_path).parent.mkdir(parents=True, exist_ok=True)
+                stats.write_trace(trace_path)
+                summary["trace"] = str(trace_path)
+                self.on_log(f"Trace saved to: {trace_path}")
+            except Exception as e:
+                self.on_log(f"Failed to write trace file: {e}")
+        self.on_stats(summary)
+
+    def do_organize_templates(self, file_list, target_dir_str):
+        self._start_run()
+        self.on_log("Task started: Classifying templates...")
+        stats = self.stats = RunStats("classify")
+        try:
+            result = self._organize(file_list, target_dir_str, stats=stats)
+        except TaskCancelled:
+            self.stats = None
+            self.on_log("Classification cancelled.")
+            return self._finish({"status": "classification_cancelled"})
+        if result.get("processed"):
+            default_trace = Path(f"{target_dir_str}.trace.json") if is_archive(target_dir_str) else \
+                Path(target_dir_str) / TRACE_FILE_NAME
+            self._report_stats(stats, self.trace_path or default_trace)
+        return self._finish(result)
+
+    def _classify_entries(self, file_list, stats, debug_entries):
+        """
+        Phase 1 of a classification: analyzes every template and decides its folder.
+        Returns [(source path, folder name, record)], empty when there is nothing to process.
+        """
+        paths, total_files = self._prepare_source(file_list)
+        if total_files == 0:
+            return []
+        self.on_log(self._start_message(total_files, "process"))
+        with stats.phase("cache"):
+            cache = self._open_cache()
+
+        entries = []
+        started = time.perf_counter()
+        try:
+            for record in analyze_templates(stats.timed(paths, "discovery"), self.jobs, cache=cache,
+                                            pool=self.pool, check=self._check_cancelled):
+                stats.record(record)
+                if record.error:
+                    debug_entries.append(f"Could not parse {record.path}: {record.error}")
+                extracted_value = record.severity
+
+                target_folder_name = DEFAULT_FOLDER
+                if extracted_value:
+                    target_folder_name = SEVERITY_TO_FOLDER_MAP.get(extracted_value.lower(), extracted_value)
+                entries.append((record.path, target_folder_name, record))
+                # Analysis is the first half of the progress bar, placement the second.
+                self._report_progress(len(entries), total_files and total_files * 2)
+        except TaskCancelled:
+            # What was analyzed so far is kept for the next run.
+            self._close_cache(cache)
+            raise
+        stats.add_phase("analysis", started, time.perf_counter() - started)
+
+        with stats.phase("cache"):
+            self._close_cache(cache)
+        return entries
+
+    def _organize(self, file_list, target_dir_str, manifest=None, stats=None):
+        """
+        Classifies 'file_list' into 'target_dir_str' and records every placement in
+        the folder's manifest, deleting copies that a source left behind in another
+        severity folder. Returns the classification result without finishing the task.
+        Phases, counters and per-file timings go to 'stats' when given.
+        A .zip or tar path as 'target_dir_str' writes a new archive instead.
+        """
+        stats = stats or RunStats("classify")
+        if is_archive(target_dir_str):
+            return self._organize_into_archive(file_list, target_dir_str, stats)
+        # Resolved, so that destinations compare with the manifest's however the folder is spelled.
+        ORGANIZED_TEMPLATES_DIR = Path(os.path.realpath(target_dir_str))
+        DEBUG_LOG_FILE = ORGANIZED_TEMPLATES_DIR / "classification_debug.log"
+        ORGANIZED_TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
+        current_debug_log_entries = []
+        entries = self._classify_entries(file_list, stats, current_debug_log_entries)
+        processed = len(entries)
+        if processed == 0:
+            self.on_log("Error: No files to process.")
+            return {"status": "classification_done", "processed": 0}
+
+        # Phase 2: plan every destination, then place the files in batches.
+        with stats.phase("planning"):
+            if manifest is None:
+                manifest = ClassificationManifest(ORGANIZED_TEMPLATES_DIR)
+            placements, renamed = plan_placements(entries, str(ORGANIZED_TEMPLATES_DIR),
+                                                  manifest.reserved(source for source, _, _ in entries))
+        for source, destination in renamed:
+            current_debug_log_entries.append(f"Name collision: {source} placed as {destination}")
+        if renamed:
+            self.on_log(f"Renamed {len(renamed)} templates whose file names collided in the same folder.")
+
+        copy_errors = 0
+        stale_removed = 0
+        placed_by = Counter()
+        # Never deleted as stale: every destination this run writes.
+        destinations = {manifest.normalize(placement.destination) for placement in placements}
+        started = time.perf_counter()
+        try:
+            for done, (placement, result) in enumerate(
+                    execute_placements(placements, self.placement, self.io_jobs, pool=self.io_pool,
+                                       check=self._check_cancelled), 1):
+                if isinstance(result, Exception) and not isinstance(result, shutil.SameFileError):
+                    copy_errors += 1
+                    self.on_log(f"Error: Failed to {self.placement} {Path(placement.source).name}: {result}")
+                    continue
+                if not isinstance(result, Exception):
+                    placed_by[result] += 1
+                # A template whose severity changed leaves its old copy behind.
+                previous = manifest.destination(placement.source)
+                if previous and previous != manifest.normalize(placement.destination):
+                    stale_removed += manifest.remove_copy(placement.source, keep=destinations)
+                manifest.record(placement.source, placement.destination)
+                self.on_classified(placement.record, placement.folder, placement.destination)
+                self._report_progress(len(placements) + done, len(placements) * 2)
+        except TaskCancelled:
+            # Every file placed before the cancellation is recorded, so the next run can clean up after it.
+            self._save_manifest(manifest)
+            raise
+        stats.add_phase("placement", started, time.perf_counter() - started)
+        stats.count("placed", sum(placed_by.values()))
+        stats.count("copy_errors", copy_errors)
+        stats.count("renamed", len(renamed))
+        with stats.phase("manifest"):
+            self._save_manifest(manifest)
+        if stale_removed:
+            self.on_log(f"Removed {stale_removed} stale copies left in other severity folders.")
+
+        self.on_log(f"Classified {processed} files.")
+        if self.placement != "copy" and placed_by["copy"]:
+            self.on_log(f"Note: '{self.placement}' was not possible for {placed_by['copy']} files "
+                        f"(e.g. across devices), they were copied instead.")
+        with stats.phase("debug log"):
+            try:
+                with open(DEBUG_LOG_FILE, 'w', encoding='utf-8') as debug_f:
+                    debug_f.write("Nuclei Template Classification Debug Log\n---\n")
+                    debug_f.write("\n".join(current_debug_log_entries))
+                self.on_log(f"Detailed debug log saved to: {DEBUG_LOG_FILE}")
+            except Exception as e:
+                self.on_log(f"Failed to write log file: {e}")
+
+        return {"status": "classification_done", "processed": processed,
+                "parse_errors": sum(1 for _, _, record in entries if record.error),
+                "copy_errors": copy_errors, "renamed": len(renamed), "stale_removed": stale_removed,
+                "placement": dict(placed_by)}
+
+    def _organize_into_archive(self, file_list, archive_path, stats):
+        """
+        Classifies 'file_list' into a new .zip or tar archive with one folder per
+        severity and the debug log at its root. An existing archive is replaced:
+        there is no manifest, every run writes the whole archive.
+        """
+        debug_entries = []
+        entries = self._classify_entries(file_list, stats, debug_entries)
+        if not entries:
+            self.on_log("Error: No files to process.")
+            return {"status": "classification_done", "processed": 0}
+        with stats.phase("planning"):
+            placements, renamed = plan_placements(entries, "")
+        for source, destination in renamed:
+            debug_entries.append(f"Name collision: {source} placed as {destination}")
+        if renamed:
+            self.on_log(f"Renamed {len(renamed)} templates whose file names collided in the same folder.")
+
+        copy_errors = 0
+        started = time.perf_counter()
+        try:
+            Path(archive_path).parent.mkdir(parents=True, exist_ok=True)
+            writer = ArchiveWriter(archive_path)
+        except Exception as e:
+            self.on_log(f"Error: Failed to create archive {archive_path}: {e}")
+            return {"status": "classification_done", "processed": len(entries), "copy_errors": len(entries)}
+        try:
+            for done, placement in enumerate(placements, 1):
+                if done % 128 == 0:
+                    self._check_cancelled()
+                try:
+                    data = read_file(placement.source)
+                except OSError as e:
+                    copy_errors += 1
+                    self.on_log(f"Error: Failed to read {placement.source}: {e}")
+                    continue
+                writer.add(placement.destination, data, self._mtime(placement.source))
+                self.on_classified(placement.record, placement.folder,
+                                   member_path(archive_path, placement.destination.replace("\\", "/")))
+                self._report_progress(len(placements) + done, len(placements) * 2)
+            writer.add("classification_debug.log", ("Nuclei Template Classification Debug Log\n---\n" +
+                                                    "\n".join(debug_entries)).encode("utf-8"))
+            writer.close()
+        except TaskCancelled:
+            writer.discard()
+            raise
+        except Exception as e:
+            writer.discard()
+            self.on_log(f"Error: Failed to write archive {archive_path}: {e}")
+            return {"status": "classification_done", "processed": len(entries), "copy_errors": len(entries)}
+        stats.add_phase("placement", started, time.perf_counter() - started)
+        stats.count("placed", len(placements) - copy_errors)
+        stats.count("copy_errors", copy_errors)
+        stats.count("renamed", len(renamed))
+        self.on_log(f"Classified {len(entries)} files into {archive_path} "
+                    f"(debug log stored as classification_debug.log inside it).")
+        return {"status": "classification_done", "processed": len(entries),
+                "parse_errors": sum(1 for _, _, record in entries if record.error),
+                "copy_errors": copy_errors, "renamed": len(renamed), "stale_removed": 0,
+                "placement": {"copy": len(placements) - copy_errors}, "archive": str(archive_path)}
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def _save_manifest(self, manifest):
+        try:
+            manifest.save()
+        except Exception as e:
+            self.on_log(f"Failed to write classification manifest: {e}")
+
+    def request_stop(self):
+        """
+        Asks the running task to stop at its next file batch (watch mode also
+        while it waits for changes); safe to call from any thread.
+        """
+        self._stop_requested.set()
+
+    def _check_cancelled(self):
+        if self._stop_requested.is_set():
+            raise TaskCancelled()
+
+    def do_watch_templates(self, roots, target_dir_str, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE,
+                           debounce=DEFAULT_DEBOUNCE, poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        Keeps 'target_dir_str' in sync with the templates under 'roots' until
+        request_stop() (or Ctrl+C). The first pass only processes sources that are
+        new or changed since the manifest was written; afterwards, bursts of file
+        system events are debounced and only the affected paths are re-classified.
+        """
+        if self.placement == "move":
+            self.on_log("Error: Watch mode cannot use the 'move' placement, it would empty the watched folders.")
+            return self._finish({"status": "watch_failed"})
+        if is_archive(target_dir_str):
+            self.on_log("Error: Watch mode needs a destination folder, not an archive.")
+            return self._finish({"status": "watch_failed"})
+        self._start_run()
+        self.on_log("Task started: Watching templates...")
+        roots = [os.path.abspath(root) for root in roots]
+        target_dir = os.path.abspath(target_dir_str)
+        Path(target_dir).mkdir(parents=True, exist_ok=True)
+        manifest = ClassificationManifest(target_dir)
+        totals = Counter()
+        watcher = None
+        try:
+            watcher = create_watcher(roots, include, exclude, poll_interval)
+            self._sync(roots, roots, target_dir, include, exclude, manifest, totals)
+            self.on_log(f"Watching {len(roots)} folder(s) for changes ({watcher.name})...")
+            self.on_idle()
+            pending, last_event = set(), 0.0
+            while not self._stop_requested.is_set():
+                events = watcher.poll(min(0.5, debounce))
+                now = time.monotonic()
+                if events:
+                    pending.update(events)
+                    last_event = now
+                elif pending and now - last_event >= debounce:
+                    batch, pending = pending, set()
+                    self._sync(batch, roots, target_dir, include, exclude, manifest, totals)
+        except (KeyboardInterrupt, TaskCancelled):
+            pass
+        finally:
+            if watcher is not None:
+                watcher.close()
+        self.on_log("Stopped watching.")
+        return self._finish({"status": "watch_done", **totals})
+
+    def _sync(self, paths, roots, target_dir, include, exclude, manifest, totals):
+        """Re-classifies the changed templates among 'paths' and deletes copies of removed ones."""
+        target_prefix = os.path.join(target_dir, "")
+        changed, removed = [], []
+        for path in sorted(paths):
+            if path == target_dir or path.startswith(target_prefix):
+                continue
+            root = next((r for r in roots if path == r or path.startswith(os.path.join(r, ""))), None)
+            if root is None:
+                continue
+            if os.path.isdir(path):
+                seen = set()
+                for file_path in walk_templates(path, include, exclude):
+                    if file_path.startswith(target_prefix) or not is_template(file_path, root, include, exclude):
+                        continue
+                    seen.add(file_path)
+                    if not self._is_current(manifest, file_path):
+                        changed.append(file_path)
+                removed.extend(source for source in manifest.sources_under(path) if source not in seen)
+            elif os.path.isfile(path):
+                if is_template(path, root, include, exclude) and not self._is_current(manifest, path):
+                    changed.append(path)
+            elif is_template(path, root, include, exclude):
+                removed.append(path)
+            else:
+                # Possibly a removed folder: drop everything that was placed from inside it.
+                removed.extend(manifest.sources_under(path))
+
+        changed = list(dict.fromkeys(changed))
+        removed = [source for source in dict.fromkeys(removed) if manifest.destination(source)]
+        deleted = sum(manifest.remove_copy(source) for source in removed)
+        if changed:
+            result = self._organize(changed, target_dir, manifest)
+            totals["processed"] += result.get("processed", 0)
+            totals["copy_errors"] += result.get("copy_errors", 0)
+        elif removed:
+            self._save_manifest(manifest)
+        if changed or removed:
+            totals["syncs"] += 1
+            totals["removed"] += len(removed)
+            self.on_log(f"Synced: {len(changed)} new or changed, {len(removed)} removed "
+                        f"({deleted} copies deleted).")
+        self.on_idle()
+
+    @staticmethod
+    def _is_current(manifest, path):
+        try:
+            return manifest.is_current(path, os.stat(path))
+        except OSError:
+            return False
+
+    def do_find_duplicates(self, file_list):
+        """
+        Reports duplicate IDs and identical files (plus semantic and near
+        duplicates when enabled) among 'file_list'. For a git_source.GitSource,
+        identical files are found by blob id: tracked files that are unchanged in
+        the work tree take theirs from the git index and are never hashed, the
+        others get theirs from "git hash-object".
+        """
+        self._start_run()
+        self.on_log("Task started: Finding duplicate templates...")
+        paths, total_files = self._prepare_source(file_list)
+        if total_files == 0:
+            self.on_log("Error: No files to process.")
+            return self._finish({"status": "deduplication_done", "results": {}})
+        self.on_log(self._start_message(total_files, "scan"))
+        stats = self.stats = RunStats("deduplicate")
+        with stats.phase("cache"):
+            cache = self._open_cache()
+        deep = self.semantic or self.near_threshold is not None
+        blobs = file_list.blobs if isinstance(file_list, GitSource) else None
+        # Records are folded into the index as they arrive; only duplicate groups become path lists.
+        index = DedupIndex(file_list.hash_algo if blobs is not None else self.hash_algo,
+                           near=self.near_threshold is not None)
+        if blobs is not None:
+            self.on_log(f"Git: {len(blobs) - file_list.hashed} of {total_files} templates are unchanged since the "
+                        f"git index, {file_list.hashed} were hashed by git; their {index.hash_algo} blob ids are "
+                        f"used as content hashes.")
+            stats.count("git_blob_ids", len(blobs) - file_list.hashed)
+            stats.count("git_hashed", file_list.hashed)
+
+        def on_hash_error(path, e):
+            self.on_log(f"Error calculating hash for {path}: {e}")
+
+        started = time.perf_counter()
+        try:
+            for record in analyze_templates(stats.timed(paths, "discovery"), self.jobs, cache=cache, deep=deep,
+                                            pool=self.pool, check=self._check_cancelled):
+                stats.record(record)
+                if record.size is None:
+                    self.on_log(f"Error calculating hash for {record.path}: {record.error}")
+                elif blobs is not None and record.path in blobs:
+                    record.digest, record.hash_algo = blobs[record.path], index.hash_algo
+                index.add(record)
+                self._report_progress(len(index.paths), total_files)
+            stats.add_phase("analysis", started, time.perf_counter() - started)
+
+            if len(index.paths) == 0:
+                self._close_cache(cache)
+                self.on_log("Error: No files to process.")
+                return self._finish({"status": "deduplication_done", "results": {}})
+
+            with stats.phase("hashing"):
+                hash_groups = find_exact_duplicates(index, on_error=on_hash_error, check=self._check_cancelled)
+        except TaskCancelled:
+            self.stats = None
+            if cache is not None:
+                cache.update_digests(index.computed_digests())
+            self._close_cache(cache)
+            self.on_log("Deduplication cancelled.")
+            return self._finish({"status": "deduplication_cancelled"})
+        with stats.phase("cache"):
+            if cache is not None:
+                cache.update_digests(index.computed_digests())
+            self._close_cache(cache)
+        results = {
+            "id_duplicates": index.materialize(index.ids.groups()),
+            "hash_duplicates": index.materialize(hash_groups, key=bytes.hex),
+            "total_scanned": len(index.paths)
+        }
+        try:
+            if self.semantic:
+                with stats.phase("semantic grouping"):
+                    groups = find_semantic_duplicates(index, check=self._check_cancelled)
+                    results["semantic_duplicates"] = index.materialize(groups, key=bytes.hex)
+            if self.near_threshold is not None:
+                self.on_log(f"Comparing template contents (similarity >= {self.near_threshold:.0%})...")
+                with stats.phase("near grouping"):
+                    near = find_near_duplicates(index.signatures, self.near_threshold, check=self._check_cancelled)
+                    results["near_duplicates"] = {label: index.paths.paths(ids) for label, ids in near.items()}
+        except TaskCancelled:
+            self.stats = None
+            self.on_log("Deduplication cancelled.")
+            return self._finish({"status": "deduplication_cancelled"})
+        self.on_log("Deduplication scan finished.")
+        self._report_stats(stats, self.trace_path)
+        return self._finish({"status": "deduplication_done", "results": results})
+
+    def do_index_templates(self, roots, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE,
+                           index_path=DEFAULT_INDEX_PATH):
+        """Refreshes the search index for the templates under 'roots'; only changed files are read."""
+        self._start_run()
+        self.on_log("Task started: Updating template index...")
+        try:
+            with TemplateIndex(index_path) as index:
+                stats = index.refresh(roots, include, exclude, self.jobs, on_progress=self._index_progress,
+                                      pool=self.pool, check=self._check_cancelled)
+        except TaskCancelled:
+            # The index is only written once every changed file was read, so it is left as it was.
+            self.on_log("Index update cancelled.")
+            return self._finish({"status": "index_cancelled"})
+        except Exception as e:
+            self.on_log(f"Error: Failed to update the template index: {e}")
+            return self._finish({"status": "index_failed"})
+        self.on_log(f"Index updated: {stats['total']} templates, {stats['indexed']} new or changed, "
+                    f"{stats['removed']} removed.")
+        return self._finish({"status": "index_done", **stats})
+
+    def _index_progress(self, done, total):
+        self._check_cancelled()
+        self._report_progress(done, total)
+
+    def do_lint_templates(self, file_list, lint=None):
+        """
+        Runs the rules of 'lint' (a LintConfig, every built-in rule by default) over
+        every template, on the process pool, and reports the findings with the run's throughput.
+        """
+        lint = lint or LintConfig()
+        self._start_run()
+        self.on_log("Task started: Linting templates...")
+        paths, total_files = self._prepare_source(file_list)
+        if total_files == 0:
+            self.on_log("Error: No files to process.")
+            return self._finish({"status": "lint_done", "results": {}})
+        try:
+            lint.rules()
+        except (OSError, ImportError, SyntaxError, ValueError) as e:
+            self.on_log(f"Error: {e}")
+            return self._finish({"status": "lint_failed"})
+        self.on_log(self._start_message(total_files, "linting"))
+        started = time.perf_counter()
+        findings = []
+        by_rule, by_severity = Counter(), Counter()
+        processed = unreadable = 0
+        try:
+            for record in analyze_templates(paths, self.jobs, lint=lint, pool=self.pool,
+                                            check=self._check_cancelled):
+                processed += 1
+                self._report_progress(processed, total_files)
+                if record.size is None:
+                    unreadable += 1
+                    self.on_log(f"Error reading {record.path}: {record.error}")
+                    continue
+                diagnostics = record.diagnostics
+                if diagnostics is None:
+                    # The file failed before the rules ran (e.g. it is not UTF-8).
+                    diagnostics = [Diagnostic(1, 1, ERROR, f"Cannot parse: {record.error}", SYNTAX_RULE)]
+                for diagnostic in diagnostics:
+                    findings.append({"path": record.path, **diagnostic.as_dict()})
+                    by_rule[diagnostic.rule] += 1
+                    by_severity[diagnostic.severity] += 1
+        except TaskCancelled:
+            self.on_log("Linting cancelled.")
+            return self._finish({"status": "lint_cancelled"})
+        elapsed = time.perf_counter() - started
+        if processed == 0:
+            self.on_log("Error: No files to process.")
+            return self._finish({"status": "lint_done", "results": {}})
+        rate = processed / elapsed if elapsed else 0.0
+        self.on_log(f"Linted {processed} templates in {elapsed:.2f}s ({rate:.0f} templates/s, {self.jobs} job(s)): "
+                    f"{by_severity[ERROR]} error(s), {by_severity[WARNING]} warning(s).")
+        results = {
+            "findings": findings,
+            "errors": by_severity[ERROR],
+            "warnings": by_severity[WARNING],
+            "by_rule": dict(by_rule.most_common()),
+            "files_with_findings": len({finding["path"] for finding in findings}),
+            "total_scanned": processed,
+            "unreadable": unreadable,
+        }
+        stats = {"files": processed, "seconds": round(elapsed, 3), "files_per_second": round(rate, 1),
+                 "jobs": self.jobs}
+        return self._finish({"status": "lint_done", "results": results, "stats": stats})
+
+    def get_template_severity(self, file_path: Path, debug_log_entries):
+        """
+        Extracts the severity/risk level from a template file.
+        It first looks for 'severity', then falls back to 'risk'.
+        """
+        try:
+            with file_path.open('r', encoding='utf-8') as f:
+                data = load_header(f.read())
+                if isinstance(data, dict) and 'info' in data and isinstance(data['info'], dict):
+                    info_block = data['info']
+                    # Prioritize 'severity'
+                    severity = info_block.get('severity')
+                    if severity and isinstance(severity, str):
+                        return severity.lower()
+
+                    # Fallback to 'risk'
+                    risk = info_block.get('risk')
+                    if risk and isinstance(risk, str):
+                        return risk.lower()
+
+        except Exception as e:
+            debug_log_entries.append(f"Could not parse {file_path}: {e}")
+        return None
+
+    def get_file_hash_for_dedup(self, file_path: Path, hash_algo=DEFAULT_HASH_ALGO):
+        hasher = new_hasher(hash_algo)
+        try:
+            with file_path.open('rb') as f:
+                while chunk := f.read(8192):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+        except Exception as e:
+            self.on_log(f"Error calculating hash for {file_path}: {e}")
+            return None
+
+    def get_semantic_hash_for_dedup(self, file_path: Path):
+        """
+        Hash of the template's requests and matchers, independent of formatting,
+        key order and the 'id'/'info' blocks. None if it cannot be parsed.
+        """
+        try:
+            with file_path.open('r', encoding='utf-8') as f:
+                return semantic_digest(load_full(f.read()))
+        except Exception as e:
+            self.on_log(f"Error calculating semantic hash for {file_path}: {e}")
+            return None
+
+    def get_template_id_for_dedup(self, file_path: Path):
+        try:
+            with file_path.open('r', encoding='utf-8') as f:
+                data = load_header(f.read())
+                if isinstance(data, dict) and 'id' in data:
+                    template_id = data.get('id')
+                    if template_id and isinstance(template_id, str):
+                        return template_id
+        except Exception:
+            pass
+        return None
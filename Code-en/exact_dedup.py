@@ -0,0 +1,131 @@
+# exact_dedup.py
+import hashlib
+import os
+from array import array
+from collections import defaultdict
+from archive_source import read_member, split_member_path
+from dedup_index import GroupIndex
+
+# Name -> hasher factory. BLAKE2b with a 16-byte digest is the fast option;
+# it is still collision resistant enough for duplicate detection.
+HASH_ALGORITHMS = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "md5": hashlib.md5,
+    "blake2b": lambda: hashlib.blake2b(digest_size=16),
+}
+DEFAULT_HASH_ALGO = "sha256"
+# Git blob object ids, by the repository's object format: the hash of
+# "blob <size>\0" followed by the content. Used by git_source inputs, which get
+# them from git; hashing files with it only happens where git could not.
+GIT_BLOB_ALGORITHMS = {"git-sha1": "sha1", "git-sha256": "sha256"}
+EDGE_SIZE = 4096
+
+
+def new_hasher(hash_algo, size=None):
+    """
+    A hashlib object for 'hash_algo'. A git blob algorithm hashes the object
+    header for a content of 'size' bytes first; without a size it is the plain
+    hash, which only suits partial digests such as edge_digest's.
+    """
+    git_algo = GIT_BLOB_ALGORITHMS.get(hash_algo)
+    if git_algo:
+        hasher = hashlib.new(git_algo)
+        if size is not None:
+            hasher.update(b"blob %d\0" % size)
+        return hasher
+    factory = HASH_ALGORITHMS.get(hash_algo)
+    return factory() if factory else hashlib.new(hash_algo)
+
+
+def file_digest(path, hash_algo=DEFAULT_HASH_ALGO):
+    """Raw digest bytes of a whole file or archive member."""
+    if split_member_path(path):
+        data = read_member(path)
+        hasher = new_hasher(hash_algo, len(data))
+        hasher.update(data)
+        return hasher.digest()
+    with open(path, 'rb') as f:
+        hasher = new_hasher(hash_algo, os.fstat(f.fileno()).st_size)
+        while chunk := f.read(1 << 16):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+def edge_digest(path, size, hash_algo=DEFAULT_HASH_ALGO, edge_size=EDGE_SIZE):
+    """Hashes only the first and last 'edge_size' bytes of a file."""
+    hasher = new_hasher(hash_algo)
+    if split_member_path(path):
+        data = read_member(path)
+        hasher.update(data[:edge_size])
+        hasher.update(data[max(edge_size, size - edge_size):][:edge_size])
+        return hasher.digest()
+    with open(path, 'rb') as f:
+        hasher.update(f.read(edge_size))
+        f.seek(max(edge_size, size - edge_size))
+        hasher.update(f.read(edge_size))
+    return hasher.digest()
+
+
+def _regroup(file_ids, key_func, paths, on_error):
+    groups = defaultdict(list)
+    for file_id in file_ids:
+        try:
+            groups[key_func(file_id)].append(file_id)
+        except OSError as e:
+            on_error(paths[file_id], e)
+    return [array('L', group) for group in groups.values() if len(group) > 1]
+
+
+def find_exact_duplicates(index, edge_size=EDGE_SIZE, on_error=None, check=None):
+    """
+    Returns [(raw digest, file ids)] of the byte-identical files in a
+    dedup_index.DedupIndex, duplicate groups only, ordered by their first file.
+    Files without a digest are bucketed by size first; within a size collision
+    only the first and last 'edge_size' bytes are hashed, and the full digest is
+    computed only for files that still collide. Digests already in the index (e.g. from the
+    metadata cache) are not recomputed; computed ones are added to it.
+    'on_error' is called with (path, exception) for files that cannot be read.
+    'check' is called before each size group and may raise to stop the search.
+    A size group with a known digest goes straight to full digests: an edge
+    comparison would have to read the files that already have one.
+    """
+    if on_error is None:
+        on_error = lambda path, e: None
+    paths, digests, hash_algo = index.paths, index.digests, index.hash_algo
+    by_size = GroupIndex()
+    for file_id, size in enumerate(index.sizes):
+        if size >= 0:
+            by_size.add(size, file_id)
+
+    def full_key(file_id):
+        digest = digests.get(file_id)
+        if digest is None:
+            digest = digests[file_id] = file_digest(paths[file_id], hash_algo)
+            index.computed.append(file_id)
+        return digest
+
+    def digest_each(file_ids):
+        for file_id in file_ids:
+            try:
+                full_key(file_id)
+            except OSError as e:
+                on_error(paths[file_id], e)
+
+    for size, group in by_size.groups():
+        if check is not None:
+            check()
+        if size <= 2 * edge_size or any(file_id in digests for file_id in group):
+            # Small files are covered entirely by one read, skip the partial stage.
+            digest_each(group)
+            continue
+        edge_key = lambda file_id: edge_digest(paths[file_id], size, hash_algo, edge_size)
+        for candidates in _regroup(group, edge_key, paths, on_error):
+            digest_each(candidates)
+
+    # Grouped by digest alone: git blob ids of files stored with clean filters
+    # (e.g. core.autocrlf) match although their work tree sizes differ.
+    by_digest = GroupIndex()
+    for file_id in sorted(digests):
+        by_digest.add(digests[file_id], file_id)
+    return by_digest.groups()
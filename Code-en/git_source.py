@@ -0,0 +1,133 @@
+# git_source.py
+# Templates of local git work trees as inputs. The index already holds the blob id of
+# every tracked file, and "git diff" names the files changed between revisions, so
+# neither needs the files to be read. Only local commands are run, never a fetch.
+import os
+import subprocess
+from discovery import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, is_template
+from exact_dedup import GIT_BLOB_ALGORITHMS
+
+# ls-files modes without a content blob of their own: symlinks and submodules.
+_NON_FILE_MODES = ("120000", "160000")
+
+
+class GitError(Exception):
+    """A git command failed, git is missing, or a folder is not inside a work tree."""
+
+
+def _git(cwd, *args, input=None):
+    try:
+        completed = subprocess.run(["git", "-C", cwd, *args], input=input, capture_output=True, check=True)
+    except FileNotFoundError:
+        raise GitError("git is not installed or not on PATH") from None
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise GitError(f"{cwd}: {message[-1] if message else f'git {args[0]} failed'}") from None
+    return completed.stdout
+
+
+def _names(output):
+    """Paths of a "-z" listing, decoded the way git stores them (UTF-8 on every platform)."""
+    return [name.decode("utf-8", "surrogateescape") for name in output.split(b"\0") if name]
+
+
+def object_format(root):
+    """exact_dedup name of the blob ids of the repository containing 'root'."""
+    value = _git(root, "rev-parse", "--show-object-format").decode().strip()
+    # Git before 2.29 echoes the unknown option; those versions only have SHA-1 repositories.
+    return f"git-{value}" if f"git-{value}" in GIT_BLOB_ALGORITHMS else "git-sha1"
+
+
+class GitSource:
+    """
+    Template paths of git work trees, for do_find_duplicates and
+    do_organize_templates: a sized iterable of absolute paths, like a file list.
+    'blobs' maps paths to their blob id (hex), in the repository's 'hash_algo':
+    files whose work tree content matches the index take it from there, without
+    being read; untracked and modified files are hashed by "git hash-object",
+    which applies the same clean filters (core.autocrlf, .gitattributes) as
+    "git add", so identical templates get the same id either way. 'hashed'
+    counts the latter. A file git could not hash is missing from 'blobs' and is
+    hashed the normal way by the caller.
+    'rev' limits the paths to the templates changed by a revision range: "A..B"
+    compares two commits, a single revision compares it with the work tree and
+    then also lists untracked templates. Files missing from the work tree are skipped.
+    """
+
+    def __init__(self, roots, rev=None, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE):
+        # "git diff" would take it as an option (e.g. --output=<file>), not as a revision.
+        if rev is not None and rev.startswith("-"):
+            raise GitError(f"{rev}: not a revision")
+        self.rev = rev
+        self.blobs = {}
+        self.hashed = 0
+        self.hash_algo = None
+        paths = {}
+        for root in [roots] if isinstance(roots, str) else roots:
+            root = os.path.abspath(root)
+            if not os.path.isdir(root):
+                raise GitError(f"{root}: not a folder")
+            hash_algo = object_format(root)
+            if self.hash_algo not in (None, hash_algo):
+                raise GitError(f"{root}: uses {hash_algo} object ids, the other folders {self.hash_algo}")
+            self.hash_algo = hash_algo
+            unhashed = []
+            for rel_path, blob in self._list(root):
+                path = os.path.join(root, rel_path.replace("/", os.sep))
+                if is_template(path, root, include, exclude):
+                    paths[path] = None
+                    if blob:
+                        self.blobs[path] = blob
+                    else:
+                        unhashed.append((rel_path, path))
+            self._hash_objects(root, unhashed)
+        self.paths = list(paths)
+
+    def _hash_objects(self, root, files):
+        """Adds the blob ids of (root-relative path, path) 'files' that git computes from the work tree."""
+        # --stdin-paths reads one path per line.
+        files = [(rel_path, path) for rel_path, path in files if "\n" not in rel_path]
+        if not files:
+            return
+        paths_in = "".join(f"{rel_path}\n" for rel_path, _ in files).encode("utf-8", "surrogateescape")
+        try:
+            blobs = _git(root, "hash-object", "--stdin-paths", input=paths_in).decode().split()
+        except GitError:
+            # E.g. a file removed since it was listed: the caller hashes them instead.
+            return
+        for (_, path), blob in zip(files, blobs):
+            self.blobs[path] = blob
+        self.hashed += len(blobs)
+
+    def _list(self, root):
+        """(root-relative path, blob id or None) of the files to process under 'root'."""
+        # Run inside 'root', ls-files and "diff --relative" list its subtree with root-relative paths.
+        blobs = {}
+        for line in _names(_git(root, "ls-files", "-s", "-z")):
+            info, rel_path = line.split("\t", 1)
+            mode, blob, stage = info.split(" ")
+            # Conflicted files (stage > 0) have several blobs and no single content.
+            blobs[rel_path] = blob if mode not in _NON_FILE_MODES and stage == "0" else None
+        changed = set(_names(_git(root, "diff-files", "--name-only", "--relative", "-z")))
+        for rel_path in changed:
+            blobs[rel_path] = None
+        if self.rev is None:
+            listed = sorted(blobs)
+            listed += sorted(_names(_git(root, "ls-files", "-o", "--exclude-standard", "-z")))
+        else:
+            listed = sorted(_names(_git(root, "diff", "--name-only", "--no-renames", "--diff-filter=d",
+                                        "--relative", "-z", self.rev, "--")))
+            changed.update(listed)
+            if ".." not in self.rev:
+                listed += sorted(_names(_git(root, "ls-files", "-o", "--exclude-standard", "-z")))
+        for rel_path in listed:
+            # Modified and diffed paths may be gone from the work tree; the others are known to exist.
+            if rel_path in changed and not os.path.isfile(os.path.join(root, rel_path)):
+                continue
+            yield rel_path, blobs.get(rel_path)
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
@@ -1 +0,0 @@
-icon_base64 = "AAABAAEAAAAAAAEAIAC6+gAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAEAAAABAAgGAAAAXHKoZgAAAAFvck5UAc+id5oAAIAASURBVHja7P0FeF1JsiWM7mJmru4udpntMjMzyjIILLRsy0ILLVmymJmZmZmZmZnRMjOUGdaLTFXff+bNnbl9GfqEv/z2EfjAVsaKtSIjIwVBZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE5nIRCYykYlMZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE5nIRCYykYlMZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE5nIRCYykYlMZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE5nIRCYykYlMZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE5nIRCYykYlMZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE5nIRCYykYlMZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE5nIRCYykYlMZCITmchEJjKRiUxkIhOZyEQmMpGJTGQiE9l/N1PcqCjILlMU1CQUhVPH6KqoKLopIhPZ34vtUpgvrJX4XpDeeUTQ+MtRQfkvJ4QjR46IbozIRPY/3Q5sERektx8WJNfueUX1iOJnakeV3tGUPiEI5aJ7IzKR/Y82eXl5YclPSwQVTSVh44r1f5I7KKN5QurY8pHcakFiv4ToBolMZP+TTVfXRzhxTE1QkDv58QklNUtNNb1hbXVdS5nDku+dlDsumJmZiW6SyET2P8F0FLQFQ00T4ewZC8HYwFwwOGMm6Jw2EgAIBgamBxycvCas7NxwzsiyUvuU5q9ntc8KioryohsnMpH9d7Rdu3YJu3duFyTFpQUdjbPC1p+Xv6J9Qu8tPS3jt08pqb65bcuu108pabx9RsdkgYOTd4p/WPxzj+Bo2Dt6XNFT1z0+6+dZb+7auk/YtW2/6GaKTGT/nYxl8I8cPiyondIWDu47+O4pJfVFDlbux73cgh0D/WO8I8KTHYOD4sxiozO8YmIyqgOC438PiUlHeHIO3HxDX6qeOt2wYd227Vu3Hnh97/ZDwmGxo6KbKjKR/XewJUuXCus3bhBOnLARDh84/OXJY6raKid1Gq2tPG64e0Y8iYzKep6eUfksJ7f2SX5B/fO8wgYkZZQhIaMEcelFcPWPgI6B+XOpo0pVEodkN0msOPDqnvW7BFP7c6KlQZGJ7L+yLZw9V1i8cJ5gaWIuKCmc+O6csZmTqZntJVMLZ9i7BsM3LA3p2fUoLO5ARXU/quoHUVrTg+ziRmQU1CCeAMAzNA7n7N2hfcbs+TF5lfydG3ev2LF8zevb1u0STuxS5EVDIhOZyP6L2caNG4Vf/jJTWLVqrbBlxebP1q3dbKprcO66g7sf3P0jEZGUj5TcOuSVdKK4vBdlVf0orexBWU0fDbrWdSOruB4B0WkwsnWDuYMXMQGLxzt2HSxau2rzkcNikh+Iy0oJh1ce+LtgAsuXLxdmLlwgKEhJCyek5YVT8icEuYNHhV0bdwjb1mwR9m/ZIxzZSfdih5ggtWWrILt9u2gSiuw/z2xNbYXty7YIcz//+bVta7dKHz2qMG5gZg1rVx94hcQhMasC6YVNyC5qR3FlH6pqh1DXOIrG1gnUNA2jpnkIxTWdiCUWwH6fDXvPYGjqmb44LKHQp6R4Slliv8R7J+RPCQoKRwVlZeX/cfeQsZvQT3zJqSWEg3skBRsTe75KsmP1+jdkD0t/cFRc6vM9m3Z/tX3tti93b9r58eHtB97etWzLq5JHpIV9W3cKYvv3C8uWLBUsLCxEE1Jk/7EmJy0n7NNTFGQOSM+ROng0R0Vd54WFkzuc/MLg7BuBwOhMpBY0oKC8C0UVPahuGEZT6yRaOqZQ3zqGupYRVDUOoqS2k4CimhhDDnxC44k9RODMOauXOnrGA5oausqHxQ5/KCelICw/tPy/7L2w+P/797fdPyVBQfq4IHGIJzxf2bVu70faqvqLzumfk3W3d7H1cnQLV5E/kbxn045MqX2H0uUOS0cfFT/sqnBEWuXIHrHlezdu/ZiBxfrlqwXpJYeE/Ut2/Zt/LgUFBUFGRkZQV1cX3NzcREAjsmnbs3GPsHPbTj5xT8qelHVx9Lzp6O6LM5b2MHXygqNPOPwj0pBb3ob69gnS/sMoq+5DRe0AAcEQjUHUNg+joW2Mfj6KvIpmJOWUIyG7BCHx6TCzd4eJlSOs7V3G9M8Yy588qvSGuqKKoC8n91/mHpzauVtQ3ycmbF+xRVj+yyJh0dy5wppVy4W9G7cLYlu3con0fzMZCRlh7679grWhrbBz8/4PNE/q7NQ7beTrZOve5ergflNXU/eJ4lG5l1vXb8LqJctxeK8YVI4p4cDu3c8kxQ/eObh3f9ehfWLu+3fuWbFl6YY3561eKGxcukr4Vkxc+LdwUWdnZ8HVw0nw8w0U0pOyBbUTWsL6NZuEQ2JHBDVNFUHuv9DfQWT/CbZt7XZh0ZxFwm+zFn66fPFq/7PnrJ55h0ThjLUjjOzc4eAdhviMctR3TqBj4Aqn/JX1AzwJWFHXj6qGATS2jaO9+yKaOsY5C2D5AM4EUnI4izC2dYadmw/cvQOqrEys5geHJQgGR8T/S0QhxSOKgvx+KUFZ1VD4VvjolVU/zHtj1Ywln25Zsv6TXbu2vrpn2xZh5f4t/+j/PUHOJCV5VEgJKBI0Tp7+8zl9MxN7S+deKwunp9ZWTtA6rY/Fi5Zi7pw5WDB/HubOnoW1q1dB5qgEjhwRh7j4Pojt2wtxMbHHu7bvqNu4dr3q6uWr//TzYS9h25ZdwpH94sKB3Qf+xZ/N2tpe0NQ8LRSX1ghWZlbv+Hr4zVQ+pvLLskXL3p/xw4+vim0Tm2Y9Ijbw92sHd+8XVq7cJezbtnfzrp1ig7LHVCjqB8M7KhE2pOMdvcKQW9qM9v6L6Bq4TJF+lJy+H9VE+ZnzVxEYNLdPoqvnCuqbR1Fa00W/34jMohqk5lfAKzQWVq6+MLJ1gZOH/31XRzdtebHDb2ifUBOio6P/0z632hE1YYuhOFF3JcEp3Uc4IXnsq0PbDxxcPGOh0dqFq4K2r956ZueGbZ/tWbdTWL9qjXBkzv+ZvFTS0BNOEPU/ekj2cxMDC2srU/vrslKK2LptD1av24RFS5bh519nYM782ViybBEWLJyLhb/Nx4rVS7F242ps3Loem7duxIaN67Fx00Zs3LDx+rKly0JXLF62cueaLW8f2LhD2L9jn7D5u2X/rOSpxREL4aLQI5zW0OZ5iISk1B/zCkrN0tNyqx0dPLLV1fWsTxxT2SkjcfQdiYOSIif4ezZJ8SPCKywSHlWUPqmscUPXyAKWzj6w9wmFW2AsAsJTyKk70TlwEW3dE2hqH0FD6zDp/iFO/WuJEXR0XUT/wA00No+RPOhGYXkrckvqkZpXDu/QOHgGx8LGPQDuvqHwcPPONdA1+LOpodl/WuTR1NQUXpJj6BgaCB+9+u4rirJKczRVtNzE9xwe3bx2632pgzJPpMSP9u3cuHPfsu8XvLppxXph27Jt/9tzHDigIpxUUBOkD8u/pX/67CknW7cL6mo6+OmXWfj62z/h+x9/wIyZv2D2vJmYv3AOli1fhJWrlmHZiiVYSo8XLpmPRUsXYvmqpVixchlWrV6JVatWYu3aNU+2btzcfGSvuL74zn0/7Fqz75U9W3YKWru3CEdIjvxTZmRkJmip6QhW9jb8a3//4LmllbVxVQ1t9wrKa5GaU/wyLDr5sbmpTbXC0WOLDTXPCjKyCiJH+Hu1w2IHeZRQOal6SEff+JqJjTMMLJ1gbOeJwKgMpGRVop6cvaN3iq4DFOX70dwxSs4/SHJgEC0d59Hbfw1Dg7fQ3jGFGpIGlbU9KCpvRjaxgKSsEiRll8I9MBoefuFwc/UetbGyWxPoFyr89NPP//FJPoqO4ZfvCkaGVoKGuuZbVlYOOwzPmmVpnNa/f1xZEypE27UMTaB0Qu35vl0Hsras3DRz1Zq1wq4VG4XdS1b9QyTeu1dN8HF0EnRUz8x2c/CqcbR3g9jBI/hp5kz8+uvP+Pmnv9D4M2bP+glz5vxCEmA2fqPov3zZUg4Evy2ah0WL52Pd+lXYsGEtli1djEW/LcD6dWuwc8tWSIsduXVw1/5YYmhr9+za/abMYSlh7YwlgvgW8X/0c7H3FeoaKpgamArj478LRvpGn5mbWO0Kj4xNzcgrepyaX4LkgjKkl9Ygr7IeYWGxd48rnNLaumnXG0cOiqo1/25NliaWo7OfoK6sscPYzOaCEWnXMwQANp4h8A9PR2pmFWn8UdL3Y6hu6KXRQ84/QM4/gMq6Pg4AfYM3MDRyBz0EBE2t46ii7xeUNCG7sIbYQzvyyhoRHJ0Gv7B4BARF3HR29th/59YjYft/wvq3kstp4bT+WUHuqMobji5eh5w9/VudvAKf27r5wsTOFeaOnjCwcICarhHkFVTu794m5rVmydrv5X55S5BYs0U4tvvYNHOSVOKJ03NG1kfd3P1vHDuhgjkL5uOXWT9jPkX9WTN/JO3/Czn/DCwiZ583dzZ+nfELli5egjUU7ZcuXYRly9igr9eswpIlizBv3jRIrFy2DFs2bMbOrTue7Ni8rXL35m0HFMUPvycnvlsQ23Lq/wQ1Cy9h82Z9wdHGid6f1GsGhufmhcUnuKXm5I36h4U/84uIQmRaJuJyixCXV4ZkkmbJKdkvba0dU1VOaXyjraUvcoS/V5M6ICFoaOoKx2SVllvYOPe7+obBIyQW3uHJiEzMR0FZK1q7J9HaM4n61iGi/sz5+zkDqG8eQgvp/96B6xiduI+B4Vto7ZpCQ/sYKgks8ksbUVbbgcLKFgRFpcIvNB7+QRF3zcysZZjzyErL/od+VqPjZoKGkg5/bGfrutrbP7zOwtHrpSMxE9eAaDh6h8HNLwo2zv4wtfMgJmABSSmlO1vW7fDZumrLX+bOnSdIr5HgEuLkidPCgX0yb9vYuTsYnLN8tmTVanz73TeYMeM7cu4F2LRpLdauW4k5c2dh1uxfiRX8ipk0FsxbQIDwG3f8DRs3YAkxAjYWLlpIvzuTxgwsWDCXfr4UGzZtwIZ1657LHDrcriIjJ7FjxZrXD2/bJez5QwokJSUJThZOgqWxgxDo4yuoqaq+5eXlszcgNLwoJCXp94C4WNh5esDVPxARqRmIysxHUkEVMYBm5OQWPwsKCI0wOGP0uY21vcgR/l5NcYeisOeQmCC+59BMXX2TJgfS6kyzhyZkE3UvR0VdDweAps5x1LWS07cO8uhfTaO2cRBtnefJ8W9ibPJ3DgAdvZfo96dQRQCQXViLInL+7JI6BEQkEwOIg7O7z0M9PUMd8Y37Xlc6okQy4Kf/GOpvYSEYS5sJru6erEjnax+v4FBnj8Antu6BCI7PQlhiLgKj0wn08hCRkAvv0ARYOvpAS9cUxxXUbsgfUdRTlFB6W/HIMUFOX044cfy0ICd76mtDQ8v0U2raWLBkCf70l6/x3V++xIxfviNNvww7dm7FgoXzeC5g3vx5xAbmEM2nqL90CRYunI/FFPV/o7GAAGERMYIVq5aSNJiLxYsXYOXKZVi9diV27NiKI/v3v9i3aUvW2oWLflo1Z6EgefiA4OvkKwS6hAnO5q5CeVmz4GLv8WlUdPzxhPSM9vDU5BfuUaFwCQlEQHQMjXjE5RQimgAgIa8UxTUEADmF/W5OHvs+/+KHVzTVRQzg73cVYMtBQVZaUThyQOorIyOrdBtHb4p+7nDxi6SonY78shZy+mECgDGK7MP/oP0ZCFTV96GpZZQkwHUMjd7G4MgtdPdfQUf/JVQ39iMjrxKZFHHSCyoRGJUCxi6s7V2eEQC4Hd5/8F2Fowo8//AfYTLS6oKuhpFwdJ/s6x6u/sd8fSMu2jn7wSMwFvFZrG6hApFJ+YhLLUFcWinCCQR8iQU5uQfD0tIVZsY2tSZnLOaanbMV9NX0hXNnrQUDPdNfjc5at5xS1cKaDRvwpz9/hZ9//Ba//PwdRfn52L1nO0X2+fjplx+JBczCL7/8gtmzZ2P+/LlE9RdgPkX6uQQQc2jMo7Fs+WIChQVYTeCxceMa+vls/r2N61Zjy+rVtzYsWaa5fu6yNzcsWS6EhqcL/j6hXIYkRKb8VFRQ6VBUXnMpIS8XnrHEaCID4RcbhZj0LPp8hYihEZWRi+yyaiRn5d61sbI3OnVU8b1zuudETvD3bOq71IXjiieF3Tt2v+Vo72Hu4xfxxMLBExZO3nDzj0ZWQR2n/PVtQwQAI9OO39DHr7VNQ6T5xwgArpH+v0JS4Cp6aPSNXCcWMM4BICWnDIlZxQiKToWduz8MzaygfEojZ8/OvX/Zt+OA8P367wWLjf++qwHSkucERQUdISwwUThnZDvX3S2oxNE54IWrTySik4sIoOqRmF2JtLxaZLEdjtlViCD54x+ZBs/AODi4BMDeznPS0dZ9c0BwlKB9Qltwc/YTbK1cF3q4Bw6e1jbE6nUb8PMv32POrB+J5s8kFvADOfsM/ErRfyZJAMYCfpnxM0mEX/Dzzz8RI5iLWSQPZhLtn71gDmaR/p/NcgAEGEuX/oY1a1Zg4W/zMHvOr1hOILB53VpsXb22ceeaDQt3rtkkRAbFCVaWtm9mpBduqqhsSa+oa/09t6IaMdlZ8I6NgEdUMIIS4hGWlIq4zAIk5JYiPrsAUckp0D97tnHvrj2/yWudFg6t2/I/sjRbZP8MO6mkLLQ0jQi2lk5boqJSJgLCEhBAETskJgOZ+TUUzXt59Gc5AMYAKinyszqABor+Le0T3PG7iPqz0TPIAOAa2nomiP43I7+8AWn5FQiOSSVQ8YKOsTl09I0uaWvqScnulXpVUUZRmFU169+P+utZCL98LyHYWlsJJxVPf2Ju5mzr6h5yz8M3ChHxuYilaJ+SW4PMokZe75BHjCedQC8sPo8kSxpc/WIIuILg5hU8aG/rtsLPN0pQU1ETosKSBXdn3+UB/lGjp7WMCAA24/sfvsesGT9iBdH6pUt+w7x5c7jz/zprBmcB0wDwMwHAjxwQfiXnnjFnBuaSo8/9bS5mzpnJgWEu/T+WDJzPZMNcVkOwhCTFapYYfLR/224LWTHpj/zdA74pLqpSraxv7SqsbXqRW1OP5KJihCYlITI1haJ9Cun+FMRmZCMuK5+AIB0RBAaG587dkZA8YrR5/dp39+zaKShKHhc5wN+7ubg7CDoaBoKmis6ngX6RUXFJOS/D4jIRnZKH9LwqlFa3c+3PnL+6cQDltb0EAv1oahvnOQAW/bv7LtMgABggJjB8Bc2dIygmACirbSPnqkJcegFsPQKgaWQOUyvHl7Y2Tsn6Gme+PnPmrADh30cG6GvqC0amFsIZPRNBVVnnHYtzDiouLoETfsEJiE8rQXp+LTIKGUDVIbukETklDQQAzbySkf08KCoLfuFpHAw9/cIb6Xl+OmtoKRgZGQl+3pGMBSx1dPAZPWNoDWVVbaLsizDzlxlYtGA+sYA5HABmkVMzEJhN0X7u/Dk8KcgAgdcIzCcGMH8m5i6awwFg7oJ59BwL6HfnYv7ChRT5V2LlytUkLzZh5bqNWL9pGxTkT/R6uvrZ5+eUxTa19lwrbyDAqqhAemUlwtPSEBKfSFE+lWh/FhKysgngMuhxDoJj4+AdHPT8+MkTKds3bfx5i5yscGTlStHkF5kgqKmpCconppeX7KzdDkTHZV6KSy0gB6lCLjkFA4Aqvvw3yB2/tLqbgwCTAM1tY+jsuYD2rkliA+No75lC18BFdPSdR20LMYXmLpTVt5OD1cI/Ohln7VxhYu0MVzffy3bWTnxRW/n4KUF5378dDbWwcBWMje0FBQU1YjVugoKUzJuu9l4HgnwiO2Pjsl+mZJdzh88lZ8+voPdW2kSjAdnFdcgqqgX7OWt0EhGXS86fjsiUXNi7+dXJyp38i9JxDeHAgX2Cn0+U4OocsMDVNXjIk6SEp284FI6dwqoVazBvFtF5ovqzZ5Hjz57JnX7eAubU87jzMzBgoPDjjB/w3Yzv8NPsnzB7IYEDRf85c+dh1vwFmPfbYixZvAKbNm6HlOwxyJ1Sh5GNI+n3ghfVDZ2P6lr7nte0dqGwugbpxYVIyMlCeHIy0f1sRKdlEeBmIyoxFaGx8fCLiICLnw/MrC07FBUVd8378utX927fLmzbvFk0+UX2hww4tk0wPWcr6OmafO4fEB0UGZvxNCWrjGfyy2o7UUkAwJJ/FQQAJVVdfB9ATeMQsYAxtHefp+sIGpqH0EpA0D14CUMT19HRT6DQM4rKRpqolU0IS8yCg28YbNz84Oji88LBzjVc/bj6p9qa2oL8pn+bJqKGyoaC7A5ZwdPRhycYTc5af+rhFiAbEZ7cnJSU9yIrvxoFFa185JDjpxfUIq2gBsm5FUjNmx7JWeVIyShHRGw2AqPTEJqYCTM7l27po4oLj8oqCXJySoKFmbNw9ozlr05O/p2RsVnw8IuEnIIKli9bTfr/F8wgnT9n9izMmjWLHJ9F9Wk28POMn8j5Z3L9z2oGfvz1B/w080eSAzMIHGYSYJDun78IP8+ah8WLV0Fe/hSs7N3IsfNR3d6L+s4BNPYMo7abmFhTKzKLSyjKpyIkLgZRxADCU1IRnkpXovuegSFw8aF77ekBczvrieOnTh7fv2/vu+IH9gv2Tk6iSS+y/yVRJq0iyMjKc6exMLVb4ucbUZ2YUvAyr7QR5fU9fNmvmgFAQz/yy9p4M5CqhkE0kOM3d46hrnkA9S2DFPkvoH/0GoYnbxITuMCTgTVNfSgoa0R0ch5F1FQ4eIXAxskLFhYOgyrH1daaGFgLxxWV/tWfwdbWXdBWMxAGrt0UnGzcPo6NSN4eHZESEBObNZmcWfoikSJ7FkX+rMJGYjd1XAKwpc7k3OmRVlBNcqAGKTnVyMit5SyAfT8gJgWG5jYjSsdV1p44pSkcP64sqJ06IxxX0PjR1MSpLiQ8BbYuvjgqdxLr1m0h6j+PtD5p+7nziQWw5T/6+tdZ+OmXX7jzzyGq/yurDyD6P4Oi/6+zf+a1Auz3f50xh4BgIVau3w5ZJTU4eQUiNb8UpY1tKKdR09KF2o4elLcSgJVXIj4zh+t8Rv+DSfO7hYXANTQITiEBMHKwwzlbO9jYOz3Q1TOw27lrzydyCorCls1bRS3aRPaPrAioqQsap9QFiX0HXrO2dFbwC4i5kkEyoKaFnL+xD+V13XzLbzVR/xoa05uCKCLx/QGDxAj6CAzG0Tt8lUCAGEDfFAHABAeBPHK8xPQSxGeUwJlYgKWDJ7R1jH+XO6qkpSgl8wZbEvzXZKP19fWF06f1+GNXJ59ZUeFJLilJecOJiXlPM7IqkVfaTLS/iWf80/PqkEYOXlBO9L+4maJ+DXLLW5FHrIAlA7No5NDIIDBIzimHV0gMbJy9hs+eNVvr6O4rqJ5QFU6rnxVUT+r+oK9nUe3sHgwHN38ondTE5s07sGbVGsyfN58GRf7Zc7ljz5w5Gz/89BNP8LGkHkv4sQTgL+T8LPovXPwbFi5ZStfl2C0mAStnL9Lu+cipqEZRQzOKGptQQqO6rQOFdfXILCsj589GTFomQpPS4B0Ti4DkJLiFh8HExQmqpkY4bW4Gew8vmFvZ1RxXOrXAxNROOCh+UNi/X9StWWT/qHa2ELwsPAUDfQvhtKbh9x7eoWVxqfkorm7lJb1ldZ1o7BxFe/8UmrvG+VIgG00dIxT9SRqQA7ENQj1D1zA4dgudfRc5Q2B7CfLI+ZIySpGUWQr/iCTYuvpBU+vsS3VVnUQVJdXPjsudFFRVVf9F75sBh7b29M43d7eAhdFRqSkxsRm/R8VlIZles4h0fml1DzLyyPlz6/hSX0p2NQFBPbKLWpBb2o7yBtbQpA955W1cGmQV1RNIVBFryYezdyjsXXybjY2sZts5uQjKCjqCtoaRoKas/fVZQ5scF/cQBIQnQE3LALv3HMCunbsJBFZjMen4X2fM4iDAAGDmzFkEAKTx58ziUmDGbGIE82ZiwdLfsHbLZsgeP0lSwxmhcSkoq28lqj+AitYOVHV0oKarE8WN9Siop/ddWoxIivhRRPUTcvIQkpyGoNRUBKakwDWMJJaXNwwd7GHl7g4Xb7/xM4YmipKSsm8SgxGkpKREE11k/3fbvUtaUJA/JRyVPPaBuaVzlG9wDN/Vx5J4hVXNqG7pQ1vfJDn9KC/2qSPazwCgqX0YdU396OiewsDwDYxO3sXQ6C00toygpr4PFdVdyMipAksu+ocnwsU3HAbGNjitadCiJKc85/gpDUF2z7+8NNjJzk04o3n2m+DA2PCEpNxHYTEZiEktREFlG0pqupFdSACUWoGkNNL3mVUU4Zt5h6PyWratmbGacZTWDtBnZPmKVr4akEoAEB6Xg8CwZHh5h2XraRt/oWdoLJhvsxd0T59juwE/cHUJDHXzDCNHC4XBOSvsIgBYumQZ1q5eg3179mIe0f+ff/4Fv5IEYFKAAcGMX3+dzgkQG5i9YD5Wb94MTQNDpBYUo6K5A41dg2jtHUVb/yhp/h7UdXSS/m9FdnkR4nNSEZGaiDCK9hGk92MysxCWnk7OnwzPmGh4hIXDMzgUQVExz+KS07oCgyPUNDV0P7R39BYOH9wtov4i+3/bmg1rBKlDCsLubQc+OGNgHubuG/oyNi2Pr+XnlNaRHOhD5+AFXhnIAIDp/7aeSbQRzW8mKdDZcxH9Q9cxNnkPkxceoL3rPKpqe1BJTpiVW43ohGz4hSXAiRzG0NQeGpqGl1SVtfb6BMYLclL/skSgxVlLwVjX6G0/j2Cd0LDE6zFJuUggppGaX438qmman5RRheTUSqRl1XDnL6nsRXnNEDGUi/QZLhOIXURN8zhKqnuJ8XRwOZBe0ECypRzxCfnPvD1CPU4oqLyrrWEomG+2IP2vJuzfcuBNAwMrZye3oBdOHkGwd/aBipo2tm3djrVr1mIdjY0bN2DZ8uXc8efP/40YAMmCOfMxd8EizFm4CFt274WJrQOySipQw5J83UMEsBPEnibQ1T9B93WQ3l8PKhoaSJ7kIzQhGkFx0TzhF5qYhODEBHhGRcLSxws2Pt5wDwxCTHzyndTkjPiIsJgN+romb/v6egp79xwU5OREpzWJ7J8wiX0SwoH9ksKOLXs/19MzTfIJjEZIbBpi0/KRUVhFVLkLLT0TqCdqX9tMk7XnPLoHL6Nv+Ao5/xRfCuzovkAAcBeXrz3ByPgtNDQPopRoeG5BLU3OLHjSc7JEoC4xAI3TRo+MDCy0Nq5Y99px+X9+DqA2p1YI9AkT7K1d58XHpDfGJubwFuV8Wa+ENSZp4Jo/Mb2S5EA1CojuV9QScyFnb+64TI52C+29N9DSfRl1reMoq+0lEOhCelEjDZIC+Y2Ij8275WLnKyO88sYr6qqG/HVPHdcWNqzY+rqlhbONl2/EC29iSua2rlBQUiEZsJc3+Fi5agUOiIsRK9hNEX8ejQWYt2Axlq/agD0HJHFcRQsRcamobOxEffsAmntG0Tt2BX2jV9A9MIWegfN0T0lCNXfS+2aVivmIS09DUm4OguMT4BIYACtPdxjYW+O0hQm0TY1f+oeGXIyMiLJ1s3f+jr1PKwsH4U9fbBPU1ExFk1tk/7RJ7ZUSDopLC/t2in+tq2uS5e4TBp/QOAREJVNULUZRVSsBwCQaO8iBOifR2X8ZA6T3h8jRe/ovoZW+z2oCBoavYery77hw5Xd090+hrKqNQKAFOfmVBABRsHEPhL6ZA86ZOb0wN3P0kTok994JRXXh0KFDf/N7PS51XJA7ynvavWJhai8dFBx/PYGcv6CqBeX1fzQmKW5CGul9pvkz8ht4L8PGNnrffdfRN3SXnOwuPb5BjOYCKlkeoLqbM4bYDHK4whZ+FoK/d2z7GU3TBfbWPoKGvAZ/be3ThsKv3/3yqp9fhFlAaPxzB49AKJ7SwradYti2fQe2bNuCFauWY9uOrZCQksCS5StI88/F4mWroX3GHNHEUlh9BVsp6aT70947iZ7Bixgcv46eoUv865bOUdQ2sd4KFP3zy5CUlYeE7FzEpGfCLTAYpk6OMHNzIr1vCQ3TM9A5d+aGsYmRqYGu3mfJSamChZaeEO5oL8iKy4omtsj+Njtx8oQge+SYICF+9DMzM8ekgJAEouyJCIpJQ2JWKYqJUnf0X6DIP4W2rgvoHbyBEaL7IxN3ifpf4yygu/8iOdcljJ2/zQFg7PxN1DT0oLCkngNASHQq6dQ4WLsGwszGHU7OfsUnjmv8SVP9rLBTfMff/F4VD6kJOmr6gs5J3S9sLF0j3X0inqUX1KCMXqukhmg8RfC0zEqkZ1XzSF5S00tUn0XWG8RY7mJg5AG9/3v0Wa6htmWcH3RSUtWNfGIJWSXtyCnrQHxSCcjxo6QOKnysrKgj7Nw43RlIQ0WXX11c/NW9/CIfBoYn0mdxwUEJGezdL4bNWzfjtyW/YcvO7dh36CA2bd+JQ1IyMLG059ukWYeloYlbGLtwj+7P3T/GbbqPN3klJQPZ+vZhXk6dU1xLbKaGZEk9kgpK4R/D2rX5wNTZGaaujrDwdIKVB+thoD4ltn+XzMpFc95Ys2ypIC0pI+zZuVs0qUX2t1tAQIBwUklDkDwk+669g6dPcHjSC5ZQi07KR0xyATlIB7p6L6Cn7zI6uqbQ23+VbwUeP/+A6P5tcq6L6KToxaL+0Ng1jE/dpol9C60UzUorW5CaXYTE1AIEhibBwT2ESwFH94ABaSnF9SyLL7ZV/G96nydPKAvHd6vyzP85HYvt3p5ho5EJuSggqcFqFEoqKZIXNCMuqYxT/+KKHjS10/sdvIXRiUcYHn2EgaGH9D7v0fevoLxmELlFrSgkpy+p6EZl0zDSSLL4+Eb/rq9povLTN39+TVpCRti/c3oJTVVFWxjouy5YmDnt9vOPvpxMzMPDJwTHT6ph7fr1WLB4EeYt+g3zly7Dmq07YO3sieyiarT1jmOYnHx86h4xpAe4QDLp4vWnmLrykKL/TXQTcLb1n0d9xxDp/m76PM1IL6hCKgFnOoFAbE4Jaf5E0vwBsPDyga2fLxx8PWHj6gCpoxJPVy5bXLV0/nzJNYsWf6CwW0zYvXGPcHSHKPMvsr81oWZhIagc0xJ++2XZa27uAVpRsekPYxKJdqYUIDIhB0UVreigKN8/eA3tHefRQdR5bOJ3TF16gvMXH2Bw5CpaOkbodybI2S5y52cg0N49Tjq2HlkFFUSryxAclgIb5wA4eIdC28D8wSFxadMTEnLvyB+W+Sd7BR6TPCYInwnCaRUDQUHi5JfWZi5BERGpT1nZck3zMKrqh4g2dyEjtwFJ6dXIKWwl2n+eKPZtDI0+wMT5Zxgee0xgdZ+A6RoqakaQX9JJ760Z2YXNBAKkuas6EZtWBONzDlcP75Pep2XgKBwR//8y6NoyWoJ7YIRges5+ubtnyEhkfBasHTyw76AElrElwOXLMW/xYqzdsh22bt6obetDPwHixMX75PgPcYWc/uqt57h04ykBwBOMX7zHnb+xcwRVzb3EYjpRVN2KPKL/bBUmPpst/eUhICEdbhHx8IpNgmd0HPzj4+EW5A8l1ZNcbixZNP/lqsWLx3as3XhOat/Br/fJLBAkt0oKq1atEk1ukf2NIKBvKjS39wkebn474+IyLseS40cm5vCmHlmFNaRNxzE0coOzgO7uSxRN73AAuHjlMQZHr/G+gU1tQ5wFjE7exDDpWs4AqlpJQjQTNa9FRHQWAsPT4UFSQPGUNo4cPJpyQvrYlwpH5ARfX9//63vT3KUp6GvrC1rKeoLMIcV3jM5aq3t4hV5l6/3ltd18pyLbq5Bf0ob0nHru/BW1Q+jqv4mh8YcYGXtC4yn6hx8QKN1AbeMk8oo7kJHXiMzCBhRWdKCgvAPJudXwCIqFuubZqUP7pXZIy2kIYnvE/uF9uM5xFcysXIQzZyxneXiHd7Heh55BUTgicwwr12/E1l17cERWAR7+oSSZJjBE9+H8lUe4duslrt1m4wUu33yGSZJIw1O30D18Ec3dY3yZtbC6BfmVjSRB6pFdWsuXYFMLKxFEzu9Jzu8XnwavmCS6JvOyX11TE2zYvhVLVyzFiuWLsX3jRihIHL1+/KiCyb6tu947tEtMWD9/jWhii+xvM2NNY8HFyV2wt3L4LjoyKT88KoWv3XuTs7INQmxr8MDIdWIBV9HTexmDw7e4BDh/8SHR/utobB1EdX03BwGWC2CjvokdKNqD6sYelFW2o7C4BcmZVQhPzIPuWSuondKu0FfX/UHvlO7/syBI0kxaUFZQFhT2yrx+Ts9MzNbBs8s3LJ7v4GMtymobBlBY0ops0vwFxe2orR9FZ88NcvpHxFSe0niO/qEHaOu6gbrm86ioG0I+0X7WCCQlp4LvEWDLfwGRaXDxCYOrW0CvgY7xCmdnH0F858F/eB+66kaCpbmrYHjG+if/wLiW2OQ8WDp6Q1xKEQel5XHOyg7xaTlE+ccwdvEOUf3HuE6Of+MOuPOfv0qUf/IGOgenePa/qrmbRg+KalqRkl+GtMJyZJVWExNpQEFlA/86JjMfwYlpCEvNRkRmHsmBAli7e2Lznn2Y/dtvBADLeX/BbVs2Q1XpFPRP6/bs3LJ9HW5fF9avXi/s2LxDNLlF9reZuqq6ICsp+ZqjvZuUq5v/uHdAFHzDEvhKQHVTH3qHWAOQywQAlwgAbhAA/I6Jqd/Jua6isWWIZ/2r67vQ1ce2C19AXeMAfd073VOgvh+V1b28OCeMAMDRPQhebv6t5mdMZ3tauwsSkv94r3rFA4qCmryK4OXqJ5zTNpntZOuR7+Qe+DwqLR/FtZ2oaSCQqe3lAJBDAFBe1YfO7qsYHLpPtP85zk+95NG/s/cWyZQrqKwbRmF5J/JKW3nRD9PbOaWNiEot4t2QgiOSnwcGRkWaGVl96WBjLxic9hUOSxwWjkpLCydl1YTHzyCYGtlvcHEJGnL1DIO5tTvMrFwRFJGIqsYu9I1cxuTl+7hMFP/GbRAAAJdvvMD4pQfoG6P71DmMyuYulNa3Ir+qDjnlNcguq+GNO5LyisjpS4kBVBEbqEUyfR2amEosIBmBNCLSsxBEDEBJQxvLiXHMX7wUy1auwpZtW6F47BisLW1hdMb42Y5N28JWLFzy9fK5C4Qdu0QlwCL7Gy00MFQwMbYQjskf/8Da0tnC1TXwnptfBF8NKK3tQGffFDq6z6OtYxIDQ9cxPnmfQOA+Oftlvu5fXt2Oytp2crRhisCTHABYt+C6Znaw6BCqawdRVNGF0PhcuHmHw987tM1Y22iOk7WnIH/gwD/6nk5JnhLkJBQE8d2H3jI1staxt/e87RMci9yKRqLO089fTNE8l7R8SVkXGpsnCJzuUtR/jMmp55iYfI6+wfvETC7R+5ggOdKNjPw6GrX8MJOy+k5klTUghCRPRFw24hNyLnm6BbB1yVd05HUE/ZO6wmllLUFOTkU4tlPpNSsj2yVersHJTk4Bj+2d/RERk4GK6g509J7H0MRNXLz6CNdvveDjyk2K+kwiTdxBxwC9ftsgOXYTvXd67YpqcvYSJOYVIrW4DHE5FN2zcxGXncO397Jlv4jkVPhFxSAgLp5AIJGcPxF6ZhaQOnYC2/aKYe3GrVixZh227twFeUUlWFnbwczEAgf2iF3ZsGKt3L71m1/bvmaDaGKL7G83dkilg4unoKWq9729jUe6s2fwy9CETBRVt6G5awzN7aNoahlGd89FDI2w7PpdDgA1RPULSxtQShO8pqELbZ1jvCS4jm8iGkRdwzABAEvUdSMymaItaxjqFdKuqaQx31LPVpCT/D+z1q5nPQQVCRXhyMIdrxyTVV5lYmZf5+QZhNjUAqLx3bwqsaSykyJ/E3LymtHQNE4S5TYB02NMXXzOAWBohFH/q/Qexsj5iW5XdvDIn5pbgdyyRuRVtCC9uA7R6YWIT8l/lppcEONm7/ONj0uooKduIBx+c4ZwQu7El9JSspuPSsprOdq6lwX4RT3y9I1CUmYZ753YP3IN4xdZ/cMTXLv5EtdpsIKoCfpe//gNNNC9YMuU+ZXNSCuo4I6fUlhETp9DTp+DUHL0sJQ0BCclkZMnICg2Hv7k+GGJyQRMSfCPjUNgXBzMnZ2gqqsHxVNqkJRRxCEJWWzathu79olD7JAEBwENjdOQOHD4xcHdYrGHdh/44vAe8X/2HGAJWXNzc8Hb21uIcHUVUiMihKSYGJFz/D2Y6lFVQemQ4vS++jOWu+1dfMcjkrORUVDF17LZFuDW9jFiARN8OXBw5Ca6ei+itrEXxeUUUauaUEGatoGiM+sVUEPUn7URa26dIBnA6HcXYlgDztgMONh6DEiLHV2jdlxbkNwvKajLq/9v70Xh0DFB8oCUILlX6ls9baMQJ4+AxyFxabyBR21DH9H9TuQWNyOfdH9F1SBR/2sU+R9x5z9/4RlRf6LdA7fR3MY6Fg/xir/c0iYkZpbwRiDZJQ1IzK5ASkENgVIuAoITej1dgzdefvhQ0NE0EGSPKL5mZmC5ztjAPFxNU29UU8vgvrOL78vI6HSwHZMNHaPoGb2KkfN3yfmfktO/oPEMly4/wcjEbXSSDGJJvrLGbnL+FmQW1yKVFffkFSA2K4ucPxvRmZkU4RMQkpQCr4hI+NDwDg+HV2govMJC6etweLLNPp4e0DI+C2UtLUgpKEHssDQOS8rTkMNhKXmIS0hj9/792L2bAGHrDmxft6V2x9otP23ftFkQe2U/72hkZW0lODo4Cp6WLoKnlbvgYuUsuJnZC772bkJUUBhngFEh0UJqTIqQm5YnVORXCtnZxUKQX4hgY2Qr2Ns6CW7uPgQMgYKTkxcBhRUNc9E5g/9TjHUJkpdXEJSOnxBOHVcVZA/LfGpq5ZDiHTJdGswq7iop0rd2TqCVAIDJgb7BKxTtJ8jJSePXthEDYCygkRy0m5jCIOopSrOf1xMTYAeMFlZ0UvStRnBUKnT0TG/IHD2upiR3/E11VU1BW0tPcLbXFzQ1/yi9lVYXDvy67xX1UzqHTU1sLzq7+xNzSCKnr0cJRe78ogZk59USBe9FT991HvnPT73A1IWX9PgJBobvoLvvKuqbR6ZXCcpapnf9lVDkZ1uBy9t4e7CE9DIEhSU/cHMLttHWMHrX3NReUDmh+p6tjYu0i3tAk4dv2FPP4Ci4B0QghOQQWxVpYDKHFfZM3sL5y48wfuERxqYe0njAd0W2dE+iikCxsqmHon8HCqubeafk9IJypOQVI7WgBEm5BaT9cxGZmk7RPoWcPRoeIaFwDfKHU4AX7P3c4R0ZClNnR5ykyH/ytB5UdQyhrKGLY8oaUNXU423J9uw7jK079mLdpi3YSGM3sYKNy9e3rFqwYpb4XnHBx8VfCAskx47IFIriS4Tasmbh0uRV4e7lO8Lla3f/oUvz5hWrX3W1dn6LAOCToqzirwsyC7/LTEz/KcAr4AuFAwpvMVnEfpeN3x+/FOrqOoSYmFQhwC9UCAqMEMLC4oT4yESBfp8/339U92eR/SuNbas1M7MQVFTUBH19Y+Ht14RXTp1U+URBRnGzhvaZMksnDzh5ByM4OhU5RfWkp0fJqSd5CXBr5zg/O7CuuY9H/7ziShpV5JStpPt7Ker3oIU1EGEHhxAbyC1tQUpuJQFACoxM7Z6bmdtXGp8x3a5yQuV99l7MzMwEZWVVQUdHT1A/pi4oHJR/z8LCwcPR2fu5s5s//Ej/s40/MUl5SMuqQBlRetajcGziAS5deYGLl0EMgAHAI354KftZRU0PcoobkFk43QewuLYLRTUkHei9xKQUIyAoCQGeUc3WJs6LqwpHBV0N/e8szO1MvPxCx4PjUhGTXYTcqkYUVDWjvLGLr9t38hLem0T972Py0gMMjd9FFzGidmJDjfRZqxr7UFrbiZLadhQTIyogUGT7KnLL6uh1a3iiL7OkAulFJbx/XxSBgG9UNHyiImiEwTMiEB40WNWfiqEBtEzNoW5oArUzJjCwsIPy6TOQUVKFtMIp7Nwvge17xbFr/0GIEzM4JC6FfTsPXJQSlzlhoG3yua2p/XtBvuEfxwbH/yU6IGZuXFDcqrTotK1psWnbM+LStlfkl0rUlFYr11TU61WVNzjU17YktDR35tZWNxVXlNeWZmTmxcbGJZnk5peqlpbXKVbWNEkXFFbuSUvNWRITk/JdaFDUpx6uvu989PanrzKnz8svFsICwgR/vwAhIDBICAwMFDnZf1XTUdURVE9bCVqn9YVgQm8tLf0PjYzN9xoYnAvV1jrTraKp91DnnCWsnL3h5hvB9/fXNg6ghSZ5MwFBQ8t05+AqorlFFP3zSqqQRVEulyY7WxFgS4H1LdM9BIqrusgJ6vmWXY/AaNZzD7YO7k/MTK277GydvDw8fPcYGBh91DMwKhjqnhVOyasJChKKf7Kydi7x8Y+Af0gcP2koJCoNqUTdC/j5BSP8bIILl5/iyjXS3leBifNP0D94kx9ZxpcIy1p5L8CMojrkV7WhhJUoEwBkEphFJxUgMiz9boBjyLkT4mrvH5c99ZudrWu8X0jk/ai0bOTUNaGwpRNlLd0ob+5GfecQ2gemeEZ/9OJdjF26TxLgzh/NUC7yDVOsmxIrS2a9FEpq2lHV1MMr/BgYlNV3ECC0EAupREZxGbJKy5GcX4CYrEwEJpLWT4yBT0w43MICYefvDR0rS1h6e8MzKg7m7j4wdnKHkb0LdMxsoGNiDUMrBxha2sPEzgX2HnQ/XbxhbefOWpo/9/EMHSoprIttbuj1a2rsTamv76qqre9qq2/qHmxp75+sa+6cqqhrukDjVnZR6YPkrLzHKVn5zyITUp9HxKe8iEvNfJmck8eakDyPTc98nFVY/jCroOJ+dkHF7dyiqktFpXW9JeX1VSVl9elFpTUeVTVNmlUVdQcy03NmhgdGvMfAICwgUjijpytYW1uLnO2/lNZXPSucPq1FVFdFMDK1EU4eV3vd0tphvpWNo62xmfWwtr7xMz1DU2joG0FV/ywsnDzh7h9JkTcfZTVdvDKQAUA1Oy+gmeh/EythrSdtXIrEjDwCikJUkAOwngENbUO8vVhJbQ9FvSaEU/S29wwiVhEEK0d32DjQ5HV2e+bm6TPu7unr6ejouk5fS/9tWxs3wUj73EZrW7cxF68gBIQnIjIhm6/ds737ZbXsBKPzGCfafYX096Urzyn6P8Xw2D109lzm5xeUV3dyoCimayZp/pL6bhQTAOSUN/NWYLEEAIH+sWWm6hbz9mwWn6mpdibRyy/saQpR9LyGFhS1daGkvRfFjZ2oaO1FY+8oOoYvoGfsCgbP3+BA0DlwAW29bLPUCKrpXpTS52arJlVNvaghacSSp000GHOoaGRA0MJXAVIKCpFWVISkvDxEZaYiICkarhT13SKC4RDsD4egILhHRsM7NpEAIB7BSRkISsyAf1wKYomVRKXn8WKhAgKU4vp2FJIES8wpRUp2KU/KttH76e+/gMGhyy976crKtdkmpLbeCXofnfQe6hCblU8MJ4+eN5lkB7GOsDCSHZFwDw3l14D4OLiHhcItJAShSSkIiUtGAL2XwOgERCSm0d8jjf+90/NKnhdW1DwiMLlWVdfUUFZW45WZlrvd3zPg/dGBMcHGxEbwcvQSXCxcRM73n236cvqCIdoEHY0zQk5WpaCrdfZTRwcPORd3v1JzG6d7WgYm0DEyYz3xoGFgBA1DYxjbOMHRMxhxFL1Lqzt4U9BGiv7lBAZs0rOCluLqJjYRaAIWIrOgAiVVraiq60ItMYBaYgm5FInjMlm/vQw4+oZxUDGytoezL2leLx9Y2jvByc3ziaeXX5u9jbPSCdnjn7o7+pwODIt/6BUcjQDS/6zHYEF5C8rrSF60jKJ76AamWPS//pKzAFac1D98E+1dUzzvUEy/W1zZTg7ZzaN/WVMf0flWcrpKRKfkw8s/5rK5haua+O6jK+VkVKKs7DwesGacBfUtKGxqQ3ZNI8rI8as6BlBNo6l/HB0jF9A1dhndo5fR1k+O3z3KmUFt2wDqaLC1fub4TV2jvI8CG21953neoLSuDYVVdQRGpYjJyEB4ciLCU5IQmpIA7xjS/2FB8IqOQkBCIrGBVCTklyGKwDSbJERVWx8qW3pRQfe6urUfde1DaOoeQys9dztJkrbhS2gbuoi+iRt809HA2HVeu9HVf5EA+zw6uphsG+UJ28Jy1iexkiRQFoJi4uEZQn8Pd2dY+7jB2tsVTkE+sPP1gJGDNQxsLWDibAdbb0+YubjAws0Ndj4+8IqIgFtwCLxCwxEQHQu/2FgEpSQTqOSQVCx/VlPbMlxT0WiXm5Y3x0z73KvuVg6Cm46OyAH/M40l2xRlFQUbOzdBWVHtDUsLp8Xu7oEe1nZuk4YmNi90jS2gZ2oFXVNLaBubQ1H9NORVNeh71kQxAxCXVoCS6nY0d45Oa/+WQd4fkEmAUopEuSQBGACkZBYR9Sa9TZG2gkCgqrGfb7llp/EEEQC4BUbBxMGNqKwlHLx9aQKGwic0DM4EBE7uXi+dXb2Gmfa3s3Uv9Q6KecFOGWKlyTnF9XxZkbUha+u+iBGK/heuUvQn+j9x4TEGx5gWv8J1eA1JlSICAMYASmu6iX73oogYQFpJPeIpSjr7hOGk+pmirbsO7xc7qBCupW/xxD8qGVkVrA1XG0X9DuSR45WR7i9v6eEsgF0biAU0D0ygvmcENR2DqG4nidNGDkmP2WjqHkFL7xhJhfN8sGYfDRwgWPuxGroHTPOzJb5Y+EaGIyg2GsEJcQhJTkAkgUJMZi6SCUALKKLnV7eigEZD1wh/nmYCm0YCktaeCZ6E7BpkB7Nc4Scz9ZLj95+/hcGp2xiYvImekatop8jP2rk10d+rkZ6DvY8SYgvpxRWISsuEO913c1cX6FqZ44SeBpR0TuGYtjIUNI9DVlURR5XlceSYNCSUjkJO/ST2ykjikJI8tM3OwdTFgScoLd1d4RIcAKeQQFjT1Tk8DCEEXrnFlaivb3tUVliR7eviM79r6oZgKi8nWOjpiRzxP9qUlJQE4X0GADo8O2t4xuIbB3vPU47OPjVm1i4PNPTOQV3/HE6fNYWBhS20jM34Yx0Tmhhaujhn5wy3gAh+7Fc56xNI1J41/mTnAbAmoFUNXSitakI+ywFQ1Mqk3yurbOUAUFLVznMAheXtBBDNvEmoW0AULFy84BwYwjPfvkQ3g+PiiV5Gw9nbD/Zu3i+d3P0eOXsGPWP9BJOyGbWt4IyjsZXAp20C/SO3yfmf4yI5//nLLzA0/js5/3W0UPSvaxnhDUxLifoXV7TT/+shbU6Rr7YT8bkVsPUKps9nCcVTOuf3HpRrkFPWuWfvHYKkgkrkEZBlEggwSl1Y20oO08Ydn42Ktl5iBKxDby8N+rq9j3+P/YyBQVPvNBtoInBo6hmmKM3kUSc5fh3vABTN23cThY6NQEBsGHyI7oeQ80enpZMkKCZpUovi2nYCi2G0UNRu6qJ7zFgEaxTSf57vteglp+8fvsqXGsfO3+OdmEZpDLKoPzHt+F3EBlr6JjlLqG0nkKL3W9rYjpyKWmSUVnCqf8baCioGepBROQ4pZUUcUpDEbom9EJc7hINyh7FPUgx7juzD5r1bsXn3Vuw6JIaN+3ZiO10PKcpCTk2ZrnIEEidw+txZaJgaQ8XMGGecHOBIzMAvOp6daYD8vJLH8VEJblZGZh8727sIRpZmIof8jzQxscPCwYNHBNmjJwT1k5pvmRrbrDU1sQ82MbG/oqZ19uVxdV2c0jEkpzfnel/tjBH0KDKfs7WHtZsn1EgGGFjawZE0Ozs5KL+8iR8awlhAH03EdgKAWlbvX92MnIIyZGQXI7+oGkUlrDSXnI8kQ2PbKP2fAaTn1hKNL4BHUAzsPP0RlsKWwJJIFsRwAGCP/Uj3egZHEOPwh3doHF+jTyGnLapsQ0vHOFrI+bt6rxDdf4hLRP0vXgMmLj7DwOhddND3G1jyjxhCcWUHbxBSQ6/b1D7BAYCt+bsExULL1I4+rzU0zphBQUUHJo5eRMVzKfo3Ip8cP6+mlUf8qo5+7uCVjH6Ts9d0DU47/T+MXj5Km7pQQr9fy6RCax/KmzqIcbRxx88uqaaon0/Oz47qSoQvOb1HiA98IoPgHx2GCJIAmSXlqGzuJgkxhPY+iuwD14i+30Df0FVy9sv0+CJ9vqt8W/Ew6ykwdY/XH4yev0/O/zvvzTAweo0fzsLOdGS5Bra7sJgkB9tglF5YgZi0LALeIFg4O+P4aQ0cUZCBzAl5iEkdoCGO3Uf28sEd//B+7D60HwekDmGP+D7sOrAXOw/uxx4J+lqCgYMEfS1OV0kCCzkcU1eHvIYaFLU1oWlmCkNHJ5IT/vQZY+lvTrKxpPJCZFiU9P41e18zO20mqh3497ZduzSFd97RF6SPnhRUlLUF1ZMGwr59hz/W0TE8YWpp16qiqf/4sOwx7JckaqesAkU1TajqnSEAMICuiQVs3Lzg6OUH37BoLgVU9c7C1sOX6GoyL2bJr2hAHelQFolYM5BGelxa1YDsghKkZeUjlyZcNjspOLeSvlfLnb+hbZJoYRvi0yvgE5YEa3c/3t6aLYPFZmbzgy1C4pOImpIujU3hjMMvMgmJxBjyy5p5O/KWzkmK/pPc2aco6k9deY5Jcv7hiUfoHrjJtwCzrcHFFZ3k/G38UFNWrcdONU5h8iM6Hc6+BC5eIThr5ULDGa7+EUjML0c2OX9udQvpbQKyqlaUE61v6BtHHWvR1U3RnEZ15yAqCRTKyfnLCRg4ONDjEgKAInI4xg4K61qRU1mPvGoapPezy6sowmfQZyOGExNFny2CJI8fXPy9CfRiyfnLUEOg0cH6KvRfRv/oTfp8tzA8docGXUdvYHSCbbG+QzJnupHIKAHA0MQd/nt9gzfob3CVWNkoL23OIMAJJWBlmpyxKydiVC5evrB3cYKGribkTxyDtKIMJOWlcFhOgpx9L8QkyZkJBMRlJSAmfRg7DuzDTnL8bXt3Yu/BfThC398rQSBx+BC27N1DP9+PNVs2Y9PO3dh7mH52RBLi8goQP34cx88YQt/WGQ6BEXAPj0VoYhoy8otfxiWkxJw9c+5jEyMLEQD8e5qEuIRw6MARYe+efYKEpOqrJ5S0vpI4KLdGUkLeUU5BeVLs8FGs2LgVC1auxeJ167Fm2zaiehI4rqlFzm4KUzsn2Ln7kvPHkObPhYtPEJS19UkGOME9KAz+UfFIyCpEVVM37ws4PHaTIvMQOXopkjOykZqVh8y8YhSW1qGgtIGcvgEVbE9AyziKq/qQlFVDAJAMO69AhCak8uOsEyhCsp744fxAy0xeeMR2/IXGZSA1p4IcuZcmOOvpN0Xa/zJFvsec9o9feEoRkDX6uIP2rsuoqCHdX9ZB0qMd1eT0Da1DXDawfv+RCXkIjc1EcHQaPAKi4eQTSlE5j2h3PYpIFzMHzq9po8ddROdJxxP1bh2aQsvAJJpJ09d1DU/TfgKA4pZuFBG1Z4BQ2zXEQaGKHjMAKGkm5lHfSkBSi0xy/tisXK63GdCxo7xC4+P4iElLI7rfwDsCsyRhN2n5/lGWwLuNkck7RO3v8D6L4+Tw4/SYjbHzd3j9Qe/INZIGl9FATs/2WpTXdPP8SEpuKa8stPb2gJGjNdQNdXBMRRnHT6nguLISZOWPQoZFfgYAclKQousBaQmIH5Ug5z6A/dJHcEjuKAWGI8QKjpDjk/6XlcIRAor9xAaOEnjslzrM2cF+YgP7jxyBuPRRkgdHsO0QgYmsArGAM1A5awF9G1dYstWb+FSaL3mIjk9J19M684mBnpEIAP6t7aiCsqB46KSgKK8sHD+mJpTXjAob12/7TOmYuoSmukHMIXHZ3oPiMg/ExKWwR0wCLPqLScvhwFE5HJZXxMnTujhraQsze1e4+YeR88UhIjETaRTtU/NKSQp4QfOsCUwdXODoE0i0PBuldR1ETS/j/MX7xAQuIreIaGZiKtKyyakKy3hBUGEZAUBhHUXkDlTWTW8GSiYA8AqKh6WLD6JSM5HFml8WlvIKucTsQkQlZyGQIr8XyYQQctb03Cqe1GvvuUQAcIFH+rGpJ3wMTzxE/9BttNH3ayjyl9LzF5e10+NeYgrDqCTNn04shHU2ConJRFBUGtz9WVVfNL1WKdFu0u7tA6iiCFzRTFq+iYCmexydRLu7x66igz5Xy8AEqknLs1qAanLWSholzNEZGHQOEAvoI+cf4D9jsqCstZvnBMqaWfKwi0CliaJ8NbJLq5FXWcNP98ktqySa3ob2gTF0DJ7nyTx2wvLwJHP+29zRGQCMEhgwAGB6nx3C2jlwCZ30uy29k/T/e/ixZiwvE52Ug8CoRN4e3NzBHio6mpzey56gv+9RcuSjkjjCnJscW1KGObU0pORlyLGPQkJBnkBAkpz/MNF5AoVj8jgiL4d9RPXFCRyOKslD4dQxHD0px5OC7KqkoQxFdWUo65wmkDHAcW0dyKio4biWHjTOmkPPwgEGtq6w8WXLhwzE6e8anRCpekz1fQMtQxEA/FuYi4W/YGFqLYQFhAvR4XGCpYelIH5A6g1pSYWv5eWObzkqfcxHTl558tBhmeerV23C+g3bcVhCFqoa5Oxm1jhtcA6aNAwt7PipNB6B4USRkxGfUUATq4xXruWU1iKvog4RyRk45+DMs/YmBALBsakoIKrMTgJiADB+4RZJgEbEEqXPKSxBCU304ooaAoBaFJQ08BbhpZVEk8s7kV3URM4dB2OKEKEJaSipayGdWs3LZFmVXHJ2MS/48QsmEIrNQE5RA5o6JtDaRRG56xKBzh0MjT8g+nuPHt9CW+cFVNX2IbeA9QNoQlVdD5rbh3leIr+4DrHJ+Tzqs9e0cPCGrWsAOU05GjpH0No3ybPj9e1DfLC+fKy+v2/8OrqHL6GLNe2g6M8iP6P5leToVd1D3PGLWTKQ5Qi48w+gpvsPefBHUrCKQIOtFNQSc2AA09Qzitb+cXpNtnQ3yh2/e+QSekauUFRn5yrc4oPp/MGx6/w6QKDQQw7fSTKrrnUElU0DqGzpRw7JlficYkSn5yAyJQO+4ZE4Y25OjnqCnFsSYkTbDxzeh6PykpCSPYKDRw7gMEXwg5Kk3w8dgDhdZY7JkaMfJYdXoKssJJVkIU2AIU0Of1xDhQBEkZjAIfpaDspaKhQAdKB1Th+6ZoYk35xg4mgHEydHuIaEwDEoBIZ2jvQ9d9gSs7OmYe7pD7uAEISRBEjLyL0dFhypKrZt3+vsBGeR/QvNwiJQOGvsIbg4+gsJ0Zn8eyE+YR+H+IfNVlPW3Gqgf87EzcUn3cLcfkTpuNqTNRs2Y/nqNVixei22bttFE0MC0rKKOKasilNaOtAxtpiu8mOVdhEJiCFKzGrWi0gLs+KeisYOlNPIr6qHT2QMTJ3ccNbGCd5hscgqruVLgMM0eScu3EFjay/ySyrJ6aso+peRs1eSBKgiSt5A4NDGs/EF5ezEoS7EpOTD1s2fdHEqSogusyYYKcQ0WCPM7KIaXirsTZE64Y+df3+l/yzLz/T/4Nh97vytXWwj0hAHmMKSpumEYys7wJSidEUzMsjR49MKifpnkJQJh5mdJ68lYEU57f3n+WYdNtjjLmIzbPfeXzPpnUPENkYuooEoPgOAUmIAJRTVqyjS1/ePEhhMSwHGCOr6htFI0byqcxoAajqH0EDA0dg7gVp6rSbWAZicumfsGnpp9BPAsDHAlu6I0g9NsEarN+hzXSMmcIV3Dm5nCT0CpYp6VjzE/gatfOsyWyIMTU5HQGw8nP39YWJvhxOn1SBODr5bbBfED+2DhOQBHDy4B5Kk6w9LiBEAiEFagaI7jSMyR7j+VzhF80D9BE5qqUJVT5MeH4faGQ1oGGhB18QA6gba9LwqFO1PQkVPDYZWpvR6PvAKD0NwYiJCklMRwHoVEOh7kCy08Q+BuY8/HEIiYBsQChN3Alv6Ojgq7lFgQGiwjZnNn1Mi0gSpY6J+hf9s0zqtLaxcs0Rws/cTBtonhR+/+PVVP4+Qb+OjUw+FBkUF2lk7N+3fe3BMWkr+obqaDsSI5v+2aBl++nUGlqxchrUbN2D3PhYRFHBCVQP6xmawdnYjre8HR69geAXHIIBod1RyDpKySyi6N6G+Y5BHrOa+EZQ1dXAqxxDe2sMPvhGJBBTVfMNLF7GAQYqavaSXGxn9rSHaX1SCzPxcZBcWo7yWHSzawU8crmjo4TXyjH57hcYiLqsAlSy6NrTzVlilde3IKqpGaEwaQiKSeQRv6Rzj5w+yTH73ADnR4A0+mPOzDUYlLNtf1kxA04xqev665n5ehJSWXYb41HxExGfBmZzf1S8SsQQGta0DvDiHOT3T3mz0DF/hy2hs9JOjsjX2FgIGdtIxW85ja//1veTIA+NoGZpE2wh9Vnpcw5b6KJrXECto6B9DLUX8BorwTf3EWAhAmuk1Gsn529k5CuP0/ETthy/c5SDTR68zPW6Qpr+CbnpPLT1j5PSDvKiI7T1Iya/gIymvHHGsR2B6HvxiEsgJI+Do602Oqckz+DvFduDAkb04QE4vISkGGdnDkJA6gKMU/eUVj+K4yjEC/FNQVFGkaK5Mj1XI6dWhpq8BTUPm8Pr8amR9DpbOtrD1cIZboC/JPXdYudjTY294h4fALSgUvtFxCEvNQlw+yTZibDG5JQhOyYE/yTn7yGg4hkXCmUDAwY+YgIv7S0Mj01pFGcXFbPl579K9gqqKqsih/zlmpmcunNUyEJysfAU7E8e3slPLFlSWtqs31fenJSZkTZ48oflkzerNmDNnEWb8Ohcz2em083/DwsVLsGTFEixdtQyr16+DxFEZ6BoYwczaAfZuvvAMjIRfeDxYkQ1LugVGJSM4JpW0fxYHAXYsWEvfOLpGLqCBJnpWeS3MnD1JCrjz7Dw7RTe/rJH3/mM9AMfO30AnOUplXRPp7lyi3glIzEhHeX0bqlt6eZVcQ+cwyhq6kFlah0CSEYk0iVh0LWumCF7TyllHQkYR2KEbofS+ysiRGyias/0G7awz8RA5Z98VAoTz/LBSttSXVVjPk3wF5U18iTK7qJbv90/KLEFEAlv6ioS9ZzCiUnL5ISfM+btJ43dQlGWRfoCi/hDpbub4DAh66Xu8DTpF73Zy5PYBGsNTaB+aHqwUuH2YJQgJPEbp98YuEjgQQJDj1xFgNPazIiGi+YOsYvDa9KDn7Gfr9PQ6Q+dvcwBgG4pYkQ4bDR1DvJqSAWA23Zs0kl+sIWhochYiM9hegQKEEdUPjE8kJhYJW09XaBvp4ZiKAqTlDuGI5D7Iyx+BjMwhSEqLQ0ZBErJKMlBUVoCKpgq09LWgd+4M1M+chrG1KXdy1lXYxs2RO7iTtztcfL1oPoTRPIime5VKf98CGvm8cCm7rAzFdQ3IqqhFfG4xwliz0sRMhNN7iyO5GJ1diJg8kiT5RdPlxUmZ8A8Mf6ampjUkLnZY4/D+g+8c3HdYOCV26l91IOzfndmZ+Qk6KkZCYfG4oHry9Be+7uGnm2sHmydH7t3p773yIiAoFrv2HMYvvy6gMQ+/kvPPX7gYS1euxMq1a7jzHzgsDnsnZ4RFxiIwJAZB4UlIzCzlR2mxdf2EzCI+ErPoj0d/2KjkbJICuUjLLycJ0EUsYAItFO0q2noQnZlHLMADHiGxiEzKRXpeJRrbhjgDGJlgADBG0bgaEXGxCIoMIbqdwA+9rG3vIypNNJn1wmvrRxFF/JisQuTVtvAy21ICALaOXtJATCMunR8lllVYTY4+TAyiHdVNPRQhLxIAMOef4I1AWYVfVkEtb/DBd/oVN/AuP8XVbUij9xUUlQpX3wiK/OGIJGZTQeDS2j9JVP8iB4BuHvVvYpgccnjqDgZJf/eOXuNSoLX3PD8PsYscv5Mific5fPfoRfqanJpkQffoJXTQtY3AsWmQHL6XLRdS9CbQaBo4TwzgPIHEZfSyijx2XyjC9zLaPzkd+XvpfnUMTKGJVeeR85fVdSCnrA7xGYWIonsfQs4VmJBO9DoTQSnZCEpOg2dEBCw93KB5zgAy5NhHZMnxpffjKA1ZNqSI5pPzyx+XIVp/ipxdE2rEEHQM9WBpZ00SyJOkni85ujcxviCExcfRPMhCeEICUnLzCMyrUVLTTCBaz0uW2SamqpY+XuXItjTnkUzLZJWMhWWIJbnmF0fUPyIOwSQBIij6+0XGvfAKirwfEhbXGxuRmOvp5BWgpaIlf+jgka/OmOsIx5QUhZMyMiKn/lvN0shF0NewmD4B1zFkRoh/sntOZu21wYGbvCtvSUUbTCwcsXHrHsycsxCz5izAvIW/YdXatVi3aSM2bd9KtPAQzhifQ0pGLmrJAZizFle2obCynXR+BzJJb7NkXyrRTN6KOrMQyTnFpO+r6PvTB4Sy2vM60sEsC15Q10raMxV2HkHwDUtEanY5X6Jj7cLYmQAd5AR5ReXwCvCHT4gvgUoqRfVW1JM2ZlVyjcQo2HJZYWMHUok+Fja08WKbcnruUvpeOr1ucEwKT0SW0SSsptdmkb2BtDADAHYmIduLkJFXzXcmpmSVITWrgm/3ZYU+DSQV2HbfqOR8eBI4evhHEbtJ5yW99QQmLX0TRMWv8Wg/SNGYdfJh/fpGL/2O0Yv3MTR1m2t0VknHknSdw+fJ2aedno2e0ct8sOQd2w/QSgBQ18e0P2n1dpYEHOJA0EhA0zI4he6Jq+gep+h//iav0e9lLGPkGpcYjIEwVsRAtri2FYkUWUMSUuEeEgnP8Gj4RMfzzUAuYRGw8vbEWTtzyKopYf/Rg9hxYDt27N1E+n4n5OT2QUFhH9H+fRT990Fd5yQMLQ1gam8OOzcnuHh5wD80lKRQEs/GZxaUElBW0RyoR3FVI4FpB2roPrNcCJND7DRotrzIBttDUdHUiwpicLkEAHHZBbxRaQxJEQoWT9JyS65l5BaNxCenN5ia2YSqqGhpq5/SWmV82vCbs6r6Hxpp67/B5rKqmoogKys6rehvNiMNE0FTSZc7v5t90JzkuJK46orB37t7KJr0XeURz9zeA/sPH6VovxYLlyzH4iXLsGzFcuzYtRN7xcVwVFEeJzTUYWbnSJo6GS1dY7hw7RGPeuysP9ajrqimjVPOv46MIpaNr+AVbKwzbT6NInLEyj8KX1giLLeqCV4hcXDwCEZcSgEv9W1sHUE/ReduinzFFXVw9vIk2u2E6NR4ApoaNHb3k0NMkE6eQHX3KIoJjIqbO8lx+oj+d6KotpmctB7hSRkUmdL4igCrpGM758qIAbSx2nd67qaOYS47EtOLkJxVyq9p2RV8h2JtyzABxjCBBwFQcALP+rMGHgzgWBa+jSJz18hlXifPnH/4/D2MXvgdIzRGCQQYPWdRuocAooP0e/vgJPomSbtPXpmO+EOMDUzx5CBjEqxGoJ4VCvX/f6OWGFA1gUEdgV0TSYdWYhBMKnQRYHAGwEHgxh9JxotoontRxcqM6R5kVdQQwyItHRsPl+AQnHN2hoG9Hc46OUBG4yTE5Q/jyDEpKKodp+h/hGt+abkDkJbdAxn5fVBSlYGmvgrOmp+BlaMVPAN8EZ2URPKokEC0mu/VqKP70MxWP3rG+X6Clm6SN30XuLzisqd7ku+wbOggoG4Z5PsQsoiZpBZXIjGnAJHxqY/DopImIqKSc+Li0i2y0gsks9Nyl8eExfxkccb045N7ZF5PSigTnMwdBcsz5sIZDV1BRlZGOH36tMip/1az0bURdBV0hYqWIcHa1PXHhNi8sJrqgUe9/bfQP3KPol41jMxdsOfAUXL8lZj321IsXbEK6zZswPadOyB++BCk5Jj+Owk1XT1WV48YosCsfJc5/9ile3wvO9PCbFdZSX0nCtmBFBXTTS/yWTksDUYDWfKvtLmDIlvfdNa7uYvvjsukScESgVHJuSisaOadgjp6JjkA1Ld208RLhj9JgMTsdHquKtSSfGhiWXFymAaiy5VEK6s7B+jxEN+Wylpgp+SXIjAmCeGJGbz+oKi6iQ+20aiF7bhjibHyRnL8EsSnFfBtr6k5ZbxDT1FlK0mCZiRnlCE4Ig3mtl5wD4hCQlYxPzeQRf9eisTDF+/wzTLDU3cxMnWfA8DoxQcYISbQzYpriKr3jF3lO/16xi9T5CbnHyPnGDrPAaFtYJLnRdgOwOqOQdR2j3BQa2aOTgyhha5N9DtstAxOD54rYMDBlvwIBJgcmL5eRhuxDMauGANKpnsQkphOAJAIl6AQnDYzg8pZQ2ianKPIr4yTOprQNT0HG3c3mNrZQc/4LHSN9HHWVB/mNib0mS3hSD8LCAsjCZaIZIrU+fR3Kq1tQy39nRnYsM1JfHlz6BIHIHZlOYjW3kkChwF+QEk5O5uQWAH7GyeQLIxKTH8WFZ9yKTQ8piQkKMLaw813u5O9+58UZI+9wQJUZ2u/kByfKlidsxLUjqkJx+SPCau3rhYdS/4vMVtjW+E1uvr7hhF6Gn2eGJPjXlvTd6+8pp8o2RSyi1pxXPUsRf0tmDl7EeYsWMSdfxlp/jXr12HP/n2QVVSEkrIy1LR1Ycq28XoEEACQBGjp53/sgYnrmLhKdPfCTTTRZGbr1KwIppSAoIK3sGKdbNp4UqqcnLmklSJ1zwCqyVnLCQhYGWwJTdhM0orJ+eV8xYA1vGglCtlBGriDKHF1M+uEw87sY513m1DX3osWcvwmGg09o3zjTEP3MD8eO7OkinRvNuKziF6m5yKWRkpeCXLLajkDqPiDopbXtZPzFxO40O+m5SONnD81pxTsgI7YlHyEhBPoBMQ8trPznjA2cbgVTZ+ZTWK2qYftpmNOPXzxNkYv38fYlQeYuPIIE5cfcQbQO36T6P5VvqOuZ+IaBqZIZl28RbT9CjpIBrQP0ecaYtn8Cb6ez2oDmini8yjPkoPEELqI7nfQlX3NKwjJ+dn2YbZzsJlVE5KzM1kwXWF4gT9m32cJxNqeYWQTs0ok4AtLySQACIWxgyP0La1gYG0NSzc32Pv4wc7LB0FxSXxtPYK0d3gCPY6PR1x6Ojl8Ht2TYmKHFcgurkZBRRPPhxSxJii19DdkW4gJCBu6R/jfoZn+9ux8gpq2Pp58TCd9n1xagdjcohfJ+WVP4lJzrgUERrQF+ARHk56XcLd1/+Gslv7b9x5C8PUJEWysHAVdXWPBxOSccPbsWZHz/ltYaX6jEO4TKfg4eH+QFp9r2NY0dH1k7BZySlpg7xUJMelTmLVgFX6dtRiLF63C2g2bsH7TZqxasxqbtm3FYSkpaJDjq2howc7ZHUHhCYTgWRQhW/iyVwtRP6ZfmfMP0QTvJrrbSpGAZa2bWNabTVAe4UZQT8DAlreqegZR00v0mq4VRNlLCBSya5pR0NCOgjqi6KTda9sH+BZYdg5eO/v/nWxvfBdp8l5iGV2oae3hk62ZXofpcPYabJmxsqmLZEcFBwDGAtLpcRJp4QyinEX0GmUNbAI38l4DpaST89nmGprcLFGVVVSJdHKYmLQ8ovvR5PzR90MCY1LVVXRVzcwcKlNzSpBD/7eU5Ab7XP0EfIwBMAAYv/YAUzeeYPzyQ079O9gOOrYGz7T61A0M0r1hANA7foVTf+b8HeT8DAxYQrCT9wS4hH763eHLtzFymRjFlXsYunSbWMMNrv07xy5zAGjsY8nBv45padBIg+UOmISo758epUTPM+hzhafmwDMsBu6hEXAOCCLH9+H77j0jouh7kcQQkhGSxLYNFyIsmSRTcjqvqIxNy0Y0gQerpkyne5lB9yejqArZBIIZJTVIo3uaXlqNbJJarDqRJfWyyelZa7Kk3EJeWxCWlPYwPC6lNjUtzy0xLu1oqF/YfC9Hry/1FbVeDfIJFuwt7QXjs8aCm5+bqJrv37yGX0JCcLf1EtRkNV7LTMiW6yLueJGo6cSFe0SjW7DjoBz+PGMh5pLjr1i5EWtWbcSGjZuxkQBg+86dED8igWPKKjCzsoONoxtFxHjkFdUQDWzg+p8VldS2DXL92ksTdOz67xi/ThHwyu808W/xrHU7gUEvgQLreMN0K8tys6WuVk5tJ3i5axnbG88Ot2AbXxrbkUfOWd02XenG1rGbeGXdAN8KW9HUyQt9WDER24vO98kTZW4icJkGgG5e/cc0PzsgI5+dilPdyAfLC7D/y07IzSPHKGQ9B+nK+uqVkDwpqWvl+YrAqCR4BUQ89PENDXe0c5utdkrjZ3//0CJ2KGkuPQ9jG4z5sOQec/6Jaw9x/sZjfh26cIfT8W4W+bnz38IAOX7/BZa0u8oTfzwZSDS+Y5AV81ym718jGXGTnusOJjmQPKLne4gLNx/z68Q1uq80Rq/eRe8kA4JLPNI3MEcnAGD3kNUP1PSOEKuiCEz3hI1KuielJK/S6PPFkBMzJsDkAFt3946KhgtrGEqgEMyKgBJTEZ1Nmjwjl363APGkz0PiE+EdTgARHcOLhAJJBvhEsUYd8fT/Y4hVhNE1jr5OoOdNgEdYJP+dIHocTKzCMygSzq7+F61N7FVNVc58+pLofUhApODr7C84mjgKRjJnBRkzGSFQWdTj79/cNDU1hf1iOwVf9xDBwtjmLylxWfk1lW3oIbroH5oIeWUtzJi/FDPnL8GCRSuwauV6rF61DqtXr8XmzVshISkNtdPasGQbdnyCkJxegFLS5qwirrVn+qiqIZ6Jpsl74RZR1cvopa8HLt6jyX6HJuo0AHSQPu1nDSUIEIYuTEe2YRp9bI2fAKGV6VtGHckZWNELkwM51c18HZ8tF9XSYDvb2Lp/0x8sopYmfFPfKFr7pstg2bl5TNPXEUhUE5gwnZ9PTs4TfsQqSinqs1FG4FLZQkDT2Il8dnZeDQ16LdYCq4ztviMQiEzNhaWjJ7Ges60nT2osCwsPFbQ1tT/y9w/xT88tes4KjKrbBnj9PFt/HyfqP3ntEXf+MQI+BgD95PT9l+7SoMeM9lNU76bI3zl8cTrxRxG/lwCxn+4dY05jV+6Toz/CpdtPcenWU1y+/ZzGU1y58wyX7zzFxVtPcOHWY0zdfMh/v+/8Nbq/13jxUB05PsunlLWRpOnsR1lHP0o7BlDWzkY/H4X02VKJ6UQSCPgnpMGN2IC1byBcw6PgQQ4dkpbJDwn1S0hBFNH+iPRpEAhNTuFtvBz8/OHKGqxExxJrYMARBlvfADgGhJDzJyEkORPRmfmIIKbBkq5uAeGwdPGGib0nSUb3303POWRbGNpqOBo77nEydpplrWf1blvjoBDiHiF42/gItgZ2gpHGOcFM21wwkTsnnDt5TuTA/1qzN/EWjkopCrPm/vzqUWmlg7pa5y4YGtnA2NIJKzbswM+zf8Oi5WuwaOlKLF22GuvWbiIGsB7r123Enj37oKh0EqaWtvDwDea0nx3TNU4T/hJFqEs0Wa/fe4ZbD1/i+oOXmLr9hGj/JdQQK6jtJirKzqWn0cI6zLAyVQKAkUv3MH6VnIUYwtSNp6SXHxCI3OVjYJKi5fjVP7LgYyioZ7vf2nnTTLakxQCAAQHT/CzJ1ToyxQdLoHWxNXUCj/Z+kgsEBLVcf7byjD8brPSYRX0GAFUkNWo6pvfds513THLkEkgUESCwr+PzymDnGwpljTPPDh6SCT10WPLjI0eOstv5ipe3v3xOYfmtGtbHr2uUl/iyBp6TVyn6X3/8DwDAPieL+t0U0bvI8XtpMC3fTs7PVg143QCTTASIIwSizPmnyOkv3XmOK3dfktPTPaXrtbsvcO3eC1y//xJX7z7nQMAAYOQSA9Pr6CMA6By9RJKAVQsOEnD2kLP3kqQiRtXJpBXLrwygmAAxjz5nOkmXFALFhOIquEYmQMPCDoYk6c65ecPMwxcWXv6wpOEbQ+yHfu4VEQ/X4AiEppBDh0aRsxMA0M9YD8Gw9DxEZhUimSRBDuts3NLH6xSq2oaQXcoSvu3TR6Xl1ZKkqkNaduWLkLCk30MC4y4lRKY3Jkdmuge5hO33sfKb5W7i9pmmlMqb7CYnJRQJeprnBP3jhoKJsolgrm4uWJvbCDbnSCaomghqClqCoqKayLn/6fp+C0FbXY8v+QX5Ry3184ss0DOwfC5zTB2rt+zGd6zAZ85vWEzOv2DhEixmZ8ItW4H169dj166dkJKSho6+IVw8fZFAqJ5bWM3X4+/ce477j4A75Ph3Hr3E7cfAtd9fEjV9gLbhK6RNp1DRNoLKNrZhhYCAwKCZlcjyApYbFP3vT0dMcpoL15/gyk2a2Dee4fzVR/T93zFMUbN78jrPglcRzWYFPnx3HWMC7YNoJgBoJe3NKuWYjGhh/fRIR7cRaDQTe2CD5QYYA2DOzzrnMDBg5+Yx6VBBMqP6j+XHYoqKTMsXNnSgiIAmk+SAR1gcFNV0n+3cc7hxx7Z9O48rnXrNWM+A30dPDx/xnILSK7X0/IzCDxOoTdDnPs/o/3XGAB7wfAADsjZy9vbxy3y0jV5EMwFbGyv2oZ+xFQFWuDNGMuz8lYcU8SnKk7NfvQdydBp3QABA4x4DgeccBBgbuHiLgcz9fwAAli9oHT6Phj663+T4rAAqlSQPy6WwiF/OciYDY2gYnkRN/ygK6LOnVjZwAAjNyIc/RW12PLhzaAy8Y1P48IxOIjmQjdicUmIChYjMLEBmZSMS8ivI8bMQlJSD9LJGlDT18kKl2t4JAmtWy9GN8tZhFNf3I62oie71CNoHrqG9h/UPJLYycgMV7MTlqk7UNxBLq+h6XpLbeK2mpL21srglIz4qyzHYN1bJw95/jYa89hfL//zb658KwqvCH+cGXL70UAgJTxZMTOyEk8c1hFMnNAVlJWVBTV1dED4QhBN7TgjxFvEix/+rsbbJNSWtQkxo4s+tTX0JZRUtj0ztPKFpaIHFqzbhBwKAxRT1V65aizlz5mHhbwuxZOkSbNm2CRJSh3DilDIsbR3h6RfKNf8gTeJb9x7iybOXePDkBW7ce4QLN37HRYr854meTt1+hp6JWxTxL5GDjaG4kRy3fQQVrByVVab1TfLE4MDUtAQYpcGc5zI72/4mTfBbL2mSv8D5m08xSg7VRzSaORFb4mO73+p48wxy8D+KYZpp4rMa+jqKdDUkDSopgjNnLyGNX0QavZicoJyiHgMDdmWJQSYNWGa6uLYNxex7xAbYejmj/6z23JWinJqu0bPDh2Vrt23ctXPf1r1vREfFCD4Ozm+H+QQsNNQ3tAuLiLlT1dCKLnp9RsWnSJ9PXScAIOcfJednyVCWzWflvb1E0zsnrvDlvPoBVuvPtgNfxxDbgz9FUf/yQ1wh8LtGEf8aj/rTjn+NjXvgjs8GkwEXWE6AXmPsMltyvMHzBm1DbGlwlC995te2IqW4BvH55YjNK0FyaSWyappQ3jWA1vFLaBw5z3caFtA9yiRwZHKgjJhQDoFjZHYxkkrqiCG0ILehm9gCgWJzL9IqmhBfVIWEompE55YjvqAGAXFZ8ApLQmJOOQqqWlHTPU6A04mEgjqkljQika4ZZfT9zgkCu9uo65oiuTRBTOchBifu8ZZr3X3XUNswgpa2KYxPEehP3EZ1ff/z4tL2+0UFzcMxYZlJqTF5pmnRuVop4VnK6TH5ckmRWQecbb3X62gYzZQ8Iv/59s273tm+YQNfMrSx8SKJdk5QU9UR1NRYa7BTf9/JRANNK8HG3FnQVNZ6NzUp16KgoPquiaUr9kgcw5b9kqT5l2LugqVYuHg5Rf9F+HXmLF7ss2HzRuzatweHJSVwUlUdTm4+SEzNoz9OJyYv3MBDcvxHj5/j5r2nGKFJyPR3P0XrQXZsNU3SwYu3eXSu756kyMpKc2kikWOWEiWv6WZOPMqXqli1G1s/HyKazCrmxi8xB3pCkfA5AcATDF/+nSTDHXSM/C8Z7/8FBNioYHS3uYMiDeuJ38SrDP+q+Znz//VaRVGPSQDWO58tQbIEIcsl1JNj1LEmHOT8qQWV8I1OhpmT5wt9Y8umE0pquw7sEn8t1DtECPTw+bo4N9+kpryiOTQk7Jq7l++LitomdJNTs4z++NX7GCWdP8hyIeNXObVvZ3vxWYUfaf5Weszq+FtZ229iQH1slyN9Xnbc15XrT3GNGBA77psBwFUCQHbkN7teuTPt+FfuPuMAM3GFSY3f+Wv1MudnS4B9o3QvBnk1JQOAVHLU5MJKhJN+94iMJa2fimSWpSdn51uNGdgxxkN0Pa2iGYkl9QhOK4Q3ObVrRCoxgWS4R6YjIqsCvvE58IhKI4aQSt9LhqVPGM7Ye0FR+xz2SClB5qQWNA0sYOrkDWPS+YY2bjilZwplPROYOHghOD4T2eWNiMuuQEBMFhLoOQsrSYpVdaGsphfVjWwfxiVMXn7EmWDf6E20dLOy7Bu8O1Nr++TTurqBR5WV3Q+KilruZ2RW3vL2i53w8otucHIJSrWz93E3NLQ5q6tlcsDCyG6eiqL2pyuXrZ4GBAc/4Yy+maCuoisoK6sI2tpa/ISqvwtjhRKqpzS5Zg3yD9/n4uQzpHhME0dpbN0vi1mL1mDeb8vw25IVBAIL8eusmTR+xco1q7Fj717s2CcGKfljUNc2gJWdO1IyigmxJ3Hj1kM8fswAgKL1zUfoGb1ClHwYTX3nMXDhFi7cfYobD1/gwu0HfM27gW1ZpcjPaHYB2/pbxzridqGqfYBvaWVFLKw6jm9moQgwTHSY6+fL93iJa/f4dR7pueMzWs+aZvA+eqyddh89D02kJtL5DeyEnHreI4/RfubsjAlw6v9X2s9AiCI/AwCWS2jtI8kwMMETikWVzXzPAjuhyDsw6rydo6f83m2HXrc1tREczR0+zkhKty0vKbtVXV2DotJy+AWFoaCkCq30f1kUZtGYZe95DmNsurqPAQCTCMxRecafj0u8uy4rDb5w7Smu3iBHv0H0ntjPtVt/OD0B4NU/AIAxo6mbjznA8Oc/P/06LOHK9g4w8GV7IVi1H2MzrDYhLquY74WIysiDR3gMLNy9ScOH8Qx9RHoOgQGBZEMXMYEhROdUwTU8jRw7Gi7h6fCJL0BAcgnCM6qIPbQgJK2YJEEmgtPzEZCSC2v/CJh5BMHY2QeyarpYvmkX5i5dgzlLVuOXeUswf9lamlsr8P2sBfhl/mLMX74Wq7buwtod+7FVTBJiUsdwTFUPJ9QNYGbrAUePYLrfsUgjJsGKhVpZzqhznBgeyabhG6jtPE9BZIiCyQVilOPIr+5GdHo5ssraUEiPy4kxZBc1PU7JqLienlbe5uwcnObnF2vl7RslaWLqsEJTw+AbyQNybzM/CIvIEGysXAUdbRNBU0VHOH5c6X8uAByWPCzonzYWlI+p/sXKzD5FQVbl+bq1u7FuoxjmLd2C5Wt2YNWajVi0eBlmzZmNmbN/xdIVS7Ft9y5y/v2QkDuG0wZmMLVxpT9QNE32egxRJH5Eev/ZUxAAvCQaeo+09wXUdIyRkxPdpck9cfMBSK7izlMCgTuP+XLg4JXbaCedzva0s6RbLkVbltwra5ne217fM873tLcOsE0xV2mS3+Talmlk5jANvGlGL98vz9ppZ5DjpRVXILeiBpUtbRTBu+lK+r26gUd/RvVrCSBYEpAVA1Wybjv0dV3HAF8dYElEtpzYRSykY+A8XzVgJcFsEoZFpT7y9g33M9Q3+8zYwEb47c8LXk2KTJQoLyo/X1bO2ofVo6CsHIFh0SgsrUV9az9ffmRr+swxGRNiKxosu892+v0VAHimf/I6rxcYu3wfF288xSVy/CsEAGxcvcki/0vu/JdvPuPjwo0nmGTLicSoWD5h+nmnE4hMXrDXbWQNQejzFde18OXNVKL+8VnsQJBSxGYVIDghDTae3jhrZwtjBwfY+vgiqaiUS4D4QqLyifmw9o2FmWck3KOyEZ1Hn69pGLV9l1A3cBFl7UMIJL1v6RsCl4jEaQbg6AUTd39omNhg26GjWLZhO2YSk/zh1zn4kcYPM+fgmx9+xhd/+R4ff/0NPvjyK3z81Vf45Kuv8dEX9PiLr/HVn77DjzNmY8bsBVi8fDW279oPpVOaMLdjXaMi4ReZgui0EkSmFhOLYEebVyKnuoNGF4KSixCXX49CAoYyAoXOybsEDhPIK6G/YW4dyuv6nmQVNdzxCYofdvUKy7d19PWxsnE/ZW3tuuWcsc2vKspaH0oekHidsYTIoATBzzlQ0D2lK0jLS//P2E0oIXFCOCwmLWzftOeNY7In1ZTkVW8cEpfDmtU7sGLVLmzeLoG9+2WwYeMO0vsrCQBmEQD8gvkL5+GQpBROqp+GmZ0bnLxD4RuawLfAdvaO49KVu3jyhADgGXD392e87JXR/OrOMYrMozy5NXb9Hm49fYnbBABXHzzHRZIJV4kRXLz3GCPXSPedv8q73uSx02ZYVSCr229ibbEHeK88xhjaebOMS6STieKSI7HmmaVEW7OriErmFCEmI5cXpyRm5VPEr6QI34Kq1k5ycKL0ROcbu4Z4j3tWD9DQPd1Gu4V3yhnn0Z516WknNsM2ALGW2M30NWMGmfmViIhInbS1ctt19SWE6qpKIdgraF5pfmlZbXX9i5oGtimoDnkEBOGxSUjPKuEAwHbcsWjP6h9YkU5L/yQ/1IPV9vcSE2AAwJf5CNhGLtzmqx4Xbz7FFXL4yxT5LzEQuPWS50DY96fYSsIVVkJ8lxf+sHtQ3zPKJQ+rtGNJ0Mo/ZAxjM2x5k5U8s6pHVvCUSPcoIZf0fH4p4nMKiRHkwDs8DMe0NHBAQQ42Pj4ISUmHZ1QiRfgCHuVjSLMnljaTLBhCz8Xfcf4eAfjvxD7uPUHL8HlePxCUnAsDovnqpvbQtnSGnrULlPVNoHT6DHaLS2HZms2Yv3QVfpo1D3/5+Vd8/f0P+PRP3xIIfIlPvvgMn33xKT765EO89+F7eOf9d/D2u2/ReBPvvf823n3vHXzw0Yf49Isv8afvf8asuYuxZPl6LFqyDouXrMX6LXshf0ob9l6hcAqIgXNwAqJYI9bkAqSzZiZVHcguZXmdfpIc7Siq66V70oas0gbklDW+SMosuR8enX7JLyC20d09JM7c1MnSwdrzsKut9woHE8dvpXaKv35G21KQEj8q7Np94L931l/6qLxgYmBNICAzS+KQfNmeXRI4dEgRa9fvxo7dUjgscRK790pj/cbdmE/IPWfuXKxcvRyLly6CjIIibJ09EBCeAJ/QRN7wopEm+LXbD3H/4Qse+Z+Sg9+6+5gi2i1Ud1D0bBlENTuphib/CAHAdZYcfPQM5+n/TN56xAHgOv2/C3efYPDybZ4RL2kbIADoIjbQivz6ThQ19qC0mbXHHuSTnG0T5pSZnKdl5AJf0sqg6B4QT/qU6Ky9uxf8w6KQmFHIi3dK69tQS87f2j/GO+30DE9vr+0gjd49Nr3ZhlUIthLAsKO2eoaJihPb6B6Y4sdr1ZAjF1e2ICU5v8bK1Hmmg6WLIH9E7p2I0GjroqKyh5U1daRbq5BRUIDUnHzEJmcijiIjaw5S3dw7XahETs/Lctl7p9frpvfQx53/Ks8LsKO+Bidv8iXD89cec4efus4i/QuK9E/5noFhkgasZLiLpBWr9mv9w/krWW9BVtvQMciPBGcJTNZTgQ222y+7rJYDQFIeO9Yrm+/vZyCQQoBQVN+MytY2BMbF8X79Rn8wgYC4FKSW1CK+oBq5dP/L6T40j17DKIHQhXsv6e/3BBfvPMH1hy/p70mMj2QIy+cEJ+fDKyodTkFxMHH2h6mzL5Q0DCBz4jTEZY5j3Y59mLeMgGDOfJICs/H1Dz/gy2++xp/+/A2++dPX+ObPX+HrP31Bj7/AJ5++hw/ffwPvvvMa3n7ndbz51ut4443X8dabb+Gdt97G22/Q9fU3+fWTz77ELwQuK9ZtxU5x6RdH5E/dUlDVGThr49TiGRjVHRCW3BUYntoXHJV+IS2/6nZpfefjHNY3sryB5F0xEtKLeRPZjJxKhEekPk1LLbqVmVYylp5UkO9o42V4XF51zrefffWa6VlrQfOkrnBaXkPwPe3732vfwccfCUJsTJFgdtbuUw31s5YKCup3V67Zjg3bDhCtV4GYxDHsPSiPDVvFsXbDXixetg6z587jzr942SLs3LsPp3WN4ewZguCYDJrw1RQlJ3H7/hM8pOjPxv2HpFGJ6rOIV0UUkTluJ0WqsduPMHKDJvfdR7hBIMEc/9J9orQ0rtMEunSfWMPlO2ikCM8yzHkkAzIqGpFJk7iAWADTpaVsj/gflX71PcNoZuv845f4ElZKaTXO2jph1ZYd+P6XmVixdhNMrd3IIctRXNPGewIw7T1x9R452H1yNKLOPCpf4RSd0XK2D7+dAcDQJQyMXeMsgJUws73pbGtwQV51rZOl+y/5GYWCjqr2Kn//kM60nDzegiwjLw8pmVkoKK1EJastINlQVEHvnT5DSR0rMmKNOtkZf2PTW3vZch8r9KHXZoymf/waXzIcvXiP3iNbMnw67fiXH6N7/BY62SGg5ID1bDdlD6vhH0V5Wx9nSWWsoQc7Io1YE9uAxCZ1XnkDb6HONlllsYrH4nLS/rkIS01HSFIqAUEOEkgKsH0VTbxkeAgFdY30PZIGiakIScwgZpAEl+B4ov5VSC1vQR47Fq3rPEavsArEJ8REfsfVO8/5MuT1+wRUNx4TS5si4GiGa2gKsYkoGDv5Q8XQFqpnbaBj7gRVA3OIHT2GDTv3Y+XmbViwfBVmLViEuQsX488//4Qv//wtPvv6c3zxzWf49PMPOAB88O4beI/YwDvvvEFA8CbeffdtvP/BO3j/fQYEr+Ltt14hUHiVwIGAggHDW++9eOuNty+899Y7Gd9+9oX5ojnzT+7avHvHUclj6/T0TPaaWzkds3Vwt7F19MgNCI2+EBKZ8Cg+o/B5bnkjMopqkJRTxk+DYpvN8oglRCdkPwj0j642NbA+rqdp9P2iGQu4RIiNzBTsLNwFvdPnhFNHTwlyh2SEnVK7/muCwunThkJKUo4QGR7/UXVNp0VtQ99ltqd+Pzn96m1ikD55GrsOyWLd9gNYvnY3lwMr12zDjFmk3egPs2TZUhySkMYJFS24+YQjq6iOT+Krdx7h3oNneMS0/xPgFtHCC9fYOv5dDEzdIBkwgqErd3CVnPwCUf7xWw9xkSTCxXvPMHr1d4zfeIgrv1NEufMU/ZfvopIod1plM3LJaZgUSCMHyqpuRRqrwa9spEnOegV20uTvQf0IOevlm2ibvEy0LxJLN2zBm+9/BOHV1/Ha6+9i9ryVMLf1pvdaT1F8iDfdHKfXmLr+gANBF7GNjjG27n6Zb8NliT/WE485ft/wZXQSIDAKzzYrZRdWIyOtqNhY1+SH/Vt3/6yrphXl5ev3JCEzAznFxUjPyUVmbgFqm9rpOSbQz3b2DTFQGef1CQwAallJMgEm3+I7OH10F2t91kuvP8RKfC/d5SXDgxfuYugSW+W4i5bBy6jqmC6cqiQZVNLMNkT1Irumhd+TFIrS2Sza031hB4vk0v1i26szi6qRyd4zXZNySxCfXYCINFa/n4bI9CxEk0SKIxbA/i+rwWCbidgmoprOfn4keXxOCTxCEmDi6A8nunpSVLfzi4VHaCoSsqtQVNVJ7G+Mn048RYB1hS3PEmPpGruDitZxJBU2IzytHH6xeXAPT4epawiMHP2gZeaEU/rmMHf2wTkbFxzX0KM5tx9L12/DkvVbMGvpMvw4fx6+n/kLvv/5e/zlu2/w4w9/xjdff4FPP/0YH3/6EY0PSA58RON9vPMeAcDbAoHDK5wpvEcs4YM3CTRef/3FR2++/uDD116ZeP8Vofz9116ze/fVVze9JgifkDu8Nnfm7Lf37zv0nYa61gEDAxMDMzuXACefoPyAqMTWtIKKG8kF5S9Y4RcLLDF0L2qIBaWlFd2Mj8suTEkqMEyIy97u4xE630jH7FslKeX3V81YyEFBfKeUsG39HmGPsauwY8d/ISAwMDDihSqpKQW7axr7J+o7JxCZUoC9EkpYsWkPth84ig3bD2LtZjEsXbkdy1Zuw9Llm/DrrAWYMXMulq1aA7FDElDXYXu+PXhHH6ZjL1y/T5r/KR4+eIGHDxkDAC6TUzNHYzUAlyjq3338DHeI5l9/+Jw7PnP2seuPMEC0tocmeffUPXScv40acjgW7XPYCTn10wCQW0eP2WAn29YQMNQ0IbuyDjl1LSjvG0UfOTJbRtwrKYd3PvoEr75GNPHV1/D6K2/izTc/xc59cohNqSB9Pkh0/jyP7iNsww3Jjd6L16bH1DXeS6+pZ4xTcdYoc5DtS2DblolSF1aSViwsf+ng6Ja0bvW6dUePHPHU19a65+LhjICoEMSkJCItJwelVbVo7hzgFYeM2g8R8xklpsG29LI9BKzJJ5MgXTwJOPkPKw1do1N89x9rGNI5co2ckUCNHKuW2Ec5sahicvp8YkXZ1e3EiFro/rQjnaJ7Br2vVJI+mXRfsqqbKZo38JZn2aX1yCmp5+wnPr0Asam5SMwivc8aarAafnL+5JIKZFTVoaJrgO7/dV6V2DV2nd7LZd49iXUXzqXXiqPnCEnNQ2haPqx9QqFJGv+4jjFO6ZyDpZMPohJzUdMyiq4Rup+Tv9Nz/E5sZfraNXofzX3X0Nh9EflVXaTPE6Bl7kZMwA2OftHwJJlg5ewH9TOWkFbWgZiiCvYqnMB2aVlsOXQYa7dvx+JVK7BgySL8MONnfPWnb/D5t1/im+/p+vXHJBU+xWefvYsPPniLGMHbxBbexid0/eKjd/ElgcRXX3yMDz98h35OX3/x6ZP33n1r9O03Xgl7/63XDnz6zttf9N8fES48vSV8LHzw+o5de9+XllH8Uk/v3DwfvzDFiNi0iKiUnCG30JhnrmFxyK/rICbVSMDXgabW0QeNTcOXigqautNTSvJCAuLDbYwdrVRk1A7v3rjv1yXzlr55cLeksHe3lPDDJvDDcv5TzeiMlaCnZy7Iyii/FxgU5xkel/3UjKiZorohxKSPY/MeCawlFrBi/W6s2rAHi5dvwao1O7Fk+UbMX7gMC35bitXrN5MEOAANXUOY2bqCbXnto8h1kzk/Uf8n5OCPOAC85EuAbE366t2nIEKAB8+Bmw8o+l+9g4kbD0jvMyB4juGrD9BD0a555CqKWwcRTxErqaSGV9sxx+edbzsGeMtr1hCEHX5R3NSBPAKBZHYYKDlAGUVoCzd/fPXDTAivv43XX3+LAOBNvPbKO3jllc+ISi6A8mlb0njVqG4a5BS/b+wKL5Htv3iDs5Mhkh4dfGluiutxtm15gAEA6XSWTGO7BlNzC2FobHZ5x87dHXLycve09bRxzsqEJrAdfEMCkZCaiqr6RrR29aGxvQ/1NKqaO1HfQV+Tk7FGJ6zakO9JGJyczkEMsu2+59ExzJKb43y3Yl0Xa+11GXV9Uygi6ZFH7KOYroWNfcit7SJHb6fRxu8Rq+TLIbmRUd3E2UAyRfuUwirS+7XEemqRkFFM4JeH+LQ8JLG2a+l5BAAkVejzsI5IZW3daB6a4LkXVqXJcgxsqbKTQIpt1S5le/Tb/igTJjCOyCwkEAiGvpUjjhxTxY4DUtA8Y4ag6Ewa2fS6bajpmELn2D0MsuPSLz0jYPsd568+JYbzO9KLmohVpMA9KBnWxAjcfKJuhMdkDCSkFkzGpuQ/9AlPfOkdlQRdG2coG5lD3dQK8tp62C11lILUVswgmfDLgt8wa/ESfEOs9NuffsC3P/6ZZMNX+OSbz/HJl5/gw4/fxWefvo9PP3mPwOFDfEJA8GfGIn7+jh6/Q7ZbJwAAemhJREFUj48/ePv5R+++MfbRm685fvb2Gwu/f++dN2b/+IMgeVReUFHTEnxCAllp4aunNQ0/NrNx3WDn5udp6ejVae8Rct/BPeR5dELBy6q6AdTUDSE3vwkVNb3IyqtDVnbNswC/+Gun1YyrZY6cVNm6btfXPPAaWgpqqvrCyWOagoKMrvDLXC9h48b/wAIkttlH9eQZHv0tzF3WObkGdOka20JcRplT/v2SitghJoVNOw9i3db9WLNpLzZtF8fGLfuwcPEqiv7zeMuvtUSvxQ5JQ5v+4DZOfhz5WRb7LnN80vSPH73AfdLxt8jpr9x6zKvSLt1+jCt3H+MmRf6pWw/4xOojqjt2nSgjMYbLhAyT9PssR5BG0SsoOZtXqaWW1RIAtPLs/l+PwmLLfGw3ICtoYV2C8mniJxRWIjAhC/uklPD+Z99CeO1tvMKc/9W38KrwIcmA7/DWB7NowuyBZ3Aa7zzTT87PpAsryhklkBq9/Dvfd8A257B2XNPNKi7yLcyskQXT05EpWYjLyIEaTcZ1m7dAWUMduufOQlVPC9pGZ+ATHIjkjHSUVlahqq4BJZW1KKtpQGlNPe9LUN7QhJzSSgKBWlTT+2crEYw9Tfc8nEBj3zBJpX5UsePA24b4Hony9mEUEPvIqe0gR58GgPz6Xg4CObWddL8apyVAWR2SSOOnlJLD55UjMY81OKlEdCpF+ewy3ryEsYBI1suAHDgprwxZ9P8q2/t5d+G24Sn0ExiOXmJ5kd+5FGErLHzTVTfLNYzxKs2S1j4uO5KKqkg+FPAOzRLHTmLjLjFIKKjAyMoVvuEpSC9uQkP3BdR2kMQZvEZSi+TejZeYvPIU3cM3UdE4hILyTgRHZuGsiUvHWSN7LUdbz/3BgTGnU1MKvQsK60siYrPHHDzDHlu5B+McSQUTJ0+ctXaGgbULdElCHNc+B3F6zRXbdmHeypX4dclv+PPcmfjTTAKFH/+C78jZv/nTV/jiq8/w9bdf4VsCgG+++woffsLA4T188v4b+PTd1+9//s7red+8/87+n7/5/P0fPnhX+H7ufOHgTnlBVUVLMDGzFbpGLwiaGnrva+sYLT1+QkvtwEEFL83TptEhoWkFwaHpbUnplTdK6/pfZpWy3pOTaOm+hOy8Rri7R1w1OmsXqaZqIH5SWfsnycMyH5Arvnr+6h3B2NhWMDKwEQwoIB86JCUoKWn9+zb50FfTFsJCEwUHG4/vwyNSEtx8wp7Ikt7fc1gOuw/KYDeh+KbtYli1bjvWb92HzbsOYd9BWezcc4gAYCV+mjEbc+cvwobNOyElexJnTR1g6xyApIwyjF24BSIAePj4OUX/Z3jwgKg+gcCN+y/4VlW2NbWPVwHe4hON0exuiq4t5GD9l27iMgHDeQIItvc/MiOfN6Nk59KnlpB2pYiZQ5GNUf/ipk6+1s8OvKgmRlDTOb01OIMmv5mjN35btQXvfvQVXnmNHJ+c//VXiRa+/x127FLB2k2K+GH2Vth7RtMkvIc7BDoXrj/AKDGPv1YYTl55xJNvnX8k/diobRngvQzS8ioQm5aLuPRsnFTXxKz5v0HX2Bh65qYEALrQNz1HDCAI0YnxJBMKKCLUoLisArkFxTwxmFGYTxKiioMAK0Zi1Ycsicl6FLDEJOvKU9c9QIMd7DmdKGQ19Gz1g23UKW0b5M6fXc02JZE+r+lGWlkzSYCmaacnEAxlXXxpRBBNj84oRARR9jACRgYCceT8rDsRO4osMiWXa3tWEFRB95NVULJqwd6RS/xkoNEL93kxEQOlGnpf1aw8e2CKQGCC52bYzkG+Y5AAJzAhFWbObjh6QgWbd4tjJ80juVNacPQOQ3hyHsIpQCTnVBHjuUjPfwtDJA/GLj0hWfSQgPg6MbEraO++9KSyurc7LaHQNdg9/ICZltUcU23rX7ycQrYH+sSZeriFZZhbuDS5eYWOe/pH3QuKyngWFlfwMja1ApHJRbAh5mdoaYszltbQMjGD2FFZrNmyDb/OW4CfZs4iqfADvv7ue/z5l5/x/cyf8fFXn+J9AoH3338TH733Jj5//+3nX3/4XuufPvloz6Jfl7z6yzd/FtbMnCnIyelTwIwWTqjqCmcMzQVbBy9hzoxfXt22ef/7mzft/0RRUeMbVdWzc7384o5l5tfHpOXWDieklT9Ny6njp0/FppYS+yp9lpxVfiE4PLXcwzPC3883Rs/G2nur2imDH0+rGn6hckLrLWsjd+HQXilh+2erhCMbj/zbO7+FjpkQl5ItWJrbfxIRmWQam5Rzx8jKGVv3SWDDDjGs27Ib6zbtxKate7ByzRZs2LIXewkUtu4+RA6/C78tWYWZFP2XLl+DfQckoXvGAnqGNnD1ikRBSTPGSDfeIyf+/cETYgDP8OjRcwKApzh/bXqffy8NVshT3trPE1RFDV28e20jW18fIip+8Tp6pq7wFt1uvCFlLIIS0nh2OqmwAunEBAob2jn1Z1GfAQA/LZcG06h5Vc3Q0DfHF9/+gjfe/og7/6uvsME030wYGvlh5z41vPPRLCicOkuT/DoIq3D792f0+BYGRm5gYOwWOvsvoYWoNzsDgC37NVD0La5qIyeumz5diOhvTmE5JKTl8OkX3+DYKTXomZpBTkUFKrq6cPbxQmhcNMmMVOQWFaKgqBiFxWUoraokx68lZ++hic9YBUXU1j5eoMOqDVkHJHYMeHVHLyqa2/ghJTnEODJIv6ewU44bu/jSWm41S/B1oaCuhz9OLa5HWsk05Y/JLkZIchaiMknrszZa6fkITshABLGpCIr64QmsYUc+oljXZfpZIjEA1luRraYwAGLFTl3EdvrHbvB+hSwHwEC2qKEDVSSvmln/wIGLqCPpxJkA3XuWe4jNK4ZXZCwsXT2hpnsW+yVksWrLTmzZfwib9x6EzAl1mDt48Pbo0eSsxdU99FqsIeoDjFx4grGLTzBOgx22UlM38KSysmuqpKA5Oy4s08jexGWtqpTq59rHdb/UOqH9s6G++dYzZyyPOzgGnAsISg4NDE7Nc3QJrrawdut2cvWaiIxNvp5bVH0nNavkeXB4Itx9QmHp4I6Tp/WxT1KGJ4eXbdiI72fNIhD4kkDgI7zLag3efB3vvvHG7fffeNNyxlfff/jtp98IqxeuFE7MPCHsW7JPUFRUFO7cEeh6SjhyRE7YveuIICYmK+jqskNGfXklrY6u1WdubqFb7Wy9XbS0zep0zlhd8wtJfBadXPgys4DuUwrrH1n1Mquw+UFWYeOEf0hyNStTNjN1MleSV1uxf+fBt4+IywlKkifpdVQFZQU14ZTyKUFeXl545513/mUrCvb69oLiFgkhI69E8PcK/nNkdKpNQnrBxeScUn4q7abdB7Fi3TYsWbEBK1dtwqbNu7FvvyQOHlHA4aMnsJskwfZdB7Bs5XqsWLUeO3buh47eOYRFpsDM2gNJ6eUYGr2J67ef8RWA3x88xtPHz/D8Gen9xy944queJkxp6xByajppwrQip45R2R7Uks5tJgpe2tKFNNYhtr6Zt3a29fSFa2AYvMLjKYoV0ASvQj7r+kOUueIPp/8rA6gk52E7ALNK6yB/UgvvvP8lz/q/9uobpP3fJAB4G2+98Rm++XoB3vtwBkmDr4npKNJEn8BjVqhELICBQVsXRXqKqkVlLSgkQCuv6UB1Pb1eXRc/6KONAQJR8k4CrTwCpG3b9uDDDz7DUXklmNo74ZSuPjTPGsHZzwd+kWHwDg1ETHIiissrUFPbiKraetQ0NaO9ZwCTl2/h2t1nxD4e8t54lY1sN2Ir8gnEKps7SGpUIS2/mJ+AzDP3rFNydgldK5FaWIvs8lakFTUQxa5HQk45otMLeWce5tSxdE0gIEjOLSOdX8BbkcfS95nzsxEUkwrP0Fj4xSQjsaCcV0zWEbtghU/tLBFJIM0O/GwfvMRrCdjx5Ix1MQnQQqyoqf8i6vumUE2/V0L3PZ9+Hl9QAb+4VATFT5/rYO3ijSPyx7F0PTna7DkUddnBMGsgdlgSssfVYe8eyE9JZs1TWUK2pYe1R79NbGiKgOU8sZ0JNPVdYqsLj6Jis7odHXz0FWRPfBXonyhkpBTzeb10zorX9HVNPzQ2sPvaUN/qRw11/Xl6OgZbjAzNpZyd/E5Fhqd4hQQnlqakFg1l51ffyi9teJBbWvs8KikLCam58PALwQm109i+Zx8WLV2O777/if6en9x75413Iz5+68P5f/nks7dn/PzTK0vXLxf2b9gvHNh9QJDYJfGP+pi0tKKgrn5OsHcK4fJ6/75D7x08JDNTTvakpIGehb2JkUO4i0tYrU9QyuWotIqn0dk015umN7+lFdQgOj77sZW5a8v+7Yfltizb/vnMT3/iqwgpRQ1CTdWwUJhXK4QGxwlOjr6C2Vlb4ee10YKOjts/7fwMtdTUNARPTz8h2Cfsk5SUXMeA8IQbLuyQCkLGM+aOOCithJVE+RcvXYslS9Zgy+Y9kJdXgbSsMsQljkH2mDrkFFWwjRx/LyG6hKQc1DTPICo2Hc7uIUjJrEI/6bsrNx7jd2IAT5++wPOnDABYEdBDXlVXTc5V0zuFgqYB5LMPzur+2UEUg1OcSrqEREHf2oH3oGPOr2tqCUMrB7gHRiE0MYuiWwVP9rEadrb0x3r3s6hfSRSZ9Q9k7aLjadIfU9HB+x9+Qc7/Jt547XW8/srrpP+nk4CvvfIeXnn1IwKAT7FPXAGVNW24fO0uzpP8aO0ZJs3egtTMUsQk5CAjuwIlFS2oJuevqG4n5x9DZ88Uahp7UUuvFx6ViAULl+GDDz+jSaQFazdvnNI3hJapKWy9PWHl5gwHHw+k5majuKIKufkl8CdAMzazgpGZHbEm1jAzhx8oUtnYT7KgFXnlTbwhamFVPdILixCXlom41Bzea5BR99D4DAREpZADpyEuo4SP2PQiovKM4mcSrc/lh46wY9Wi6coiPXN4dsgKuwZGp9BzZCKArp5h8QgmR0gqqERhXTtvytrRf54nOjvpb9JOjl5Ln7mwvoPLrgoC2xa+PfkKmokh1fWc54nJis5Rvgswjp6HrQ4wJpJT2oiYtAI4ePpDQVWV2OU2zFk4D9/+5Vt8+vkn+PKbb3gPSfEjsjhjbAs7lyD6nKUkr+qRWUwg30ZSZPIemsduo6r7AkmgAaTmVV/18IkIMD5nv3Ldmp2v6+uaCyrKeoKlpbtga+0tmJu6UCQ2FfwD4/469V8V2yv1/qmTet/p6ZitNTd3OW5r62kQEZnikZycl5SVWVpfWt5wISkl635oeMwzb7/gl3b2LlA+qf5iz84DIzs37Y3YvGqb6sp5q1avmrOaLRW+cu6YtiC394hwcL2YcHDJQUFSUvJ/i8isNFhdS1lQU1QXTp7QFJSO6wjLv3j9lfWL176zc+WuTxSlVGcZnnWQNLHx9tQ1dWowsHS57hES/yQ2s5gHr6CIJFhYuAybGduHujr6GpmYOsgbnbXe6+LkuykkKGaBl0fQ1wpyKm/eeQzBxydMMDez+X87P3tDqtIawgmFU/xreoLdSWkFE3EZRbDwCIS6sTXf6itBjr5x636sXrMNq1dtxg5WByB1HIrHT0NN6xzOmjgQ3TfHVpIJGzbtgPRRBRib2iAyNg3u3hGITSxCU8sYLly6j/vEAJ6R4794/gJPnjzHOFF6tqW2gpCufuAyilqGUNQ6jMaRq2gh/d88dhX5RH3P2LlAWkUTmufMYGznhLPW9tAzsSIAiKSIxlpqNfGjrotosHPvC9mqAE3c/MpmPhhVjkjJgYGpHX76ZS6P/m+yJcBXXsXrwht0pcHqAV59G6+98RGkZE4hK7ecIj5F+QZ63oo65JJ+TmObY4impmeXobyyDfVNfait70ELyYAG+gwlNe3krI0wJXD69PNv8NkX38LYyh4eoVHQMDaDiuFZnLG1hp6VGTlZEKF7PkKj4qFvYIb1G3bg8y+/w0ef/gWffTUD3/xlAZav3YfDMmo4a+5CEbEcGYXVCItPQXh8IqKTUhCXkoUY+lxhcRnciX3DEuDiGw7/iGR4BEbz8mt2mlJYfDo/RZmdzhvCTlgikAgmRw+i4R0SS7+fyI9dY6cTMQAIIVANJxmQVlqL8uYeNHWNUtS/yPU/69jb3HceNZ0jxMx6UdrWyxuusIaj7SNst+JVNPReQH3/BXLQcWQRU4qk9x6eznofEkCTNMkubeCrDM4+flAnWSR26AB+WzwfX3z5Md5593W89c7r+PiTj/Htn77DsuXrL+kaWFWdNXPucvQIuxUeX/CkgR3AOnSTAIdYQe9lvsEnv7z9WWhkVoOtnd8hZSXN9ytqRoWzBjbCabUzwslTisKJkyeEUyeVheMKKsKJ4+qCuuoZ4Yy+pRCdVsTp+RfvfPGa2O6D76ooaX5hYmg9y9XZ94CXZ6Cej2+Qi5v7/6+9twCv68qyhI8hTirMSSWppCpcSRyOA7YTxyxblsXMzPD0xMzMzMzMzGChLcuybMvMzIzr3+e6umfq756Zqk66O9V1l7/7ycL3Luy91zpnQ2J+cFBkrZOjx5C1hWTKWeI1JrV2HTbRNGsw1zIPsNIyk7dQM3pTc738Iy8+toTpaygztfXKxAw2sXKWwlasWPFXtrdp0ya2eu1qpqGsxVRI16tu1Gb2Uu+H39ug8pSqiuHn69cqmaxaszlVx9S2NzAu5Whmee29YpJuxdXN96saum5HJ+RdjIzNOVZX37u/uXlwe1vbcH1zU79ncWH9j4GBsc8IC/neof+X+n4LV2aiYs7eYW/Ms7Kw/yg6Nr2mtLr9Pi+kKaRI5+gbBUsnP8gq62ONjCpWrZbH0u9XY5OsKvQMzGEj8YBPUDQcXf2hZ2yDVevk6CZ+S/JAEU4uXkjLLEZxRQuaOycwRl77xMlrwtbfvTu8COgeLlP0nztw4uFkl6l9QsTo4zR79jhmT92g4zpRyD2IL6yBvp0zdK3t4ODjB8+wCPhERdPHSJIAhahq7xNoKKf9AuWnj+08L2BgHLX0AFdS9KnkJa2kff3C4yAjp4onnnpR0P8LyPAXCccCLJo/jz7naaRPw9jcHmUUpepbetFANLiuuZMMsBUtXYNE2UcxPLaTov5+bOPzACf3CNR/kJxBF7GG6sZOKKlpY+Gjj+Otdz+Eb1g0Uosq4ReTBBsvb5g4OcLKwxUJeblIzi2ErIIG/vDmB0QvX8Hjv3sRTz71Gtj854mJvIgFj9LXnn4Df3rvc6LHuogjo84prUFWcTnSi4ooYhcjJa8A8cSEEjOK/9WgE4nCh8WnIywuTRjHzZ1ASk6pMMw0l6J8DjkMPtUonOfD08FnJwRGplBUTqf3VIZykgc1nYNCizMe/fkwjiky+u27jwr5CEPb95LE2kN0fO5h09CdB4Q6i3H6/tS+M+QITmN093H0Tu0XFiHz67tR2jyA7nG+KLufPs6SRBkU3ldYfCocXD2goKaGxV9+jldefRHPvfAk3aNFeHThPDy+YGHjF3/+/Btlee0fzc0dLdw9Q/2y86rLsosap6paR04XNw7dHtx+FKM7T6FzeA/auqf25RU0hHv7Ri0xM5E8zg3B3yWUWVLUTSmrZjYGD/fZbWRsGOifibopM9S1YLqapsyGnIWHSwBLTy4SqDp3DOvWbnpMRUnreWU5tVdlVsm9u2Hlpi9UN2t+ZW1ou8rB2N7Q18HLI8DBK8DdVGJioWLwleZapTc11iq/rr5R5TnZ5Rvnm64wZn9c9kemqKj4f7RFrfWmTPcnU6alYso0tcyZiY0/27B01cKl3yx74etvlr+vrmOsFB6bVpVZWHUhju5vdEYJfKOz6WMFimp7yekXkWOvf9DYNnKTJOqu+uaBpNycsjUuTp5P/7svaG1tx8yVjZi7ly8zN7N5y8nJKyssMvkGn123fe8ZNBH1jEkvg5NvNLSNJXRzjCFDTuDHZeuJ4usLBuLo7g+Jmx/0zeyFtYA1MvJY8t1ychTrYWZhhzyiljxXurphkPTyDPYfOEsO4D7u3wFFf74WcAenL1wXRluP7n4YMQZ2HMb43tOYJbbAt/vKSN/aECXWsbKnCOoFz/CHxu8XEwuviGjBAVSS3uZ6f4Jny+09KtT4cwnQyvPae0eE8dT5FG1yKurgHxkPPVNbvP/nL7Bw4RP/6gR4MtAj87gDmI9nnnsJ9k6ewn54LmnW0upGkjHNKKttRlvPFgwTpd3B25bzvvnktMYmdpN+n0J7DzGNtkHExGfgvQ8XY97Cx/D9T6sRHJssVNKFJmdA4ucHHRsr2Pt6I6mgEGb2znjqud/jaZIljy16Bs8+8zpFvjfxyKMv44dlsli7Xh1PPPkaFj7yLB57/EVBivkERxPlb0JmcSlC4mPhHhiEkOhEhJJu5gbsSU6Za2yf0Bh4BUfR55HCYFU+WTk4JlVwEDza86/5RSTSkQSfsARhLiH/Oh/71dDzcNAKTxfum5gV6h648fNJwLwAiksq/j0+PYnXGPBW4nwngDdX4f0at+49KRR1tZJEKm7sRU5lKzljcpzTB0gqHBMKtRpJQuWWNwmsw4Peo52bJ5R1dLHs5+V47+N38dJrz+GpJx/B04sW9L32zFPvfLhqCXvzkSfmr/555SNGRlYvm1u7fuXgGqwp8YyMLW8YnG7q3HqluXPb/RmSBu1D07ez8mum01IKY6NDExW9pD6vq6zdON/a3IlJleyYi57b/9EYrays2IYNG5gBOQpDQ0tmZmZNzMGa6euYMHl5VSa7WYGZ6tiyifHdgoPQ2qS2yFbL4nkHfavXzJQMXtNer/yW/mbNpXoKWisU121+UV5Gcb7KKhX63f93YdC/NB1RVdZkcmsU2A8//MQ+XvUT+/APf5pvoGvxR9+AKHN33/BGc3uPwxYOflcjEgrvpPDMyaBEeAcnIKuoHrWtg2ju2HKnvq5zNjwkPuDffSGphQNzsXNnUluXp0NCY33Do5MvZhVUo5vo2cSuk+gc2Y2c8nYERmVB6hUBHSN7rJNRwWpiAXqk+V3JKN0DwmHp6A5dMigVLRNyAAr4ccUaLP9xJRQU1REamYSK2i6KpF1kIDM4dOQ8OYB7eHAPuH+fnMBd4BQ5gLljF4RMtpHdvFjnLKYOncf04XMYoChTTtHX1tMXFi5uRP89IfUPEJyAjYcXnANDkVJYITSt4AM8eIXbw4Ee+//VAdT3DKOsuYvofz1yyQGEkO40tXXGRnl1vPzaH7Fg4e8wny8GCvSfpwQvwocff47AiDjkldcIRUK5RWV0Ho2oocg+MDKN6dnDxFwezhic3XMCg/SQt3eOkKPr4Xng0DWwxONPvYAnnnmBHKMOgqLjSJeXkgzIhkd4CIwkdnQO4YjPzsNqWSXMf+QJet2/bEkueAoLFjyNxx57CXJy2lBVNcKTj7/8cH1i3uMkT57EZ18tQxAZbnRyJuzdPehwh4uPPz0EEfALi4ezTwgdwYLxe4dEw8U3BE7eIZB4BMKBZJ2TTyh8wxOEwzWQHERoHILjM5FeUvtw3797WHCcfPW/mRgAn8XA+ybyUeWDk7uFAS2NfWPCUI5eXg7NsxTJCfAmJdv3n8QUGT+fNNxLjrGGqH46XZNiYpT9xJQ4u+QViaPEIjrpWhaSs4nLKhbmOHqERsElIJgcgQs2qmzGR19+jNfffIVn6Z35/fNPq7mbaMxbu3yFsMru7OzL2sY6BQOUkdN9xl7iv9zG2ss5KCCptntox/nmga1o7BxFfePA/bzcmjNBfrHVzhJfRQMts6dDU9OYi7UL83D1Zm5Wbn97cRz9i6N/Kp+rsM0KpPPXKDJNGVVmrGrAHMlZuJlKmIWlAVv1tsw8pbWbH1HaoPCUgszmx2VWbZhvoGzAPv/887+vGI/+EUFh6l+rMNmNinTOweyj9z9YoKJq8LqSsv66NatV7KTSgMS4uOyxuPjs6xJnX7j7kk3kFKG8thUFeRV3XSTeM//mDxtuNmRWJg9pUJB/pExJReNBvofdSpq2gwyVJ2Z0bdmDgspuBBPNsHUJJAM3I42vBFk5TfgHxwnRxJ4YgJmDG/QtJNAytIKckhbWb5THzyvXYYOsIlzogSur6SD6TKxi5ghOn72OG9fv/m8O4AEO8Yq+ueNk/CeISpKGPHgBUwfOCc1AeQJKRkkFPEPC4BoULER93+gYcgKB5BA8EZyQLuxh81Xu6o4h+vkR4YHle+P84eQPMTf+vOoG+juVSKILwyWArYs39MxssGLtRrzz4cekuV8g3fkknnv+FXz59VKK/l4UJQtIN1chq7CMHEA56ps60Na1BaP0EE/PHMYuMvydfEQVUdwOimzVdR0oKmtAeHQqvvp2ORY+9iRp+LeIOamSo/RDWEI8AuMiYevhBBNHO3rQg8gplGODgiY5gMcxf8ECcgALHm5N8nWIBY/j0UVPESt4Ggvn/47kye/oI09ceowYymvQMbSBqY0TVHQNYGBlTY5YSk6AnGNQFBl+DPwjEsh5J5L8iBUcAd/ODSCHHE1SITw5GxGpxAYSMxFAMiGRy4aCCvpYQdG6C1UdA8K2InesDbw4iUd6vpNCTIDXKPBrzdOI+Wixf6H+/CN3ALxJ6TjfAqTr1Ny/lQy8E9nlzWil/0/OHhFanvMmJ7xRK79PhXXtiEzPhzOxGjtyWu5hMfCJjoWZkxNkVJSIQS3Fe++/ff/1V19K+/M7bz398Xt/ZMuWLWMaGjJs40YzJqegxzQNHQS6/uITLyxSktV4n/SvR15x/UTf6Ozt0Zmj5LB2Iaek5UF4ZNYBP8/IAFd773e543D3CGIrluqRQ/H6VbbS3Re5M2/6J/+NHFNdp8A0ZVWZmowy09qkzXSX6/6imYN8MVFZWY7p6BgxPUMbFhCVzZYsXjL/+y+XP22oY/pVkH94kI2N44iyiuYpVQ2dy24evkftrB0r5WWUbP9Npl/O2Z3MnBiAjprRS5ERSXkt3SP3+8mz13TwXvczGCY91dq/g+hvq0AtDCycIK9qSAxAFfJKeqT74+AZTDdJ6gldMn5NI2uo61tQtDMQEoDWrdsEMy4RXHwRlZgtTMOZJYO+ep0v/JEEIAdwjxzATWIAvMqON/AYmzuF0T2nsYWcwJadx9C/da9QYRaakEIPbDJCEpMQn8v3/vMQkpQO/5hkpBXXoKShGxUt/cLDWtMxiArS+9wR8AhV0dqL3OpGobd8fFYewhNSySjiSdYEkdHYEd3UI/liDnNbG5hb2cDdIwDxSTkoIEPmo8fz6MgmGVNOTqaljfQrUdYJel/cAWznXYpHdqKLaD+v5U/NKEAIsQZ9Ewv86f0P8cEnn9DxEZatXA4rR1u4+nvCLcgLli52MLK3gom9AyISMmBp54Ynn36ZDHvhXxzAQyaykO9QCLKEHwvJATxCnz9CLOBRPPvCG8S2VPD9Chms3CAHDSNjGNvYUHT3gqtfGDwoqgfT9eHG7+gZIByufuHEBmLhF5WEIDL68LRc4QgmZ5BR1YSU8jrE5pcjr76dZFc/aukacidQTw6giVdY8pLhoW3C14rqO4SuvcK4MT5zkFcb8ik+vBU7SYBRnghEDqC6fRhFFPmb+3hK81FhzuAsn21ALIFP/OH3KLOcnCY5AK/oZEi5XIlOgr1/OAwlrlAzNoeGoTHWb5LD4s8+2/Hee+8t5c/wF198/ler6yoqxkxdXZet/lGW6ek6svVLN/zOylz6Qyrprpq2kau13VvRMrgTnXQ0t45dq67ubE5PLVB2dvR+tjAvmxyADTMx4Z2B/zF6/i1Z4szWrN3M1q7azGSIhcSEZbP1K9c9oa6s/sn6NeuUv/r8K+Nvv/pO/uvPv/rjx+/8edFf/bKdnS8z0LdmsjJKC2xtXbUzs8tOTvGGmKRpe8b3YNueMxiYOEA6YhRRSUWwlQZATccCimpGUFE3ga2DF/zDEmHq4AETiQfMHT1hJfWih9yDWIAFlv60Bj/9vB4u7n7wo0jkSQ9jAem8IycuC9V/vP7/HjmAG2T9J89dEcpaJyma8hz/mWNXSf+ffegEyHPzTLWYzFwk5hUgJitHmEATn1uEhNwSOsqElWqeylpLkbmJHiZer13bMYy6ji2obO4T9ro57edUOyYtg4wiHl7EJqQ+frBwdBIMR1VHmxyVFFHELrKyi5CTV47iykZhrFdpTRtKKlpQUdWOxoY+dHePY5yu0dj4bgwM/YX2U+QvKa9HUmoWySLS9yamUNXVhaGVBX7esBZfL/8WStoqsHa2Ja3uBTsPCQysTYk1WcCP6HlaZim++WaFkJcgSJEF88kBzCNjn0dGz/AIHQuFxcl5mD/vEWIKT+DV19/HZ1+vwJ8//w7frliFTWrqUNM3gLG1Axy9giAleeZNkdSZqL+1C72mu69g/C7kBCT0PTeKtmEp2cK+fCo52cKWbuQ2tiORLy7WtApbdlV0Let6ybnxa0usijuBmu4tKCWnWts3imZyCJwB8C7LvL8APzgD4F/rndxFTngUZS29ZOTjwoLhjn0nhXvNsyd5F+bu0WliZs1Cx2TOQpzpWrhFxsOXWJ0ZyRRDeq4sXX3hSjLTztUTGxWU7yz5dmnGqhWrX/l55Wr22GOP/RvD0FXQZUZq+sxQ04y9+4eX5tlYufxZ6hTgHBSaNlpe239zcPIgBZaDaOgcf1BU2ng8KDg+wtLS6V1hTczcjoUHRAga/B+pk8/KlSvZJjlZpq6swSzMH7L69V9/Mq+iAGz59yvY0q+W/vUvmJlJWHJ6AfP1D/8gKb2go5aiJy90GSJ9N0Y0fffhyxibPoay2n4y9FTomTgKe/1KdJiaSeHjH4PI+FyKouGwcePbhH6CvrR39YO+qS1+WrUB3y9bBX+iouExqXAnb15Y2YR95PnPX7wtNAHhDuDy1Vs4ePwCdh+5RFGD6PSJSzh85T52HL2MLbtOYohYQFFTH9LK6pBaWkUPCkXYxDSEJWcJ9DW1qAZ5VS0oIcrKtWrXyBTJl23kBMZQ286HRXYJ++LxmcQY4hPhE0YPv4cnOSwprF1dYekkhY6ZCWTkNkJRWR5mZsbw8fFFckoaMvMKkVVQQo6gAQ3NvaQje9HcNID2tmH0E5XtotdoaR0UjD8zp5iOQgRHRMPMzoGMzg9RKanwj4wkeWQPOXVVrFfcDBU9bdh7OJMxOkLP0hDaxgawsnNGUkohHKX+eOP1D8nwHyYnPSJsT84TjoV8YfIvzIDT/6effxM/rJDFT2sV8Pn3PwqFLsvWrsP6zcpQ0jIkZiOFEUkDJ99gOPuFkLMLEvIluPHzBb/QpCy6jplEu/PoutYgX+jeO4ichnbEk0NIoGuWUd2K/EZiVrxAiM6/iih/cXM3sklXVnQPoXl0Sij44aPG/6WxCHcEfEuwY5wPD+1HHml7nnrcTdJhy1/6NXInwHcTukd2oKqlD+l8m5iklmcEMZWAUHgQO3OPTICNX6jQIciVHJU/MQKpfxBUDYyhoKx+XENFS1FbgTS2ktL/eRHPRMo0lXRYTHwB++aDLx/VVTP7wtsrKry4ovN4dlnng4LaPmK4U3xs+42k1MI6T4/gVcpyao+mpBczF6kXMzcyEpjyPxK++uor9umXX7JVP/7IVnz/PfuZHMPmzcQQZGT+96Qfe+bg4Mm0NU0XxcSnS2pbeq/0CB1htmGUbsxBob3Ufew+eBklVd1w9gwnDWuETYo60NWzgrd3BBKSChCXwrV0MrEAT5jZu8ORtL6EvLYjOYHV6+Tx9bc/wsbBFU7u/vANjRWm5G4nmn/u/E1iAA9ZwPmLN3BEmH13G9sPXBAcwMGLdzA8e0xI9Kjp3Y6i5kHk0u+m0IMalpoNH3o4AmJTEZHC96prUEzfqya9yvf8e3lbq3GiecPbBQZQzstSi6sRQA+VnqU1lHR0KBJrQ1lPD0Z2trD3dIe5gw02K8lBQXEj9HXVYGKsA28fN6LywcKs+sS0TFTUNKONDKC5ZQAVxAYayRnwo7KqRTD+8Ch6TyFEWc0tYU8UvKCqDnmVtYhITqfXjiND9IeWiTlklFSxiZyBog53CBsgIy+LDXKKMLd0QkhIMlRVTPHiC28Jep+XJvOcBL4zMX/efKL9PPL/Ds+9+Eesk9OBq28UMQpvOh99fPzNN/huxUooqOsT87CAkq4ZnaspjG2dYOXsBa/QaHgQtXYnJhYSn4GEnBJiVHwUVxlSS6qRS0Zd1NKDvMYOpJLDy+AJRbUdyG/ircB7kVZSTz9XKxReZde2oGHLVrTyjsFC9t8OQcfzgzsA/nlV1zDySUZUkfFzJ8G7L43MHhAW/nj15OAEsQNiTrz2ID6rCO4hEbD28IbELwi23v6w8vSDJCicZEEuYjPzyeFnwMbLF+ZOLjCzsr1hoGPoJvvTykeUZTf/3xPcFPSZnY4lU5bTZElx5cxQz/Z5D/coAwtL35LQ2MKjdb3bSNLsoEDXeT8mPnMmLi7dOSQ45lMjHZPHKss7mLebL3OWOjGJg+R/TjtwGxsps3P0YFa2Tu9EJWR0FPAsssZOdJJHnxMGR/LiDorAU4eQWVAHe2d/KGoYCYe3fzTSM8qRm99A0bEeceklFPnDYE8MwNWLKCd5bGePIHqo1bF2gyKMLewEScC1Z0lNO6YoCly+cuthDgBJAc4GZvliH0mO7QcvYe70beyhY/LAefRMHSBq2oxqHs27R8mgWhDGF6yiUxCZnCukkubQA1Ra14lGopq80EeYJLtjn9COq3NgGxq4/qTf8w6JIXpsCqmXH4JjE4TcAaeAYEgo2ls5UzQ20YG8wlqsW/MdVq/6GlpacnBytkFAsD/ik1NRWlmPKnI05dWkjSuaUUf/L+NJMrnFSM/KR3RCMiSuHrCQSJFFTIU3z8wupShK0S0xuwThiVlkgNEwsHHEz3Jy+GblcnzwxUd4+/0/4d333sHXX32Dn39aC20tEyjIqeGNV/+Ixx97GguFSkWK+gsXYeHvnsKrb7yPjYr6cAtKRGxGMbwCI+/q6pnMffrJl9Off/bt9Q3yWlA3toO+jSs5OHdYOPnA1o0ccGQiAmJShMifXFQpTN3JqyFplVUoTOrhC38xJKkSKfqnlNcis6YJaRUkach5ZpBDSC6pQSRPC6aPhU1dqBsaR9PoNtQNjD6cfrRlm7DgyicuNfPqv7Y+kg5byInPom96Dn3EEvjODF/0G56aE7aoiulaxqUXkhzjbb+doU0OWs/WAcZSV9gSYwkieZJE7zWloBwBccn0dRfYenjB0NTipIKsoprS4nXzFFcq/E3PvKKiJlu67Efm5hzBXn3hjQXLv5N5WUHJRDswKnuisWfb/ZLGAaFZaGl99/WswurJ1NQCn9CgqG9cpa5P8IXFhOhU5iZxY4sV/kzB0+Ef1/i9vb2ZubkDk12ntMDFI8DIJyTmrJNPMHLKanDkwlWhz97pa/eEUVQ9W2YRmZgPK4kXdE1soW8mQVRCLlHhITQ2k7ar7kVydhXcA6Lp4fcXjD88Nh0+gbHQ0rMUtthUtQ0FSursE4a6tiHsPXQaly7dxN1b94VS4HMX75ImvIjRnTwH4DTp/1vYdeoOttLXavom6QGsFZoqtAxMIqu4HkExaWT8OYhNy0cmT12l7xeSgfNmFjzPn3e4FTTm7mMY2boXXQNTaKDXTc+vRAxJhoqmDjT3bUF97zBKmjspqpUjJCEeJqTH129cgR9//Aw/Lv8EMjI/wNBQHQGBPkhOS0VRaSWyKVpm5ZWjkIyioLACGSQroqLjERETD1t6OGVV1MjYPJFF15Ln2vMkmurWflRSBOWRLiI1j9hLIowkzpDT1sX3q1bh7Q8/wCu/fwWv0fH7V14mCfAGPvtoMb786HN8/N4nd1558fe3nn76uXsvv/YG3lv8FX5crwgrlyCixFnwj0qBhY3T0I/fr9j40Zsf/vTtZz9k/PSz7HkZYmqGtu5C+auNeyBcKOqHJpHWL6hEblWTsFA6tGOvUDkZlpqDOHIA3NCisosQQVQ8mhhNUgmf5lNG/y+ie0DSi34mir7OHUBBUydKO/pQ0TOIUnIk5XTwmQHlvCSbD/sgB8FbiPP6Ad6tmTdq5f0ZuEzoJM3fRveSZzNm5BEzi0iCvZsvdC1toG5qBjVTC5i5eAr9AxKKqoSJQSmFlfAieWBBDtaOHIC6tn7vsm9/fG/5spXC9tjfs4JuZqnMNm5QZmt/1mYfffjFIk+v6HVpOTV5YUlFM8WNA7fza8m5keRpbB24lZVVsj05LjOqIKtUNtg3/GW+Y1BWVM9iI1JYsFcMc3XyYKEx/v9YzMDBwY4lJxawsJC4PyalFjT4hcU/CIhKFKbdnr1+G5eJmp+/ARw7dwsTM4cRl1oMA9L8pjYu8CTDzsqvR2fXdgwMzZFhTaCgogNh8dnwCIgSCjeSssropqbCzMYdy1fJYfnqjVDSNICLbxhqiD4fOnoRly/dxl0y/iuXbuHwsYtksOcxNcdn1Z/DzIlb2HnyFqaPXkHr6E6hfp1XtxU3dCIqNZ+idxqSib4mZRcL6azFRMHLSIM308/1j89i265j2EvshZeo7thzCj1E7+pbh+iB60Yj0dGR7bsxsfsgRncdxMD2PUKBS3P/EFJysqCioYRVa37AGmIBP/74JeTkVsOKHIOXtztiSQrExMUhNS0DqamZiCbDDwoOg4PUGVr6RpBRVMaKDZugY2GDwPgU5FQ2Cm22eLfdsZmDaB/cKtQqRGcWISAhC1IySj3S6GsV1PDZkh/wzvvv45133sLbb72G15599torjz/T+/bLbwT+4YXXpC89+2LWH//07vkfVq7HZqL1tiTBbD3CoG8hfaCirpf87RffPInjaezbz759/YvPvnf4/KsfR1esVbigYWB9j+/vx5PTyqpspmvYTY5yDF3DO4S5CHyuQhIZVxSxAG78XqSzfWKTEZiULszyC8/IQwhJrvCMfIEdxBNL4A4gh+QCdwAl7b0kD7pQUM/HfjcIhppGzjGVHEYW79HQ3C2MD+edl4UW7OQIajsGUVbfgbS8CngGxMDCwQO65rZQMzQlBmADUydXuARHCI6HM5AMumYJuaVw9g8j9uRAUtPxjqq6duT3n3//+MoVq//uclieiisjs4EtXjXF1q5XZUs++WHe6jVKz62V1fxJ38ypwNLR5zLv61dFzjshhVhmWtHtooKaY6VFdSUNtZ36mUn5H0QExj5ppmojFOFkpxQwRxt3pqiqw4yN7X/bxs/THW2tHjb5yM4uVcovqTvtTlE7LCFD6IJ7ivQ4b9Rx8eYDHD55DcOTc0jMKCNjdiOKbA8PvxjUNY5gz95L2D13EcPjB4kyDSAmrYSMPhmuXB4UNyCOJIKFg6+wQPXjmk1QJhYg9QxCeW0nDhw6jxvXSf/fBC5euIW5/acFRzPJM+qOXRLo//TRq9hJBtw7uQe5Qo14PcLiMuBCLCKC71dnFgpHLi9Z5fv/NW1o6hxGB0WWLVv3Yfehyzh6+i72kKQYntiL1u5xlNa2k1RoE+oN+FQdoTPw3HGhcGX7/mPEHPaT88qEtoE21DWVoKOrAj19dWhqKWGT3FqoqSnAwcEaEgdbODpKYG5hDh09PcgpKWGlzEZompjBgOirprk1fKITUNTQLqTO7th/ShhGMjy1V1iryCZDzKpqR3xhHXzjckjXhkHZwAI/r5fFTyt+xHdff3runddeinv50cf//DRb+OjL7HcLn130xJ/ff+fPw8tXb4CMhgHUzJ2gYmQPI2vnm2YW9h4/Lv3xkTUr17GlXy5nn3zyzaOLP/rm8w/e+9x4zXqlcmMbl0vxZGxVPWOo799GOn0vOcHDwtCV7olZYYclmhxqcEoO3MLj4B2biGBycIFJGYJT4G2tYsgAk3n1Xnm9sAaQQc6tkAw/vuDhME9u7NHpBYgnqRNLMkFYUyAGVE3G3tA3imqeSkxMoLlvTKg4TKLX8wtPgLXUG1rG1tA2sYa5owuMHaQky0IRm10o/N0c+hs8NyEwLg127n5Q0jbAJgXVI2vXbtzEn+cfvv/+P2wLGiq6TEPTimlrWzF5RUO27gPGli5d/ydZOS1PV8/QOVfv0PtSjwDheQuJTkZZVcu96tqO09nZZb0dHcNpXZ0jnmUl9fIJUSkfmhvZPepm7cisjG2Yg9VvWB58BXnmHxbBvN0Dn4hPyI4IjU67K/EMFoo+eLeZU+ev4yxp8kMUlQ/SMTA6i8T0Uljae8HEygXJmZXo6JnG/oNXcfDwdYxvP4aqlhGKzCUU4aNg4xqEEJIMcfRzFhI/rNyggiXL19DDLQd7Zx/UNPZibt9pXL16HzfJCZw7R3qfT+nZ+XCOPR9OOXfyJhnoJYrme+9l5tfs9g2MaQ6PSh6WOvvsNzVzuOQfFH3PPyQWCen5yKZoU0iUtoQcQB1R7aaOYfSN7BIaSXAHcODodYxNHURjxxaUkQPIp4hSRxR1J2/ddeIytvNW2YfPCV2F958mZ7F9FnFpmXD2JKopdYC5tRmMTPWgrLoZikoboaYqD1UVeXIO2tiwSRYypOUNLCxh7+FJ550M76g4gb4GJ2cKfQj5Hvfuw+eFpiFbSZLUdY+ggJhMFr3fNGIuMQW1CCSGZekWLBiCvoHJeYVNsiFff/zhq39+4232x6dfYa899zp79emX3vjDq291L/78O3y/ejOWbVTHJh0L2LsHHLeVuMg0D86wZctWsbdff4Z99ukP7M+Ll7IPf//W/B++Xfmuhp5VXmRG8d2GkRl0Tx/C0CzPvjuOnvHdaOgdR2FjF1JKa4UhnpwBRGTmk4HXoZgMvIoMt5giYVlr378efLBnFq8kbOxAHLGCiLRchCVlITieHAbdk6iMAqFBSza/L/SzvNcgH49W1tgpFClFJGYK6zESMi6+S2FoJYEDGbfUJxBWzp7wDItBZFoeEoQFygpha9DRN4R+VgoFVe0HP69cV//1l9+98d2SZf+So/+LsH69DFNQVGJrV69mijqGbM2Psk9qqBvJqqkbFmnrmx21d3K/b2hmDTUtA8gra0HHwOyBT0D4nbCoxGs5eWWni3PLR6OCY72tTWw/tta3WmhDToAX+PwmkRybyQ6fuMLaWwdXtLYPz6bkVJA2zCHqVoU68tZzh89ijvTzwMgO9A1Po4QilX9oEgwp4hhZSJGRX4MtE/tw/OQNYfTUVtLtNe2jSM6vhVtAHKTekXAilhAUmwM75yCskVUjCcC3qmTh4OqHspp2zFCkP3/xDi5cuoMjZBi84+7uoxdw9sZdnLtxT2hjPUoRqr178kB8fK6hmanD6xJ71/e1NQ1X6uuYWJiZ2Re4uPmfSadok0KRJJ20eN5f9urrWvrR2T8lvK/DJCP4mKwpetjbeiZQSw6ihKhrLWnV7ftOCjMCZ45ewgS9/vjekxjjHWx4Z2FyECFEf42IbmqbmEDf3ARKGsoUeTZBS0cDmjpa0Dc2ga6xKexc3JFSUIz82kaKVg0ITcuGtbc/glKyhJHgfMV7/4kr/+oAGvsmhAU0vsqeXFEnTMXxTciBe1gSbJ39T5qa2fnrqeu9qaWxmf3w6dfsk/c/Y1b6NvNeefaVn5947Jkdb7z5Ib5fsQkK2pZwDYlDaFzakJWd0/suXoHsu++WCltAVZhh0gA/prNBZ6HExvPjkMj0nPLW4Tt9M0cwsvc0ercfQOfYLjLMEeRVt5K2L0NgSrZwhBLV5zQ/m1hVE7EpnoLNWULTwDiq6PngrcPyalqRUlSNHDJwTvdT6OfjiI3FZhQiIadU2M/n6wlZxBJ4SnE+bypCDiOJ7pdXUBRdMx+Y27nA0cNPSFWWegXCyTsIBpYOMLKV0rOTKuwKpNEzyVmFZ1gcjOycYUyOQt/Q/Pr6tbLuH739waIfvl7KPvroo1/FLlas0Gcf/OEN9t3b37GVazexJxfMm/f9Nz+9LC+rpKQop5j77RdLttFxbtVPq+6tXrEa3y75HsuWr4CjgzMSIhMR4hVy0crQqkRfXe89V2On/2uxz38rYqPT2WvPvzW/rXXIoW9w6mZRTQcyy5pQ1tyLEtJlvNa8d8sM6Z9epOdWCok+9i7+MLVyhqWdO4qJvm4jPXvi9HVhjDdv4MnTPOOyeZpuEoJisugGZhK9SyGDD4KsojZWUvTfqKAKqZAO3I7ZvSdwnoz/+OmrmCFD5B1lj5BDOH+bD4m4SPr8GPpGZ29V1XbGhQbFvxASksj8fYKYvpkF09FSX6Aop/ZHH6/gsrTMogcp9LBF0YMbm56HrOIaoZFlTTNvHrFbWAc4ce4u5g5dwBB93tS5RZAAfLejqXdcmBo0MH0AvVMH0L1tPx28f90eVHaOkGauhjQgCmomVtC3toOWiSk2q2tCVUcPpuQYvALDkUg0lRcW8ZXuOtK4aRQ1fRNS4ROfLKyi82aYfGT54TM3sZN36p3aR0Y0jAKKqNwBhGUVQMrz80Pj4BES/4Cuc7GSst7vre282PoV64X79f0PP5Nhr3j5s8++TXvjzfeuffzFD/Q+jGBLjCE8Mft2aHRKpJam3uNGRhbsg/dNmbm5E/PyCGe2Fu4LMzLLVPMK69urmwcv9G87gKlDF7F1/xm0k2Mva+gWuv7wPg+23sGw9QuFXUAEosiAk+k6JuRVooSegaaBrejbNofG/kmU8QlHZMzZZMwPdXmZYKjc8ON5GXFeOZLoayl8F4EYAO8hkEpGHJNWgOCYNGF7mBdfmZMx27t4CYeEnIC+hR3U9M1gSl938QujZyhV6O3A/x4vUuL1Crr0M7ZSd0gkLhNqihpLeeSX3SD7q9uHyvcqwqLimlXr2Yqla9lPz30x/9O33n/hz6+/9eWKr7812bhiVe7yL7/p//Td96e/++zzPZoKSlP6qtqVaptUwvRVdZ20FDXfGXJuYgoKCr9NB1Bd1cqKCqpfGBycKhuZ2PMgkQw3Mq1IqObis+GGtu5FS+8ksksa4B+eBBsp99auQpqqs3sgOkjPHTl1AafOXsWFK3eE5p28+0tyYS28w1IQn1GC1NwKgTXYOPpAS98C8ipaUCXt5kgPAKfph09dwmXe6//sNYrEp4R8/wPnbuHopRuY3M3Hge3l1Pl4TVOPIr/RjlJfpqVtwbTUDJiBlhFb/NS7850dPU1iYlIvhZI2C4hORDhR7jiinryslaftNnYOY4qYxjEyvkMUgcfI+Nr7J1Dd0iMsQJU1dqOWImAvPdyDO49gbO8ZTND7GNl7Cv0zR1E7MIOSthGiwyUISEiHV2ScUKQSRXQ3j6JjRXPPwwIY3vt/2x6UEVUOTCXW4x9KxhSMhOJKYU7eTtL+B09dw+D4HGratlD0bBfGZsVRBA1KyYcrRTe+SGfv6vtA4uJVaW0recVO4sI0rFYweQUttnrVhgUaOmZaZDjHZJQ0sXyDAjklW6LLEQ+CI1JGXJz9vuVNHzTUVZimpg3TVDdhBY19zC8o7rPM4vqBksa+Bz2T+4iJnKNre0oo8CqpaL2dkJx30Sc09oKupeSOnI4JTF19YEIMzTc+C4l0L5OI0eVUkbNsHSANPyFswVZ3DqGI5Es67zVAUZ9HZ944hG9x8rJhHuUzy+rIeZYhjBxyGF2rmL/0FQiOTqX7HwgzaymkRPfd/YjSW9oT/bcnlmUFFV0TgQkERCULi7x8yzSW/j5PH+dFS3b0/lw9A45aW9qby8nIPq6hosEW0L//LCxdupQt+XE5k/1uA1vy4Wfswzf/zD54/fUF33z44XNfvPveH798+73Pli7+9Nufv17yyWfvfvTK7594/vHvvvzmsY3rNsx/97W3mIaGxm/TAXR2jpATaPl4eHx2iuvusKRcmDt6CQszO/efxL4T19A9uos+byWdlgBjGxfS8h6kc3nUi8TEjr24dov38b+LS5f5TPkrGNl1GBn0877RGfQwlJMur0dgRDIkbgEwMLOlg6KoiSXp6gBUkvEdO31ZcAAnLtwh6n+RNDhp5PMUJY+dxzBp5qZ+nsU32l1U2fBu79gMs7V1+l+10opazNLOkRnrmX/k7OzTw/MOAoiCBcelkA73hcTTB4FRscgpqxSm+e6YO45DJ6+QtDmHiRmivoOTQppwFT3Y5SQX+PzAUT4Yk97DjhNXMXv6JqaPXcfAzpN0XqcxvOMYmgenhZ2I2r5xoc8er5XoHN8hJLb0krNqHpkmPd+MYHropSFRcA2PQ25DO4Z3kf4/cVGY78ez3VILqxFFEdOLKK4psSFDZ1/Y0Ps3Jeeqom74wM7OacTD1XtJQVY5k5NVYR4hYUzf2P5dZ5/Idu/IVIrUodioYUT03wSGFo47bGzd5LWUDBbqa1kwPSMTpqpmxKJSs5mJpfPr0ckFqVnlrTdruiYwPnsCkzPH0NW77UZeXu1EWHB8sJuzr46RqY2horpeobq++Tl7Mk47r1DY+0bBLSwVviThkksaUULXqHlo6mGz0eEpVJOe50U7vEkobxbKOwnxXIe8inqU1LUimxxAUn65sA7AC3v4tmdUci78whLg6h0GDx9+hFJw8ICOiTX0zO1gRE5Bm54TB68gBMWlIzAhA550Tz3IOUrIKZlYSsj4/U+7ufsGampov2BpZss++/bT/5IpOnzHYLOaGvv0zTfZko8Xs6Wffc6+eu8Dtvitd9jPnyxm635cwX748jv25XuLibWtYfIb5dnKL3/87Y79Kq5oY8mped9WNHTtLW/uh71XCDZrGMCVbkobefmp3ScwSHSxpLYHEUn5sHb2g66ZBFbkJJJzyoQ6cF7I8+AOcI8o+4VrdzGy+zgSS5oQmsK9fTHRvSx4BMYIxSgG5rbQMbaAua0jIuPT0NjSi0NHzxH9v459Ry9j58Gz2MZbbZ++gh28vTbR9vbBnXfKarpC3T39H4uOy2QSifu/vn+1j5SZlo4hU1fRXWRqYq/jIPHaJXHyecBzDdbIbsaqDRuhpK1J7yEGZfRA9o/OYCdJjqldhzC8dRd6+LxAorU1nIrXtqOA5EArGXP/7CH0zhzC1kOXsPvMHcwcv4lZPqxi73kMTh1C05YdqOGdfolZ1LQPko7vEFbB8xrbkVXbShGfj8CuRja9Jk977ZrchW18fPf+E6ikn0srKENkKkUz3xDo2Dphk4E5NmgbQ9vcgbSt9I6cnMZOVUUtib2l/avB7qEUyY3Y2qVrFlo7eNsGxGZfTqvqQFJpC9yCeb6BzzlLK2fbjz/8eJGaqi6ztnBjJhYObBFj8+xdvN/zCUuISMqrOl/cMICmnm3oGdqJxqaB85nppbHebkHfaKvqCI0xXqSfV1HUeFNNVd9e39B22MLO87qlNACWLiHkbKIQllEsLBBypze8g08YOoC+rXvQQY6Ar6cUVzcLxp+YXUSUPRcp+bzQqlBYD+AR3DeCjD4okqRhNBzc/MmYA2Bu7QojMwfoGlkJ/f5MbF2gbWoHfUtHOPP6BHKItjziewY9MLZ3u6WsYXBCU0u/28Lcxt7K3Ob1QO9Ypqys8N+2yMYdwup169iyjz9mX3z2GVv+7rvsvFCu+w+C+s5pFhmTJpuaV3GSR381I74FY4MwomiNrYMY236AjsOobBwgTd0I76BEGFq6IigqDS0945jdf0pYvLtz6+FAj8u3gK0HziCrpps0XxuS8+uIkmchLDFHaDjB6Z2Chr7g7SNIz41uncVJkg+HjpPx7zuNsR0HhZFXB8/fwBzR9e2kU9v7pk+XlLVo8fcb4B/1V+9fZ60OK3DRYsryBmyznPoTZsZ2qprqhnVLvl52/Juvvruz+JNPb7zz/vvXdYxNH0RRJOFrDt0UwTr6x4UcgAYy4Ho6eMJKPhludk0LClt70Do5i9aJ3eQM9pAMOIs9Z+7h8PkHOHL2PvadvkXR/CiqiAUUEgVO5vvmmfkIpYc+lKJ+HH2eXduGopZugRVM8KYYu45gZHo/Kknv8+1Pa6mXkJKrTtdBxZgor7E1NIxtblnYu89Y27kmG+hbbCDd+WRqeClbseonpq9nzVQV9F508QytjiWZxtuj1REzikjOvydx8S/V0TF7w8zCmfmH5DN7iR9b8vXSBZZ27t+4+kdWhKfmX8usbEFFx6jQDLSqvhcpSQVD9tauHxTntAoz7A3IwShtVmXa5mZMZq3sY2tWy3+5SU47REvHeo+5tecdawc/SClipxfVoH1ou1DXz+XaBF2HAWJAHf2TwoJqelEFgmKThRoDnmrM/x+akAa3gHDYuHrC2N6BDNwCKjqGUNcxhaKqPlQ0DIUya2diQVJiHva8Y/TDJLL7zm4BF3T0LMf1DKzKNHVM/TbJqyvJblJ8f+2q9Y9FJKQyov9MT0+PifiPY15mTqllQmbxdUffcGzWMiaK787n12N0Yg927DqBls5xFFd0ILe4GQFh6XBwDUViRjm2zR4TBnecv3RbSOS5yBfyLtwWDHfLntNEp/eib/IAGdcWYVGQa1sNeuAVtAygqmsm7OPvP3oeV4hBnDhzHbv2n8H03AnsOXoBR+jvbj94Hh1bdqO8umciKjL9w/z8ZmZk9G9vthHRXXNLRaambMRWfvvzwh+W/PTGR+98rL7iux/zvv3sq+g333yrWFvP+EYY6cmUzFKUkhOoIYOvoGhfTPqb97zn1Wd8nz6fjoTiaoRnFSMmrwq59T2oIto8OXcOh8/eIflA72vuDAam9pEOHhEWvrzC4xFAkoNrXJ4mm0VOpJTXyw9OkDM8Qbr/HEZnDgqNO72CY7FOXgPy6oYw5xWT9OAb0/U2s3O/bWzhWG5iJlmurKTzzOJXX58nJ6PMDPR0mZaGFtPVsWBK8jq/d/MK60zIKkNt1xiK67rhH5o4Z2YhXccj+Jo1ikzqEsxs7LwWBYanK4UnFPTG51TdTi1vQnHbAPIbe5FV3oLM3Mp7CTEZea62bs/7uAYwLVUjIXNt04rNbOMPG0huqDIZbTO2bMnKp9evUZIxMrDLt7f17LewdBnKzKs61zk4RUzopFC+y0t5+/isAWJQvEw6KjWHInwUHDz9BSfAqw0NrBygSaxPQUsHyrpakFFUxCYVdYr8tvD2jxD6JKRmFiMrpwJR0Wnw9g67JnX03iGxdy+ws3ExVZLTWLxpndJL63+We3T5h9/NU1XfxJQV1ZmGghrTVNQULfgX1QBY2C4qLK3zjc8oumvl4ocNKrqQkdeE1DUQVTVE97rI+MvIs2eRUUTnkFdOQiA5gZKqLuw7cgmXrj8QFv8uXrkndPblFXyT+89igDRm+9g+TO47j7E9p5Bb3Ql77xCoEs3jEsPUzlVoSrlr/0kcPX2ZpMN9HD97HXtJe+88eFqILl3jc/SQDz4oKm6tCfKPeykmKovov+TfX61VVmGLv1vAVDars7U/b2Abl8ks1Nqs/ifF1RtfVVFWN/DxC70YRQ4nMi4LabkVyCWqmkXGmkkRjR/Z5Q1CHnwJ0fOMigZI6ME0knje8YtOOxmbUXY4u7D5ZHPbxMnh0bljpeXtc/EphbN+ofEnTKyd7hjbOsMvOhEJ+WXIJz3MJ940Dm5FD0mMaT7KnOTM5NwRYfvLjKSTIdFc9+AYMpY8xOeUIpCYUWBw/DFba9dNvf3TTEub9Ds92J9++zbbuHGjcH6rV21m33+76lkdHYsUibPf1ZDItDvxyfnXvH3CIzdtVH2Cvs6WrdVjEcllzNM//ov4jKrJvJpeVPdsRTlv/00yJa2sEVEp+QiLTNrl7RGwTmud/HyptfSvriOvENP4OohtWqvE1qyUYyu+XD5fQ8XgVQNty/d1NMw/Tc8sy+no33qHF4hN7TmOUd70ZGAbyuq7hEU6XmFo6uACfk1s3XzJyblBw9ACavomdN81oWagBz0zc0g9fBGfnIPyqjZUVnegprYb9XU9d0oKanaGBUQHWpo6fKeppvfiymXLF6hoGvAR9ExxswZRfVW2bp0+k5PTFY3314CjjdOilPTCgPD4rLtGZJSbiY5tJlrm5BaEPKL8LZ2jJAXIuxc2IjA0HS6e0WREeXxPnmj7FTL+u7hw9S7OX3mAY+fuYO/Jq2T0pwWK2jN1GM3Du4hWdyM6qwISYhiKuqaQU9eHN0XCutYBbOXDPbbPCRNwd1NE4Tn7c8fOYfbIWXTS3yio6b2fk1eX4OLo/URIUPzflsixfD377tPvWIZ1O3uGGI5U6m4eFZt2LSG1QGhwybvjZpdyw69COjGdpOwyJJIhZnKnUFaHbIpkSfS5Z1D0NiVtEx0re69VEkmAQmBAomJ+Xs36qPDUb6ytXD5XVNA2lFfQ3G5gbge/yAQh9ZXP0+N17nyACe+Eu+/UZRy9eAtTB08gk77vEZ6AaJ6vQE4npZAXBZUiJjkPCQnZIx7Ofh8EeYcyOzvvf5NL/sM3K9iHb386f/3qzZ9vltNwsDB39PP3jZB6uPp/zKO//AZFZmgmGPO8kLhcAzL+K12TB8kJ7Rf6/+eTBIhKykNweNJ1T8+AEDVl1SctTaxZtGfcv3sNV3+1mmma27N1xAr0tS2ZhbGEvc7mz4uNy7Gobu6/2sHzQkgi8W7HfPAJr2vwDo+DriVRfDM7ovyRCCWHGxSdAle/UKHgysjGTii7dvULRGwyOWIKANwBlFOAKSlsvFCcV5ufm1KwKtDV/wl/7zhmpG/BtDX0mdpKVaa+QV001v8MuDp5/q60vCk6M7/6vtQnDKr6FkKFn72TP6oa+gRKzvfmy4luhkRlISgiAxVk0FunD1DEv4FrNx/gCh1nrwBHL5BOvnAH++nr2w+fw45jV9A+vpco9CQS8qrh4BMKddK6fI/XySsYlXWdmCRqzEdm92yhB2p0J3gDEj7598ilGxiaPUIGNXq/oLgxxdXJ66mw0IS/69wMtfQFg3D38reMjEu/EZ9eiICoFATFpSEhuwiF1TxHoB8l1e3CthVnArGpFCFj0u9HRKceSkzO9ra3dXoiNq1UyDDjx8mLYNlZlczR0ZcpyKg8b25hn+vg4nU/MDoJ1W19QvHR4PY5YZFs19FzOELXYvbQGaEYxp0MxDc2FSnFtUgvqUdyTiUSUgrvx8ZlH46JTPWQ2kifdLR2Yg4O/7be/Lslq9iXi5eyoPIi9odnX5r/yTt/XvjSI4/O5+9Jk4zELShcOFf/yJTFOZXtNW1je+5u3X8eg9v2C/MKssjYEuKzb/n7RTSaGVt9VFnWQzRa6W9ucOFk48tMtWwejY7NDSLpcadtZAaDU/uERqB9ozuQVlQJO68A2Lj7wYOce1xGMTIKaxDOaxw8A+FIEV/LyBR6FlYkMZ3hRF9z9Q5FRGTKg8y04uMZyYX+YX4xr/PzCfOJYCpKyizIL0g00P9sWJjaLaqt6wrOL224z/WplrEN6XNzaBrYwj88Dc29YxjbeQD95O0bOsZQ1zIszLs/c/4mGf99YZjnhav3cODkDdK6V0i3nyUHcA2HLt3C/gu3hTbeNcQWEvOr4RORBBM7F2gYmAvbOVXkACZ2HMTA1r2kkQ9jaOscdh8+i5NXbmPr/mMY2nWYKPngA9Ks5Z7uvi+GhMT8XeemqSk83PPcvIJMgqNTrkX/hXKHUvQJT8miqNiIrqHtGOQpsO3DyCqoQUhECrx9Ig7YWDobO9m5v7RaXoFpaBgxPT07ZmYoZdba1izQM4I5O/uwNd98u8DYzMrFxTvwZlx6Hrq3TGEnUf6Zw2cwQo5t+94TmN53Ah2D24R+e7YeAQiMS0c8ZxxZ5Q9iEwtORoZnVAT6xKg72Xg+z9+sopLC/7HhxIpvVrGfvlrJVv+4nsnLqjAtZW1mYmLLFDepLrS3dnvH3StcJaOovq5pcPvVfn49Zw6hrKbzZmxk6t7IgOiucL+YKC8X/69X/7ByvoGmIeN7538LGhvBIsNymK9n1Ls5+Y195W3DaBiextjuY9hDkm1o6ywyyqrhStrf3jMYvpEpqCbW2DMyi+KadviGxtHzZI4NSqpQ0TMkJ2ADHVNL6BpbwtbO+YCXe4BNsEfY8xX5zczB0pklBRT/Q3Xe+YcG97i5ueW2+aX1dzwFB2CLzeqG0DWV0I1LQh7p1vq+MXSN7cLAJHn8ncdx9NQ1nCNae+U6T9+9LrT0mp47h/FdZ4TZb4cpegvDOq/cQ/fWfUgubkAERQSfyCSYO7hBWdMQ+vQ6LR0jmNx5TFjo27bvHPacuEaRnxjE2esY5HMAiWVkV3ciKj6r3kXq/oq3d/DfdW5aWkaMDJtJHD3lgsITz8RnFAkOICSJTxBKEfrjt3SOYTs5qdFtB4QhpQnJhQgJSSw11rd50dnNjxmoWzJDQ2vma+8rXKuUlAzmae+70M8/8kVTa+d3rCRuUQFRCbeKa1sxNrNf6GK8+8h5bJ/j46pOYoBYTQbJDFveFcnSEZ7BcQiPzUZiasmB8PA0e2tjp9c3vbdqfoBXJFuzmq/26/+N5xbALCwceWvqR9w9AxX8g+Nao5PzT2aUNd4taulFBe/UU9N2LSAwJsfOzPFnaz2rPxmqGD7Jz8FA3VDog/+358ZbssPHLrCQ4BSZvJLmU2Wtg6gb3CrM+9tKTrpzcAIpBWXwjkwkBxCGkPg8dA7PYmLmGGpbhhAYmSxs8cmrad1U0dK9pKatf0dOQQWm5jbXHCWuUdpqOs/5hYayTYs3MDsbe9Eo/6sdQEFBhWVeWe0tJ78wKOtZQF7dCB5+UUjJKROaOHSQnm0enkHz4AzGZ47j2JmHK/+XrtzAxcvXcezkFew5yHP4rwh5+0ev3MKpm/dw8NxNtI/OIoS0t2NgDEXAYGH/18DEFsr0GvmlLRia5E0ij2CS6OrU0YuYOXEFI7tPoWNsP2r7phGTXQkn14BqQz3Tl81Nbf+uc1NUNGfG+tZMV9PoYw/34FH/kARIiXa6B0cL/fB5n4Kquh6MbTso1Ap0De5AXlEDYmOz47U1jB61tXZlvn+Zv15yfj9Lis8lehr9dHZWmXFielFjUFzGYFhSzpnMkjphLh8f0T1Hxn/k1HUcPXkdW6cO3EpJKThgYGhzZJOizl1NfSv4BcYjNCzlREhQor3U3utJP684ZmNgz6p7dzELTYu/+dx0dB9WcHp6hSyJis8cTcguRUF9F8o6BpFV24LUggqERyQNWRjafJpf3MBcLJyZnaEDM1W3YBZaln/XddTTcRaYVGBool5KbsVlHhR4L0DeAryTHEFNc6+woyP1iYBXeCq9dgNF/z0Y234EFfU9cOQJYKY2N3X0jKs2b1Sw0lDVzjDWNz3qLHHtcpW6fdWztZvZKdow71XeokH+dziAopJq85ySmltSv3DoW7vCwMoVIdEZiCE9XNrUiy18Dt/uk0Jb7r2nb+I0RfZrt4Hbd+7j7r17uHX3AS5ee4DjF+5i7uRVHKVvHr9xF2Nzx5DH1w6S8+HoHwOXgGjSfsEw/IsDCIpIQ+fQLgxNHcOWnScwsucEJg6cRe/UIdT2TCOzqhtJ+XVwdQvMU1FQfU5f1+TvPj8NZV0mJyP/OFF6Z0trtxPGVs5CPkIs37LLLEZBWQtF6d3YTue3Zet+VNL7zcgoSzAzcljk5vpQg1pYuFL0i2P+7iGPpSTlmadnlx1LK6pBelkDylr60dI3gf7xnRiliDi18zBmOTXec+JOR9tQk52Vs/yKZes0ZdYqluprW8y6OQXs8PeO8rGz8ngxLCiB/eH15/9uuiuMbTORMG0Vw98FBsUFxKUW3iogOdXE250PTyK/vg3hcekPPDwCC8z0LZ820jZj2pt1/sPPiLGWHXuaPT3fOyDGNDmn/CrP/ecdgVsHJtHYuUVIt+bdhs0cPGHnEYrM0mZ00TUdJPZXWtMBZ/cA3gl6n66u4Zo/PvvifDVFtVdsLOzMbS3tFBTlFR8x0jX6u5yfiF8Z6dklNjll9beDErIh9YuBucQP7gF8+EUz6rvGMDJ7DDuJnh8mIz9y7R4OX7yJK7e58fMmnndx5+59XL35QMhxH+ETYg+R9j1+DrUDWxGVVYHghDy4hybDyTcK5nbuMLOUQkPHFBLXIGGoY03HVvRM7MMsRf+9525hKzmaxoGdKKjrR1Xz0N3E+OwwhQ2Kj1ub/f111eqaasxSL5tpaxq+JC+nbWZo7LA9LCb9QVp+OQoqmlBU2Yb23m3CRNvBiT3CrIL8wtosqaPP4z4+EcLfsLZ0FxxlelrRhpzCmr0ZFPGzeSlxY7eQF8/XLsa37xfmAgxv2YGBvskH3R1Dw/kZxUufYk/NX7ds+QLVDSqvmWlbLHEwc/raxkTynFC88sP6/1CKqLGxKzPhwybVTF7yD4yvTi9sQNPwdmHcdkP/mLC4WVhSczcpLj3ewsTid3bWdr+oQ42engV7+9V3FvgGxzlkFtde59V/vLlnbcfDpirRybngPSS4zOHbnLE8T6FnHLWdI8Iui69/BCR2zl1m+mZvmuqbMTtLB2aoY/SosaHFIhtTc+Zm7fbXDSpF/Nfhjacfn5+YlifNLm24zSve3ENTYeEYCANLN4TG56C1bzumD17E1GGi56euYNdZovmHT+DwqQu4fvMu7t2/LziAMxduYGL2MHq27kHfjgNom9iFuMJ6+Mflkt7OhW9UFrzDUmFEEVjHwBJKavrQNrTlBo7G3u3op+i778wNjO45LgwCbeifRn5l54P6luFDmelFfK7yPHtzl7/7/DQ1NZmCoixTVzFiH3741aPaWhaSgOD4q8k5RJkrm4UdAK5Tt2zbh356z7yEODOnrNjN1e9ZX99wwXBcHP2ZxNr9saSU/LjMotr7vCFmYWsfSolud5LGH50+KKREj0zsRl19N6oqmk4VZBfrK8tsXODj5sPWrljL5NepMHtTKfN08mOu9r5MdZUy05fX/7vORUvLhv3hxWXMzEKohZhnZ+P1U2Ja2Uzbll0YnD0idDOqbx9ATm7Zvez0gi2JUckr+M9ZW1n/h5+PjRvjmK6uDZOVUX/MNyQ+IrWw6i4fuMLr+ksbupBHLCg5uwQB0cmwIQdg7eILr8gkpFc0IpO+F5GQBR+f0DsSa2mYroLaY2ZaRkx+kzwzITZnZmTFUn2cRSP878TjjM33D44mBtBwIy6nClFpvOSyECY2XrB09EVpbS9mD1/GwI5D2DJ3FDtPXsCu46Tzz17Cleu3QbZPEgDkEC6jbXAKVZ1jKG3dQrq/BG7haYhIK0V2WSvyqrsQT3reSuoDJXVDqGoZwzMwGtv3nsLu41cwvP0A5o5fRs/kHNrGdqNzbA755W1HsnOrJKGB0c+X5Lcycwvz/9A5ciPWVjcXori7NFAnOjbzYlx6ATJLeO/AVtQ0DaBjcDs6hqZQVN2GlIyiIT+/8A+jo9PZOuWvmJWZI7MwtHsiPCotNzGvAnn08BeRA2gc3EZO7whm9p0SFvz4+O+a2o77+XllFSGBoa8mxab+avdJW9uWqSqZMUePYKarZfs7X9+YtclpZfW1rWO3eNJVJ7GX5u4t94tL6o4nxabnhPiELdParLHAXMecmZma/YdfV9/AlunQ31BTNXrRIyC6KonOP4ePEK9rF2b38UnCfJ6gPzkAO48A4eBFO2GpeQhLyoFfcCxcpT4HjDSNV+ZlVTNVOVXR6H5rCI9KMs4ra7yakFMNv8hsJOfUIiA8nXRkDkpqu8kBXMT2A6ex/8wVHDh3BccuXsfVOw9wTdgCvINTJAmm957A0PQBZFV2IDCxEFGZ5agjGsjHRPeM70J56xCiMkqFduFKWibYrKondA7uJ/p8iKf9kgFN7DyEPvq8tm8bWrbsfFBQ0Vbi4hLwalZBHfvx+2+YpaXlf/gctRSNBQdgbeKk7ekVfjEsIRPZ5fWCAyit6UJ9xwhq2oeRXdqIxLTCS0nJuY5OErdH/XzCyOBM2boVso+aWDlHBMZl3MupbSOJMonRHQex+9BZzNB75wkxTa2DqKxsOpGZnqfGI6+rs/uv0hxSX9WEaSkbPqTjxtavO7gH2YfF504TQ7rbOUqyY9dJdJEDqKhuPRQVnmjjaOX4Ej9XJ0spczN0+0XvwcYmjllaOTMjQ7uPnb3DJiL5pOH8CiTxMeHFtUjMKkFIXDpcAiNhLHGDqaMHL9yBV1ii0C/SzsEL+trmdTIrNrwiu5oi/yYT0eB+a4uA8YkZCrmldaeLaroRllCE2JQyBEdmIi6tSEhWmTlwBicv38XFW8AVMvozl2/hzJVbwuy+Ldv2CsMc+Cinli3bEZtbhZjscmEKzEn6mTM37mIP/VxN9xgCEnJh7RYEHTMHbCIHwDsH8xr8rbz8lvceIAo+MnMIXVv3om9q/4Pqpv5cH6/wZ6OiM1hEeNIvOs9NazSZb0AYU5bTlXdyCjjHHUBSQTk5gGYUVbQR0+khStuHPHIIabyEObt0MiE2/auK0lbm6RXF9LTNX3B0DUiNzSy+x7vg8EW/KXJY07zIh2RPHf1uTnbFvdzMkrLw4OhX0xKz2WffffiL748GyQR1eU22admqBcaGNl87eQZnekelng6me5PfOIDWsT1on9iLKnJeKWn5FVYW9i97ufkxPR1dZmFhQZFb7Re9vhmxH/6M+PlEykUl5Zzihp9UVIVIYlBxGUUIiU0XmnbYePjDmo8ZC45GYGwGgqLSYWnjCSND+3tqSvrx635a//imtQq/3bLYf1bkFRWzqOjE9/NK6wZK6noQnVIKr+BkWEp8YWAhRWBUmqDtearuLBkqz/47dPwS9hw6j2EyVD7braSxB/G88wtRat4fbnzuCM7e5O28buHi7Xs4deMeurfNISStBFYeobBw8oOGkQ1sXYNQR45h6/4TOHb+pvAaPIGmZ2ofhuk1W3rGt5WWNy05duYOC/CP+GUOYPXDVFJdDXN9V/eQy77hiYjO4EM+65BfxrsI96O4rhc55AwyCmqRml50JT4m3fJPjz03z8nB7Zm4+GyPpKyS4+mltShr6kFL16gw+LOjZxTV9V3Iza64nxSX3RfiF7Xsh/eXzHO2cWNqamq/+P6oKKoLBmhh7vill3dES2B0+q24ghqkk7Mu79mK9sl9qCbGlERf8w+JydHXMXrC2spRSCb6pexDYEzWbkxxs/aihKR8n+yyplv5dK4lrX1CGzCeWRkYGn/f3tnntqGt833HgAjEZpcIayuJ6cWwc/SDpob5FQVZTfuVy1Yv2LReSTS43xq8vAOZxN7hkfDoFLuU7IrLReQEwlMKYSrxEibJSDyCUUf0nTcDrWsewNi2/di1/zy27jyF7i1zqG4fQwoZTHhKPlpJQ/NZ8DsPn8bZ63dx5MxlHDp7Cadu3RfKZ+MKGuAQkAArz3DYeIZC6hOFnMo21PWNY4wi/yjR6EFyFOPkaHgqcevg1I0t43tiy0qbnmxqGvhF56mlasw2b1D7naWZS7SdxPeelZOP0FsunihsMUmAhvZJVDWPIq+qG8l5tYhNLrgWG5tpx3830DdiWU5B1d6c8gZhDFZpUzcKy5qQnFKA1Iziuxk5ZZcT4zLawgKiVspv3LzAwV7KApOif5X7Y6xny9Q26z3p4hZMSi3vVnRmGZJLW1DQOITS1lFUdU8IVX5hFJF9QmNHPL2DPomIy/5VxleFOfkzL48w5mDn+3JydnVNdecEurYdQA/dp4qmXiQn51x0k3qVa6obBWxW0p+2o2clPCkXGTnlSMkshpmtG1aukj/081KZtS++9g2TW7tZNLjfGuxsbZl/cCJzdQ/8IDG1cIS3iGqgh4pTdRPS604+EYhOLqSINy4sllU39qNneCdR/0PoHt6NqtYRwQGklzRgiDQx3wbs3DItlIrOknSYJWdwitjAnjPXUdYxjoDkYjiHpsAlJJFYQzUqWnlbqR6U1/cKtQdVzQ9bTjUNTqG8of9uc+tIRn5e2bPl5Y2/6DwtTaTMQNvqD94eEe1e3lFCrYONsy+CIlOQmlODzMIWZBS1IDqtDGHxeYhLKpgODU36Ib+4jnm7+a9ITys8VFTehJrWfpTVdiA9veSyp1twj79vRHxCYpZlcEDExxoqKgvs7B2YU6AHk+pIf5X74+7ox3cP/hQUnDAYlpCNCIqsyaVNyKvrE9ZbMstb6fN6hJMDCIxIvBgcEquz9I3350nMJL/odZ2cfJinw8Ptz+io7FVVzcP7+qcOYWLfWUzsPYXKxp7roSGx8aY6pm+tXSH3+mYF/QpzR18h05H3koiIy4AhMciffto08+N36778cvFPzNRCTO/9zcHFxZV5eYYwS3Ppo8nJ+V6NzcPXh8b3kzE0ISSxgCJkFYJjc5CQUY60vGpkkrHzbbMh0p28NqC8sQ8lZMCtQ9PoJUnAu8v2Tu7F+M7j2HXoEo5dvIXTt+5g37nr6Nl+EOn00LpFpMGU6H9ySRNqicaW0d/rHtqJ9t7tRMl5k8l2cgx8fFfn7di4fC+Jg9Ojfn6/TALoaloxVQX99/28YsYSEgoRGZcDJ2IhLh5hcPKKhLUr/d8/DtZSf6K1STdCQpMCjPWtH7exkDJjLZMXAzzD0jLTiu9mZ5UjO7PsSlRoUrKZjtXHGvJaT777+p/mF5fUMRtzG+bh5cXs9e1/tftjrmfN9JT1/yR19OnmejuB70LUdaG4qR/JBXWIySwVqgt5TwJvv/Arfj6hxp99/P58A32DX/S6jo62zNctjDnZej6XX9iU1Lll950tM8cwc/gSdhw8T8Gg71iAX+RaH98oZqhn9bGJmfOksZ03XANjERSeTI41GabEADbL62zbuEZ5scwaUfv/ZuHr6M3CorKYr0fYh+mppT19Azsxuv0o0eEeiu5NiM2oRChFxaCYTKLLHWgf2IZaitwVDb3oHp0RFu62UlToJqfAE3pGdp7AxO4zmN53AYfP3cDxq9cxuIMcxsAUisjYA5ILYOIaAGlQIvIb+lHSMoyatjFiFHtIX28Ryodbt8yiuWvydl5Bg5e9ndOisLDEX3SOipv02MbVKu87S4JGcvMbUVTVIfQrDEvIgV9UOpz8Y2Fk7Y61MmoPrKxchlylvl8GpyYx4w1GQhSU2rgtjgiKy02ITptJTcjO8HENeKcgv5GZ61sRRXZm1qY2LNYu9VcvYlGV1WCbftr4FL2nRO/QuPtxuaXIr+9AQX0nErLL4BOeJNRYeAZFwds7aMpJ4vZtdXkH+79NyP1/wcHBl0kdH5YWh4Uly1bU9R3qGJ2j+3wMU3vPYIhkYEl588WI0AQdfm0M9W02GJu6nDC294XUNxqe/nQEREPbyA5ycjq7NZUMl8nKGDBddbGG/zcJH2d/5u4cyDasV1mYmVpi3NszdXbPgcsY3nYUZQ0jyChuQ2FNL31sQkF1B6pbB1FFEai0tkug+1vnSLMfOIeh6SMYmz2J7fsvYPbQZWIAl3H0/A2cvn4LA9t3o6Z7FBUdWxCaXgQbn3CEk55tG59DZc8k8onS1nfzJpPbUN03JeQCVLcOn4pLKBAaqnt6hv2ic1QiByC7WuVtO2uf3qS0cjqPduTVtCGvlj7S/2PTS+BCjEBV1fCkgpy6qYGa/iJNRV1moWrFVOR4mur786xM7F8M9gn/PCI45lX+N400DZmZhvl/2sq2lZUTM9K1ZDJL1y/y8I0IDknIusdHope19SGnkhxzWgH8w+LhExwNv+DIM+6uXs662vq/Mzb+Ze/J2dmPeXgEMHc3v+fikvKyimq77zUOEkPjLG1gGtUtA8jOq0JMZHKTvYXkHVNTqY7ENey8W2gqPMNT4RUQB++geNgTyzM1cz5vYeBgaL5eZp6ZlplobL9VNG2NZ3HhWSw0IO6F5saBiOmZkzf3H76JiZkzqGnfipL6IWSWtdHRQqygThj1lZRdhbbB7Zg9chHTB86T8Z+gjxew9/h1HDhxHUfP3MD5G3dx4fZdYgSH0DK4DeX08MRklwodbb2jM4RFrBYy9pFdp9A/dRi8icXkYfp7Ry9haOu+6ey8ms8mZ44wieSXrWhvXq/OZH5WfFZP0ybUwzPqZGRi7p24zGIk5ZQjPq0YAYEJ9+xs3E8Y6ppHrV+98RV5BTW2/NXPBEOyMg1hWupWzNHWjUVGxLHEmDTmYCNhzvYu/yn3gq8fBLD3mb21lIWEZTJzM+kfQqIzq5KL6h4U8izEpm5h5FZIVAoCgqJuBQZH7/TzC/WQ2kt/HxkczzS1ftlqu52NB4uNTWP+vpGfpWaXb88hp1/WPkbsbBBZpU1IzqsUCqk8PAJPGxlY+phbu2W7ByXdDksvp3tbjYyCemQV1SM8PheOjoG37M1dAyyVzB6x1LIRDe23Cn//UOZsJWWN7WMsNirt7dbWsaq5PZfu7z9CxjtzFlWtE8it7EZZ8zBFn05EppUhJqMCg1MHsPPwBYr654gJ8G4+V3H0LOn+i7dx5cZ9XL8HXLxzH0fOXcfEriMoa+xBdEYhHHxCEJKUK9SsTx06j0n63cFth9FHx8ie05jce/rBwMiu+oz00peLS5pZeLjPL2MAq5XZxm9l56nLG76po2GlbmXlFhMZmbY1L7vyTFxkxh47C7c8FXkdNU0Vndc2KSyfpyC7mams++soWqBSwFxUXJiuii5TVfnPyWgz0zFjm79bzZycfJmSzMYFLi7+HwYEJwdHpZSeTC1rRRFJr5y6DmHsln9QzFknR88cR4nrKitzyRORCfFszdKVzMjI6Be9B4m5O4uL55Iw/JuI+OzdvJ4jobABacUNiEovRGhyDgJIdkiknrfU1Q2mdY0dDli5hz/wiMlFLjHF1t4pNHdPIru4GZ4ekQ/o7+VZa9g8a61rLxrabxlh3lHM0zFA0LxJCQVLezq2b901dwV7j9zBtj0X0Dq4C/W906hoG0VGaRsKavrIcPkE3zPYtvc0ZkgGHD51A+eu3MPVWw9wgwz/ItH/E5eu48y1eyQLzqKcIlhcVgkcfcOQXFCFwxdu4uC5WxjZcQxdW/YQo9iFzpE96Bvdc6Wre0LqbOv7SEZa2S/e01Zco8Jkf1JmBtpCQdG8jT/LP+njFLQkO65AN8IrdrWphsXLn/7+w3mm2rYkhdazTRv+69tMm6qYspWffMwiwnKZvbHkyQC/KOWImMyWpMyqK1kV3SjtmEBFz1ZiAH3wD0++6OTsF26kZ/Emv1/OEk+muHoTM1I3+sXvQ2LjziIi05ivV8Q3cWmFs/EF1cgiFpBPkomPEw+MT4e7fwSsbV2uycmpN25U1OvSsnS77RCUhLTSdjT3cAewDcVV3fD3T4CFvkOhuozGszp/Z+2DiP8OJ+Cbyrzcw5mRoeUjKfGFeh1d24/NzF3G7oO3sHXXZbQNzaGqfQJVbUTd+2cxtP0Itmw/hN0Uxc9fvotrguEDt+4/wLV793Dm8jWcungdF2/dw/aDx5Bd3YKw1BJ4RaQjKqOY5MM5HLt4l753AT3bDglyo7t/5/2ujsnuorzaxeNbdjN/78hf5dwU1ugwZVktvhbA1BT0WWJS9sNWX7fArPUkbNNaRSYrv+FfG3H+V4JLDelny5jEMZjZmLs+ExiQ7BiTWLg/Jr38QXJRM8o7tqJxeA+Kyfkm5tXBwzNyykTX+kupQwBTV9ZgId6/Tt6BxC6eObk8bH6SlFksV9zQcbKitQ8NXSOobu5BYkb+PXefkCsODh7H7K1ca1UV9NasWaWsrGfkeMjeOwqBycXEAvpRTYwxI68Rvn7xsDJ3Ltkso/SsiryWaGC/+R0BirQpWV3M1zuW2Vt6PJ2cXOrW1bPz/OjkCeyYu4qJ2XNClG4d2IXJ3eeFlf7dZLw86l8n4+fFQXfuPcBN+s81XiV4+SZOXbqFy3cfYO7kGSGRJrGwHsnFTYjJrUTP1t0CixjeeQLdk4fQ2LUd/f2z+5prBtTNtc0XRgclsuiwlF/9PO31XJiDrjNzMHZhVgaOTENXlenr//dFqM3rw5gesQ+5DVqPurpGGIRE5hyOzaxEckkz8uoHyAFMopkYUl7DAAJjc+HqGrrTzsz5Syc3P+az3udXeQ/Wxg8r89JTClmQX9xztU39ye2DW+/QIcxSKC6uO+XtFZxrZSmxMdG33GRtaPuOq5rH/HWrlV9SVjXK0zaT3rXyCEdwYjHyqnoRnVwGT99YSBx9uw0NrP5gbuYoGtg/AjykgcxA15tFx6UxT5ewl7PSa8LqaoYv9vXPYXTbMYxNH8fI9AnsPnIb+4/fwsnzd4TBoLw/4M3bxAJu3sGVm3dx+eZ9+v4lISno9NU72HfqHArqWpBUWIOa3q1EZyfQuGUnurfx/nWnMLbzLLaMHz5bU9nrEhuV/mRuahkbK+37H3+91ZTVeLot209RV1nd8msH96jhgNh8JJGT5ANWyon6N/RNo3lgJyo7xoXJywHBCadcHX2VHyU5Y65u/ovfg6lpGovNLWFhoVnMySpgUVFhs2Fr5/iJ3pEd6B7eLnSHzkgqrDfXtnxz8R8+mV8zRrLDwpNpqRgyPWX1ebIKGl9rG9nX2zgH3w6IykZOWQfCEgoREpWJoNCEnc7O3ot9fSNE4/pHgaMkmpmbuLOO6hHmKgl6LT4qL7SspONsZ/d2DI8fwNaZ05gjB3D0zAOcvngfp87fwoWrt3GddP+l63fo69dw4MRVbNtzGuO7TuDwues4fuk62obHhUk6hc39aBzdhS37L2DbkZvonzqJvi0H7k+MH+7ISC5/Z7BnmmloWrKQkOT/8ddacbM8MzXKJmOy+L2esWucjUf0db/EImTX9aK2f0oojR6ePoLe8TnUdo0jo7geMYk5V8OC4+x/+NPH8+1MfvniWlarC/P0DmMrf1abn5lZta6xZWSqvW8bOinyt/ER5mXNCA9ObJOYOf3ezsSRmeibMHVNdaaqqsM2ymmxtz78dJ6ikuFiE1PnYnfPyBvxqaVISCtDXGohklLy9gUFRn6RmJgpGtY/EuztfZm9mQuLSG9kEmvPl6MjMiXFhU0zjU1Dd3v6dmLHrgs4dOIujp29T8Z+jYz+Oi7cfCC0DNt58CLJhTMY2HYEbSO7MLHnBE5fu4sDpy+hqmMAVT0jKGofQSvR/tHdF1HfseNBY+P4sS39s06J4SmPZiUSDfWN/qe4zmaa1kxfRmuh1DrATOoac9IjIgepFZ2o7d2GgakDwiSibbtPonvLDCqb+xCTko+Y+MwzsTEpfEzSPBvLX5527OITzZo6hlhUYv77FXV9TW390/f52PCmvnHUdQwhlgzZ3T3kkIWx/XKJhRsxhv/VZGSjoiZbs0ZJWDdQltN5z8HGMyEwIP5YRmbZg4zMkrupyTmtgf4hf4qNShKN6h9uTYCcgJe9O3OXxDArU8nvfDxCV8XGZBYUFjSe6+3diV17L+Lo6bvCcfDkbRw8dYeM/wrR+dPYMn0KvZOH0TGyW1jZ5w1DD569jt6ts5jYdwydk3Oo6tyKrqF9KC3r3ZWVVmVbU9L6Kn+QQgNC/mmusa2uMzPbbPlkVFBmdlh0IQISS4RS3/6t+zA9dwpzhy8JQ1p7R2dQUd+FyJj0e8HBsS1+fiEfJCRkMWNT41/8HpxcA9mrz/1hfmFlq1ltx9jl5qEd5Lh3oLl/XBid5u4fTVre56qVucTgky/enael9dc9BmV+VmJrlm1ikaltTF5G5QUXibdWcUF1RV5WSUpYQORSM12ThS42LqJB/aMuDLp7SpmbxPdhxDK2ec3bI8wmP7t2rL9vx+3ZuXM4coJo/8kH2H/0Hj20lzG64xRGZ/hxDEPbD9FxFOO7z2Lu1A0cOHcDJ68TSzhyATUtY+jrmz1SV9FraWPo9ERnwwRb/cN3LDEq5Z/m+lrpOjLDTcZPRgRnZMalVyGlrA0lrcPkQPdj79GLOHLmBqb3n0LP2A5U1nUgM7PkZFBAlOHa9RsWmpvb/irpx3b2Xkx+o/qjSeml3qUN/XerSPO3kfZv6hpGbEoeLO3cYWkqOWdjaq//3fIl8xXkFf7N39i0chNbu3wVM1A3ZVrKygu8nH1edrfzeIZ/z9neiYUFhInG9I8MJ0sn5mBlx5wk/kxXVW+Rr2v4V+kpJZFNjYNz2yaP3N237wb27L1J0uAyZuYuYtfBSzh09haOXLyH2aM3sOPIDcwcvYqZw+cxc+AUts0evdPRuW1/e+OIT1Fa5QsF6TUsKSKBBfuH/1NdVy15c/b92z8udHQMdo5KLbuZ19iPmt5xjOzYj30nLmLfqSuY3HsUbUMTKK1o4k1HqoO9w97KSMhnhoa/zmRcW2tvJrtOc1FScpFXXdvo3er2LSiqbkVyegE8vIIvGRja9BlrmgfY6Ji/l+qbwL5e/OW/+3f4diauglkYWbJQvwjGR52ZGJowe3N70YD+J4BHm3UKK5ijlZSVl3cwMx3LJ0P94n+qKGhL623fcXR0+PDdibHj2Lr9FKZ3ncWOAxcxffgyhqaPYYD0fu+W3XfbOifO9PVsG54a35c6MrhTubq09fl9d28yp432LDow5Z/umqps1hb0s521h0pMYv75qrZh9EzuxsSeY5g9fBY7yVmObN+H6oYu5OSUHUqKSVNT/Exuvrut569WfORg684+/eSH+THhyTqVpY0nqiqabibGZRwMD45pkdi4OChuUv9AZrnMY1orfpinKbOGvfXGG6Ix/DPDwciBWakZCx1ub+Is87YLfiExsnBTUW5rXH31cGdv986ZLVv27R8c2XdoePLg0aHx/UdGJw9MDwzMFFaVtevUlXR8VJtT96Ty8q/nddRvYaY/mbAEu4R/ymu5abMsq6rqYVIH7zUx8dkn+Bjxge17MUWGv/vYBUzMHERlbSfi47IuRIYlhgR5Br8QGRPHgl72+tXeg4uVhOXnFLEQ35CXCjLyjcvySn0i/MJlnCwc/6gtq7JIV8eSya6UY4ZE/fXl5UUDEPEQ7vZBzMIwmAV5PJzca2fu/USwX8pbaQmlX+Zl1SzLSa9eUVHavqa7Y2JtT+fkktrqjpeUFDbM72+fZNW5tSwvLZdN1kyy+Pj4f+rrmJpWyPx9I7738Y+a8wyKRkJOKYobOjExexCDE7Ooqmq7Fx+VVmpv4fynvJwaprde51+nFv0aiPCOYEve/pZlxGcwldVq8010TR/hrMTHyYsZqemzZ157ma1YsUJ84EX8W/hIQ5inYyRzsotifm7RLCIok5UVd7COxgnW1TXNdu46zc5dBNs1d47V1vWw+LgklpdXzTaulf9Vuub+T4CbWyCTSNxfs7SS5nv4ht1OzipGQEQCmjuH0D+0FR0tfUfykvN5md88iamUSc2lv/p78NX3ZdEbopmHuQdztXVlJqYmzNtbHNcl4m/VsirlbNHzR5mXWwzzdgxjPl5hzNs1jIX6xrPkmGyWm1TM8lPyWVZElnix/n+QkXlYwqutabjE3d2/PiIy8XJsbNq9pqau220t3XtqSuukiaEJz2QnZjPn4GTxgokQ8T8J8vKaTF5WmS3/esl8Iz3TP3u7+zvkZBRkVZfVxuSm5a11k3g+Xp5RKfyso6mYUy9CxP84qMmrMYUN8sxV6sssdS0WBvuEPuXn4vc4/16g78M9dH8ff/FCiRDxPxVG2kZs88aNTGLhxIJ8QlmkfxQL9ghmBWVFzNfBV7xAIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChAgRIkSIECFChIj/Fvx/jLSQ968ZExYAAAAASUVORK5CYII="
@@ -0,0 +1,184 @@
+# job_scheduler.py
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+from worker import Worker
+
+DEFAULT_MAX_RUNNING = 2
+DEFAULT_IO_THREADS = 8
+# Engine methods that mostly wait for file events: their jobs do not take one of the 'max_running' slots.
+IDLE_METHODS = ("do_watch_templates",)
+
+
+class Job(QObject):
+    """
+    One task of a JobScheduler: an engine method run by its own Worker on its
+    own QThread. The job's signals are its progress channel: they relay the
+    worker's signals and are delivered in the GUI thread, so each job reports to
+    whoever submitted it, whatever else runs at the same time.
+    'name' is the kind of task (e.g. "classify"); jobs of the same 'group' never
+    run at the same time.
+    """
+    QUEUED, RUNNING, CANCELLING, DONE = "queued", "running", "cancelling", "done"
+
+    log = Signal(str)
+    percent = Signal(int)
+    discovered = Signal(int)
+    stats = Signal(dict)
+    finished = Signal(dict)
+
+    def __init__(self, name, group, method_name, args, worker_options, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.group = group
+        self.method_name = method_name
+        self.args = args
+        self.worker_options = worker_options
+        self.state = Job.QUEUED
+        self.worker = None
+        self.thread = None
+        # (worker signal, receiver) pairs, disconnected by close().
+        self._relays = []
+        self._closed = False
+
+    def start(self, pool, io_pool):
+        self.worker = Worker(pool=pool, io_pool=io_pool, **self.worker_options)
+        self.worker.set_task(self.method_name, *self.args)
+        self.thread = QThread()
+        self.worker.moveToThread(self.thread)
+        self._relays = [(self.worker.progress_log, self.log), (self.worker.progress_percent, self.percent),
+                        (self.worker.files_discovered, self.discovered), (self.worker.run_stats, self.stats),
+                        (self.worker.finished, self._worker_finished)]
+        for signal, receiver in self._relays:
+            signal.connect(receiver)
+        self.thread.started.connect(self.worker.run)
+        self.thread.finished.connect(self.thread.deleteLater)
+        self.state = Job.RUNNING
+        self.thread.start()
+
+    def cancel(self):
+        """A queued job is dropped at once; a running one stops at its next file batch."""
+        if self.state == Job.QUEUED:
+            self.state = Job.DONE
+            self.finished.emit({"status": "cancelled"})
+        elif self.state == Job.RUNNING:
+            self.state = Job.CANCELLING
+            self.worker.request_stop()
+
+    def wait(self):
+        """Blocks until the worker thread has ended; the worker must have been asked to stop or be done."""
+        if self.thread is not None:
+            # quit() also works before the thread's event loop starts: it then returns at once.
+            self.thread.quit()
+            self.thread.wait()
+
+    def close(self):
+        """
+        Detaches a job whose thread has ended without going through 'finished'
+        (see JobScheduler.shutdown()): signals of its worker that are still
+        queued are ignored, as its thread may already be deleted.
+        """
+        self._closed = True
+        self.state = Job.DONE
+        for signal, receiver in self._relays:
+            try:
+                signal.disconnect(receiver)
+            except (RuntimeError, TypeError):
+                pass
+        self._relays = []
+        if self.worker is not None:
+            self.worker.deleteLater()
+        self.worker = None
+        self.thread = None
+
+    @Slot(dict)
+    def _worker_finished(self, result):
+        if self._closed:
+            return
+        self.wait()
+        self.worker.deleteLater()
+        self.worker = None
+        self.thread = None
+        self.state = Job.DONE
+        self.finished.emit(result)
+
+
+class JobScheduler(QObject):
+    """
+    Runs Jobs in submission order, at most 'max_running' at a time and never
+    two of the same group at once; a job whose group is busy waits, and later
+    jobs of other groups may start before it. Watch jobs (IDLE_METHODS) are not
+    counted against 'max_running', so watching a folder leaves every slot free. Running jobs share one process
+    pool for parsing and hashing and one thread pool for placing files, both
+    started when first needed.
+    """
+
+    def __init__(self, max_running=DEFAULT_MAX_RUNNING, processes=None, io_threads=DEFAULT_IO_THREADS,
+                 parent=None):
+        super().__init__(parent)
+        self.max_running = max(1, max_running)
+        self.processes = processes or os.cpu_count() or 1
+        self.io_threads = io_threads
+        # Queued and running jobs, in submission order.
+        self.jobs = []
+        self._pool = None
+        self._io_pool = None
+
+    def submit(self, name, group, method_name, *args, **worker_options):
+        """
+        Queues 'method_name' of a Worker created with 'worker_options' and starts
+        it when possible. Connect to the returned Job's signals right away: they
+        are only delivered once control returns to the event loop.
+        """
+        job = Job(name, group, method_name, args, worker_options, self)
+        job.finished.connect(lambda result: self._job_done(job))
+        self.jobs.append(job)
+        self._start_ready()
+        return job
+
+    def active(self, group):
+        """The queued or running job of 'group', or None."""
+        return next((job for job in self.jobs if job.group == group), None)
+
+    def _start_ready(self):
+        started = [job for job in self.jobs if job.state != Job.QUEUED]
+        running = sum(1 for job in started if job.method_name not in IDLE_METHODS)
+        busy = {job.group for job in started}
+        for job in self.jobs:
+            if job.state != Job.QUEUED or job.group in busy:
+                continue
+            counted = job.method_name not in IDLE_METHODS
+            if counted and running >= self.max_running:
+                continue
+            if job.worker_options.get("jobs", 1) > 1 and self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.processes)
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=self.io_threads)
+            job.start(self._pool, self._io_pool)
+            running += counted
+            busy.add(job.group)
+
+    def _job_done(self, job):
+        if job in self.jobs:
+            self.jobs.remove(job)
+        job.deleteLater()
+        # Started from the event loop, so the submitter sees 'finished' before the next job of its group starts.
+        QTimer.singleShot(0, self._start_ready)
+
+    def shutdown(self):
+        """Cancels every job, waits for the running ones to stop at their next file batch and stops the pools."""
+        jobs, self.jobs = self.jobs, []
+        for job in jobs:
+            if job.state == Job.QUEUED:
+                job.state = Job.DONE
+            elif job.state == Job.RUNNING:
+                job.cancel()
+        for job in jobs:
+            job.wait()
+            job.close()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self._io_pool is not None:
+            self._io_pool.shutdown(cancel_futures=True)
+            self._io_pool = None
@@ -0,0 +1,76 @@
+# lint_model.py
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+
+SEVERITY_RANK = {"error": 0, "warning": 1}
+SEVERITY_COLORS = {"error": QColor("#f48771"), "warning": QColor("#cca700")}
+# (header, value shown, sort key) of a finding dict from TemplateEngine.do_lint_templates().
+LINT_COLUMNS = [
+    ("Severity", lambda f: f["severity"], lambda f: (SEVERITY_RANK.get(f["severity"], 2), f["rule"])),
+    ("Rule", lambda f: f["rule"], lambda f: f["rule"]),
+    ("File", lambda f: f["path"], lambda f: (f["path"], f["line"], f["column"])),
+    ("Line", lambda f: str(f["line"]), lambda f: (f["line"], f["path"])),
+    ("Message", lambda f: f["message"], lambda f: f["message"]),
+]
+
+
+class LintResultsModel(QAbstractTableModel):
+    """
+    Read-only table of lint findings. Sorting and filtering are done on the
+    finding dicts themselves, which stays fast for large corpora where a
+    QSortFilterProxyModel would call data() for every row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._findings = []
+        self._shown = []
+        self._filter = ""
+        self._sort = (0, Qt.AscendingOrder)
+
+    def set_findings(self, findings):
+        self._findings = findings
+        self._rebuild()
+
+    def set_filter(self, text):
+        self._filter = text.strip().lower()
+        self._rebuild()
+
+    def finding(self, row):
+        return self._shown[row]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort = (column, order)
+        self._rebuild()
+
+    def _rebuild(self):
+        self.beginResetModel()
+        shown = self._findings
+        if self._filter:
+            needle = self._filter
+            shown = [f for f in shown if needle in f["path"].lower() or needle in f["rule"]
+                     or needle in f["message"].lower() or needle == f["severity"]]
+        column, order = self._sort
+        self._shown = sorted(shown, key=LINT_COLUMNS[column][2], reverse=order == Qt.DescendingOrder)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._shown)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(LINT_COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        finding = self._shown[index.row()]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return LINT_COLUMNS[index.column()][1](finding)
+        if role == Qt.ForegroundRole and index.column() == 0:
+            return SEVERITY_COLORS.get(finding["severity"])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return LINT_COLUMNS[section][0]
+        return None
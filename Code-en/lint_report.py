@@ -0,0 +1,59 @@
+# lint_report.py
+import json
+import os
+from pathlib import Path
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+TOOL_NAME = "nuclei-template-toolkit"
+TOOL_URI = "https://github.com/opium-00pium/Nuclei-Template-Toolkit"
+
+
+def _artifact(path, base_dir):
+    """SARIF artifactLocation: relative to the SRCROOT base when 'path' is inside it."""
+    path = os.path.abspath(path)
+    if base_dir:
+        relative = os.path.relpath(path, base_dir)
+        if not relative.startswith(os.pardir):
+            return {"uri": Path(relative).as_posix(), "uriBaseId": "SRCROOT"}
+    return {"uri": Path(path).as_uri()}
+
+
+def to_sarif(result, rules, base_dir=None):
+    """
+    SARIF 2.1.0 log of a TemplateEngine.do_lint_templates() result.
+    'rules' are the template_validation.Rule objects that ran; paths inside
+    'base_dir' are written relative to it, as code scanning services expect.
+    """
+    rule_index = {rule.rule_id: i for i, rule in enumerate(rules)}
+    driver = {
+        "name": TOOL_NAME,
+        "informationUri": TOOL_URI,
+        "rules": [{"id": rule.rule_id, "shortDescription": {"text": rule.description},
+                   "defaultConfiguration": {"level": rule.severity}} for rule in rules],
+    }
+    results = []
+    for finding in result.get("results", {}).get("findings", []):
+        entry = {
+            "ruleId": finding["rule"],
+            "level": finding["severity"],
+            "message": {"text": finding["message"]},
+            "locations": [{"physicalLocation": {
+                "artifactLocation": _artifact(finding["path"], base_dir),
+                "region": {"startLine": finding["line"], "startColumn": finding["column"]},
+            }}],
+        }
+        if finding["rule"] in rule_index:
+            entry["ruleIndex"] = rule_index[finding["rule"]]
+        results.append(entry)
+    run = {"tool": {"driver": driver}, "results": results, "properties": {"stats": result.get("stats", {})}}
+    if base_dir:
+        run["originalUriBaseIds"] = {"SRCROOT": {"uri": Path(os.path.abspath(base_dir)).as_uri() + "/"}}
+    return {"$schema": SARIF_SCHEMA, "version": SARIF_VERSION, "runs": [run]}
+
+
+def write_report(path, result, rules, base_dir=None):
+    """Writes SARIF when 'path' ends with .sarif (or .sarif.json), the plain JSON result otherwise."""
+    report = to_sarif(result, rules, base_dir) if ".sarif" in Path(path).name.lower() else result
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
@@ -1,28 +1,52 @@
 # main.py (English Version)
+import time
+# Taken before anything else is imported: the start of the window's own startup.
+LAUNCHED = time.time()
 import sys
 import os
-import base64
 import ctypes
 import multiprocessing
 from ctypes import wintypes
 from pathlib import Path
-import yaml
-from PySide6.QtGui import QIcon, QPixmap, QColor, QPalette
-from PySide6.QtCore import Qt, QThread, QPoint, QEvent
+from PySide6.QtGui import QIcon, QColor, QTextCharFormat, QTextCursor, QTextFormat
+from PySide6.QtCore import Qt, QThread, QPoint, QEvent, QTimer, Signal
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout,
                                QHBoxLayout, QLabel, QLineEdit, QPushButton, QTextBrowser,
-                               QFileDialog, QTreeWidget, QTreeWidgetItem, QSplitter,
-                               QPlainTextEdit, QMessageBox, QProgressBar)
+                               QFileDialog, QTreeView, QTableView, QSplitter,
+                               QPlainTextEdit, QMessageBox, QProgressBar, QSpinBox,
+                               QCheckBox, QComboBox, QDoubleSpinBox, QTextEdit, QTreeWidget,
+                               QTreeWidgetItem)
 
-try:
-    from icon_data import icon_base64
-except ImportError:
-    icon_base64 = "" 
-from worker import Worker
-from yaml_highlighter import YamlHighlighter
+# Only modules that import neither yaml nor the engine are loaded up front. The
+# worker, the template index, validation and the highlighter (all of which pull
+# in PyYAML) are imported by the first tab or task that needs them.
+from app_paths import DEFAULT_CACHE_PATH, DEFAULT_INDEX_PATH
+from dedup_model import DedupResultsModel
+from archive_source import ARCHIVE_SEPARATOR, is_archive, read_file, split_member_path
+from discovery import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, expand_archives, parse_globs, walk_templates
+from exact_dedup import DEFAULT_HASH_ALGO, HASH_ALGORITHMS
+from git_source import GitError, GitSource
+from lint_model import LintResultsModel
+from lint_report import write_report
+from near_dedup import DEFAULT_NEAR_THRESHOLD
+from placement import DEFAULT_PLACEMENT, PLACEMENT_MODES
+from search_model import SearchResultsModel
+
+MAX_LISTED_FILES = 200
+TEMPLATE_FILE_FILTER = "Templates and Archives (*.yaml *.yml *.zip *.tar *.tar.gz *.tgz *.tar.bz2 *.tar.xz);;YAML Files (*.yaml *.yml)"
+# Editor validation starts once typing paused for this long.
+VALIDATION_DELAY_MS = 400
+MAX_LISTED_DIAGNOSTICS = 5
+# Classification traces go to the destination folder, deduplication has none of its own.
+DEDUP_TRACE_PATH = DEFAULT_CACHE_PATH.parent / "deduplication_trace.json"
+DIAGNOSTIC_COLORS = {"error": QColor(232, 17, 35, 70), "warning": QColor(255, 170, 0, 55)}
+ICON_FILENAME = "design.ico"
+# Same spelling as startup_timing, which is only imported when one of them is given.
+STARTUP_MEASURE_FLAG = "--startup-time"
+STARTUP_PROBE_FLAG = "--startup-probe"
 
 DARK_STYLE = """
-#MainWindow, #CentralWidget { background-color: #1e2129; } #CustomTitleBar { background-color: #1e2129; height: 35px; } #TitleLabel { color: #a0a5b1; font-weight: bold; padding-left: 5px; } #MinimizeButton, #MaximizeButton, #CloseButton { background-color: transparent; border: none; width: 35px; height: 35px; padding: 8px; qproperty-iconSize: 12px; } #MinimizeButton:hover, #MaximizeButton:hover { background-color: #2c313c; } #CloseButton:hover { background-color: #e81123; } QWidget { background-color: #2c313c; color: #e0e5f1; border: none; font-family: "Segoe UI", "Microsoft YaHei", "Arial"; font-size: 10pt; } QTabWidget::pane { border-top: 2px solid #3c414d; } QTabBar::tab { background: #2c313c; color: #a0a5b1; padding: 10px 25px; border-top-left-radius: 4px; border-top-right-radius: 4px; min-width: 150px; } QTabBar::tab:selected, QTabBar::tab:hover { background: #3c414d; color: #ffffff; font-weight: bold; } QLabel { color: #a0a5b1; font-weight: bold; padding-top: 5px; } QLineEdit, QTextBrowser, QPlainTextEdit, QTreeWidget { background-color: #252932; color: #e0e5f1; border: 1px solid #3c414d; border-radius: 4px; padding: 5px; } QLineEdit:focus, QPlainTextEdit:focus { border: 1px solid #5d78ff; } QPushButton { background-color: #5d78ff; color: white; font-weight: bold; padding: 8px 15px; border-radius: 4px; min-height: 20px; } QPushButton:hover { background-color: #758fff; } QPushButton:disabled { background-color: #4a4e5a; color: #888888; } QMessageBox { background-color: #3c414d; } QProgressBar { border: 1px solid #3c414d; border-radius: 5px; text-align: center; color: #e0e5f1; background-color: #252932; } QProgressBar::chunk { background-color: #5d78ff; border-radius: 4px; } QTreeWidget::item { padding: 5px 0; } QTreeWidget::item:hover { background-color: #3c414d; } QTreeWidget::item:selected { background-color: #5d78ff; color: white; } QHeaderView::section { background-color: #3c414d; color: #a0a5b1; padding: 5px; border: 1px solid #252932; font-weight: bold; } QSplitter::handle { background-color: #3c414d; height: 3px; }
+#MainWindow, #CentralWidget { background-color: #1e2129; } #CustomTitleBar { background-color: #1e2129; height: 35px; } #TitleLabel { color: #a0a5b1; font-weight: bold; padding-left: 5px; } #MinimizeButton, #MaximizeButton, #CloseButton { background-color: transparent; border: none; width: 35px; height: 35px; padding: 8px; qproperty-iconSize: 12px; } #MinimizeButton:hover, #MaximizeButton:hover { background-color: #2c313c; } #CloseButton:hover { background-color: #e81123; } QWidget { background-color: #2c313c; color: #e0e5f1; border: none; font-family: "Segoe UI", "Microsoft YaHei", "Arial"; font-size: 10pt; } QTabWidget::pane { border-top: 2px solid #3c414d; } QTabBar::tab { background: #2c313c; color: #a0a5b1; padding: 10px 25px; border-top-left-radius: 4px; border-top-right-radius: 4px; min-width: 150px; } QTabBar::tab:selected, QTabBar::tab:hover { background: #3c414d; color: #ffffff; font-weight: bold; } QLabel { color: #a0a5b1; font-weight: bold; padding-top: 5px; } QLineEdit, QTextBrowser, QPlainTextEdit, QTreeView { background-color: #252932; color: #e0e5f1; border: 1px solid #3c414d; border-radius: 4px; padding: 5px; } QLineEdit:focus, QPlainTextEdit:focus { border: 1px solid #5d78ff; } QPushButton { background-color: #5d78ff; color: white; font-weight: bold; padding: 8px 15px; border-radius: 4px; min-height: 20px; } QPushButton:hover { background-color: #758fff; } QPushButton:disabled { background-color: #4a4e5a; color: #888888; } QMessageBox { background-color: #3c414d; } QProgressBar { border: 1px solid #3c414d; border-radius: 5px; text-align: center; color: #e0e5f1; background-color: #252932; } QProgressBar::chunk { background-color: #5d78ff; border-radius: 4px; } QTreeView::item { padding: 5px 0; } QTreeView::item:hover { background-color: #3c414d; } QTreeView::item:selected { background-color: #5d78ff; color: white; } QHeaderView::section { background-color: #3c414d; color: #a0a5b1; padding: 5px; border: 1px solid #252932; font-weight: bold; } QSplitter::handle { background-color: #3c414d; height: 3px; }
 """
 
 class CustomTitleBar(QWidget):
@@ -80,15 +104,9 @@ class CustomTitleBar(QWidget):
         self.start_pos = None
         self.start_frame_pos = None
 
-class OverlayWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        palette = QPalette(self.palette())
-        palette.setColor(QPalette.Window, QColor(0, 0, 0, 128)) 
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
-
 class MainWindow(QMainWindow):
+    validation_requested = Signal(int, str)
+
     def __init__(self, icon: QIcon):
         super().__init__()
         self.setWindowTitle("Nuclei Template Toolkit")
@@ -114,42 +132,66 @@ class MainWindow(QMainWindow):
         content_layout.addWidget(self.tabs)
         self.main_layout.addWidget(self.content_widget)
 
-        self.overlay = OverlayWidget(self.content_widget)
-        self.overlay.hide()
-        
-        self.classification_tab = self._create_classification_tab()
-        self.deduplication_tab = self._create_deduplication_tab()
-        self.editor_tab = self._create_editor_tab()
-        
-        self.tabs.addTab(self.classification_tab, "Template Classifier")
-        self.tabs.addTab(self.deduplication_tab, "Template Deduplicator")
-        self.tabs.addTab(self.editor_tab, "YAML Editor")
-
-        self.is_task_running = False
-        self.worker = None
-        self.thread = None
+        # Started with the first task; see _run_task.
+        self.scheduler = None
         
         self.classify_file_list = []
         self.dedup_file_list = []
+        self.classify_source_dir = None
+        self.dedup_source_dir = None
+        # Opened on first use: loading a large index takes a moment.
+        self.template_index = None
+        self.lint_result = None
+        # Editor validation: started on the first edit, see _schedule_validation.
+        self.validation_thread = None
+        self.validation_worker = None
+        self.validation_generation = 0
+        self.validated_text = None
+        self.diagnostics = []
 
-    def resizeEvent(self, event):
-        self.overlay.resize(self.content_widget.size())
-        super().resizeEvent(event)
+        # Each tab starts as an empty page and is built when it is first shown.
+        self.tab_builders = {}
+        self.classification_tab = self._add_tab("Template Classifier", self._create_classification_tab)
+        self.deduplication_tab = self._add_tab("Template Deduplicator", self._create_deduplication_tab)
+        self.lint_tab = self._add_tab("Template Linter", self._create_lint_tab)
+        self.search_tab = self._add_tab("Template Search", self._create_search_tab)
+        self.editor_tab = self._add_tab("YAML Editor", self._create_editor_tab)
+        self._build_tab(self.tabs.currentWidget())
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _add_tab(self, title, create):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        self.tab_builders[page] = create
+        self.tabs.addTab(page, title)
+        return page
+
+    def _build_tab(self, page):
+        """Creates the content of 'page' unless it was already built."""
+        create = self.tab_builders.pop(page, None)
+        if create is not None:
+            page.layout().addWidget(create())
 
     def _create_classification_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(10, 10, 10, 10)
-        layout.addWidget(QLabel("Select Template Files (Multi-Select Enabled):"))
+        layout.addWidget(QLabel("Select Template Files (Multi-Select Enabled) or a Template Folder:"))
         select_file_layout = QHBoxLayout()
         self.classify_file_display = QPlainTextEdit()
         self.classify_file_display.setReadOnly(True)
-        self.classify_file_display.setPlaceholderText("Click 'Browse' to select one or more .yaml files...")
+        self.classify_file_display.setPlaceholderText("Click 'Browse' to select one or more .yaml files, or 'Folder' to scan a directory recursively...")
         select_file_layout.addWidget(self.classify_file_display)
-        source_browse_btn = QPushButton("Browse...")
-        source_browse_btn.clicked.connect(self._browse_source_files_classify)
-        select_file_layout.addWidget(source_browse_btn)
+        select_file_layout.addLayout(self._create_source_buttons(self._browse_source_files_classify,
+                                                                 self._browse_source_folder_classify))
         layout.addLayout(select_file_layout)
+        self.classify_include, self.classify_exclude = self._create_glob_edits()
+        layout.addLayout(self._labeled_row("Folder Include:", self.classify_include,
+                                           QLabel("Exclude:"), self.classify_exclude))
+        self.classify_use_git, self.classify_git_rev = self._create_git_options()
+        layout.addLayout(self._labeled_row("Git:", self.classify_use_git, QLabel("Changed by:"),
+                                           self.classify_git_rev))
         layout.addWidget(QLabel("Destination Folder:"))
         target_layout = QHBoxLayout()
         self.classify_target_dir = QLineEdit()
@@ -159,10 +201,26 @@ class MainWindow(QMainWindow):
         target_layout.addWidget(self.classify_target_dir)
         target_layout.addWidget(target_browse_btn)
         layout.addLayout(target_layout)
+        self.classify_jobs = self._create_jobs_spinbox()
+        self.classify_use_cache = self._create_cache_checkbox()
+        self.classify_placement = QComboBox()
+        self.classify_placement.addItems(list(PLACEMENT_MODES))
+        self.classify_placement.setCurrentText(DEFAULT_PLACEMENT)
+        self.classify_placement.setToolTip("copy duplicates the data; hardlink/symlink/reflink avoid it, "
+                                           "move relocates the originals. Falls back to copy when not possible.")
+        layout.addLayout(self._labeled_row("Parallel Jobs:", self.classify_jobs, self.classify_use_cache,
+                                           QLabel("Placement:"), self.classify_placement))
         
         self.classify_start_btn = QPushButton("Start Classification")
         self.classify_start_btn.clicked.connect(self._start_classification)
-        layout.addWidget(self.classify_start_btn)
+        self.classify_watch_btn = QPushButton("Watch Folder")
+        self.classify_watch_btn.setToolTip("Keep the destination in sync with the source folder: only added, changed "
+                                           "or removed templates are processed, until watching is stopped.")
+        self.classify_watch_btn.clicked.connect(self._toggle_watch)
+        start_layout = QHBoxLayout()
+        start_layout.addWidget(self.classify_start_btn, 1)
+        start_layout.addWidget(self.classify_watch_btn)
+        layout.addLayout(start_layout)
         
         self.classify_progress_bar = QProgressBar()
         self.classify_progress_bar.setVisible(False)
@@ -170,22 +228,51 @@ class MainWindow(QMainWindow):
         layout.addWidget(QLabel("Log Output:"))
         self.classify_log = QTextBrowser()
         layout.addWidget(self.classify_log)
+        self.classify_stats = self._create_stats_panel()
+        layout.addWidget(self.classify_stats)
         return widget
 
     def _create_deduplication_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(10, 10, 10, 10)
-        layout.addWidget(QLabel("Select Template Files for Deduplication (Multi-Select Enabled):"))
+        layout.addWidget(QLabel("Select Template Files for Deduplication (Multi-Select Enabled) or a Template Folder:"))
         select_file_layout = QHBoxLayout()
         self.dedup_file_display = QPlainTextEdit()
         self.dedup_file_display.setReadOnly(True)
-        self.dedup_file_display.setPlaceholderText("Click 'Browse' to select one or more .yaml files...")
+        self.dedup_file_display.setPlaceholderText("Click 'Browse' to select one or more .yaml files, or 'Folder' to scan a directory recursively...")
         select_file_layout.addWidget(self.dedup_file_display)
-        source_browse_btn = QPushButton("Browse...")
-        source_browse_btn.clicked.connect(self._browse_source_files_dedup)
-        select_file_layout.addWidget(source_browse_btn)
+        select_file_layout.addLayout(self._create_source_buttons(self._browse_source_files_dedup,
+                                                                 self._browse_source_folder_dedup))
         layout.addLayout(select_file_layout)
+        self.dedup_include, self.dedup_exclude = self._create_glob_edits()
+        layout.addLayout(self._labeled_row("Folder Include:", self.dedup_include,
+                                           QLabel("Exclude:"), self.dedup_exclude))
+        self.dedup_use_git, self.dedup_git_rev = self._create_git_options()
+        layout.addLayout(self._labeled_row("Git:", self.dedup_use_git, QLabel("Changed by:"),
+                                           self.dedup_git_rev))
+        self.dedup_jobs = self._create_jobs_spinbox()
+        self.dedup_use_cache = self._create_cache_checkbox()
+        self.dedup_hash_algo = QComboBox()
+        self.dedup_hash_algo.addItems(list(HASH_ALGORITHMS))
+        self.dedup_hash_algo.setCurrentText(DEFAULT_HASH_ALGO)
+        self.dedup_hash_algo.setToolTip("Hash used for exact duplicates; blake2b is the fastest.")
+        layout.addLayout(self._labeled_row("Parallel Jobs:", self.dedup_jobs, self.dedup_use_cache,
+                                           QLabel("Hash:"), self.dedup_hash_algo))
+        self.dedup_semantic = QCheckBox("Find semantic duplicates")
+        self.dedup_semantic.setToolTip("Group templates that send the same requests with the same matchers, "
+                                       "whatever their formatting, ID or info block.")
+        self.dedup_near = QCheckBox("Find near duplicates")
+        self.dedup_near.setToolTip("Also compare the requests and matchers of every template (reads every file in full).")
+        self.dedup_near_threshold = QDoubleSpinBox()
+        self.dedup_near_threshold.setRange(0.5, 1.0)
+        self.dedup_near_threshold.setSingleStep(0.05)
+        self.dedup_near_threshold.setValue(DEFAULT_NEAR_THRESHOLD)
+        self.dedup_near_threshold.setToolTip("Minimum estimated similarity for two templates to be grouped.")
+        self.dedup_near_threshold.setEnabled(False)
+        self.dedup_near.toggled.connect(self.dedup_near_threshold.setEnabled)
+        layout.addLayout(self._labeled_row("Content:", self.dedup_semantic, self.dedup_near,
+                                           QLabel("Similarity:"), self.dedup_near_threshold))
 
         self.dedup_start_btn = QPushButton("Start Deduplication")
         self.dedup_start_btn.clicked.connect(self._start_deduplication)
@@ -201,13 +288,28 @@ class MainWindow(QMainWindow):
         log_layout.addWidget(QLabel("Log Output:"))
         self.dedup_log = QTextBrowser()
         log_layout.addWidget(self.dedup_log)
+        self.dedup_stats = self._create_stats_panel()
+        log_layout.addWidget(self.dedup_stats)
         splitter.addWidget(log_container)
         results_container = QWidget()
         results_layout = QVBoxLayout(results_container)
         results_layout.setContentsMargins(0, 0, 0, 0)
-        results_layout.addWidget(QLabel("Deduplication Results:"))
-        self.dedup_results_tree = QTreeWidget()
-        self.dedup_results_tree.setHeaderLabels(["Duplicate Item (ID / Hash)", "File Path"])
+        results_header = QHBoxLayout()
+        results_header.addWidget(QLabel("Deduplication Results:"))
+        results_header.addStretch()
+        self.dedup_filter = QLineEdit()
+        self.dedup_filter.setPlaceholderText("Filter by ID, hash, similarity group or path...")
+        self.dedup_filter.textChanged.connect(self._filter_dedup_results)
+        results_header.addWidget(self.dedup_filter)
+        results_layout.addLayout(results_header)
+        self.dedup_results_model = DedupResultsModel(self)
+        self.dedup_results_tree = QTreeView()
+        self.dedup_results_tree.setModel(self.dedup_results_model)
+        self.dedup_results_tree.setUniformRowHeights(True)
+        # Sorting orders groups by their number of files; the header toggles the direction.
+        self.dedup_results_tree.setSortingEnabled(True)
+        self.dedup_results_tree.sortByColumn(0, Qt.DescendingOrder)
+        self.dedup_results_model.modelReset.connect(self._expand_dedup_roots)
         self.dedup_results_tree.setColumnWidth(0, 300)
         results_layout.addWidget(self.dedup_results_tree)
         splitter.addWidget(results_container)
@@ -215,6 +317,164 @@ class MainWindow(QMainWindow):
         layout.addWidget(splitter)
         return widget
 
+    def _create_lint_tab(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.addWidget(QLabel("Template Folder to Lint:"))
+        root_layout = QHBoxLayout()
+        self.lint_root = QLineEdit()
+        self.lint_root.setPlaceholderText("Select a template folder; every template is checked against the lint rules...")
+        root_browse_btn = QPushButton("Browse...")
+        root_browse_btn.clicked.connect(lambda: self._browse_directory(self.lint_root))
+        root_layout.addWidget(self.lint_root)
+        root_layout.addWidget(root_browse_btn)
+        layout.addLayout(root_layout)
+        self.lint_include, self.lint_exclude = self._create_glob_edits()
+        layout.addLayout(self._labeled_row("Folder Include:", self.lint_include,
+                                           QLabel("Exclude:"), self.lint_exclude))
+        self.lint_jobs = self._create_jobs_spinbox()
+        self.lint_start_btn = QPushButton("Start Linting")
+        self.lint_start_btn.clicked.connect(self._start_linting)
+        self.lint_export_btn = QPushButton("Export Report...")
+        self.lint_export_btn.setToolTip("Save the findings as SARIF (.sarif) or JSON (.json).")
+        self.lint_export_btn.setEnabled(False)
+        self.lint_export_btn.clicked.connect(self._export_lint_report)
+        layout.addLayout(self._labeled_row("Parallel Jobs:", self.lint_jobs, self.lint_start_btn,
+                                           self.lint_export_btn))
+
+        self.lint_progress_bar = QProgressBar()
+        self.lint_progress_bar.setVisible(False)
+        layout.addWidget(self.lint_progress_bar)
+        self.lint_log = QTextBrowser()
+        self.lint_log.setMaximumHeight(80)
+        layout.addWidget(self.lint_log)
+
+        self.lint_status = QLabel("")
+        layout.addWidget(self.lint_status)
+        self.lint_filter = QLineEdit()
+        self.lint_filter.setPlaceholderText("Filter by path, rule, message or severity...")
+        layout.addLayout(self._labeled_row("Filter:", self.lint_filter))
+        self.lint_results_model = LintResultsModel(self)
+        self.lint_filter.textChanged.connect(self.lint_results_model.set_filter)
+        self.lint_results_view = QTableView()
+        self.lint_results_view.setModel(self.lint_results_model)
+        self.lint_results_view.verticalHeader().setVisible(False)
+        self.lint_results_view.horizontalHeader().setStretchLastSection(True)
+        self.lint_results_view.setSelectionBehavior(QTableView.SelectRows)
+        self.lint_results_view.setSortingEnabled(True)
+        self.lint_results_view.sortByColumn(0, Qt.AscendingOrder)
+        self.lint_results_view.setToolTip("Double-click a finding to open the template in the YAML Editor.")
+        self.lint_results_view.doubleClicked.connect(self._open_lint_finding)
+        layout.addWidget(self.lint_results_view)
+        return widget
+
+    def _create_search_tab(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.addWidget(QLabel("Template Folder to Index:"))
+        root_layout = QHBoxLayout()
+        self.search_root = QLineEdit()
+        self.search_root.setPlaceholderText("Select a template folder; only new or changed files are re-read...")
+        root_browse_btn = QPushButton("Browse...")
+        root_browse_btn.clicked.connect(lambda: self._browse_directory(self.search_root))
+        root_layout.addWidget(self.search_root)
+        root_layout.addWidget(root_browse_btn)
+        layout.addLayout(root_layout)
+        self.search_include, self.search_exclude = self._create_glob_edits()
+        layout.addLayout(self._labeled_row("Folder Include:", self.search_include,
+                                           QLabel("Exclude:"), self.search_exclude))
+        self.search_jobs = self._create_jobs_spinbox()
+        self.search_refresh_btn = QPushButton("Update Index")
+        self.search_refresh_btn.setToolTip(f"The index is stored in:\n{DEFAULT_INDEX_PATH}")
+        self.search_refresh_btn.clicked.connect(self._start_indexing)
+        layout.addLayout(self._labeled_row("Parallel Jobs:", self.search_jobs, self.search_refresh_btn))
+
+        self.search_progress_bar = QProgressBar()
+        self.search_progress_bar.setVisible(False)
+        layout.addWidget(self.search_progress_bar)
+        self.search_log = QTextBrowser()
+        self.search_log.setMaximumHeight(80)
+        layout.addWidget(self.search_log)
+
+        self.search_query = QLineEdit()
+        self.search_query.setPlaceholderText("e.g. severity:critical tag:rce protocol:http  (also author:, cve:, id:, name:, path:, -tag:dos)")
+        self.search_query.textChanged.connect(self._run_search)
+        layout.addLayout(self._labeled_row("Query:", self.search_query))
+        self.search_status = QLabel("")
+        layout.addWidget(self.search_status)
+        self.search_results_model = SearchResultsModel(self)
+        self.search_results_view = QTableView()
+        self.search_results_view.setModel(self.search_results_model)
+        self.search_results_view.verticalHeader().setVisible(False)
+        self.search_results_view.horizontalHeader().setStretchLastSection(True)
+        self.search_results_view.setSelectionBehavior(QTableView.SelectRows)
+        self.search_results_view.setToolTip("Double-click a template to open it in the YAML Editor.")
+        self.search_results_view.doubleClicked.connect(self._open_search_result)
+        layout.addWidget(self.search_results_view)
+        return widget
+
+    def _create_source_buttons(self, browse_files_slot, browse_folder_slot):
+        buttons = QVBoxLayout()
+        files_btn = QPushButton("Browse...")
+        files_btn.clicked.connect(browse_files_slot)
+        buttons.addWidget(files_btn)
+        folder_btn = QPushButton("Folder...")
+        folder_btn.clicked.connect(browse_folder_slot)
+        buttons.addWidget(folder_btn)
+        buttons.addStretch()
+        return buttons
+
+    def _create_glob_edits(self):
+        include = QLineEdit("; ".join(DEFAULT_INCLUDE))
+        include.setToolTip("Glob patterns for template files when scanning a folder, separated by ';'.")
+        exclude = QLineEdit("; ".join(DEFAULT_EXCLUDE))
+        exclude.setToolTip("Glob patterns for files or folders to skip, separated by ';'.")
+        return include, exclude
+
+    def _create_git_options(self):
+        use_git = QCheckBox("List the folder with git")
+        use_git.setToolTip("For a folder in a git checkout: tracked and untracked templates are listed by git, "
+                           "and files unchanged since the git index are not hashed (their blob ids are used).")
+        rev = QLineEdit()
+        rev.setPlaceholderText("e.g. main..HEAD, or HEAD~5 (optional)")
+        rev.setToolTip("Only process the templates changed by this revision range: 'A..B' between two commits, "
+                       "or 'A' against the work tree (untracked templates included).")
+        rev.setEnabled(False)
+        use_git.toggled.connect(rev.setEnabled)
+        return use_git, rev
+
+    def _create_jobs_spinbox(self):
+        spinbox = QSpinBox()
+        spinbox.setRange(1, max(1, os.cpu_count() or 1) * 2)
+        spinbox.setValue(os.cpu_count() or 1)
+        spinbox.setToolTip("Number of processes used to parse and hash templates.")
+        return spinbox
+
+    def _create_cache_checkbox(self):
+        checkbox = QCheckBox("Use metadata cache")
+        checkbox.setChecked(True)
+        checkbox.setToolTip(f"Skip unchanged files using the cache stored in:\n{DEFAULT_CACHE_PATH}")
+        return checkbox
+
+    def _create_stats_panel(self):
+        """Run statistics of the last task, filled by _show_run_stats; hidden until then."""
+        panel = QTreeWidget()
+        panel.setHeaderLabels(["Run Statistics", "Value"])
+        panel.setColumnWidth(0, 260)
+        panel.setVisible(False)
+        panel.itemDoubleClicked.connect(self._open_stats_item)
+        return panel
+
+    def _labeled_row(self, text, *widgets):
+        row = QHBoxLayout()
+        row.addWidget(QLabel(text))
+        for widget in widgets:
+            row.addWidget(widget)
+        row.addStretch()
+        return row
+
     def _create_editor_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -225,8 +485,19 @@ class MainWindow(QMainWindow):
         font = self.editor_text.font()
         font.setFamily("Courier New")
         self.editor_text.setFont(font)
+        from yaml_highlighter import YamlHighlighter
         self.highlighter = YamlHighlighter(self.editor_text.document())
+        self.highlighter.attach_viewport(self.editor_text)
         layout.addWidget(self.editor_text)
+        self.validation_timer = QTimer(self)
+        self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(VALIDATION_DELAY_MS)
+        self.validation_timer.timeout.connect(self._request_validation)
+        self.editor_text.textChanged.connect(self._schedule_validation)
+        self.editor_status = QLabel("")
+        self.editor_status.setWordWrap(True)
+        self.editor_status.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.editor_status)
         layout.addWidget(QLabel("Save to Folder:"))
         save_dir_layout = QHBoxLayout()
         self.editor_save_dir = QLineEdit()
@@ -252,19 +523,68 @@ class MainWindow(QMainWindow):
         if directory:
             line_edit.setText(directory)
 
+    def _show_selected_files(self, display, files):
+        # Listing tens of thousands of paths in a QPlainTextEdit freezes the UI.
+        shown = files[:MAX_LISTED_FILES]
+        text = f"{len(files)} files selected:\n" + "\n".join(shown)
+        if len(files) > len(shown):
+            text += f"\n... and {len(files) - len(shown)} more"
+        display.setPlainText(text)
+
     def _browse_source_files_classify(self):
-        if self.is_task_running: return
-        files, _ = QFileDialog.getOpenFileNames(self, "Select Template Files", "", "YAML Files (*.yaml *.yml)")
+        if self._active_job("classify"): return
+        files, _ = QFileDialog.getOpenFileNames(self, "Select Template Files", "", TEMPLATE_FILE_FILTER)
         if files:
             self.classify_file_list = files
-            self.classify_file_display.setPlainText("\n".join(files))
+            self.classify_source_dir = None
+            self._show_selected_files(self.classify_file_display, files)
 
     def _browse_source_files_dedup(self):
-        if self.is_task_running: return
-        files, _ = QFileDialog.getOpenFileNames(self, "Select Template Files", "", "YAML Files (*.yaml *.yml)")
+        if self._active_job("dedup"): return
+        files, _ = QFileDialog.getOpenFileNames(self, "Select Template Files", "", TEMPLATE_FILE_FILTER)
         if files:
             self.dedup_file_list = files
-            self.dedup_file_display.setPlainText("\n".join(files))
+            self.dedup_source_dir = None
+            self._show_selected_files(self.dedup_file_display, files)
+
+    def _browse_source_folder_classify(self):
+        if self._active_job("classify"): return
+        directory = QFileDialog.getExistingDirectory(self, "Select Template Folder")
+        if directory:
+            self.classify_file_list = []
+            self.classify_source_dir = directory
+            self.classify_file_display.setPlainText(f"Folder: {directory}\n(scanned recursively when the task starts)")
+
+    def _browse_source_folder_dedup(self):
+        if self._active_job("dedup"): return
+        directory = QFileDialog.getExistingDirectory(self, "Select Template Folder")
+        if directory:
+            self.dedup_file_list = []
+            self.dedup_source_dir = directory
+            self.dedup_file_display.setPlainText(f"Folder: {directory}\n(scanned recursively when the task starts)")
+
+    def _selected_source(self, files, include_edit, exclude_edit):
+        # Selected archives are replaced by their template members.
+        return expand_archives([str(Path(f).absolute()) for f in files],
+                               parse_globs(include_edit.text()) or DEFAULT_INCLUDE, parse_globs(exclude_edit.text()))
+
+    def _folder_source(self, directory, include_edit, exclude_edit, use_git=None, rev_edit=None):
+        """The templates of a folder, listed by git when 'use_git' is checked (raises GitError)."""
+        if use_git is not None and use_git.isChecked():
+            return GitSource(directory, rev_edit.text().strip() or None,
+                             parse_globs(include_edit.text()) or DEFAULT_INCLUDE, parse_globs(exclude_edit.text()))
+        return walk_templates(directory, parse_globs(include_edit.text()) or DEFAULT_INCLUDE,
+                              parse_globs(exclude_edit.text()))
+
+    def _update_discovered(self, task_type, count):
+        if task_type == "lint":
+            self.lint_status.setText(f"{count} template files found")
+            return
+        if task_type in ("classify", "watch"):
+            directory, display = self.classify_source_dir, self.classify_file_display
+        else:
+            directory, display = self.dedup_source_dir, self.dedup_file_display
+        display.setPlainText(f"Folder: {directory}\n{count} template files found")
 
     def _save_yaml_file(self):
         content = self.editor_text.toPlainText()
@@ -276,11 +596,22 @@ class MainWindow(QMainWindow):
         if not filename.endswith(('.yaml', '.yml')):
             filename += '.yaml'
         
-        try:
-            yaml.safe_load(content)
-        except yaml.YAMLError as e:
-            QMessageBox.critical(self, "Save Failed", f"Invalid YAML format. Cannot save:\n\n{e}")
+        from template_validation import ERROR, SYNTAX_RULE, validate
+
+        # Reuse the background validation when it already covers this text.
+        diagnostics = self.diagnostics if content == self.validated_text else validate(content)
+        syntax_errors = [d for d in diagnostics if d.rule == SYNTAX_RULE]
+        if syntax_errors:
+            QMessageBox.critical(self, "Save Failed", f"Invalid YAML format. Cannot save:\n\n"
+                                 f"Line {syntax_errors[0].line}: {syntax_errors[0].message}")
             return
+        errors = [d for d in diagnostics if d.severity == ERROR]
+        if errors:
+            answer = QMessageBox.question(self, "Template Problems",
+                                          f"The template has {len(errors)} error(s), e.g. line {errors[0].line}: "
+                                          f"{errors[0].message}\n\nSave anyway?")
+            if answer != QMessageBox.Yes:
+                return
 
         file_path = Path(save_dir) / filename
         try:
@@ -291,132 +622,402 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
 
-    def _update_progress(self, value):
-        if self.tabs.currentWidget() == self.classification_tab:
-            self.classify_progress_bar.setValue(value)
-        elif self.tabs.currentWidget() == self.deduplication_tab:
-            self.dedup_progress_bar.setValue(value)
-
-    def _set_ui_for_task_start(self):
-        self.is_task_running = True
-        self.classify_start_btn.setEnabled(False)
-        self.dedup_start_btn.setEnabled(False)
-        self.overlay.show()
-
-    def _set_ui_for_task_finish(self):
-        self.is_task_running = False
-        self.classify_start_btn.setEnabled(True)
-        self.dedup_start_btn.setEnabled(True)
-        self.classify_progress_bar.setVisible(False)
-        self.dedup_progress_bar.setVisible(False)
-        self.overlay.hide()
+    def _schedule_validation(self):
+        if self.highlighter.rehighlighting:
+            return
+        # Raising the generation right away cancels a run that is still busy with older text.
+        self.validation_generation += 1
+        if self.validation_worker is not None:
+            self.validation_worker.latest = self.validation_generation
+        self.validation_timer.start()
+
+    def _request_validation(self):
+        text = self.editor_text.toPlainText()
+        if text == self.validated_text:
+            self._show_diagnostics(self.validation_generation, self.diagnostics)
+            return
+        if self.validation_thread is None:
+            from worker import ValidationWorker
+            self.validation_thread = QThread(self)
+            self.validation_worker = ValidationWorker()
+            self.validation_worker.moveToThread(self.validation_thread)
+            self.validation_requested.connect(self.validation_worker.validate)
+            self.validation_worker.finished.connect(self._show_diagnostics)
+            self.validation_thread.finished.connect(self.validation_worker.deleteLater)
+            self.validation_thread.start()
+        self.validation_worker.latest = self.validation_generation
+        self.editor_status.setText("Validating...")
+        self.validation_requested.emit(self.validation_generation, text)
+
+    def _show_diagnostics(self, generation, diagnostics):
+        if generation != self.validation_generation:
+            return  # The text changed since this run started.
+        self.validated_text = self.editor_text.toPlainText()
+        self.diagnostics = diagnostics
+        document = self.editor_text.document()
+        selections = []
+        for diagnostic in diagnostics:
+            block = document.findBlockByNumber(min(diagnostic.line, document.blockCount()) - 1)
+            selection = QTextEdit.ExtraSelection()
+            selection.format = QTextCharFormat()
+            selection.format.setBackground(DIAGNOSTIC_COLORS[diagnostic.severity])
+            selection.format.setProperty(QTextFormat.FullWidthSelection, True)
+            selection.format.setToolTip(diagnostic.message)
+            selection.cursor = QTextCursor(block)
+            selections.append(selection)
+        self.editor_text.setExtraSelections(selections)
+        if not self.validated_text.strip():
+            self.editor_status.setText("")
+            return
+        if not diagnostics:
+            self.editor_status.setText("No problems found.")
+            return
+        from template_validation import ERROR
+
+        errors = sum(1 for d in diagnostics if d.severity == ERROR)
+        lines = [f"{errors} error(s), {len(diagnostics) - errors} warning(s):"]
+        lines += [f"Line {d.line}: {d.message}" for d in diagnostics[:MAX_LISTED_DIAGNOSTICS]]
+        if len(diagnostics) > MAX_LISTED_DIAGNOSTICS:
+            lines.append(f"... and {len(diagnostics) - MAX_LISTED_DIAGNOSTICS} more")
+        self.editor_status.setText("\n".join(lines))
+
+    def _on_tab_changed(self, index):
+        self._build_tab(self.tabs.widget(index))
+        if self.tabs.widget(index) is self.search_tab and self.template_index is None:
+            self._run_search()
+
+    def _get_template_index(self):
+        if self.template_index is None:
+            try:
+                from template_index import TemplateIndex
+                self.template_index = TemplateIndex(DEFAULT_INDEX_PATH)
+            except Exception as e:
+                self.search_status.setText(f"Template index unavailable: {e}")
+        return self.template_index
+
+    def _run_search(self, *_):
+        index = self._get_template_index()
+        if index is None:
+            return
+        started = time.perf_counter()
+        try:
+            entries = index.query(self.search_query.text())
+        except ValueError as e:
+            self.search_status.setText(str(e))
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.search_results_model.set_entries(entries)
+        self.search_status.setText(f"{len(entries)} of {len(index)} templates match ({elapsed_ms:.1f} ms).")
+
+    def _open_search_result(self, model_index):
+        self._open_in_editor(self.search_results_model.entry(model_index.row()).path)
+
+    def _open_lint_finding(self, model_index):
+        finding = self.lint_results_model.finding(model_index.row())
+        self._open_in_editor(finding["path"], finding["line"])
+
+    def _open_in_editor(self, path, line=None):
+        try:
+            content = read_file(path).decode('utf-8')
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
+            return
+        self._build_tab(self.editor_tab)
+        self.editor_text.setPlainText(content)
+        member = split_member_path(path) if ARCHIVE_SEPARATOR in path else None
+        # An archive member is saved as a plain file next to its archive.
+        file_path = Path(member[0]).parent / member[1].rsplit("/", 1)[-1] if member else Path(path)
+        self.editor_save_dir.setText(str(file_path.parent))
+        self.editor_filename.setText(file_path.name)
+        self.tabs.setCurrentWidget(self.editor_tab)
+        if line:
+            cursor = QTextCursor(self.editor_text.document().findBlockByNumber(line - 1))
+            self.editor_text.setTextCursor(cursor)
+            self.editor_text.centerCursor()
+
+    def _start_linting(self):
+        if self._cancel_task("lint"):
+            return
+        root = self.lint_root.text()
+        if not root or not (os.path.isdir(root) or (is_archive(root) and os.path.isfile(root))):
+            QMessageBox.warning(self, "Incomplete Information", "Please select a template folder to lint.")
+            return
+        from template_validation import LintConfig
+        self._run_task("lint", self._folder_source(str(Path(root).absolute()), self.lint_include, self.lint_exclude),
+                       LintConfig())
+
+    def _export_lint_report(self):
+        if not self.lint_result:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Lint Report", "lint-report.sarif",
+                                              "SARIF (*.sarif);;JSON (*.json)")
+        if not path:
+            return
+        from template_validation import LintConfig
+        try:
+            write_report(path, self.lint_result, LintConfig().rules(), base_dir=self.lint_root.text() or None)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to write the report: {e}")
+
+    def _start_indexing(self):
+        if self._cancel_task("search"):
+            return
+        root = self.search_root.text()
+        if not root or not os.path.isdir(root):
+            QMessageBox.warning(self, "Incomplete Information", "Please select a template folder to index.")
+            return
+        self._run_task("index", [str(Path(root).absolute())], parse_globs(self.search_include.text()) or DEFAULT_INCLUDE,
+                       parse_globs(self.search_exclude.text()))
+
+    def _task_ui(self, task_type):
+        """(group, button, idle text, log area, progress bar) of a task type; a group runs one job at a time."""
+        if task_type == "classify":
+            return "classify", self.classify_start_btn, "Start Classification", self.classify_log, self.classify_progress_bar
+        if task_type == "watch":
+            return "classify", self.classify_watch_btn, "Watch Folder", self.classify_log, self.classify_progress_bar
+        if task_type == "deduplicate":
+            return "dedup", self.dedup_start_btn, "Start Deduplication", self.dedup_log, self.dedup_progress_bar
+        if task_type == "lint":
+            return "lint", self.lint_start_btn, "Start Linting", self.lint_log, self.lint_progress_bar
+        return "search", self.search_refresh_btn, "Update Index", self.search_log, self.search_progress_bar
+
+    def _set_task_running(self, task_type, running):
+        """Turns the task's button into its Cancel button (and back); other tabs stay usable."""
+        _, button, idle_text, _, progress_bar = self._task_ui(task_type)
+        button.setText(("Stop Watching" if task_type == "watch" else "Cancel") if running else idle_text)
+        button.setEnabled(True)
+        if task_type in ("classify", "watch"):
+            # Classifying and watching write to the same destination folder.
+            other = self.classify_watch_btn if task_type == "classify" else self.classify_start_btn
+            other.setEnabled(not running)
+        if not running:
+            progress_bar.setVisible(False)
+
+    def _active_job(self, group):
+        return self.scheduler.active(group) if self.scheduler is not None else None
+
+    def _cancel_task(self, group):
+        """Cancels the queued or running job of 'group'; False when there is none."""
+        job = self._active_job(group)
+        if job is None:
+            return False
+        button = self._task_ui(job.name)[1]
+        button.setText("Cancelling...")
+        button.setEnabled(False)
+        job.cancel()
+        return True
 
     def _start_classification(self):
-        if not self.classify_file_list or not self.classify_target_dir.text():
+        if self._cancel_task("classify"):
+            return
+        if not (self.classify_file_list or self.classify_source_dir) or not self.classify_target_dir.text():
             QMessageBox.warning(self, "Incomplete Information", "Please select template files and a destination folder.")
             return
-        file_list = [str(Path(f).absolute()) for f in self.classify_file_list]
+        if self.classify_source_dir:
+            try:
+                file_list = self._folder_source(self.classify_source_dir, self.classify_include,
+                                                self.classify_exclude, self.classify_use_git, self.classify_git_rev)
+            except GitError as e:
+                QMessageBox.warning(self, "Git Unavailable", str(e))
+                return
+        else:
+            file_list = self._selected_source(self.classify_file_list, self.classify_include, self.classify_exclude)
         self._run_task("classify", file_list, self.classify_target_dir.text())
 
+    def _toggle_watch(self):
+        if self._cancel_task("classify"):
+            return
+        if not self.classify_source_dir or not self.classify_target_dir.text():
+            QMessageBox.warning(self, "Incomplete Information", "Please select a template folder and a destination folder to watch.")
+            return
+        if self.classify_placement.currentText() == "move":
+            QMessageBox.warning(self, "Unsupported Placement", "Watch mode cannot move templates out of the watched folder.")
+            return
+        self._run_task("watch", [self.classify_source_dir], self.classify_target_dir.text(),
+                       parse_globs(self.classify_include.text()) or DEFAULT_INCLUDE,
+                       parse_globs(self.classify_exclude.text()))
+
     def _start_deduplication(self):
-        if not self.dedup_file_list:
+        if self._cancel_task("dedup"):
+            return
+        if not (self.dedup_file_list or self.dedup_source_dir):
             QMessageBox.warning(self, "Incomplete Information", "Please select template files to check for duplicates.")
             return
-        file_list = [str(Path(f).absolute()) for f in self.dedup_file_list]
+        if self.dedup_source_dir:
+            try:
+                file_list = self._folder_source(self.dedup_source_dir, self.dedup_include, self.dedup_exclude,
+                                                self.dedup_use_git, self.dedup_git_rev)
+            except GitError as e:
+                QMessageBox.warning(self, "Git Unavailable", str(e))
+                return
+        else:
+            file_list = self._selected_source(self.dedup_file_list, self.dedup_include, self.dedup_exclude)
         self._run_task("deduplicate", file_list)
 
     def _run_task(self, task_type, *args):
-        if self.is_task_running:
+        group, _, _, log_area, progress_bar = self._task_ui(task_type)
+        if self._active_job(group):
             return
-        
-        self._set_ui_for_task_start()
-        
-        self.thread = QThread()
-        self.worker = Worker()
-        self.worker.moveToThread(self.thread)
+        if self.scheduler is None:
+            from job_scheduler import JobScheduler
+            self.scheduler = JobScheduler(parent=self)
+
+        # Only the tab that started the task is guaranteed to be built, so only its options are read.
+        options = {}
+        if task_type in ("classify", "watch"):
+            jobs_box, cache_box = self.classify_jobs, self.classify_use_cache
+            options["placement"] = self.classify_placement.currentText()
+        elif task_type == "deduplicate":
+            jobs_box, cache_box = self.dedup_jobs, self.dedup_use_cache
+            options.update(trace_path=DEDUP_TRACE_PATH, hash_algo=self.dedup_hash_algo.currentText(),
+                           near_threshold=self.dedup_near_threshold.value() if self.dedup_near.isChecked() else None,
+                           semantic=self.dedup_semantic.isChecked())
+        elif task_type == "lint":
+            jobs_box, cache_box = self.lint_jobs, None
+        else:
+            jobs_box, cache_box = self.search_jobs, None
 
-        log_area = None
-        progress_bar = None
-        
         if task_type == "classify":
-            self.thread.started.connect(lambda: self.worker.do_organize_templates(*args))
-            log_area = self.classify_log
-            progress_bar = self.classify_progress_bar
+            method_name = "do_organize_templates"
+            self.classify_stats.setVisible(False)
         elif task_type == "deduplicate":
-            self.thread.started.connect(lambda: self.worker.do_find_duplicates(*args))
-            log_area = self.dedup_log
-            progress_bar = self.dedup_progress_bar
-            self.dedup_results_tree.clear()
+            method_name = "do_find_duplicates"
+            self.dedup_results_model.clear()
+            self.dedup_stats.setVisible(False)
+        elif task_type == "watch":
+            method_name = "do_watch_templates"
+        elif task_type == "lint":
+            method_name = "do_lint_templates"
+            self.lint_results_model.set_findings([])
+            self.lint_export_btn.setEnabled(False)
+            self.lint_status.setText("")
         else:
-            self._set_ui_for_task_finish()
-            return
+            method_name = "do_index_templates"
 
-        self.worker.progress_log.connect(log_area.append)
-        self.worker.progress_percent.connect(self._update_progress)
-        self.worker.finished.connect(self._task_finished)
-        self.thread.finished.connect(self.thread.deleteLater)
-        
         log_area.clear()
+        # A folder is streamed, so its size is unknown: show a busy indicator instead.
+        progress_bar.setRange(0, 100 if isinstance(args[0], (list, GitSource)) else 0)
         progress_bar.setValue(0)
         progress_bar.setVisible(True)
-        
-        self.thread.start()
+        self._set_task_running(task_type, True)
 
-    def _task_finished(self, data):
-        if self.thread and self.thread.isRunning():
-             self.thread.quit()
-             self.thread.wait()
+        job = self.scheduler.submit(task_type, group, method_name, *args, jobs=jobs_box.value(),
+                                    cache_path=DEFAULT_CACHE_PATH if cache_box and cache_box.isChecked() else None,
+                                    **options)
+        # Each job reports to its own tab, whichever tab is shown.
+        job.log.connect(log_area.append)
+        job.percent.connect(progress_bar.setValue)
+        job.discovered.connect(lambda count: self._update_discovered(task_type, count))
+        job.stats.connect(self._show_run_stats)
+        job.finished.connect(lambda data: self._task_finished(task_type, data))
+        if job.state == job.QUEUED:
+            log_area.append("Queued: starts when one of the running tasks finishes...")
 
-        self._set_ui_for_task_finish()
+    def _task_finished(self, task_type, data):
+        self._set_task_running(task_type, False)
 
         status = data.get("status")
+        log_area = self._task_ui(task_type)[3]
 
-        if "classification" in status:
+        if status.endswith("cancelled"):
+            log_area.append("\n--- Task cancelled ---")
+        elif status == "failed":
+            log_area.append("\n--- Task failed ---")
+        elif "classification" in status:
             self.classify_log.append("\n--- Classification task finished ---")
+        elif status in ("watch_done", "watch_failed"):
+            self.classify_log.append("\n--- Watching stopped ---")
         elif "deduplication" in status:
             if status == "deduplication_done":
                 self.dedup_log.append("\n--- Deduplication task finished ---")
                 self._populate_dedup_results(data.get("results", {}))
-        
-        if self.worker:
-            self.worker.deleteLater()
-            self.worker = None
-        self.thread = None
+        elif status == "lint_done":
+            self.lint_result = data
+            results, stats = data.get("results", {}), data.get("stats", {})
+            self.lint_results_model.set_findings(results.get("findings", []))
+            self.lint_export_btn.setEnabled(bool(results))
+            if results:
+                self.lint_status.setText(
+                    f"{results['errors']} error(s) and {results['warnings']} warning(s) in "
+                    f"{results['files_with_findings']} of {results['total_scanned']} templates "
+                    f"({stats['seconds']:.1f} s, {stats['files_per_second']:.0f} templates/s)")
+        elif status == "index_done":
+            if self.template_index is not None:
+                self.template_index.reload()
+            self._run_search()
+
+    def _show_run_stats(self, summary):
+        panel = self.classify_stats if summary.get("task") == "classify" else self.dedup_stats
+        panel.clear()
+        total = summary["seconds"] or 1.0
+        QTreeWidgetItem(panel, ["Total", f"{summary['seconds']:.2f} s, {summary['files']} files, "
+                                         f"{summary['files_per_second']:.0f} files/s, "
+                                         f"{summary['bytes_read'] / 1048576:.1f} MiB read"])
+        phases = QTreeWidgetItem(panel, ["Phases", ""])
+        # Qt passes the summary as a QVariantMap, which does not keep the phase order.
+        for name, seconds in sorted(summary["phases"].items(), key=lambda item: -item[1]):
+            QTreeWidgetItem(phases, [name, f"{seconds:.3f} s ({seconds / total:.0%})"])
+        within = QTreeWidgetItem(panel, ["Time within phases", ""])
+        within.setToolTip(0, "Worker times are summed over all processes and can exceed the run time.")
+        for name, seconds in sorted(summary["within"].items(), key=lambda item: -item[1]):
+            QTreeWidgetItem(within, [name, f"{seconds:.3f} s"])
+        counters = QTreeWidgetItem(panel, ["Counters", ""])
+        for name, value in sorted(summary["counters"].items()):
+            QTreeWidgetItem(counters, [name.replace("_", " "), str(value)])
+        slowest = QTreeWidgetItem(panel, ["Slowest files (read + parse)", ""])
+        for entry in summary["slowest_files"]:
+            item = QTreeWidgetItem(slowest, [entry["path"], f"{entry['seconds'] * 1000:.1f} ms"])
+            item.setData(0, Qt.UserRole, entry["path"])
+            item.setToolTip(0, "Double-click to open in the editor")
+        if "trace" in summary:
+            QTreeWidgetItem(panel, ["Trace (chrome://tracing)", summary["trace"]])
+        panel.expandAll()
+        panel.setVisible(True)
+
+    def _open_stats_item(self, item, column):
+        path = item.data(0, Qt.UserRole)
+        if path:
+            self._open_in_editor(path)
 
     def _populate_dedup_results(self, results):
-        self.dedup_results_tree.clear()
         total = results.get('total_scanned', 0)
         self.dedup_log.append(f"Total files scanned: {total}.")
-        id_duplicates = results.get("id_duplicates", {})
-        hash_duplicates = results.get("hash_duplicates", {})
-        id_root = QTreeWidgetItem(self.dedup_results_tree, ["Potential Duplicates by Template ID"])
-        if id_duplicates:
-            for tid, files in id_duplicates.items():
-                parent = QTreeWidgetItem(id_root, [f"ID: {tid} ({len(files)} files)"])
-                for file in files:
-                    QTreeWidgetItem(parent, ["", file])
-        else:
-            QTreeWidgetItem(id_root, ["No duplicates found based on ID."])
-        id_root.setExpanded(True)
-        hash_root = QTreeWidgetItem(self.dedup_results_tree, ["Exact Duplicates by File Hash"])
-        if hash_duplicates:
-            for f_hash, files in hash_duplicates.items():
-                parent = QTreeWidgetItem(hash_root, [f"Hash: {f_hash[:12]}... ({len(files)} files)"])
-                for file in files:
-                    QTreeWidgetItem(parent, ["", file])
-        else:
-            QTreeWidgetItem(hash_root, ["No duplicates found based on hash."])
-        hash_root.setExpanded(True)
-        
+        self.dedup_results_model.set_results(results)
+
+    def _expand_dedup_roots(self):
+        for row in range(self.dedup_results_model.rowCount()):
+            self.dedup_results_tree.expand(self.dedup_results_model.index(row, 0))
+
+    def _filter_dedup_results(self, text):
+        self.dedup_results_model.set_filter(text)
+
     def closeEvent(self, event):
-        if self.is_task_running:
-            QMessageBox.information(self, 'Task in Progress', 'Please wait for the current task to finish before closing the window.')
-            event.ignore()
-        else:
-            event.accept()
+        # Running tasks stop at their next file batch (watching right away), queued ones never start.
+        if self.scheduler is not None:
+            self.scheduler.shutdown()
+        if self.template_index is not None:
+            self.template_index.close()
+        if self.validation_thread is not None:
+            self.validation_worker.latest = -1
+            self.validation_thread.quit()
+            self.validation_thread.wait()
+        event.accept()
+
+def load_app_icon():
+    """The window icon, read straight from the .ico file (bundled next to the executable when frozen)."""
+    base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    icon_path = os.path.join(base_dir, ICON_FILENAME)
+    # QIcon decodes the file lazily, the first time a size of it is painted.
+    return QIcon(icon_path) if os.path.isfile(icon_path) else QIcon()
 
 if __name__ == '__main__':
     multiprocessing.freeze_support()
+
+    if sys.argv[1:2] == [STARTUP_MEASURE_FLAG]:
+        import startup_timing
+        sys.exit(startup_timing.main(__file__, sys.argv[2:]))
+    # A launch made by the measurement: it reports its milestones and quits at the first paint.
+    milestones = {"launched": LAUNCHED, "imports_done": time.time()} if STARTUP_PROBE_FLAG in sys.argv else None
     
     if sys.platform == 'win32':
         my_app_id = 'MyCompany.MyProduct.SubProduct.1'
@@ -426,22 +1027,18 @@ if __name__ == '__main__':
             pass
 
     app = QApplication(sys.argv)
-
-    try:
-        if icon_base64:
-            decoded_icon_data = base64.b64decode(icon_base64)
-            pixmap = QPixmap()
-            pixmap.loadFromData(decoded_icon_data)
-            app_icon = QIcon(pixmap)
-            app.setWindowIcon(app_icon)
-        else:
-            app_icon = QIcon()
-    except Exception:
-        app_icon = QIcon() 
+    app_icon = load_app_icon()
+    app.setWindowIcon(app_icon)
 
     if DARK_STYLE:
         app.setStyleSheet(DARK_STYLE)
 
     window = MainWindow(icon=app_icon)
+    if milestones is not None:
+        milestones["window_built"] = time.time()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    if milestones is not None:
+        milestones["window_shown"] = time.time()
+        from startup_timing import StartupProbe
+        StartupProbe(window, milestones)
+    sys.exit(app.exec())
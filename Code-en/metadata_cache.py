@@ -0,0 +1,109 @@
+# metadata_cache.py
+import os
+import sqlite3
+from pathlib import Path
+from app_paths import DEFAULT_CACHE_PATH
+from template_analysis import TemplateRecord
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash_algo TEXT,
+    digest TEXT,
+    template_id TEXT,
+    severity TEXT,
+    tags TEXT NOT NULL,
+    error TEXT
+)
+"""
+
+
+class MetadataCache:
+    """
+    Persistent per-file analysis results keyed by (path, size, mtime_ns).
+    The content digest is optional and only filled in once something hashed the file.
+    A file whose size or modification time changed is treated as a miss and
+    re-analyzed; entries for files that no longer exist are evicted on demand.
+    """
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS templates")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.execute(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def lookup(self, path, stat):
+        """Returns the cached TemplateRecord for 'path', or None on a miss."""
+        row = self.conn.execute(
+            "SELECT hash_algo, digest, template_id, severity, tags, error FROM templates "
+            "WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        hash_algo, digest, template_id, severity, tags, error = row
+        return TemplateRecord(path, stat.st_size, digest, hash_algo, template_id, severity,
+                              tuple(tags.split(",")) if tags else (), error)
+
+    def store(self, record, stat):
+        # Read failures are not cached, the file may become readable later.
+        if record.size is None:
+            return
+        self._pending.append((record.path, stat.st_size, stat.st_mtime_ns, record.hash_algo, record.digest,
+                              record.template_id, record.severity, ",".join(record.tags), record.error))
+        if len(self._pending) >= 1000:
+            self.flush()
+
+    def update_digests(self, rows):
+        """Remembers (hash_algo, hex digest, path) rows computed after analysis, e.g. by the duplicate finder."""
+        self.flush()
+        with self.conn:
+            self.conn.executemany("UPDATE templates SET hash_algo = ?, digest = ? WHERE path = ?", rows)
+
+    def flush(self):
+        if self._pending:
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO templates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                      self._pending)
+            self._pending = []
+
+    def evict_missing(self):
+        """Removes entries whose file no longer exists and returns how many were dropped."""
+        self.flush()
+        stale = [(path,) for (path,) in self.conn.execute("SELECT path FROM templates")
+                 if not os.path.exists(path)]
+        if stale:
+            with self.conn:
+                self.conn.executemany("DELETE FROM templates WHERE path = ?", stale)
+        return len(stale)
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self):
+        return (f"Metadata cache: {self.hits} hits, {self.misses} misses "
+                f"({self.hit_ratio():.1%} hit ratio).")
+
+    def close(self):
+        self.flush()
+        self.conn.close()
@@ -0,0 +1,187 @@
+# near_dedup.py
+import hashlib
+import re
+from array import array
+from collections import defaultdict
+
+NUM_BINS = 64
+DEFAULT_NEAR_THRESHOLD = 0.8
+# Top-level keys that describe a template rather than what it sends or matches.
+IGNORED_KEYS = ("id", "info")
+SHINGLE_WORDS = 3
+LONG_VALUE = 40
+MAX_BUCKET_PAIRS = 32
+CHECK_BUCKETS = 1024
+# Nodes a parsed template may have once its YAML aliases are expanded.
+MAX_NODES = 200_000
+_WHITESPACE = re.compile(r"\s+")
+_BIN_BITS = NUM_BINS.bit_length() - 1
+# Bin values have 64 - _BIN_BITS bits, so this marks an empty bin and, multiplied by
+# the densification distance (< NUM_BINS), still fits an unsigned 64-bit array item.
+_EMPTY = 1 << (64 - _BIN_BITS)
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip().lower()
+    return str(value).lower()
+
+
+def check_tree(data, max_nodes=MAX_NODES):
+    """
+    Raises ValueError when a parsed template cannot be walked as a tree: a YAML
+    alias refers to one of its own ancestors, or aliases reused many times
+    expand it to more than 'max_nodes' nodes. Containers shared by siblings
+    are fine. The walk is iterative and stops at the first problem.
+    """
+    # (node, False) is a node to visit, (container id, True) marks leaving that container.
+    stack = [(data, False)]
+    open_ids = set()
+    nodes = 0
+    while stack:
+        item, leaving = stack.pop()
+        if leaving:
+            open_ids.discard(item)
+            continue
+        nodes += 1
+        if nodes > max_nodes:
+            raise ValueError(f"Template expands to more than {max_nodes} nodes through YAML aliases")
+        if isinstance(item, (dict, list)):
+            if id(item) in open_ids:
+                raise ValueError("Template contains a recursive YAML alias")
+            open_ids.add(id(item))
+            stack.append((id(item), True))
+            stack.extend((value, False) for value in (item.values() if isinstance(item, dict) else item))
+
+
+def content_tokens(data):
+    """
+    Returns the set of tokens describing a template's requests and matchers.
+    'id' and 'info' are dropped, mapping keys become order-free key paths
+    (list positions are ignored), scalars are whitespace- and case-normalized,
+    and long strings such as raw requests are split into word shingles so that
+    a small edit only changes a few tokens. The walk is iterative.
+    Raises ValueError for data that check_tree rejects.
+    """
+    tokens = set()
+    if not isinstance(data, dict):
+        return tokens
+    check_tree(data)
+    stack = [(str(key), value) for key, value in data.items() if key not in IGNORED_KEYS]
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend((f"{path}.{key}", item) for key, item in value.items())
+        elif isinstance(value, list):
+            stack.extend((path, item) for item in value)
+        else:
+            text = _normalize(value)
+            words = text.split(" ")
+            if len(text) < LONG_VALUE or len(words) <= SHINGLE_WORDS:
+                tokens.add(f"{path}={text}")
+            else:
+                for i in range(len(words) - SHINGLE_WORDS + 1):
+                    tokens.add(f"{path}~{' '.join(words[i:i + SHINGLE_WORDS])}")
+    return tokens
+
+
+def minhash_signature(tokens):
+    """
+    One-permutation MinHash: each token is hashed once and the minimum is kept
+    per bin, with rotation densification for empty bins. Returns an array of
+    NUM_BINS unsigned 64-bit integers, or None for an empty token set.
+    """
+    if not tokens:
+        return None
+    bins = [_EMPTY] * NUM_BINS
+    for token in tokens:
+        h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+        index, value = h & (NUM_BINS - 1), h >> _BIN_BITS
+        if value < bins[index]:
+            bins[index] = value
+    signature = list(bins)
+    for i in range(NUM_BINS):
+        if bins[i] == _EMPTY:
+            distance = 1
+            while bins[(i + distance) % NUM_BINS] == _EMPTY:
+                distance += 1
+            signature[i] = bins[(i + distance) % NUM_BINS] + distance * _EMPTY
+    return array('Q', signature)
+
+
+def similarity(sig_a, sig_b):
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_BINS
+
+
+def lsh_params(threshold, num_bins=NUM_BINS):
+    """Picks (bands, rows) with bands * rows == num_bins whose S-curve midpoint is closest to threshold."""
+    pairs = [(b, num_bins // b) for b in range(1, num_bins + 1) if num_bins % b == 0]
+    return min(pairs, key=lambda pair: abs((1 / pair[0]) ** (1 / pair[1]) - threshold))
+
+
+def find_near_duplicates(entries, threshold=DEFAULT_NEAR_THRESHOLD, check=None):
+    """
+    Groups (key, name, signature) entries whose content signatures are at least
+    'threshold' similar; 'name' labels a group (e.g. the template ID).
+    Candidates come from an LSH index (signatures cut into bands, bucketed per
+    band), so the work stays roughly linear in the number of templates; every
+    candidate pair is then verified on the full signature and pairs are merged
+    into clusters with union-find. Returns {label: [keys]} in input order.
+    A bucket of more than MAX_BUCKET_PAIRS members (typically many copies of one
+    template) is not compared exhaustively: every member is compared with its
+    first member and with the others of its run of MAX_BUCKET_PAIRS consecutive
+    members. Two similar templates of such a bucket that are in different runs and
+    not similar to its first member are only found through another band.
+    'check' is called once per band and every CHECK_BUCKETS buckets and may
+    raise to stop early (e.g. when the run is cancelled).
+    """
+    signed = [entry for entry in entries if entry[2]]
+    bands, rows = lsh_params(threshold)
+    parent = list(range(len(signed)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    best = defaultdict(float)
+    checked = set()
+    for band in range(bands):
+        if check is not None:
+            check()
+        buckets = defaultdict(list)
+        for i, (_, _, signature) in enumerate(signed):
+            buckets[signature[band * rows:(band + 1) * rows].tobytes()].append(i)
+        for number, members in enumerate(buckets.values(), 1):
+            if check is not None and number % CHECK_BUCKETS == 0:
+                check()
+            if len(members) < 2:
+                continue
+            # Small buckets are compared exhaustively, large ones in capped runs (see above).
+            pairs = [(a, b) for start in range(0, len(members), MAX_BUCKET_PAIRS)
+                     for n, a in enumerate(members[start:start + MAX_BUCKET_PAIRS], start)
+                     for b in members[n + 1:start + MAX_BUCKET_PAIRS]]
+            if len(members) > MAX_BUCKET_PAIRS:
+                pairs += [(members[0], b) for b in members[MAX_BUCKET_PAIRS:]]
+            for i, j in pairs:
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                score = similarity(signed[i][2], signed[j][2])
+                if score >= threshold:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j:
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+                    best[i] = max(best[i], score)
+                    best[j] = max(best[j], score)
+
+    clusters = defaultdict(list)
+    for i in range(len(signed)):
+        clusters[find(i)].append(i)
+    results = {}
+    for number, members in enumerate(sorted(m for m in clusters.values() if len(m) > 1), 1):
+        name = signed[members[0]][1]
+        score = min(best[i] for i in members)
+        results[f"#{number} {name} (>= {score:.0%} similar)"] = [signed[i][0] for i in members]
+    return results
@@ -0,0 +1,303 @@
+# nuclei_toolkit.py
+# Headless entry point: python -m nuclei_toolkit classify|dedup|lint [options] PATH...
+# Results go to stdout as JSON (or NDJSON), progress optionally to stderr.
+# Must not import PySide6, so it can run on build servers without a display.
+import argparse
+import json
+import os
+import signal
+import sys
+from itertools import chain
+from archive_source import is_archive
+from engine import TemplateEngine
+from discovery import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, parse_globs, walk_templates
+from exact_dedup import DEFAULT_HASH_ALGO, HASH_ALGORITHMS
+from git_source import GitError, GitSource
+from metadata_cache import DEFAULT_CACHE_PATH
+from near_dedup import DEFAULT_NEAR_THRESHOLD
+from placement import DEFAULT_PLACEMENT, PLACEMENT_MODES
+from lint_report import write_report
+from progress import ProgressReporter
+from run_stats import format_summary
+from template_index import DEFAULT_INDEX_PATH, TemplateIndex
+from template_validation import RULES, LintConfig
+from watch import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL
+
+EXIT_OK = 0
+EXIT_FINDINGS = 1
+EXIT_USAGE = 2
+
+
+class CliEngine(TemplateEngine):
+    def __init__(self, args, **kwargs):
+        super().__init__(**kwargs)
+        self.show_progress = args.progress
+        self.ndjson = args.format == "ndjson"
+        self.reporter = ProgressReporter(stderr_line,
+                                         lambda value: stderr_line(f"progress: {value}%"),
+                                         lambda count: stderr_line(f"discovered: {count}"),
+                                         max_rate_hz=4)
+
+    def on_log(self, message):
+        if self.show_progress:
+            self.reporter.log(message)
+
+    def on_percent(self, value):
+        if self.show_progress:
+            self.reporter.percent(value)
+
+    def on_discovered(self, count):
+        if self.show_progress:
+            self.reporter.count(count)
+
+    def on_stats(self, summary):
+        if self.show_progress:
+            self.reporter.flush()
+            for line in format_summary(summary):
+                stderr_line(line)
+        if self.ndjson:
+            emit({"type": "stats", **summary})
+
+    def on_finished(self, result):
+        self.reporter.flush()
+
+    def on_idle(self):
+        self.reporter.flush()
+
+    def on_classified(self, record, folder, destination):
+        if self.ndjson:
+            emit({"type": "classified", "path": record.path, "severity": record.severity,
+                  "folder": folder, "destination": destination})
+
+
+def stderr_line(text):
+    print(text, file=sys.stderr, flush=True)
+
+
+def emit(obj):
+    sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+
+
+def collect_sources(args):
+    """
+    Files are used as given; directories and .zip/tar archives are walked recursively and streamed.
+    With --git or --git-diff the folders are listed by git instead (raises GitError).
+    """
+    include = parse_globs(args.include) or DEFAULT_INCLUDE
+    exclude = parse_globs(args.exclude)
+    if getattr(args, "git", False) or getattr(args, "git_diff", None):
+        return GitSource(args.paths, args.git_diff, include, exclude)
+    files, walkers = [], []
+    for path in args.paths:
+        if os.path.isdir(path) or is_archive(path):
+            walkers.append(walk_templates(path, include, exclude))
+        else:
+            files.append(os.path.abspath(path))
+    if walkers:
+        return chain(files, *walkers)
+    return files
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="nuclei_toolkit",
+                                     description="Classify, deduplicate, lint and search Nuclei templates without the GUI.")
+    # Options shared by every subcommand.
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes for parsing and hashing (default: CPU count)")
+    output.add_argument("--format", choices=("json", "ndjson"), default="json", help="stdout format")
+    output.add_argument("--progress", action="store_true", help="write progress and log lines to stderr")
+    output.add_argument("--include", default=";".join(DEFAULT_INCLUDE), help="';'-separated globs for folders")
+    output.add_argument("--exclude", default=";".join(DEFAULT_EXCLUDE), help="';'-separated globs to skip")
+    common = argparse.ArgumentParser(add_help=False, parents=[output])
+    common.add_argument("paths", nargs="+",
+                        help="template files, folders or .zip/tar archives (scanned recursively)")
+    common.add_argument("--cache", default=str(DEFAULT_CACHE_PATH), help="metadata cache file")
+    common.add_argument("--no-cache", action="store_true", help="analyze every file, ignore the cache")
+    common.add_argument("--trace", metavar="FILE",
+                        help="write a Chrome trace of the run (classify default: next to the debug log)")
+    common.add_argument("--git", action="store_true",
+                        help="paths are folders in git work trees: list tracked and untracked templates with git "
+                             "and use the blob ids of unchanged files as content hashes")
+    common.add_argument("--git-diff", metavar="REV",
+                        help="only templates changed by REV: 'A..B' between two commits, or 'A' against the "
+                             "work tree (implies --git)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    classify = sub.add_parser("classify", parents=[common], help="copy templates into per-severity folders")
+    classify.add_argument("-o", "--output", required=True,
+                          help="destination folder, or a .zip/.tar.gz/... archive to create")
+    classify.add_argument("--placement", choices=PLACEMENT_MODES, default=DEFAULT_PLACEMENT,
+                          help="how templates are placed; link modes fall back to copy when not possible")
+    classify.add_argument("--io-jobs", type=int, default=8, help="threads used to place files (default: 8)")
+    classify.add_argument("--watch", action="store_true",
+                          help="keep the output in sync with the source folders until interrupted (Ctrl+C)")
+    classify.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                          help=f"--watch: seconds without events before a sync (default: {DEFAULT_DEBOUNCE})")
+    classify.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                          help=f"--watch: rescan interval when inotify is unavailable (default: {DEFAULT_POLL_INTERVAL})")
+    classify.add_argument("--fail-on-errors", action="store_true",
+                          help=f"exit with {EXIT_FINDINGS} if any template failed to parse or copy")
+
+    dedup = sub.add_parser("dedup", parents=[common], help="report duplicate IDs and identical files")
+    dedup.add_argument("--hash", choices=sorted(HASH_ALGORITHMS), default=DEFAULT_HASH_ALGO)
+    dedup.add_argument("--semantic", action="store_true",
+                       help="also group templates with identical requests/matchers regardless of formatting")
+    dedup.add_argument("--near", action="store_true",
+                       help="also group templates with similar requests/matchers (parses every file in full)")
+    dedup.add_argument("--near-threshold", type=float, default=DEFAULT_NEAR_THRESHOLD, metavar="THRESHOLD",
+                       help=f"minimum similarity for --near, in (0, 1] (default: {DEFAULT_NEAR_THRESHOLD})")
+    dedup.add_argument("--fail-on-duplicates", action="store_true",
+                       help=f"exit with {EXIT_FINDINGS} if any ID, exact or semantic duplicate is found")
+
+    lint = sub.add_parser("lint", parents=[output], help="check templates against lint rules")
+    lint.add_argument("paths", nargs="+", help="template files, folders or .zip/tar archives (scanned recursively)")
+    lint.add_argument("--sarif", metavar="FILE", help="also write the findings as a SARIF 2.1.0 report")
+    lint.add_argument("--rules", action="append", default=[], metavar="FILE.py",
+                      help="Python file registering extra rules with @template_validation.lint_rule (repeatable)")
+    lint.add_argument("--enable", help=f"','-separated rule ids to run (default: all of {', '.join(RULES)})")
+    lint.add_argument("--disable", help="','-separated rule ids to skip")
+    lint.add_argument("--fail-on", choices=("error", "warning"),
+                      help=f"exit with {EXIT_FINDINGS} if a finding of this severity or worse is found")
+
+    search = sub.add_parser("search", parents=[output],
+                            help="query the template index, optionally updating it first")
+    search.add_argument("query", help="e.g. 'severity:critical tag:rce protocol:http' (also author:, cve:, "
+                                      "id:, name:, path:, -field:value to exclude)")
+    search.add_argument("paths", nargs="*", help="template folders to index (only changed files are read)")
+    search.add_argument("--index", default=str(DEFAULT_INDEX_PATH), help="template index file")
+    search.add_argument("--limit", type=int, help="print at most this many matches")
+    return parser
+
+
+def run_watch(engine, args):
+    if args.git or args.git_diff:
+        stderr_line("error: --watch cannot be combined with --git or --git-diff")
+        return EXIT_USAGE
+    missing = [path for path in args.paths if not os.path.isdir(path)]
+    if missing:
+        stderr_line(f"error: --watch needs folders, not: {', '.join(missing)}")
+        return EXIT_USAGE
+    # Service managers stop with SIGTERM: finish the current sync and exit cleanly.
+    signal.signal(signal.SIGTERM, lambda signum, frame: engine.request_stop())
+    result = engine.do_watch_templates(args.paths, args.output, parse_globs(args.include) or DEFAULT_INCLUDE,
+                                       parse_globs(args.exclude), args.debounce, args.poll_interval)
+    emit({"type": "summary", **result} if engine.ndjson else result)
+    return EXIT_OK if result["status"] == "watch_done" else EXIT_USAGE
+
+
+def run_classify(engine, args, sources):
+    result = engine.do_organize_templates(sources, args.output)
+    if engine.ndjson:
+        emit({"type": "summary", **result})
+    else:
+        emit(result)
+    if not result.get("processed"):
+        return EXIT_USAGE
+    if args.fail_on_errors and (result.get("parse_errors") or result.get("copy_errors")):
+        return EXIT_FINDINGS
+    return EXIT_OK
+
+
+def run_dedup(engine, args, sources):
+    result = engine.do_find_duplicates(sources)
+    results = result.get("results", {})
+    if engine.ndjson:
+        for kind, key in (("id", "id_duplicates"), ("hash", "hash_duplicates"),
+                          ("semantic", "semantic_duplicates"), ("near", "near_duplicates")):
+            for value, files in results.get(key, {}).items():
+                emit({"type": "duplicate", "kind": kind, "key": value, "files": files})
+        emit({"type": "summary", "status": result["status"], "total_scanned": results.get("total_scanned", 0)})
+    else:
+        emit(result)
+    if not results.get("total_scanned"):
+        return EXIT_USAGE
+    if args.fail_on_duplicates and any(results.get(key) for key in
+                                       ("id_duplicates", "hash_duplicates", "semantic_duplicates")):
+        return EXIT_FINDINGS
+    return EXIT_OK
+
+
+def _rule_ids(value):
+    return tuple(rule_id.strip() for rule_id in value.split(",") if rule_id.strip()) if value else ()
+
+
+def run_lint(engine, args):
+    lint = LintConfig(tuple(os.path.abspath(path) for path in args.rules),
+                      _rule_ids(args.enable) or None, _rule_ids(args.disable))
+    result = engine.do_lint_templates(collect_sources(args), lint)
+    if result["status"] != "lint_done":
+        return EXIT_USAGE
+    results = result.get("results", {})
+    if engine.ndjson:
+        for finding in results.get("findings", []):
+            emit({"type": "finding", **finding})
+        emit({"type": "summary", "status": result["status"],
+              **{key: value for key, value in results.items() if key != "findings"},
+              "stats": result.get("stats", {})})
+    else:
+        emit(result)
+    if args.sarif:
+        write_report(args.sarif, result, lint.rules(), base_dir=os.getcwd())
+    if not results.get("total_scanned"):
+        return EXIT_USAGE
+    if args.fail_on and (results["errors"] or (args.fail_on == "warning" and results["warnings"])):
+        return EXIT_FINDINGS
+    return EXIT_OK
+
+
+def run_search(engine, args):
+    if args.paths:
+        missing = [path for path in args.paths if not os.path.isdir(path)]
+        if missing:
+            stderr_line(f"error: not a folder: {', '.join(missing)}")
+            return EXIT_USAGE
+        result = engine.do_index_templates([os.path.abspath(path) for path in args.paths],
+                                           parse_globs(args.include) or DEFAULT_INCLUDE,
+                                           parse_globs(args.exclude), args.index)
+        if result["status"] != "index_done":
+            return EXIT_USAGE
+    with TemplateIndex(args.index) as index:
+        try:
+            entries = index.query(args.query, args.limit)
+        except ValueError as e:
+            stderr_line(f"error: {e}")
+            return EXIT_USAGE
+        if engine.ndjson:
+            for entry in entries:
+                emit({"type": "template", **entry.as_dict()})
+            emit({"type": "summary", "matches": len(entries), "indexed": len(index)})
+        else:
+            emit({"matches": [entry.as_dict() for entry in entries], "indexed": len(index)})
+    return EXIT_OK
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "dedup" and not 0 < args.near_threshold <= 1:
+        parser.error(f"--near-threshold must be greater than 0 and at most 1, not {args.near_threshold}")
+    if args.command == "search":
+        return run_search(CliEngine(args, jobs=args.jobs), args)
+    if args.command == "lint":
+        return run_lint(CliEngine(args, jobs=args.jobs), args)
+    engine = CliEngine(args, jobs=args.jobs, cache_path=None if args.no_cache else args.cache,
+                       hash_algo=getattr(args, "hash", DEFAULT_HASH_ALGO),
+                       placement=getattr(args, "placement", DEFAULT_PLACEMENT),
+                       io_jobs=getattr(args, "io_jobs", 8),
+                       near_threshold=args.near_threshold if getattr(args, "near", False) else None,
+                       semantic=getattr(args, "semantic", False), trace_path=args.trace)
+    if args.command == "classify" and args.watch:
+        return run_watch(engine, args)
+    try:
+        sources = collect_sources(args)
+    except GitError as e:
+        stderr_line(f"error: {e}")
+        return EXIT_USAGE
+    if args.command == "classify":
+        return run_classify(engine, args, sources)
+    return run_dedup(engine, args, sources)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
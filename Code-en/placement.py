@@ -0,0 +1,195 @@
+# placement.py
+import errno
+import os
+import shutil
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from archive_source import read_member, split_member_path
+
+PLACEMENT_MODES = ("copy", "hardlink", "symlink", "reflink", "move")
+DEFAULT_PLACEMENT = "copy"
+
+# From linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+
+def _reflink(src, dst):
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is only supported on Linux")
+    import fcntl
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def _same_file(src, dst):
+    try:
+        return os.path.samefile(src, dst)
+    except OSError:
+        return False
+
+
+def _clear_destination(dst):
+    # Links cannot overwrite, unlike copy2; an existing file at dst is replaced.
+    if os.path.lexists(dst):
+        os.unlink(dst)
+
+
+def place_file(src, dst, mode=DEFAULT_PLACEMENT):
+    """
+    Places 'src' at 'dst' using 'mode' and returns the mode actually used.
+    Hardlinks, symlinks and reflinks fall back to a copy when the filesystem or
+    platform refuses them (e.g. across devices); 'move' already copies and
+    deletes across devices. Raises shutil.SameFileError like shutil.copy2
+    when both paths already refer to the same file. Archive members
+    ('bundle.zip!/x.yaml') can only be copied out.
+    """
+    if split_member_path(src):
+        with open(dst, 'wb') as f:
+            f.write(read_member(src))
+        return "copy"
+    if _same_file(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    if mode == "copy":
+        shutil.copy2(src, dst)
+        return mode
+    if mode == "move":
+        _clear_destination(dst)
+        shutil.move(src, dst)
+        return mode
+    try:
+        _clear_destination(dst)
+        if mode == "hardlink":
+            os.link(src, dst)
+        elif mode == "symlink":
+            os.symlink(os.path.abspath(src), dst)
+        elif mode == "reflink":
+            _reflink(src, dst)
+        else:
+            raise ValueError(f"Unknown placement mode: {mode}")
+        return mode
+    except (OSError, NotImplementedError):
+        shutil.copy2(src, dst)
+        return "copy"
+
+
+class Placement:
+    """One planned file placement: 'source' goes to 'destination' inside 'folder'."""
+    __slots__ = ("source", "destination", "folder", "record")
+
+    def __init__(self, source, destination, folder, record=None):
+        self.source = source
+        self.destination = destination
+        self.folder = folder
+        self.record = record
+
+
+def _renamed(name, number):
+    stem, dot, suffix = name.rpartition(".")
+    if not dot:
+        return f"{name}__{number}"
+    return f"{stem}__{number}.{suffix}"
+
+
+def plan_placements(entries, target_dir, reserved=()):
+    """
+    Builds the placement plan for (source path, folder name, record) entries.
+    Sources that would land on the same destination name are resolved
+    deterministically: ordered by source path, the first keeps its name and the
+    others get a '__2', '__3', ... suffix. Destinations in 'reserved' (e.g. owned
+    by files placed in an earlier run) are never reused. Returns (placements in
+    input order, list of (source, renamed destination)). A source listed twice is
+    placed once.
+    """
+    placements = []
+    by_destination = {}
+    seen_sources = set()
+    for source, folder, record in entries:
+        if source in seen_sources:
+            continue
+        seen_sources.add(source)
+        destination = os.path.join(target_dir, folder, os.path.basename(source))
+        placement = Placement(source, destination, folder, record)
+        placements.append(placement)
+        by_destination.setdefault(destination, []).append(placement)
+
+    reserved = set(reserved)
+    taken = set(by_destination) | reserved
+    renamed = []
+    for destination, group in by_destination.items():
+        keeps_name = destination not in reserved
+        if len(group) < 2 and keeps_name:
+            continue
+        group.sort(key=lambda p: p.source)
+        number = 1
+        for placement in (group[1:] if keeps_name else group):
+            while True:
+                number += 1
+                candidate = os.path.join(os.path.dirname(destination), _renamed(os.path.basename(destination), number))
+                if candidate not in taken:
+                    break
+            taken.add(candidate)
+            placement.destination = candidate
+            renamed.append((placement.source, candidate))
+    return placements, renamed
+
+
+def _place_batch(batch, mode):
+    results = []
+    for placement in batch:
+        try:
+            results.append(place_file(placement.source, placement.destination, mode))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def execute_placements(placements, mode=DEFAULT_PLACEMENT, io_jobs=8, batch_size=128, pool=None, check=None):
+    """
+    Executes a placement plan and yields (placement, result) in plan order,
+    where result is the mode actually used or the exception raised.
+    Every destination folder is created once up front, then batches of
+    placements run on a bounded I/O thread pool: 'pool' when one is shared
+    with other runs, otherwise one started for this plan.
+    'check' is called before each batch starts and may raise to stop early
+    (e.g. on cancellation); the exception is re-raised once the batches already
+    started were yielded, so every placement that ran is reported.
+    """
+    for folder in sorted({os.path.dirname(p.destination) for p in placements}):
+        os.makedirs(folder, exist_ok=True)
+    batches = [placements[i:i + batch_size] for i in range(0, len(placements), batch_size)]
+    if pool is None and (io_jobs <= 1 or len(batches) <= 1):
+        for batch in batches:
+            if check is not None:
+                check()
+            yield from zip(batch, _place_batch(batch, mode))
+        return
+    own_pool = ThreadPoolExecutor(max_workers=io_jobs) if pool is None else None
+    in_flight = deque()
+    stopped = None
+    try:
+        for batch in batches:
+            if check is not None:
+                try:
+                    check()
+                except Exception as e:
+                    stopped = e
+                    break
+            in_flight.append((batch, (pool or own_pool).submit(_place_batch, batch, mode)))
+            if len(in_flight) > max(1, io_jobs):
+                done, future = in_flight.popleft()
+                yield from zip(done, future.result())
+        while in_flight:
+            done, future = in_flight.popleft()
+            yield from zip(done, future.result())
+    finally:
+        if own_pool is not None:
+            own_pool.shutdown()
+    if stopped is not None:
+        raise stopped
@@ -0,0 +1,55 @@
+# progress.py
+import time
+
+
+class ProgressReporter:
+    """
+    Coalesces progress updates before they reach a (possibly slow) sink.
+    Percentages and counts are "latest value wins" and only forwarded when they
+    changed; log lines are buffered and forwarded as one multi-line message.
+    Nothing is forwarded more often than 'max_rate_hz', except through flush(),
+    which must be called at the end of a run so nothing is lost.
+    """
+
+    def __init__(self, log_sink, percent_sink, count_sink=None, max_rate_hz=20, clock=time.monotonic):
+        self.log_sink = log_sink
+        self.percent_sink = percent_sink
+        self.count_sink = count_sink
+        self.interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self.clock = clock
+        self._lines = []
+        self._percent = None
+        self._sent_percent = None
+        self._count = None
+        self._sent_count = None
+        self._last_flush = float("-inf")
+
+    def log(self, message):
+        self._lines.append(message)
+        self._maybe_flush()
+
+    def percent(self, value):
+        self._percent = value
+        if value != self._sent_percent:
+            self._maybe_flush()
+
+    def count(self, value):
+        self._count = value
+        if value != self._sent_count:
+            self._maybe_flush()
+
+    def _maybe_flush(self):
+        if self.clock() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = self.clock()
+        if self._lines:
+            lines, self._lines = self._lines, []
+            self.log_sink("\n".join(lines))
+        if self._percent is not None and self._percent != self._sent_percent:
+            self._sent_percent = self._percent
+            self.percent_sink(self._percent)
+        if self.count_sink and self._count is not None and self._count != self._sent_count:
+            self._sent_count = self._count
+            self.count_sink(self._count)
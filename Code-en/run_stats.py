@@ -0,0 +1,139 @@
+# run_stats.py
+import heapq
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+SLOWEST_FILES = 10
+# Per-file trace events beyond this are only counted, so the trace of a huge run stays loadable.
+MAX_FILE_EVENTS = 20000
+
+
+class RunStats:
+    """
+    Wall-clock phase timers, counters and the slowest files of one engine run,
+    exported as a summary dict and as a Chrome trace (chrome://tracing, Perfetto).
+    Phases run one after another and their times add up to the run. Time spent
+    inside them on something else (discovering files while analyzing, handing
+    updates to the GUI, reading and parsing in worker processes) is kept apart
+    in 'within': worker time is summed over processes and can exceed the wall time.
+    """
+
+    def __init__(self, task, slowest=SLOWEST_FILES):
+        self.task = task
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.phases = {}
+        self.within = {}
+        self.counters = Counter()
+        self.slowest = slowest
+        self._slowest = []
+        self._events = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, start, time.perf_counter() - start)
+
+    def add_phase(self, name, start, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        self._event(name, "phase", start, seconds, os.getpid(), threading.get_ident())
+
+    def add_within(self, name, seconds):
+        self.within[name] = self.within.get(name, 0.0) + seconds
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def timed(self, iterable, name):
+        """Yields from 'iterable', adding the time spent waiting for each item to within[name]."""
+        it = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.add_within(name, time.perf_counter() - start)
+                return
+            self.add_within(name, time.perf_counter() - start)
+            yield item
+
+    def record(self, record):
+        """Accounts for one template_analysis.TemplateRecord."""
+        self.counters["files"] += 1
+        if record.size is None:
+            self.counters["unreadable"] += 1
+        elif record.error:
+            self.counters["parse_failures"] += 1
+        if record.timing is None:
+            self.counters["cache_hits"] += 1
+            return
+        self.counters["bytes_read"] += record.size or 0
+        start, read_seconds, parse_seconds, pid = record.timing
+        self.add_within("worker read", read_seconds)
+        self.add_within("worker parse", parse_seconds)
+        seconds = read_seconds + parse_seconds
+        entry = (seconds, record.path)
+        if len(self._slowest) < self.slowest:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+        if self.counters["files"] - self.counters["cache_hits"] <= MAX_FILE_EVENTS:
+            self._event(os.path.basename(record.path), "file", start, seconds, pid, pid, {"path": record.path})
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self.started
+        return self
+
+    def _event(self, name, category, start, seconds, pid, tid, args=None):
+        self._events.append((name, category, start, seconds, pid, tid, args))
+
+    def summary(self):
+        seconds = self.seconds if self.seconds is not None else time.perf_counter() - self.started
+        files = self.counters["files"]
+        return {
+            "task": self.task,
+            "seconds": round(seconds, 4),
+            "files": files,
+            "files_per_second": round(files / seconds, 1) if seconds else 0.0,
+            "bytes_read": self.counters["bytes_read"],
+            "phases": {name: round(value, 4) for name, value in self.phases.items()},
+            "within": {name: round(value, 4) for name, value in self.within.items()},
+            "counters": dict(self.counters),
+            "slowest_files": [{"path": path, "seconds": round(value, 4)}
+                              for value, path in sorted(self._slowest, reverse=True)],
+        }
+
+    def write_trace(self, path):
+        """Writes the phases and per-file spans in the Chrome trace event format."""
+        events = [{"name": "process_name", "ph": "M", "pid": os.getpid(),
+                   "args": {"name": f"nuclei-template-toolkit {self.task}"}}]
+        for name, category, start, seconds, pid, tid, args in self._events:
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                     "ts": round((start - self.started) * 1e6, 1), "dur": round(seconds * 1e6, 1)}
+            if args:
+                event["args"] = args
+            events.append(event)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": self.summary()}, f)
+
+
+def format_summary(summary):
+    """Human-readable lines of a RunStats.summary(), as shown by the CLI."""
+    lines = [f"{summary['task']}: {summary['files']} files in {summary['seconds']:.2f} s "
+             f"({summary['files_per_second']:.0f} files/s, {summary['bytes_read'] / 1048576:.1f} MiB read)"]
+    total = summary["seconds"] or 1.0
+    for name, seconds in summary["phases"].items():
+        lines.append(f"  {name:<18} {seconds:9.3f} s  {seconds / total:6.1%}")
+    for name, seconds in summary["within"].items():
+        lines.append(f"  ({name}){'':<{max(0, 16 - len(name))}} {seconds:9.3f} s")
+    lines.append("  " + ", ".join(f"{name}={value}" for name, value in sorted(summary["counters"].items())))
+    for entry in summary["slowest_files"]:
+        lines.append(f"  slow: {entry['seconds'] * 1000:8.1f} ms  {entry['path']}")
+    return lines
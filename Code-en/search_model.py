@@ -0,0 +1,45 @@
+# search_model.py
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# (header, value of an IndexEntry)
+SEARCH_COLUMNS = [
+    ("ID", lambda e: e.template_id or ""),
+    ("Name", lambda e: e.name or ""),
+    ("Severity", lambda e: e.severity or ""),
+    ("Tags", lambda e: ", ".join(e.tags)),
+    ("Protocols", lambda e: ", ".join(e.protocols)),
+    ("CVE", lambda e: ", ".join(e.cves)),
+    ("File Path", lambda e: e.path),
+]
+
+
+class SearchResultsModel(QAbstractTableModel):
+    """Read-only table over a list of template_index.IndexEntry; cells are formatted on demand."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+
+    def set_entries(self, entries):
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def entry(self, row):
+        return self._entries[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(SEARCH_COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return SEARCH_COLUMNS[index.column()][1](self._entries[index.row()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return SEARCH_COLUMNS[section][0]
+        return None
@@ -0,0 +1,82 @@
+# semantic_dedup.py
+import hashlib
+from near_dedup import IGNORED_KEYS, check_tree
+
+# Markers written between the tokens of the canonical form.
+_OPEN_MAP, _CLOSE_MAP, _OPEN_LIST, _CLOSE_LIST = b"{", b"}", b"[", b"]"
+
+
+def _scalar_token(value):
+    if value is None:
+        text = "null"
+    elif isinstance(value, bool):
+        text = "true" if value else "false"
+    elif isinstance(value, str):
+        # Quoting, folding and chomping styles only change surrounding whitespace and line endings.
+        text = value.replace("\r\n", "\n").strip()
+    else:
+        # Numbers compare by value, so 200 and "200" (as Nuclei reads them) collide.
+        text = str(value)
+    data = text.encode("utf-8")
+    return b"s%d:" % len(data) + data
+
+
+def canonical_tokens(data):
+    """
+    Yields the canonical form of a template as a stream of byte tokens:
+    top-level 'id' and 'info' dropped, mapping keys sorted, list order kept,
+    scalars normalized and length-prefixed so token boundaries are unambiguous.
+    The walk uses an explicit stack, so nesting depth is not limited by recursion.
+    Raises ValueError for data that near_dedup.check_tree rejects (recursive
+    aliases, alias fan-out), whose canonical form would be infinite or huge.
+    """
+    check_tree(data)
+    stack = [{key: value for key, value in data.items() if key not in IGNORED_KEYS}]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, bytes):
+            yield item
+        elif isinstance(item, dict):
+            yield _OPEN_MAP
+            stack.append(_CLOSE_MAP)
+            for key in sorted(item, key=str, reverse=True):
+                stack.append(item[key])
+                stack.append(_scalar_token(key))
+        elif isinstance(item, list):
+            yield _OPEN_LIST
+            stack.append(_CLOSE_LIST)
+            stack.extend(reversed(item))
+        else:
+            yield _scalar_token(item)
+
+
+def semantic_digest(data):
+    """
+    Returns a hex digest of the requests/matchers of a parsed template, or None
+    when it is not a mapping or has nothing besides 'id' and 'info'.
+    """
+    if not isinstance(data, dict) or not any(key not in IGNORED_KEYS for key in data):
+        return None
+    hasher = hashlib.blake2b(digest_size=16)
+    for token in canonical_tokens(data):
+        hasher.update(token)
+    return hasher.hexdigest()
+
+
+def find_semantic_duplicates(index, check=None):
+    """
+    Returns [(raw semantic digest, file ids)] of the files of a
+    dedup_index.DedupIndex that share a semantic digest. Groups made only of
+    byte-identical files are left out, since they are already reported as exact
+    duplicates, so this runs after find_exact_duplicates.
+    'check' is called before each group and may raise to stop early.
+    """
+    results = []
+    for digest, file_ids in index.semantic.groups():
+        if check is not None:
+            check()
+        raw_digests = {index.digests.get(file_id) for file_id in file_ids}
+        if len(raw_digests) == 1 and None not in raw_digests:
+            continue
+        results.append((digest, file_ids))
+    return results
@@ -0,0 +1,112 @@
+# startup_timing.py
+# Cold start measurement of the GUI: "python main.py --startup-time" launches the
+# window several times with "-X importtime", each launch reports its milestones
+# and quits at its first paint, and the medians are printed with the imports that
+# were paid for before it.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+MEASURE_FLAG = "--startup-time"
+PROBE_FLAG = "--startup-probe"
+PROBE_PREFIX = "startup-probe: "
+DEFAULT_RUNS = 5
+SLOWEST_IMPORTS = 15
+
+
+class StartupProbe(QObject):
+    """
+    Installed on the main window of a probe launch: at the first paint it prints
+    the wall-clock milestones as one JSON line and quits the application.
+    """
+
+    def __init__(self, window, milestones):
+        super().__init__(window)
+        self.milestones = milestones
+        window.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and "first_paint" not in self.milestones:
+            self.milestones["first_paint"] = time.time()
+            print(PROBE_PREFIX + json.dumps(self.milestones), flush=True)
+            QTimer.singleShot(0, watched.close)
+        return False
+
+
+def parse_importtime(stderr):
+    """{module: cumulative microseconds} of the top-level imports in "-X importtime" output."""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # The header line.
+        # Nested imports are indented by two spaces per level.
+        if len(name) - len(name.lstrip()) == 1:
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def probe_once(script, env):
+    """Milestones (seconds since launch) and top-level import times of one probe launch."""
+    launched = time.time()
+    completed = subprocess.run([sys.executable, "-X", "importtime", script, PROBE_FLAG],
+                               capture_output=True, text=True, env=env)
+    for line in completed.stdout.splitlines():
+        if line.startswith(PROBE_PREFIX):
+            milestones = json.loads(line[len(PROBE_PREFIX):])
+            break
+    else:
+        error = completed.stderr.strip().splitlines()
+        raise RuntimeError(error[-1] if error else f"exit code {completed.returncode}")
+    # The milestones are written in the order they were reached.
+    return ({name: value - launched for name, value in milestones.items()},
+            parse_importtime(completed.stderr))
+
+
+def measure(script, runs=DEFAULT_RUNS, offscreen=False):
+    """Median milestones and import times of 'runs' launches of the GUI 'script'."""
+    env = dict(os.environ)
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    results = [probe_once(script, env) for _ in range(runs)]
+    milestones = {name: statistics.median(result[0][name] for result in results) for name in results[0][0]}
+    modules = set().union(*(result[1] for result in results))
+    imports = {name: statistics.median(result[1].get(name, 0) for result in results) / 1e6 for name in modules}
+    return {"runs": runs, "milestones": milestones,
+            "imports": dict(sorted(imports.items(), key=lambda item: -item[1]))}
+
+
+def format_report(report, slowest=SLOWEST_IMPORTS):
+    lines = [f"Startup, median of {report['runs']} launches (seconds since launch):"]
+    for name, seconds in report["milestones"].items():
+        lines.append(f"  {name.replace('_', ' '):<16} {seconds:8.3f} s")
+    lines.append("Slowest top-level imports before the first paint (cumulative):")
+    for name, seconds in list(report["imports"].items())[:slowest]:
+        lines.append(f"  {name:<32} {seconds * 1000:8.1f} ms")
+    return lines
+
+
+def main(script, argv):
+    parser = argparse.ArgumentParser(prog=f"{os.path.basename(script)} {MEASURE_FLAG}",
+                                     description="Measures the cold start of the GUI")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="launches to take the median of")
+    parser.add_argument("--offscreen", action="store_true", help="use Qt's offscreen platform (no display)")
+    parser.add_argument("--json", metavar="FILE", help="also save the report as JSON, e.g. to compare runs")
+    args = parser.parse_args(argv)
+    try:
+        report = measure(script, max(1, args.runs), args.offscreen)
+    except RuntimeError as e:
+        print(f"Startup probe failed: {e}", file=sys.stderr)
+        return 1
+    print("\n".join(format_report(report)))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
@@ -0,0 +1,208 @@
+# template_analysis.py
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from archive_source import read_file
+from exact_dedup import new_hasher
+from near_dedup import content_tokens, minhash_signature
+from semantic_dedup import semantic_digest
+from template_metadata import load_full, load_header
+
+# Severity spellings found in templates -> the canonical severity (also the classification folder).
+SEVERITY_TO_FOLDER_MAP = {
+    "critical": "critical", "high": "high", "medium": "medium",
+    "low": "low", "info": "info", "informative": "info",
+    "informational": "info", "unknown": "unknown"
+}
+
+
+class TemplateRecord:
+    """
+    Compact per-file result shared by classification and deduplication.
+    'size' is None when the file could not be read; 'digest' is only set when
+    a content hash was requested (its algorithm is kept in 'hash_algo');
+    'error' holds the read or parse failure message, if any.
+    'signature' and 'semantic_digest' are only computed by a deep analysis,
+    'diagnostics' (template_validation.Diagnostic list) only when linting.
+    'timing' is (start, read seconds, parse seconds, pid) of a fresh analysis,
+    None for a record served from the cache.
+    """
+    __slots__ = ("path", "size", "digest", "hash_algo", "template_id", "severity", "tags", "error",
+                 "signature", "semantic_digest", "diagnostics", "timing")
+
+    def __init__(self, path, size=None, digest=None, hash_algo=None, template_id=None, severity=None,
+                 tags=(), error=None):
+        self.path = path
+        self.size = size
+        self.digest = digest
+        self.hash_algo = hash_algo
+        self.template_id = template_id
+        self.severity = severity
+        self.tags = tags
+        self.error = error
+        self.signature = None
+        self.semantic_digest = None
+        self.diagnostics = None
+        self.timing = None
+
+    def __repr__(self):
+        return (f"TemplateRecord(path={self.path!r}, template_id={self.template_id!r}, "
+                f"severity={self.severity!r}, digest={self.digest!r})")
+
+
+def _split_tags(value):
+    if isinstance(value, str):
+        return tuple(tag.strip() for tag in value.split(",") if tag.strip())
+    if isinstance(value, list):
+        return tuple(str(tag).strip() for tag in value if tag is not None and str(tag).strip())
+    return ()
+
+
+def extract_fields(data):
+    """
+    Returns (template_id, severity, tags) from a parsed template.
+    'severity' is looked up first, then 'risk', and is always lower-cased.
+    """
+    template_id, severity, tags = None, None, ()
+    if not isinstance(data, dict):
+        return template_id, severity, tags
+    value = data.get('id')
+    if value and isinstance(value, str):
+        template_id = value
+    info_block = data.get('info')
+    if isinstance(info_block, dict):
+        for key in ('severity', 'risk'):
+            value = info_block.get(key)
+            if value and isinstance(value, str):
+                severity = value.lower()
+                break
+        tags = _split_tags(info_block.get('tags'))
+    return template_id, severity, tags
+
+
+def analyze_template(file_path, hash_algo=None, deep=False, lint=None):
+    """
+    Reads a template (a file or an archive member) once and extracts its header in one pass.
+    When 'hash_algo' is given the same buffer is hashed as well.
+    'deep' parses the whole template instead of the header and, from that same
+    tree, computes its semantic digest and near-duplicate signature.
+    'lint' (a template_validation.LintConfig) runs its rules on the parse that
+    also provides the fields, so linting does not read or parse a file twice.
+    """
+    path = str(file_path)
+    start = time.perf_counter()
+    try:
+        raw = read_file(path)
+    except Exception as e:
+        record = TemplateRecord(path, error=str(e))
+        record.timing = (start, time.perf_counter() - start, 0.0, os.getpid())
+        return record
+
+    read_done = time.perf_counter()
+    record = TemplateRecord(path, size=len(raw))
+    if hash_algo:
+        hasher = new_hasher(hash_algo, len(raw))
+        hasher.update(raw)
+        record.digest, record.hash_algo = hasher.hexdigest(), hash_algo
+    try:
+        text = raw.decode('utf-8')
+        if lint is not None:
+            data, record.diagnostics, record.error = lint.run(text)
+        else:
+            data = load_full(text) if deep else load_header(text)
+        record.template_id, record.severity, record.tags = extract_fields(data)
+        if deep:
+            record.semantic_digest = semantic_digest(data)
+            record.signature = minhash_signature(content_tokens(data))
+    except Exception as e:
+        record.error = str(e)
+    record.timing = (start, read_done - start, time.perf_counter() - read_done, os.getpid())
+    return record
+
+
+def _analyze_chunk(paths, hash_algo, deep, lint):
+    return [analyze_template(path, hash_algo, deep, lint) for path in paths]
+
+
+def _chunks(items, size):
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _drain(batch, hash_algo, deep, lint, cache):
+    entries, misses, pending = batch
+    if pending is None:
+        fresh = (analyze_template(path, hash_algo, deep, lint) for path in misses)
+    else:
+        fresh = iter(pending.result())
+    for path, stat, cached in entries:
+        if cached is not None:
+            yield cached
+            continue
+        record = next(fresh)
+        if cache is not None and stat is not None:
+            cache.store(record, stat)
+        yield record
+
+
+def analyze_templates(paths, jobs=1, chunk_size=64, hash_algo=None, cache=None, deep=False, lint=None,
+                      pool=None, check=None):
+    """
+    Yields a TemplateRecord for every path, in input order.
+    'paths' may be any iterable, including a generator that is still walking a
+    directory tree: paths are consumed in chunks, so analysis overlaps discovery.
+    With jobs > 1 each chunk becomes one process pool task, which keeps pickling
+    overhead low compared to one task per file, and only a bounded number of
+    chunks is in flight at a time.
+    When a MetadataCache is given, unchanged files are served from it without
+    being read, and freshly analyzed files are stored back into it. Content
+    signatures and lint results are not cached, so a 'deep' or 'lint' run reads
+    every file.
+    'pool' is a ProcessPoolExecutor shared with other runs, used instead of
+    starting one and left running. 'check' is called before each chunk and may
+    raise to stop the run (e.g. when it is cancelled); chunks still waiting in
+    the pool are then cancelled.
+    """
+    own_pool = None
+    in_flight = deque()
+    try:
+        for chunk in _chunks(paths, chunk_size):
+            if check is not None:
+                check()
+            entries, misses = [], []
+            for path in chunk:
+                path = str(path)
+                stat = _stat(path) if cache is not None else None
+                cached = cache.lookup(path, stat) if stat is not None and not deep and lint is None else None
+                entries.append((path, stat, cached))
+                if cached is None:
+                    misses.append(path)
+
+            pending = None
+            # A lone short chunk is cheaper to analyze here than to start a pool for.
+            if misses and jobs > 1 and (pool is not None or len(chunk) == chunk_size):
+                if pool is None:
+                    pool = own_pool = ProcessPoolExecutor(max_workers=jobs)
+                pending = pool.submit(_analyze_chunk, misses, hash_algo, deep, lint)
+            in_flight.append((entries, misses, pending))
+
+            while len(in_flight) > (jobs * 2 if pool is not None else 0):
+                yield from _drain(in_flight.popleft(), hash_algo, deep, lint, cache)
+        while in_flight:
+            yield from _drain(in_flight.popleft(), hash_algo, deep, lint, cache)
+    finally:
+        if own_pool is not None:
+            own_pool.shutdown(cancel_futures=True)
+        for _, _, pending in in_flight:
+            if pending is not None:
+                pending.cancel()
@@ -0,0 +1,356 @@
+# template_index.py
+import os
+import re
+import sqlite3
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from app_paths import DEFAULT_INDEX_PATH
+from discovery import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, walk_templates
+from template_analysis import SEVERITY_TO_FOLDER_MAP, _split_tags, extract_fields
+from template_metadata import load_outline
+
+SCHEMA_VERSION = 1
+
+# Top-level template sections and the protocol they are indexed under.
+PROTOCOL_KEYS = {
+    "http": "http", "requests": "http", "dns": "dns", "file": "file", "network": "network",
+    "tcp": "network", "headless": "headless", "ssl": "ssl", "websocket": "websocket",
+    "whois": "whois", "code": "code", "javascript": "javascript", "workflows": "workflow",
+}
+# Query fields answered from inverted lists, and the aliases accepted for them.
+LIST_FIELDS = ("severity", "tag", "author", "protocol", "cve")
+TEXT_FIELDS = ("id", "name", "path")
+FIELD_ALIASES = {"tags": "tag", "authors": "author", "sev": "severity", "proto": "protocol",
+                 "type": "protocol", "file": "path"}
+_CVE = re.compile(r"CVE-\d{4}-\d{4,}", re.IGNORECASE)
+_SEPARATOR = "\x1f"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    template_id TEXT,
+    name TEXT,
+    severity TEXT,
+    authors TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    protocols TEXT NOT NULL,
+    cves TEXT NOT NULL
+)
+"""
+
+
+class IndexEntry:
+    """Searchable metadata of one template file."""
+    __slots__ = ("path", "size", "mtime_ns", "template_id", "name", "severity", "authors", "tags",
+                 "protocols", "cves")
+
+    def __init__(self, path, size, mtime_ns, template_id=None, name=None, severity=None, authors=(),
+                 tags=(), protocols=(), cves=()):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.template_id = template_id
+        self.name = name
+        self.severity = severity
+        self.authors = authors
+        self.tags = tags
+        self.protocols = protocols
+        self.cves = cves
+
+    def values(self, field):
+        """
+        Returns the lower-cased values of a list field, as used by the inverted
+        lists. Severity spellings are merged like the classifier does (e.g.
+        "informational" is "info").
+        """
+        if field == "severity":
+            return (_canonical_severity(self.severity),) if self.severity else ()
+        if field == "tag":
+            return tuple(tag.lower() for tag in self.tags)
+        if field == "author":
+            return tuple(author.lower() for author in self.authors)
+        if field == "protocol":
+            return self.protocols
+        return tuple(cve.lower() for cve in self.cves)
+
+    def as_dict(self):
+        return {"path": self.path, "id": self.template_id, "name": self.name, "severity": self.severity,
+                "authors": list(self.authors), "tags": list(self.tags), "protocols": list(self.protocols),
+                "cves": list(self.cves)}
+
+    def _row(self):
+        return (self.path, self.size, self.mtime_ns, self.template_id, self.name, self.severity,
+                _SEPARATOR.join(self.authors), _SEPARATOR.join(self.tags),
+                _SEPARATOR.join(self.protocols), _SEPARATOR.join(self.cves))
+
+
+def _canonical_severity(value):
+    return SEVERITY_TO_FOLDER_MAP.get(value, value)
+
+
+def _split_row(value):
+    return tuple(value.split(_SEPARATOR)) if value else ()
+
+
+def index_entry(path, size=None, mtime_ns=None):
+    """
+    Reads one template and returns its IndexEntry; unparsable files get an entry
+    without metadata. 'size' and 'mtime_ns' come from os.stat when not given.
+    """
+    if size is None or mtime_ns is None:
+        stat = os.stat(path)
+        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+    entry = IndexEntry(path, size, mtime_ns)
+    try:
+        with open(path, 'rb') as f:
+            data, keys = load_outline(f.read().decode('utf-8'))
+    except Exception:
+        return entry
+    entry.template_id, entry.severity, entry.tags = extract_fields(data)
+    info = data.get("info") if isinstance(data, dict) else None
+    if isinstance(info, dict):
+        if isinstance(info.get("name"), str):
+            entry.name = info["name"]
+        entry.authors = _split_tags(info.get("author"))
+        classification = info.get("classification")
+        cve_field = classification.get("cve-id") if isinstance(classification, dict) else None
+    else:
+        cve_field = None
+    entry.protocols = tuple(dict.fromkeys(PROTOCOL_KEYS[key] for key in keys if key in PROTOCOL_KEYS))
+    text = " ".join(str(value) for value in (entry.template_id, entry.name, cve_field) if value)
+    entry.cves = tuple(dict.fromkeys(cve.upper() for cve in _CVE.findall(text)))
+    return entry
+
+
+def _index_chunk(items):
+    return [index_entry(path, size, mtime_ns) for path, size, mtime_ns in items]
+
+
+def parse_query(text):
+    """
+    Parses a query such as 'severity:critical tag:rce,sqli protocol:http -tag:dos log4j'
+    into a list of (field, values, negated). Terms are AND-ed, comma-separated values
+    are OR-ed, a trailing '*' matches a prefix and bare words search id, name and path.
+    Severities are matched by their canonical spelling, so 'severity:info' also
+    finds "informational" templates. Raises ValueError for an unknown field.
+    """
+    terms = []
+    for word in text.split():
+        negated = word.startswith("-") and len(word) > 1
+        if negated:
+            word = word[1:]
+        field, colon, value = word.partition(":")
+        if not colon:
+            field, value = "text", word
+        field = FIELD_ALIASES.get(field.lower(), field.lower())
+        if field not in LIST_FIELDS and field not in TEXT_FIELDS and field != "text":
+            raise ValueError(f"Unknown search field '{field}' (use one of: "
+                             f"{', '.join(LIST_FIELDS + TEXT_FIELDS)})")
+        values = tuple(v for v in value.lower().split(",") if v)
+        if field == "severity":
+            values = tuple(_canonical_severity(v) for v in values)
+        if values:
+            terms.append((field, values, negated))
+    return terms
+
+
+class TemplateIndex:
+    """
+    Persistent, incrementally refreshed index of template metadata.
+    Entries live in SQLite keyed by path with their (size, mtime_ns); refresh()
+    only re-reads files whose size or modification time changed. Queries run
+    against in-memory inverted lists (severity, tags, authors, protocols, CVEs),
+    so they never touch the disk.
+    """
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS entries")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.execute(_SCHEMA)
+        self.reload()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def close(self):
+        self.conn.close()
+
+    def reload(self):
+        """Rebuilds the in-memory lists from the database, e.g. after another process refreshed it."""
+        self._entries = {}
+        self._postings = {field: defaultdict(set) for field in LIST_FIELDS}
+        # Lower-cased id, name, path and all three joined, for substring terms.
+        self._text = {}
+        self._sorted = None
+        for row in self.conn.execute("SELECT path, size, mtime_ns, template_id, name, severity, authors, "
+                                     "tags, protocols, cves FROM entries"):
+            entry = IndexEntry(*row[:6], *(_split_row(value) for value in row[6:]))
+            self._add(entry)
+
+    def _add(self, entry):
+        self._entries[entry.path] = entry
+        fields = tuple((value or "").lower() for value in (entry.template_id, entry.name, entry.path))
+        self._text[entry.path] = fields + ("\n".join(fields),)
+        for field, postings in self._postings.items():
+            for value in entry.values(field):
+                postings[value].add(entry.path)
+        self._sorted = None
+
+    def _remove(self, path):
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        del self._text[path]
+        for field, postings in self._postings.items():
+            for value in entry.values(field):
+                paths = postings[value]
+                paths.discard(path)
+                if not paths:
+                    del postings[value]
+        self._sorted = None
+
+    def refresh(self, roots, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE, jobs=1, on_progress=None,
+                pool=None, check=None):
+        """
+        Brings the entries under 'roots' up to date: new or modified files are
+        (re)indexed, files that disappeared are dropped, unchanged files are only
+        stat'ed. 'on_progress(done, total)' is called while files are indexed.
+        With jobs > 1 the changed files are read in chunks on 'pool', a shared
+        ProcessPoolExecutor, or on one started for this refresh; at most
+        2 * jobs chunks are in flight. 'check' is called before each chunk is
+        started; when it or 'on_progress' raises, the index is left unchanged
+        and chunks still waiting in the pool are cancelled.
+        Returns {"total", "indexed", "removed"}.
+        """
+        seen = set()
+        changed = []
+        for root in roots:
+            for path in walk_templates(root, include, exclude):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                entry = self._entries.get(path)
+                if entry is None or entry.size != stat.st_size or entry.mtime_ns != stat.st_mtime_ns:
+                    changed.append((path, stat.st_size, stat.st_mtime_ns))
+
+        prefixes = tuple(os.path.join(os.path.abspath(root), "") for root in roots)
+        removed = [path for path in self._entries if path.startswith(prefixes) and path not in seen]
+
+        fresh = []
+        chunks = [changed[i:i + 256] for i in range(0, len(changed), 256)]
+        parallel = jobs > 1 and (pool is not None or len(chunks) > 1)
+        own_pool = None
+        in_flight = deque()
+        try:
+            for chunk in chunks:
+                if check is not None:
+                    check()
+                if parallel:
+                    if pool is None:
+                        pool = own_pool = ProcessPoolExecutor(max_workers=jobs)
+                    in_flight.append(pool.submit(_index_chunk, chunk))
+                else:
+                    in_flight.append(chunk)
+                while len(in_flight) > (jobs * 2 if parallel else 0):
+                    self._collect(in_flight.popleft(), fresh, len(changed), on_progress)
+            while in_flight:
+                self._collect(in_flight.popleft(), fresh, len(changed), on_progress)
+        finally:
+            for pending in in_flight:
+                if not isinstance(pending, list):
+                    pending.cancel()
+            if own_pool is not None:
+                own_pool.shutdown(cancel_futures=True)
+
+        with self.conn:
+            self.conn.executemany("DELETE FROM entries WHERE path = ?", [(path,) for path in removed])
+            self.conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                  [entry._row() for entry in fresh])
+        for path in removed:
+            self._remove(path)
+        for entry in fresh:
+            self._remove(entry.path)
+            self._add(entry)
+        return {"total": len(seen), "indexed": len(fresh), "removed": len(removed)}
+
+    @staticmethod
+    def _collect(pending, fresh, total, on_progress):
+        """Adds the entries of a chunk (a future, or the chunk itself when indexing in this process)."""
+        fresh.extend(_index_chunk(pending) if isinstance(pending, list) else pending.result())
+        if on_progress:
+            on_progress(len(fresh), total)
+
+    def _lookup(self, field, values):
+        postings = self._postings[field]
+        paths = set()
+        for value in values:
+            if value.endswith("*"):
+                prefix = value[:-1]
+                for key, matched in postings.items():
+                    if key.startswith(prefix):
+                        paths |= matched
+            else:
+                paths |= postings.get(value, set())
+        return paths
+
+    def _filter_text(self, entries, field, values, negated):
+        column = TEXT_FIELDS.index(field) if field in TEXT_FIELDS else 3
+        text = self._text
+        values = [value.rstrip("*") for value in values]
+        if len(values) == 1:
+            value = values[0]
+            return [e for e in entries if (value in text[e.path][column]) != negated]
+        return [e for e in entries if any(value in text[e.path][column] for value in values) != negated]
+
+    def _in_path_order(self, paths):
+        if self._sorted is None:
+            self._sorted = sorted(self._entries.values(), key=lambda e: e.path)
+        if paths is self._entries:
+            return list(self._sorted)
+        # Filtering the presorted list beats sorting once a sizable share matches.
+        if len(paths) * 8 > len(self._sorted):
+            return [entry for entry in self._sorted if entry.path in paths]
+        return [self._entries[path] for path in sorted(paths)]
+
+    def query(self, text, limit=None):
+        """Returns the entries matching a query (see parse_query), ordered by path."""
+        terms = parse_query(text)
+        included = [self._lookup(f, v) for f, v, neg in terms if f in LIST_FIELDS and not neg]
+        excluded = [self._lookup(f, v) for f, v, neg in terms if f in LIST_FIELDS and neg]
+        text_terms = [(f, v, neg) for f, v, neg in terms if f not in LIST_FIELDS]
+
+        if included:
+            included.sort(key=len)
+            candidates = included[0].intersection(*included[1:])
+            for paths in excluded:
+                candidates -= paths
+            entries = self._in_path_order(candidates)
+        else:
+            entries = self._in_path_order(self._entries.keys() - set().union(*excluded)) if excluded \
+                else self._in_path_order(self._entries)
+        for field, values, negated in text_terms:
+            entries = self._filter_text(entries, field, values, negated)
+        if limit is not None:
+            entries = entries[:limit]
+        return entries
+
+    def facets(self, field):
+        """Returns {value: number of templates} for a list field, e.g. to list known tags."""
+        return {value: len(paths) for value, paths in self._postings[field].items()}
@@ -0,0 +1,192 @@
+# template_metadata.py
+import yaml
+from yaml.events import (DocumentEndEvent, DocumentStartEvent, MappingEndEvent,
+                         MappingStartEvent, ScalarEvent, SequenceEndEvent, SequenceStartEvent,
+                         StreamEndEvent, StreamStartEvent)
+
+try:
+    from yaml import CSafeLoader as HeaderLoader
+except ImportError:
+    from yaml import SafeLoader as HeaderLoader
+
+HEADER_KEYS = ("id", "info")
+STR_TAG = "tag:yaml.org,2002:str"
+MAP_TAG = "tag:yaml.org,2002:map"
+SEQ_TAG = "tag:yaml.org,2002:seq"
+# Resolved tags of plain scalars whose construction cannot fail.
+_SAFE_SCALAR_TAGS = (STR_TAG, "tag:yaml.org,2002:null", "tag:yaml.org,2002:bool")
+_NON_STR_STARTS = frozenset("0123456789+-.=<")
+_NEXT_ROLE = {"key": "value", "value": "key", "item": "item"}
+
+
+class _Undecided(Exception):
+    """Raised when the event stream needs the full loader to be interpreted correctly."""
+
+
+def _scalar(loader, event):
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+    node = yaml.ScalarNode(tag, event.value, style=event.style)
+    return loader.construct_object(node)
+
+
+def _check_collection_tag(event, default_tag):
+    if event.tag not in (None, "!", default_tag):
+        raise _Undecided()
+
+
+def _read_value(loader):
+    """Builds the Python value of the next node from its events."""
+    event = loader.get_event()
+    if isinstance(event, ScalarEvent):
+        return _scalar(loader, event)
+    if isinstance(event, SequenceStartEvent):
+        _check_collection_tag(event, SEQ_TAG)
+        items = []
+        while not loader.check_event(SequenceEndEvent):
+            items.append(_read_value(loader))
+        loader.get_event()
+        return items
+    if isinstance(event, MappingStartEvent):
+        _check_collection_tag(event, MAP_TAG)
+        mapping = {}
+        while not loader.check_event(MappingEndEvent):
+            key = _read_value(loader)
+            if key == "<<" or isinstance(key, (list, dict)):
+                raise _Undecided()
+            mapping[key] = _read_value(loader)
+        loader.get_event()
+        return mapping
+    # Aliases (and anything unexpected) are left to the full loader.
+    raise _Undecided()
+
+
+def _check_scalar(loader, event):
+    """
+    Raises where constructing a skipped scalar could fail or need the full
+    loader: explicit tags are left to it, and plain scalars that do not resolve
+    to a string, null or bool (ints, floats, timestamps, ...) are constructed
+    like the full parse would, so an invalid one raises here too.
+    """
+    if event.tag not in (None, "!"):
+        raise _Undecided()
+    # Only these first characters resolve to something else than a string, null or bool.
+    if event.implicit[0] and event.value[:1] in _NON_STR_STARTS:
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag not in _SAFE_SCALAR_TAGS:
+            _scalar(loader, event)
+
+
+def _skip_value(loader):
+    """
+    Consumes the events of the next node without constructing its collections.
+    Anything the full parse could reject or read differently (tags, aliases,
+    collection or merge keys, invalid scalars) raises instead of being skipped.
+    """
+    # Per open collection: "key" or "value" for a mapping (the next node's role), "item" for a sequence.
+    stack = []
+    while True:
+        event = loader.get_event()
+        is_key = bool(stack) and stack[-1] == "key"
+        if isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+            stack.pop()
+        elif isinstance(event, ScalarEvent):
+            if is_key and event.value == "<<" and event.implicit[0]:
+                raise _Undecided()
+            _check_scalar(loader, event)
+            if stack:
+                stack[-1] = _NEXT_ROLE[stack[-1]]
+        elif isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+            # A collection as a mapping key is unhashable for the full loader.
+            if is_key:
+                raise _Undecided()
+            mapping = isinstance(event, MappingStartEvent)
+            _check_collection_tag(event, MAP_TAG if mapping else SEQ_TAG)
+            if stack:
+                stack[-1] = _NEXT_ROLE[stack[-1]]
+            stack.append("key" if mapping else "item")
+            continue
+        else:
+            # Aliases (e.g. to an undefined anchor) and anything unexpected.
+            raise _Undecided()
+        if not stack:
+            return
+
+
+def _read_header(stream, outline=False):
+    """
+    Reads 'id' and 'info' from the event stream. The rest of the top-level
+    mapping is still scanned, without constructing its values, so that a key
+    repeated further down is seen. With 'outline', (header, top-level keys) is returned.
+    """
+    loader = HeaderLoader(stream)
+    try:
+        if not isinstance(loader.get_event(), StreamStartEvent):
+            raise _Undecided()
+        if not isinstance(loader.get_event(), DocumentStartEvent):
+            raise _Undecided()
+        event = loader.get_event()
+        if not isinstance(event, MappingStartEvent):
+            raise _Undecided()
+        _check_collection_tag(event, MAP_TAG)
+
+        header = {}
+        keys = []
+        while not loader.check_event(MappingEndEvent):
+            event = loader.get_event()
+            if not isinstance(event, ScalarEvent):
+                raise _Undecided()
+            key = _scalar(loader, event)
+            if key == "<<" or (outline and key in keys):
+                raise _Undecided()
+            keys.append(key)
+            if key in HEADER_KEYS:
+                # A repeated key would be overridden by the full loader.
+                if key in header:
+                    raise _Undecided()
+                header[key] = _read_value(loader)
+            else:
+                _skip_value(loader)
+
+        # Only trust the answer for a single-document stream.
+        loader.get_event()
+        if not isinstance(loader.get_event(), DocumentEndEvent):
+            raise _Undecided()
+        if not isinstance(loader.get_event(), StreamEndEvent):
+            raise _Undecided()
+        return (header, tuple(keys)) if outline else header
+    finally:
+        loader.dispose()
+
+
+def load_header(text):
+    """
+    Returns the top-level 'id' and 'info' of a template without constructing the rest
+    of it: the other values are only scanned, so repeated keys, further documents and
+    syntax errors anywhere in the file are still noticed. Anything the event reader
+    cannot decide on its own (aliases, merge keys, custom tags, repeated keys, parse
+    errors) falls back to a full yaml.safe_load, whose result or exception is returned as-is.
+    """
+    try:
+        return _read_header(text)
+    except Exception:
+        return yaml.safe_load(text)
+
+
+def load_outline(text):
+    """
+    Returns (data, top-level keys): 'data' holds 'id' and 'info' like load_header,
+    and the keys tell which protocol sections a template has. Values of the other
+    keys are skipped, not constructed. Falls back to yaml.safe_load like load_header.
+    """
+    try:
+        return _read_header(text, outline=True)
+    except Exception:
+        data = yaml.safe_load(text)
+        return data, tuple(data) if isinstance(data, dict) else ()
+
+
+def load_full(text):
+    """Parses a whole template, with the C loader when libyaml is available."""
+    return yaml.load(text, Loader=HeaderLoader)
@@ -0,0 +1,491 @@
+# template_validation.py
+import importlib.util
+import re
+import warnings
+from collections import Counter, namedtuple
+from functools import lru_cache
+from pathlib import Path
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+from template_analysis import SEVERITY_TO_FOLDER_MAP
+from template_index import PROTOCOL_KEYS
+
+try:
+    from yaml.cyaml import CParser as _EventSource
+except ImportError:
+    from yaml.parser import Parser
+    from yaml.reader import Reader
+    from yaml.scanner import Scanner
+
+    class _EventSource(Reader, Scanner, Parser):
+        def __init__(self, stream):
+            Reader.__init__(self, stream)
+            Scanner.__init__(self)
+            Parser.__init__(self)
+
+ERROR = "error"
+WARNING = "warning"
+SYNTAX_RULE = "yaml-syntax"
+
+# Top-level keys that are not protocol sections.
+TEMPLATE_KEYS = {"id", "info", "variables", "constants", "flow", "self-contained", "stop-at-first-match",
+                 "signature", "workflows"}
+# Nuclei's own rule for template ids.
+TEMPLATE_ID = re.compile(r"^([a-zA-Z0-9]+[-_])*[a-zA-Z0-9]+$")
+SEVERITIES = ("info", "low", "medium", "high", "critical", "unknown")
+# type -> key holding the values of that matcher / extractor type.
+MATCHER_TYPES = {"word": "words", "regex": "regex", "binary": "binary", "status": "status",
+                 "size": "size", "dsl": "dsl", "xpath": "xpath"}
+EXTRACTOR_TYPES = {"regex": "regex", "kval": "kval", "xpath": "xpath", "json": "json", "dsl": "dsl"}
+CONDITIONS = ("and", "or")
+CANCEL_CHECK_NODES = 1000
+
+
+class Diagnostic:
+    """One problem found in a template; 'line' and 'column' are 1-based, 'rule' names the check."""
+    __slots__ = ("line", "column", "severity", "message", "rule")
+
+    def __init__(self, line, column, severity, message, rule):
+        self.line = line
+        self.column = column
+        self.severity = severity
+        self.message = message
+        self.rule = rule
+
+    def __repr__(self):
+        return f"Diagnostic({self.line}:{self.column} {self.severity} [{self.rule}]: {self.message})"
+
+    def as_dict(self):
+        return {"line": self.line, "column": self.column, "severity": self.severity,
+                "rule": self.rule, "message": self.message}
+
+
+class ValidationCancelled(Exception):
+    """Raised inside validate() when 'cancelled()' turns true."""
+
+
+class Rule:
+    """A lint check: 'check(template)' yields (node, message) for each problem in a ParsedTemplate."""
+    __slots__ = ("rule_id", "severity", "description", "check")
+
+    def __init__(self, rule_id, severity, description, check):
+        self.rule_id = rule_id
+        self.severity = severity
+        self.description = description
+        self.check = check
+
+
+# Every known rule by id, built-in ones first. Rule modules add theirs with @lint_rule.
+# The first two have no check function: parse_template() and check_tree() report them.
+RULES = {SYNTAX_RULE: Rule(SYNTAX_RULE, ERROR, "The file is a single valid YAML document", None),
+         "template-root": Rule("template-root", ERROR, "A template is a mapping of top-level keys", None)}
+
+
+def lint_rule(rule_id, severity, description):
+    """Registers the decorated function as a Rule (replacing a rule with the same id)."""
+    def register(check):
+        RULES[rule_id] = Rule(rule_id, severity, description, check)
+        return check
+    return register
+
+
+def load_rule_module(path):
+    """Imports a Python file so that its @lint_rule functions get registered."""
+    path = Path(path).resolve()
+    spec = importlib.util.spec_from_file_location(f"nuclei_lint_rules_{path.stem}", path)
+    if spec is None:
+        raise ImportError(f"Cannot load rule module {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class LintConfig(namedtuple("LintConfig", "modules enabled disabled", defaults=((), None, ()))):
+    """
+    Picklable selection of rules, so process pool workers can rebuild it:
+    'modules' are Python files with extra @lint_rule functions, 'enabled'
+    limits the run to these rule ids (None: all), 'disabled' removes rule ids.
+    """
+    __slots__ = ()
+
+    def rules(self):
+        return select_rules(self)
+
+    def run(self, text):
+        """
+        Parses 'text' once and lints it. Returns (data, diagnostics, error):
+        the constructed template (for the caller's own fields and digests),
+        the Diagnostics, and the syntax error message or None.
+        """
+        rules = self.rules()
+        root, data, error = parse_template(text, construct=True)
+        if error is not None:
+            return None, [error] if RULES[SYNTAX_RULE] in rules else [], error.message
+        return data, check_tree(text, root, rules) if root is not None else [], None
+
+
+@lru_cache(maxsize=8)
+def select_rules(config=LintConfig()):
+    """The Rules of a LintConfig, in registration order; loads its modules once per process."""
+    for path in config.modules:
+        load_rule_module(path)
+    unknown = [rule_id for rule_id in (config.enabled or ()) + tuple(config.disabled) if rule_id not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown lint rule(s): {', '.join(unknown)}")
+    return tuple(rule for rule_id, rule in RULES.items()
+                 if (config.enabled is None or rule_id in config.enabled) and rule_id not in config.disabled)
+
+
+class _NodeLoader(Composer, _EventSource, SafeConstructor, Resolver):
+    """
+    Builds the node tree (which keeps line numbers) from libyaml events, in
+    Python so that 'cancelled()' can be checked every CANCEL_CHECK_NODES nodes;
+    yaml.compose() with the C loader cannot be interrupted.
+    """
+
+    def __init__(self, stream, cancelled):
+        _EventSource.__init__(self, stream)
+        Composer.__init__(self)
+        SafeConstructor.__init__(self)
+        Resolver.__init__(self)
+        self.cancelled = cancelled
+        self.nodes = 0
+
+    def compose_node(self, parent, index):
+        self.nodes += 1
+        if not self.nodes % CANCEL_CHECK_NODES and self.cancelled():
+            raise ValidationCancelled()
+        return Composer.compose_node(self, parent, index)
+
+
+def items(node):
+    """(key, key node, value node) of a mapping node, keys as strings."""
+    return [(str(key.value) if isinstance(key, yaml.ScalarNode) else None, key, value)
+            for key, value in node.value]
+
+
+def get(node, key):
+    """The value node of 'key' in a mapping node, or None."""
+    if isinstance(node, yaml.MappingNode):
+        for name, _key_node, value in items(node):
+            if name == key:
+                return value
+    return None
+
+
+def scalar(node):
+    return node.value if isinstance(node, yaml.ScalarNode) else None
+
+
+def scalars(node):
+    """(node, value) of a node that is a scalar or a list of scalars."""
+    if isinstance(node, yaml.SequenceNode):
+        return [(item, item.value) for item in node.value if isinstance(item, yaml.ScalarNode)]
+    if isinstance(node, yaml.ScalarNode):
+        return [(node, node.value)]
+    return []
+
+
+class ParsedTemplate:
+    """What a rule sees: the template's text, its root node and its top-level keys."""
+
+    def __init__(self, text, root, cancelled=lambda: False):
+        self.text = text
+        self.root = root
+        self.cancelled = cancelled
+        self.keys = {name: (key_node, value) for name, key_node, value in items(root)}
+
+    def value(self, name):
+        return self.keys[name][1] if name in self.keys else None
+
+    def requests(self):
+        """(section name, request node) of every protocol request that is a mapping."""
+        for name, (_key_node, section) in self.keys.items():
+            if name not in PROTOCOL_KEYS or name == "workflows" or not isinstance(section, yaml.SequenceNode):
+                continue
+            for request in section.value:
+                if self.cancelled():
+                    raise ValidationCancelled()
+                if isinstance(request, yaml.MappingNode):
+                    yield name, request
+
+    def operators(self, key):
+        """(request, item) for every mapping in the 'matchers' or 'extractors' list of a request."""
+        for _section, request in self.requests():
+            node = get(request, key)
+            if isinstance(node, yaml.SequenceNode):
+                for item in node.value:
+                    if isinstance(item, yaml.MappingNode):
+                        yield request, item
+
+
+@lint_rule("duplicate-key", ERROR, "Top-level keys appear only once")
+def _check_duplicate_keys(template):
+    seen = set()
+    for name, key_node, _value in items(template.root):
+        if name in seen:
+            yield key_node, f"Duplicate top-level key '{name}'"
+        seen.add(name)
+
+
+@lint_rule("required-field", ERROR, "'id', 'info.name' and 'info.severity' are present")
+def _check_required(template):
+    template_id, info = template.value("id"), template.value("info")
+    if template_id is None:
+        yield template.root, "Missing required key 'id'"
+    elif not scalar(template_id):
+        yield template_id, "'id' must be a non-empty string"
+    if info is None:
+        yield template.root, "Missing required key 'info'"
+        return
+    if not isinstance(info, yaml.MappingNode):
+        yield info, "'info' must be a mapping"
+        return
+    name = get(info, "name")
+    if name is None:
+        yield info, "Missing required key 'info.name'"
+    elif not scalar(name):
+        yield name, "'info.name' must be a non-empty string"
+    if get(info, "severity") is None:
+        yield info, "Missing required key 'info.severity'"
+
+
+@lint_rule("template-id", WARNING, "'id' only uses letters, digits, '-' and '_'")
+def _check_id(template):
+    template_id = template.value("id")
+    if scalar(template_id) and not TEMPLATE_ID.match(template_id.value):
+        yield template_id, "'id' should only contain letters, digits, '-' and '_'"
+
+
+@lint_rule("severity", ERROR, "'info.severity' is a severity Nuclei knows")
+def _check_severity(template):
+    severity = get(template.value("info"), "severity")
+    if severity is not None and str(scalar(severity) or "").lower() not in SEVERITY_TO_FOLDER_MAP:
+        yield severity, f"'info.severity' must be one of: {', '.join(SEVERITIES)}"
+
+
+@lint_rule("severity-alias", WARNING, "'info.severity' uses the canonical spelling")
+def _check_severity_alias(template):
+    severity = get(template.value("info"), "severity")
+    value = scalar(severity)
+    if value and value not in SEVERITIES and value.lower() in SEVERITY_TO_FOLDER_MAP:
+        yield severity, f"Severity '{value}' is an alias, use '{SEVERITY_TO_FOLDER_MAP[value.lower()]}'"
+
+
+@lint_rule("deprecated-key", WARNING, "No deprecated top-level keys")
+def _check_deprecated(template):
+    if "requests" in template.keys:
+        yield template.keys["requests"][0], "'requests' is deprecated, use 'http'"
+
+
+@lint_rule("unknown-key", WARNING, "Top-level keys are known to Nuclei")
+def _check_unknown_keys(template):
+    for name, (key_node, _value) in template.keys.items():
+        if name not in PROTOCOL_KEYS and name not in TEMPLATE_KEYS:
+            yield key_node, f"Unknown top-level key '{name}'"
+
+
+@lint_rule("protocol-section", ERROR, "At least one protocol section, each a list of request mappings")
+def _check_sections(template):
+    if not any(name in PROTOCOL_KEYS for name in template.keys):
+        yield template.root, "No protocol section (http, dns, network, ...) or workflows"
+    for name, (_key_node, section) in template.keys.items():
+        if name not in PROTOCOL_KEYS or name == "workflows":
+            continue
+        if not isinstance(section, yaml.SequenceNode):
+            yield section, f"'{name}' must be a list of requests"
+            continue
+        for request in section.value:
+            if not isinstance(request, yaml.MappingNode):
+                yield request, f"Each '{name}' request must be a mapping"
+
+
+@lint_rule("request-shape", ERROR, "Matchers and extractors have a known type and its values")
+def _check_operators(template):
+    for _section, request in template.requests():
+        for key, types in (("matchers", MATCHER_TYPES), ("extractors", EXTRACTOR_TYPES)):
+            node = get(request, key)
+            if node is None:
+                continue
+            if not isinstance(node, yaml.SequenceNode):
+                yield node, f"'{key}' must be a list"
+                continue
+            kind = key[:-1]
+            for item in node.value:
+                if not isinstance(item, yaml.MappingNode):
+                    yield item, f"Each {kind} must be a mapping"
+                    continue
+                type_node = get(item, "type")
+                item_type = scalar(type_node)
+                if type_node is None:
+                    yield item, f"The {kind} has no 'type'"
+                elif item_type not in types:
+                    yield type_node, f"Unknown {kind} type '{item_type}' (expected {', '.join(types)})"
+                elif get(item, types[item_type]) is None:
+                    yield item, f"A '{item_type}' {kind} needs a '{types[item_type]}' list"
+
+
+@lint_rule("condition", ERROR, "'condition' and 'matchers-condition' are 'and' or 'or'")
+def _check_conditions(template):
+    for _section, request in template.requests():
+        condition = get(request, "matchers-condition")
+        if condition is not None and scalar(condition) not in CONDITIONS:
+            yield condition, "'matchers-condition' must be 'and' or 'or'"
+    for _request, matcher in template.operators("matchers"):
+        condition = get(matcher, "condition")
+        if condition is not None and scalar(condition) not in CONDITIONS:
+            yield condition, "'condition' must be 'and' or 'or'"
+
+
+@lint_rule("duplicate-name", WARNING, "Matcher names are unique per request, extractor names per template")
+def _check_duplicate_names(template):
+    seen = Counter()
+    for request, matcher in template.operators("matchers"):
+        name = get(matcher, "name")
+        if scalar(name):
+            seen[id(request), name.value] += 1
+            if seen[id(request), name.value] == 2:
+                yield name, f"Another matcher of this request is also named '{name.value}'"
+    for _request, extractor in template.operators("extractors"):
+        name = get(extractor, "name")
+        if scalar(name):
+            seen[name.value] += 1
+            if seen[name.value] == 2:
+                yield name, f"Another extractor is also named '{name.value}'"
+
+
+def _go_regex_problem(pattern):
+    """
+    Why Nuclei (Go's RE2 syntax) would reject 'pattern', or None. The pattern
+    is translated to Python's dialect first for the syntax RE2 has and Python
+    lacks (\\z, \\Q...\\E, \\p{...}, flags in the middle, the U flag).
+    """
+    translated, flags, i = [], "", 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped == "Q":
+                end = pattern.find("\\E", i + 2)
+                end = len(pattern) if end < 0 else end
+                translated.append(re.escape(pattern[i + 2:end]))
+                i = end + 2
+                continue
+            if escaped in "pP":
+                match = re.match(r"\{[^}]*\}|[A-Za-z]", pattern[i + 2:])
+                translated.append(".")
+                i += 2 + (len(match.group()) if match else 0)
+                continue
+            if escaped.isdigit() and escaped != "0":
+                return "backreferences are not supported by Go regular expressions"
+            translated.append("\\Z" if escaped == "z" else pattern[i:i + 2])
+            i += 2
+            continue
+        if pattern.startswith(("(?=", "(?!", "(?<=", "(?<!"), i):
+            return "lookaround assertions are not supported by Go regular expressions"
+        flag_group = re.match(r"\(\?([imsU]+)\)", pattern[i:])
+        if flag_group:
+            flags += flag_group.group(1).replace("U", "")
+            i += flag_group.end()
+            continue
+        translated.append(char)
+        i += 1
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            re.compile((f"(?{''.join(sorted(set(flags)))})" if flags else "") + "".join(translated))
+    except re.error as e:
+        return str(e)
+    return None
+
+
+@lint_rule("invalid-regex", ERROR, "Regexes of matchers and extractors compile")
+def _check_regexes(template):
+    for key in ("matchers", "extractors"):
+        for _request, item in template.operators(key):
+            if scalar(get(item, "type")) != "regex":
+                continue
+            for node, pattern in scalars(get(item, "regex")):
+                problem = _go_regex_problem(pattern)
+                if problem:
+                    yield node, f"Invalid regex {pattern!r}: {problem}"
+
+
+@lint_rule("unreachable-extractor", WARNING, "Internal extractors are used by a later request or expression")
+def _check_unreachable_extractors(template):
+    for _request, extractor in template.operators("extractors"):
+        internal = get(extractor, "internal")
+        if scalar(internal) not in ("true", "True", "yes"):
+            continue
+        name = get(extractor, "name")
+        if not scalar(name):
+            yield internal, "An internal extractor needs a 'name', its value is never shown"
+        # The name is defined once; any other mention ({{name}}, a DSL expression) uses it.
+        elif len(re.findall(rf"(?<![\w-]){re.escape(name.value)}(?![\w-])", template.text)) < 2:
+            yield name, f"Internal extractor '{name.value}' is never used"
+
+
+def _diagnostic(node, rule, message):
+    mark = node.start_mark
+    return Diagnostic(mark.line + 1, mark.column + 1, rule.severity, message, rule.rule_id)
+
+
+def parse_template(text, cancelled=lambda: False, construct=False):
+    """
+    Returns (root node, data, syntax Diagnostic). 'root' is None for an empty
+    document or a syntax error; 'data' is the constructed Python value of the
+    same tree when 'construct' is set, so a caller needing both parses once.
+    """
+    loader = _NodeLoader(text, cancelled)
+    try:
+        root = loader.get_single_node()
+        data = loader.construct_document(root) if construct and root is not None else None
+        return root, data, None
+    except yaml.MarkedYAMLError as e:
+        mark = e.problem_mark or e.context_mark
+        line, column = (mark.line + 1, mark.column + 1) if mark else (1, 1)
+        error = f"YAML syntax: {e.problem or e.context}"
+    except yaml.YAMLError as e:
+        line, column, error = 1, 1, f"YAML syntax: {e}"
+    except RecursionError:
+        # The Python composer recurses once per nesting level (e.g. thousands of '[').
+        line, column, error = 1, 1, "YAML syntax: the document is nested too deeply to be parsed"
+    finally:
+        loader.dispose()
+    return None, None, Diagnostic(line, column, ERROR, error, SYNTAX_RULE)
+
+
+def check_tree(text, root, rules, cancelled=lambda: False):
+    """Runs 'rules' over a parsed template and returns their Diagnostics sorted by line."""
+    if not isinstance(root, yaml.MappingNode):
+        rule = RULES["template-root"]
+        return [_diagnostic(root, rule, "A template must be a mapping of keys")] if rule in rules else []
+    template = ParsedTemplate(text, root, cancelled)
+    diagnostics = []
+    for rule in rules:
+        if rule.check is None:
+            continue
+        if cancelled():
+            raise ValidationCancelled()
+        diagnostics.extend(_diagnostic(node, rule, message) for node, message in rule.check(template))
+    return sorted(diagnostics, key=lambda d: (d.line, d.column))
+
+
+def validate(text, cancelled=lambda: False, rules=None):
+    """
+    Returns the Diagnostics of a template's text, sorted by line: the YAML
+    syntax error if there is one (the structure is not checked then), else
+    what the rules (default: all registered) found. Raises
+    ValidationCancelled as soon as 'cancelled()' is true.
+    """
+    if not text.strip():
+        return []
+    rules = select_rules() if rules is None else rules
+    root, _data, error = parse_template(text, cancelled)
+    if error is not None:
+        return [error] if RULES[SYNTAX_RULE] in rules else []
+    if root is None:
+        return []
+    return check_tree(text, root, rules, cancelled)
@@ -0,0 +1,5 @@
+# The modules live next to this folder and are imported as top-level modules, as the CLI and GUI do.
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,109 @@
+import io
+import os
+import tarfile
+import zipfile
+import pytest
+import archive_source
+from archive_source import (ArchiveWriter, hold_archives, is_archive, member_path, read_file, release_archives,
+                            split_member_path)
+from discovery import walk_archive
+from engine import TemplateEngine
+
+TEMPLATES = {
+    "http/cves/a.yaml": b"id: a\ninfo:\n  severity: high\n",
+    "http/misc/b.yaml": b"id: b\ninfo:\n  severity: low\n",
+    "dns/c.yaml": b"id: c\ninfo:\n  severity: high\n",
+    "README.md": b"not a template\n",
+}
+
+
+def make_zip(path, files=TEMPLATES, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(path, "w", compression) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def make_tar(path, mode, files=TEMPLATES, prefix=""):
+    with tarfile.open(path, mode) as archive:
+        for name, data in files.items():
+            info = tarfile.TarInfo(prefix + name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def run_holds_archives():
+    hold_archives()
+    yield
+    release_archives()
+
+
+def test_member_paths():
+    assert is_archive("x.ZIP") and is_archive("x.tar.gz") and not is_archive("x.yaml")
+    path = member_path("/t/bundle.zip", "http/a.yaml")
+    assert split_member_path(path) == ("/t/bundle.zip", "http/a.yaml")
+    assert split_member_path("/t/not!/an/archive.yaml") is None
+
+
+@pytest.mark.parametrize("builder", [
+    lambda p: make_zip(p / "t.zip"),
+    lambda p: make_zip(p / "stored.zip", compression=zipfile.ZIP_STORED),
+    lambda p: make_tar(p / "t.tar", "w"),
+    lambda p: make_tar(p / "t.tar.gz", "w:gz"),
+    lambda p: make_tar(p / "dot.tar", "w", prefix="./"),
+])
+def test_walk_and_read_members(tmp_path, builder):
+    archive = builder(tmp_path)
+    members = list(walk_archive(archive))
+    assert [split_member_path(m)[1] for m in members] == ["http/cves/a.yaml", "http/misc/b.yaml", "dns/c.yaml"]
+    assert read_file(members[0]) == TEMPLATES["http/cves/a.yaml"]
+
+
+def test_missing_member(tmp_path):
+    archive = make_zip(tmp_path / "t.zip")
+    with pytest.raises(FileNotFoundError):
+        read_file(member_path(archive, "missing.yaml"))
+
+
+def test_replaced_archive_is_reopened(tmp_path):
+    archive = make_zip(tmp_path / "t.zip")
+    path = member_path(archive, "dns/c.yaml")
+    assert read_file(path) == TEMPLATES["dns/c.yaml"]
+    make_zip(tmp_path / "t.zip", {"dns/c.yaml": b"id: replaced\n"})
+    os.utime(archive, ns=(1, 1))
+    assert read_file(path) == b"id: replaced\n"
+
+
+def test_readers_stay_open_until_last_release(tmp_path):
+    archive = make_zip(tmp_path / "t.zip")
+    hold_archives()
+    read_file(member_path(archive, "dns/c.yaml"))
+    release_archives()
+    # The fixture's hold is still active.
+    assert archive in archive_source._open_archives
+    read_file(member_path(archive, "http/cves/a.yaml"))
+
+
+@pytest.mark.parametrize("name", ["out.zip", "out.tar.gz"])
+def test_writer_close_and_discard(tmp_path, name):
+    target = tmp_path / name
+    writer = ArchiveWriter(target)
+    writer.add("high/a.yaml", b"id: a\n")
+    writer.close()
+    assert read_file(member_path(str(target), "high/a.yaml")) == b"id: a\n"
+    writer = ArchiveWriter(tmp_path / ("discarded-" + name))
+    writer.add("x", b"x")
+    writer.discard()
+    assert os.listdir(tmp_path) == [name]
+
+
+def test_classify_archive_into_archive(tmp_path):
+    source = make_zip(tmp_path / "in.zip")
+    target = str(tmp_path / "out.zip")
+    result = TemplateEngine().do_organize_templates(list(walk_archive(source)), target)
+    assert result["processed"] == 3 and result["copy_errors"] == 0
+    with zipfile.ZipFile(target) as archive:
+        assert sorted(archive.namelist()) == ["classification_debug.log", "high/a.yaml", "high/c.yaml",
+                                              "low/b.yaml"]
@@ -0,0 +1,37 @@
+import os
+from classification_manifest import ClassificationManifest
+
+
+def test_one_folder_spelled_two_ways(tmp_path):
+    real = tmp_path / "real"
+    real.mkdir()
+    os.symlink(real, tmp_path / "link")
+    source = tmp_path / "a.yaml"
+    source.write_text("id: a\n", encoding="utf-8")
+    manifest = ClassificationManifest(str(tmp_path / "link"))
+    manifest.record(str(source), str(tmp_path / "link" / "high" / "a.yaml"))
+    manifest.save()
+
+    reloaded = ClassificationManifest(str(real))
+    assert reloaded.destination(str(source)) == reloaded.normalize(str(real / "high" / "a.yaml"))
+    assert reloaded.is_current(str(source), os.stat(source))
+
+
+def test_remove_copy_keeps_current_and_outside_files(tmp_path):
+    target = tmp_path / "out"
+    (target / "high").mkdir(parents=True)
+    copy = target / "high" / "a.yaml"
+    copy.write_text("id: a\n", encoding="utf-8")
+    outside = tmp_path / "b.yaml"
+    outside.write_text("id: b\n", encoding="utf-8")
+    manifest = ClassificationManifest(str(target))
+    manifest.record(str(tmp_path / "a.yaml"), str(copy))
+    manifest.record(str(tmp_path / "c.yaml"), str(outside))
+
+    assert not manifest.remove_copy(str(tmp_path / "a.yaml"), keep={manifest.normalize(str(copy))})
+    assert copy.exists()
+    manifest.record(str(tmp_path / "a.yaml"), str(copy))
+    assert manifest.remove_copy(str(tmp_path / "a.yaml"))
+    assert not copy.exists()
+    assert not manifest.remove_copy(str(tmp_path / "c.yaml"))
+    assert outside.exists()
@@ -0,0 +1,79 @@
+from engine import TemplateEngine
+from exact_dedup import EDGE_SIZE, file_digest, new_hasher
+
+HEADER = "id: {id}\ninfo:\n  severity: low\n"
+
+
+def write(folder, name, text):
+    path = folder / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def find(paths, **options):
+    return TemplateEngine(**options).do_find_duplicates(paths)["results"]
+
+
+def test_identical_files_are_grouped(tmp_path):
+    a = write(tmp_path, "a.yaml", HEADER.format(id="a"))
+    b = write(tmp_path, "b.yaml", HEADER.format(id="a"))
+    c = write(tmp_path, "c.yaml", HEADER.format(id="c"))
+    results = find([a, b, c])
+    assert list(results["hash_duplicates"].values()) == [[a, b]]
+    assert results["id_duplicates"] == {"a": [a, b]}
+    assert results["total_scanned"] == 3
+
+
+def test_large_files_differing_in_the_middle(tmp_path):
+    body = "x" * (4 * EDGE_SIZE)
+    middle = len(body) // 2
+    a = write(tmp_path, "a.yaml", HEADER.format(id="a") + f"# {body}\n")
+    b = write(tmp_path, "b.yaml", HEADER.format(id="a") + f"# {body}\n")
+    c = write(tmp_path, "c.yaml", HEADER.format(id="a") + f"# {body[:middle]}y{body[middle + 1:]}\n")
+    assert list(find([a, b, c])["hash_duplicates"].values()) == [[a, b]]
+
+
+def test_hash_algorithms_agree_on_groups(tmp_path):
+    a = write(tmp_path, "a.yaml", HEADER.format(id="a"))
+    b = write(tmp_path, "b.yaml", HEADER.format(id="a"))
+    for algo in ("sha256", "blake2b", "md5"):
+        assert list(find([a, b], hash_algo=algo)["hash_duplicates"].values()) == [[a, b]]
+
+
+def test_git_blob_digest_matches_git():
+    # "git hash-object" of "hello\n".
+    hasher = new_hasher("git-sha1", 6)
+    hasher.update(b"hello\n")
+    assert hasher.hexdigest() == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_file_digest_of_git_blob(tmp_path):
+    path = write(tmp_path, "hello.txt", "hello\n")
+    assert file_digest(path, "git-sha1").hex() == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_cached_digests_are_reused(tmp_path):
+    a = write(tmp_path, "a.yaml", HEADER.format(id="a"))
+    b = write(tmp_path, "b.yaml", HEADER.format(id="a"))
+    cache = str(tmp_path / "cache.db")
+    first = find([a, b], cache_path=cache)
+    second = find([a, b], cache_path=cache)
+    assert first["hash_duplicates"] == second["hash_duplicates"]
+
+
+def test_semantic_groups_skip_byte_identical(tmp_path):
+    a = write(tmp_path, "a.yaml", HEADER.format(id="a") + "http:\n  - method: GET\n    path: ['/x']\n")
+    b = write(tmp_path, "b.yaml", HEADER.format(id="b") + "http: [{path: [/x], method: GET}]\n")
+    c = write(tmp_path, "c.yaml", HEADER.format(id="a") + "http:\n  - method: GET\n    path: ['/x']\n")
+    results = find([a, b, c], semantic=True)
+    assert list(results["semantic_duplicates"].values()) == [[a, b, c]]
+    assert list(results["hash_duplicates"].values()) == [[a, c]]
+
+
+def test_recursive_alias_does_not_hang(tmp_path):
+    text = HEADER.format(id="r") + "http:\n  - &a {method: GET, self: *a}\n"
+    a = write(tmp_path, "a.yaml", text)
+    b = write(tmp_path, "b.yaml", text)
+    results = find([a, b], semantic=True, near_threshold=0.8)
+    assert results["semantic_duplicates"] == {} and results["near_duplicates"] == {}
+    assert list(results["hash_duplicates"].values()) == [[a, b]]
@@ -0,0 +1,80 @@
+import os
+import shutil
+import subprocess
+import pytest
+from engine import TemplateEngine
+from git_source import GitError, GitSource
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+TEMPLATE = "id: {id}\ninfo:\n  severity: high\n"
+
+
+def git(repo, *args):
+    return subprocess.run(["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                          check=True, capture_output=True).stdout.decode().strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "http").mkdir(parents=True)
+    git(repo, "init", "-q")
+    (repo / "http" / "a.yaml").write_text(TEMPLATE.format(id="a"), encoding="utf-8")
+    (repo / "http" / "b.yaml").write_text(TEMPLATE.format(id="b"), encoding="utf-8")
+    (repo / "notes.txt").write_text("not a template\n", encoding="utf-8")
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+def test_lists_tracked_and_untracked_templates(repo):
+    (repo / "http" / "new.yaml").write_text(TEMPLATE.format(id="new"), encoding="utf-8")
+    source = GitSource(str(repo))
+    assert sorted(os.path.basename(p) for p in source) == ["a.yaml", "b.yaml", "new.yaml"]
+    assert source.hash_algo == "git-sha1"
+    assert source.hashed == 1
+
+
+def test_blob_ids_match_git(repo):
+    (repo / "http" / "b.yaml").write_text(TEMPLATE.format(id="changed"), encoding="utf-8")
+    source = GitSource(str(repo))
+    for path in source:
+        assert source.blobs[path] == git(repo, "hash-object", path)
+
+
+def test_revision_limits_paths(repo):
+    (repo / "http" / "b.yaml").write_text(TEMPLATE.format(id="changed"), encoding="utf-8")
+    git(repo, "commit", "-q", "-am", "change b")
+    source = GitSource(str(repo), rev="HEAD~1..HEAD")
+    assert [os.path.basename(p) for p in source] == ["b.yaml"]
+
+
+def test_option_like_revision_is_rejected(repo, tmp_path):
+    with pytest.raises(GitError):
+        GitSource(str(repo), rev=f"--output={tmp_path / 'written'}")
+    assert not (tmp_path / "written").exists()
+
+
+def test_not_a_work_tree(tmp_path):
+    with pytest.raises(GitError):
+        GitSource(str(tmp_path))
+
+
+def test_duplicates_across_tracked_and_untracked(repo):
+    copy = repo / "http" / "copy.yaml"
+    copy.write_text(TEMPLATE.format(id="a"), encoding="utf-8")
+    results = TemplateEngine().do_find_duplicates(GitSource(str(repo)))["results"]
+    assert list(results["hash_duplicates"].values()) == [[str(repo / "http" / "a.yaml"), str(copy)]]
+
+
+def test_autocrlf_copies_match_the_index(tmp_path, repo):
+    clone = tmp_path / "clone"
+    subprocess.run(["git", "clone", "-q", "-c", "core.autocrlf=true", str(repo), str(clone)], check=True)
+    crlf = (clone / "http" / "a.yaml").read_bytes()
+    assert b"\r\n" in crlf
+    (clone / "http" / "crlf.yaml").write_bytes(crlf)
+    (clone / "http" / "lf.yaml").write_text(TEMPLATE.format(id="a"), encoding="utf-8")
+    results = TemplateEngine().do_find_duplicates(GitSource(str(clone)))["results"]
+    groups = [sorted(os.path.basename(p) for p in group) for group in results["hash_duplicates"].values()]
+    assert groups == [["a.yaml", "crlf.yaml", "lf.yaml"]]
@@ -0,0 +1,56 @@
+import json
+from engine import TemplateEngine
+from lint_report import SARIF_VERSION, to_sarif, write_report
+from template_validation import SYNTAX_RULE, LintConfig
+
+VALID = ("id: valid-template\ninfo:\n  name: Valid\n  author: someone\n  severity: high\n"
+         "http:\n  - method: GET\n    path: ['{{BaseURL}}']\n    matchers:\n      - type: status\n        status: [200]\n")
+
+
+def lint(tmp_path):
+    (tmp_path / "templates").mkdir()
+    good = tmp_path / "templates" / "good.yaml"
+    good.write_text(VALID, encoding="utf-8")
+    bad = tmp_path / "templates" / "bad.yaml"
+    bad.write_text("id: bad\ninfo: [\n", encoding="utf-8")
+    config = LintConfig()
+    return TemplateEngine().do_lint_templates([str(good), str(bad)], config), config.rules()
+
+
+def test_lint_result(tmp_path):
+    result, _ = lint(tmp_path)
+    assert result["status"] == "lint_done"
+    findings = result["results"]["findings"]
+    assert [(f["path"].rsplit("bad", 1)[-1], f["rule"]) for f in findings if f["rule"] == SYNTAX_RULE] == \
+        [(".yaml", SYNTAX_RULE)]
+    assert result["results"]["total_scanned"] == 2
+
+
+def test_sarif_log(tmp_path):
+    result, rules = lint(tmp_path)
+    sarif = to_sarif(result, rules, base_dir=str(tmp_path))
+    assert sarif["version"] == SARIF_VERSION
+    run = sarif["runs"][0]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == [rule.rule_id for rule in rules]
+    syntax = [r for r in run["results"] if r["ruleId"] == SYNTAX_RULE]
+    assert len(syntax) == 1
+    location = syntax[0]["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"] == {"uri": "templates/bad.yaml", "uriBaseId": "SRCROOT"}
+    assert location["region"]["startLine"] >= 2
+    assert run["tool"]["driver"]["rules"][syntax[0]["ruleIndex"]]["id"] == SYNTAX_RULE
+    assert run["originalUriBaseIds"]["SRCROOT"]["uri"].endswith("/")
+
+
+def test_paths_outside_base_are_file_uris(tmp_path):
+    result, rules = lint(tmp_path)
+    sarif = to_sarif(result, rules, base_dir=str(tmp_path / "elsewhere"))
+    uris = [r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for r in sarif["runs"][0]["results"]]
+    assert uris and all(uri.startswith("file://") for uri in uris)
+
+
+def test_write_report_picks_format(tmp_path):
+    result, rules = lint(tmp_path)
+    write_report(tmp_path / "report.sarif", result, rules)
+    write_report(tmp_path / "report.json", result, rules)
+    assert json.loads((tmp_path / "report.sarif").read_text(encoding="utf-8"))["version"] == SARIF_VERSION
+    assert json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))["status"] == "lint_done"
@@ -0,0 +1,80 @@
+import pytest
+from near_dedup import check_tree, content_tokens, find_near_duplicates, minhash_signature, similarity
+from template_analysis import analyze_template
+from template_metadata import load_full
+
+REQUEST = """\
+id: {id}
+info:
+  name: {id}
+  severity: high
+http:
+  - raw:
+      - |
+        GET /admin/login.php?user=admin&debug=1 HTTP/1.1
+        Host: {{{{Hostname}}}}
+        Accept: */*
+        X-Marker: {marker}
+    matchers:
+      - type: word
+        words: [administrator, dashboard, "login successful"]
+      - type: status
+        status: [200]
+"""
+
+LAUGHS = "id: laughs\ninfo: {severity: low}\na: &a [x, x, x, x, x, x, x, x, x, x]\n" + "".join(
+    f"{chr(98 + i)}: &{chr(98 + i)} [{', '.join(['*' + chr(97 + i)] * 10)}]\n" for i in range(7))
+
+
+def signature(text):
+    return minhash_signature(content_tokens(load_full(text)))
+
+
+def test_id_and_info_are_ignored():
+    a = load_full(REQUEST.format(id="a", marker="1"))
+    b = load_full(REQUEST.format(id="b", marker="1"))
+    assert content_tokens(a) == content_tokens(b)
+
+
+def test_small_edit_stays_similar():
+    a, b = signature(REQUEST.format(id="a", marker="1")), signature(REQUEST.format(id="b", marker="2"))
+    assert similarity(a, b) >= 0.7
+
+
+def test_groups_near_duplicates():
+    entries = [("a", "a", signature(REQUEST.format(id="a", marker="1"))),
+               ("b", "b", signature(REQUEST.format(id="b", marker="1"))),
+               ("c", "c", signature("id: c\nhttp:\n  - method: POST\n    path: [/other]\n"))]
+    groups = find_near_duplicates(entries, threshold=0.9)
+    assert list(groups.values()) == [["a", "b"]]
+
+
+def test_large_bucket_is_grouped():
+    entries = [(f"k{i}", f"t{i}", signature(REQUEST.format(id=i, marker="same"))) for i in range(100)]
+    groups = find_near_duplicates(entries)
+    assert [len(keys) for keys in groups.values()] == [100]
+
+
+def test_recursive_alias_raises():
+    data = load_full("id: r\nhttp:\n  - &a {method: GET, self: *a}\n")
+    with pytest.raises(ValueError):
+        content_tokens(data)
+
+
+def test_alias_fan_out_is_capped():
+    data = load_full(LAUGHS)
+    with pytest.raises(ValueError):
+        check_tree(data)
+    with pytest.raises(ValueError):
+        content_tokens(data)
+
+
+def test_shared_alias_is_accepted():
+    check_tree(load_full("id: a\nv: &v {x: 1}\nhttp:\n  - vars: *v\n  - vars: *v\n"))
+
+
+def test_alias_fan_out_is_recorded_as_error(tmp_path):
+    path = tmp_path / "laughs.yaml"
+    path.write_text(LAUGHS, encoding="utf-8")
+    record = analyze_template(path, deep=True)
+    assert record.error and record.signature is None
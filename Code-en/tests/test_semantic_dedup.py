@@ -0,0 +1,43 @@
+import pytest
+from template_analysis import analyze_template
+from template_metadata import load_full
+from semantic_dedup import semantic_digest
+
+RECURSIVE = """\
+id: recursive
+info:
+  name: Recursive alias
+  severity: high
+http:
+  - &a {method: GET, path: ["/"], self: *a}
+"""
+
+
+def test_formatting_does_not_change_digest():
+    block = load_full("id: a\ninfo: {severity: low}\nhttp:\n  - method: GET\n    path: ['{{BaseURL}}']\n")
+    flow = load_full('id: b\ninfo:\n  severity: high\nhttp: [{path: ["{{BaseURL}}"], method: "GET"}]\n')
+    assert semantic_digest(block) == semantic_digest(flow)
+
+
+def test_different_requests_differ():
+    a = load_full("id: a\nhttp:\n  - method: GET\n")
+    b = load_full("id: a\nhttp:\n  - method: POST\n")
+    assert semantic_digest(a) != semantic_digest(b)
+
+
+def test_shared_alias_is_not_a_cycle():
+    data = load_full("id: a\nvariables: &v {x: 1}\nhttp:\n  - vars: *v\n  - vars: *v\n")
+    assert semantic_digest(data) is not None
+
+
+def test_recursive_alias_raises():
+    with pytest.raises(ValueError):
+        semantic_digest(load_full(RECURSIVE))
+
+
+def test_recursive_alias_is_recorded_as_error(tmp_path):
+    path = tmp_path / "recursive.yaml"
+    path.write_text(RECURSIVE, encoding="utf-8")
+    record = analyze_template(path, deep=True)
+    assert record.error
+    assert record.semantic_digest is None
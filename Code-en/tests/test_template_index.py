@@ -0,0 +1,69 @@
+import pytest
+from template_index import TemplateIndex, parse_query
+
+TEMPLATES = {
+    "http/cves/CVE-2021-44228.yaml": "id: CVE-2021-44228\ninfo:\n  name: Log4j RCE\n  author: alice,bob\n"
+                                     "  severity: critical\n  tags: cve,rce,log4j\nhttp: []\n",
+    "dns/takeover.yaml": "id: dns-takeover\ninfo:\n  name: Takeover\n  author: carol\n  severity: high\n"
+                         "  tags: dns,takeover\ndns: []\n",
+    "http/tech/detect.yaml": "id: tech-detect\ninfo:\n  name: Tech\n  author: alice\n"
+                             "  severity: informational\n  tags: tech\nhttp: []\n",
+    "http/misc/banner.yaml": "id: banner\ninfo:\n  name: Banner\n  author: dave\n  severity: info\n"
+                             "  tags: tech,dos\nhttp: []\n",
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    root = tmp_path / "templates"
+    for name, text in TEMPLATES.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    with TemplateIndex(tmp_path / "index.db") as index:
+        index.refresh([str(root)])
+        yield index
+
+
+def ids(entries):
+    return sorted(entry.template_id for entry in entries)
+
+
+def test_parse_query():
+    assert parse_query("sev:Critical tags:rce,sqli -tag:dos log4j proto:http") == [
+        ("severity", ("critical",), False), ("tag", ("rce", "sqli"), False), ("tag", ("dos",), True),
+        ("text", ("log4j",), False), ("protocol", ("http",), False)]
+
+
+def test_parse_query_unknown_field():
+    with pytest.raises(ValueError):
+        parse_query("colour:red")
+
+
+def test_parse_query_severity_aliases():
+    assert parse_query("severity:informational,informative") == [("severity", ("info", "info"), False)]
+
+
+def test_list_fields_and_negation(index):
+    assert ids(index.query("tag:tech -tag:dos")) == ["tech-detect"]
+    assert ids(index.query("author:alice protocol:http")) == ["CVE-2021-44228", "tech-detect"]
+    assert ids(index.query("cve:cve-2021-44228")) == ["CVE-2021-44228"]
+    assert ids(index.query("protocol:dns")) == ["dns-takeover"]
+
+
+def test_severity_aliases_match(index):
+    assert ids(index.query("severity:info")) == ["banner", "tech-detect"]
+    assert ids(index.query("severity:informational")) == ["banner", "tech-detect"]
+
+
+def test_text_and_prefix_terms(index):
+    assert ids(index.query("log4j")) == ["CVE-2021-44228"]
+    assert ids(index.query("tag:take*")) == ["dns-takeover"]
+
+
+def test_refresh_is_incremental(index, tmp_path):
+    root = tmp_path / "templates"
+    (root / "dns/takeover.yaml").unlink()
+    (root / "http/new.yaml").write_text("id: new\ninfo: {severity: low}\nhttp: []\n", encoding="utf-8")
+    assert index.refresh([str(root)]) == {"total": 4, "indexed": 1, "removed": 1}
+    assert ids(index.query("severity:low")) == ["new"]
@@ -0,0 +1,63 @@
+import pytest
+import yaml
+from template_metadata import load_header, load_outline
+
+HEADER = "id: sample\ninfo:\n  name: Sample\n  severity: high\n  tags: a,b\n"
+
+
+def full_header(text):
+    """What a full yaml.safe_load gives for the header: the 'id' and 'info' keys, or the exception type."""
+    try:
+        data = yaml.safe_load(text)
+    except Exception as e:
+        return type(e)
+    return {key: data[key] for key in ("id", "info") if key in data} if isinstance(data, dict) else data
+
+
+def fast_header(text):
+    try:
+        data = load_header(text)
+    except Exception as e:
+        return type(e)
+    return {key: data[key] for key in ("id", "info") if key in data} if isinstance(data, dict) else data
+
+
+CASES = [
+    HEADER + "http:\n  - method: GET\n    path: ['{{BaseURL}}']\n    matchers:\n      - type: status\n        status: [200]\n",
+    "info:\n  severity: low\nid: reversed\n",
+    HEADER + "http: []\nid: repeated\n",
+    HEADER + "http: []\ninfo:\n  severity: low\n",
+    HEADER + "x: !custom 1\n",
+    HEADER + "x: !!int abc\n",
+    HEADER + "d: 2024-13-45\n",
+    HEADER + "d: 2024-01-02\n",
+    HEADER + "x: [1, 2.5, 0x1f, .inf, ~, yes]\n",
+    HEADER + "x: !custom {a: 1}\n",
+    HEADER + "x: !custom [a]\n",
+    HEADER + "x: {? [a, b] : 1}\n",
+    HEADER + "x: {<<: 1}\n",
+    HEADER + "x: <<\n",
+    HEADER + "x: *missing\n",
+    HEADER + "v: &v {a: 1}\nw: *v\n",
+    HEADER + "http: [\n",
+    HEADER + "---\nid: second\n",
+    "id: &i anchored\ninfo: {severity: *i}\n",
+    "- not a mapping\n",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", CASES)
+def test_same_answer_as_full_parse(text):
+    assert fast_header(text) == full_header(text)
+
+
+def test_outline_lists_top_level_keys():
+    data, keys = load_outline(HEADER + "http: []\ndns: []\n")
+    assert data == {"id": "sample", "info": {"name": "Sample", "severity": "high", "tags": "a,b"}}
+    assert keys == ("id", "info", "http", "dns")
+
+
+def test_outline_falls_back_on_repeated_keys():
+    data, keys = load_outline(HEADER + "http: []\nhttp: [1]\n")
+    assert data["http"] == [1]
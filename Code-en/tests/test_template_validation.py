@@ -0,0 +1,19 @@
+from template_validation import ERROR, SYNTAX_RULE, LintConfig, validate
+
+VALID = "id: valid-template\ninfo:\n  name: Valid\n  author: someone\n  severity: high\nhttp:\n  - method: GET\n    path: ['{{BaseURL}}']\n    matchers:\n      - type: status\n        status: [200]\n"
+
+
+def test_syntax_error_has_its_line():
+    diagnostics = validate(VALID + "  bad: [\n")
+    assert [d.rule for d in diagnostics] == [SYNTAX_RULE]
+    assert diagnostics[0].severity == ERROR and diagnostics[0].line > 1
+
+
+def test_deep_nesting_is_a_syntax_error():
+    diagnostics = validate("[" * 5000)
+    assert [(d.line, d.rule) for d in diagnostics] == [(1, SYNTAX_RULE)]
+
+
+def test_lint_reports_deep_nesting_as_error():
+    data, diagnostics, error = LintConfig().run("[" * 5000)
+    assert data is None and error
@@ -0,0 +1,152 @@
+# watch.py
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from discovery import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, walk_directories, walk_templates
+
+DEFAULT_DEBOUNCE = 2.0
+DEFAULT_POLL_INTERVAL = 5.0
+
+# From linux/inotify.h
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+_EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """
+    Recursive watch of template folders with Linux inotify (through libc, no
+    extra dependency). poll() returns the paths that changed: files, and folders
+    that appeared, disappeared or overflowed the event queue and must be rescanned.
+    """
+    name = "inotify"
+
+    def __init__(self, roots, exclude=DEFAULT_EXCLUDE):
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.exclude = exclude
+        self.watches = {}
+        try:
+            for root in self.roots:
+                self._watch_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, root):
+        for directory in walk_directories(root, self.exclude):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                code = ctypes.get_errno()
+                if code == errno.ENOSPC:
+                    raise OSError(code, "inotify watch limit reached (fs.inotify.max_user_watches)")
+                continue
+            self.watches[wd] = directory
+
+    def poll(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buffer, offset)
+                name = buffer[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    changed.update(self.roots)
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self.watches[wd]
+                    continue
+                path = os.path.join(directory, os.fsdecode(name)) if name else directory
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+                changed.add(path)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """
+    Portable fallback: every 'interval' seconds the folders are walked and the
+    (size, mtime) of each template compared with the previous walk.
+    """
+    name = "polling"
+
+    def __init__(self, roots, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE, interval=DEFAULT_POLL_INTERVAL):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.include = include
+        self.exclude = exclude
+        self.interval = interval
+        self.snapshot = self._scan()
+        self.last_scan = time.monotonic()
+
+    def _scan(self):
+        snapshot = {}
+        for root in self.roots:
+            for path in walk_templates(root, self.include, self.exclude):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def poll(self, timeout):
+        remaining = self.interval - (time.monotonic() - self.last_scan)
+        if remaining > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(0.0, remaining))
+        snapshot = self._scan()
+        self.last_scan = time.monotonic()
+        changed = {path for path, state in snapshot.items() if self.snapshot.get(path) != state}
+        changed.update(path for path in self.snapshot if path not in snapshot)
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(roots, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE, poll_interval=DEFAULT_POLL_INTERVAL):
+    """Returns an InotifyWatcher where inotify is usable, a PollingWatcher otherwise."""
+    try:
+        return InotifyWatcher(roots, exclude)
+    except (OSError, AttributeError):
+        return PollingWatcher(roots, include, exclude, poll_interval)
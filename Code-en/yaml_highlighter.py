@@ -1,41 +1,152 @@
 # yaml_highlighter.py
-from PySide6.QtCore import QRegularExpression
+from PySide6.QtCore import QRegularExpression, QTimer
 from PySide6.QtGui import QColor, QTextCharFormat, QFont, QSyntaxHighlighter
 
+KEYWORDS = ["id", "info", "name", "author", "severity", "description", "reference",
+            "classification", "metadata", "tags", "requests", "http", "dns", "file",
+            "network", "headless", "websocket", "matchers", "extractors", "type", "part",
+            "words", "status", "body", "header", "method", "path", "raw"]
+# Documents with more lines than this only get formats for the blocks around the viewport.
+LARGE_DOCUMENT_LINES = 3000
+VIEWPORT_MARGIN = 50
+
+# Block states carried from line to line (QSyntaxHighlighter starts at -1).
+NORMAL = 0
+IN_DOUBLE_QUOTE = 1
+IN_SINGLE_QUOTE = 2
+# BLOCK_SCALAR + n: inside a '|' or '>' scalar whose parent line is indented by n spaces.
+BLOCK_SCALAR = 16
+
+# A quoted scalar only starts at the beginning of a value, not inside plain text (e.g. "Don't").
+_QUOTE_START = r"(?<![^\s\[{,])"
+# One alternation for every token, tried left to right in a single pass; the
+# group that matched selects the format. Groups must not be nested.
+TOKEN_PATTERN = QRegularExpression(
+    r"(^\s*-(?:\s|$))"                                                    # 1 list item
+    r"|((?<!\S)#.*)"                                                      # 2 comment
+    r"|(" + _QUOTE_START + r"""(?:"(?:[^"\\]|\\.)*"|'(?:[^']|'')*'(?!')))"""   # 3 quoted string
+    r"|(" + _QUOTE_START + r'"(?:[^"\\]|\\.)*$)'                          # 4 unterminated "...
+    r"|(" + _QUOTE_START + r"'(?:[^']|'')*$)"                             # 5 unterminated '...
+    r"|(\b(?:" + "|".join(KEYWORDS) + r"):)"                              # 6 keyword
+    r"|(\b[0-9]+\b)")                                                     # 7 number
+DOUBLE_QUOTE_END = QRegularExpression(r'^(?:[^"\\]|\\.)*"')
+SINGLE_QUOTE_END = QRegularExpression(r"^(?:[^']|'')*'(?!')")
+BLOCK_SCALAR_START = QRegularExpression(r"^( *)(?:- +)*(?:[^\s#][^#]*?:[ \t]+)?[|>][-+0-9]*[ \t]*(?:#.*)?$")
+for _pattern in (TOKEN_PATTERN, DOUBLE_QUOTE_END, SINGLE_QUOTE_END, BLOCK_SCALAR_START):
+    _pattern.optimize()
+
+
 class YamlHighlighter(QSyntaxHighlighter):
+    """
+    Single-pass highlighter: one precompiled alternation per line, block scalars
+    and multi-line quoted strings tracked with setCurrentBlockState (their lines
+    get one format run). For large documents attached to an editor, lines far
+    from the viewport only have their state computed and are formatted once
+    they are scrolled into view.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
         # 数字格式
         number_format = QTextCharFormat()
         number_format.setForeground(QColor("#B5CEA8"))
-        self.highlighting_rules.append((QRegularExpression(r"\b[0-9]+\b"), number_format))
         # 字符串格式 (带引号)
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor("#CE9178"))
-        self.highlighting_rules.append((QRegularExpression(r"'.*?'"), string_format))
-        self.highlighting_rules.append((QRegularExpression(r'".*?"'), string_format))
+        self.string_format = QTextCharFormat()
+        self.string_format.setForeground(QColor("#CE9178"))
         # 关键字格式
         keyword_format = QTextCharFormat()
         keyword_format.setForeground(QColor("#569CD6"))
         keyword_format.setFontWeight(QFont.Bold)
-        keywords = ["id", "info", "name", "author", "severity", "description", "reference",
-                    "classification", "metadata", "tags", "requests", "http", "dns", "file",
-                    "network", "headless", "websocket", "matchers", "extractors", "-", "type", "part",
-                    "words", "status", "body", "header", "method", "path", "raw"]
-        for word in keywords:
-            self.highlighting_rules.append((QRegularExpression(rf"\b{word}:"), keyword_format))
-        self.highlighting_rules.append((QRegularExpression(r"^\s*-\s"), keyword_format))
         # 注释格式
         comment_format = QTextCharFormat()
         comment_format.setForeground(QColor("#6A9955"))
         comment_format.setFontItalic(True)
-        self.highlighting_rules.append((QRegularExpression(r"#[^\n]*"), comment_format))
+        # Indexed by the TOKEN_PATTERN group that matched.
+        self.token_formats = [None, keyword_format, comment_format, self.string_format,
+                              self.string_format, self.string_format, keyword_format, number_format]
+        self.editor = None
+        self.visible_range = None
+        # True while formats are re-applied to scrolled-in blocks: Qt reports that as an edit.
+        self.rehighlighting = False
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.timeout.connect(self._highlight_viewport)
+
+    def attach_viewport(self, editor):
+        """Enables viewport-limited highlighting for large documents shown in 'editor' (a QPlainTextEdit)."""
+        self.editor = editor
+        editor.verticalScrollBar().valueChanged.connect(self._schedule_viewport)
+        editor.blockCountChanged.connect(self._schedule_viewport)
+        self._update_visible_range()
+
+    def _viewport_limited(self):
+        return self.editor is not None and self.document().blockCount() > LARGE_DOCUMENT_LINES
+
+    def _update_visible_range(self):
+        first = self.editor.firstVisibleBlock().blockNumber()
+        last = self.editor.cursorForPosition(self.editor.viewport().rect().bottomLeft()).blockNumber()
+        self.visible_range = (first - VIEWPORT_MARGIN, last + VIEWPORT_MARGIN)
+
+    def _schedule_viewport(self, *_):
+        self._viewport_timer.start(0)
+
+    def _highlight_viewport(self):
+        if not self._viewport_limited():
+            return
+        self._update_visible_range()
+        first, last = self.visible_range
+        block = self.document().findBlockByNumber(max(0, first))
+        self.rehighlighting = True
+        try:
+            while block.isValid() and block.blockNumber() <= last:
+                self.rehighlightBlock(block)
+                block = block.next()
+        finally:
+            self.rehighlighting = False
 
     def highlightBlock(self, text):
-        for pattern, format in self.highlighting_rules:
-            expression = QRegularExpression(pattern)
-            it = expression.globalMatch(text)
+        apply = True
+        if self._viewport_limited():
+            first, last = self.visible_range
+            apply = first <= self.currentBlock().blockNumber() <= last
+        self.setCurrentBlockState(self._highlight(text, self.previousBlockState(), apply))
+
+    def _highlight(self, text, state, apply):
+        """Formats 'text' (only when 'apply') and returns the state for the next line."""
+        start = 0
+        if state >= BLOCK_SCALAR:
+            stripped = text.lstrip(" ")
+            if not stripped.strip():
+                return state
+            if len(text) - len(stripped) > state - BLOCK_SCALAR:
+                if apply:
+                    self.setFormat(0, len(text), self.string_format)
+                return state
+        elif state in (IN_DOUBLE_QUOTE, IN_SINGLE_QUOTE):
+            end = (DOUBLE_QUOTE_END if state == IN_DOUBLE_QUOTE else SINGLE_QUOTE_END).match(text)
+            if not end.hasMatch():
+                if apply:
+                    self.setFormat(0, len(text), self.string_format)
+                return state
+            start = end.capturedEnd()
+            if apply:
+                self.setFormat(0, start, self.string_format)
+
+        state = NORMAL
+        # Without formats to apply, only a quote can change the state of the next line.
+        if apply or '"' in text or "'" in text:
+            it = TOKEN_PATTERN.globalMatch(text, start)
             while it.hasNext():
                 match = it.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
\ No newline at end of file
+                group = match.lastCapturedIndex()
+                if apply:
+                    self.setFormat(match.capturedStart(), match.capturedLength(), self.token_formats[group])
+                if group == 4:
+                    state = IN_DOUBLE_QUOTE
+                elif group == 5:
+                    state = IN_SINGLE_QUOTE
+        if state == NORMAL and start == 0 and ("|" in text or ">" in text):
+            block_start = BLOCK_SCALAR_START.match(text)
+            if block_start.hasMatch():
+                state = BLOCK_SCALAR + block_start.capturedLength(1)
+        return state